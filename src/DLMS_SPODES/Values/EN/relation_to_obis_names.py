@@ -69,6 +69,24 @@ GENERAL_DISPLAY_READOUT = "General display readout"
 ALTERNATE_DISPLAY_READOUT = "Alternate display readout"
 # 6.2.44 Parameter changes and calibration objects
 PARAMETER_CHANGES_AND_CALIBRATION_0 = "RU. Correction counter(Configuring)"
+NUMBER_OF_CONFIGURATION_PROGRAM_CHANGES = "Number of configuration program changes"
+DATE_A_OF_LAST_CONFIGURATION_PROGRAM_CHANGE = "Date of last configuration program change"
+DATE_A_OF_LAST_TIME_SWITCH_PROGRAM_CHANGE = "Date of last time switch program change"
+DATE_A_OF_LAST_RIPPLE_CONTROL_RECEIVER_PROGRAM_CHANGE = "Date of last ripple control receiver program change"
+STATUS_OF_SECURITY_SWITCHES = "Status of security switches"
+DATE_A_OF_LAST_CALIBRATION = "Date of last calibration"
+DATE_A_OF_NEXT_CONFIGURATION_PROGRAM_CHANGE = "Date of next configuration program change"
+DATE_A_OF_ACTIVATION_OF_THE_PASSIVE_CALENDAR = "Date of activation of the passive calendar"
+NUMBER_OF_PROTECTED_CONFIGURATION_PROGRAM_CHANGES = "Number of protected configuration program changes"
+DATE_A_OF_LAST_PROTECTED_CONFIGURATION_PROGRAM_CHANGE = "Date of last protected configuration program change"
+DATE_A_CORRECTED_OF_LAST_CLOCK_SYNCHRONIZATION_SETTING = "Date (corrected) of last clock synchronization/setting"
+DATE_OF_LAST_FIRMWARE_ACTIVATION = "Date of last firmware activation"
+# Internal operating status
+INTERNAL_OPERATING_STATUS_GLOBAL = "Internal operating status, global"
+INTERNAL_OPERATING_STATUS_1 = "Power quality status (profile of daily testimony)"
+INTERNAL_OPERATING_STATUS_2 = "Power control status word"
+INTERNAL_OPERATING_STATUS_3 = "Internal operating status 3"
+INTERNAL_OPERATING_STATUS_4 = "Power quality status (power quality log)"
 # 6.2.48 Status of internal control signals objects
 RU_LCD_BACKLIGHT_MODE = "Lcd backlight mode"
 
@@ -38,7 +38,7 @@ def get_values2(*args: str) -> tuple[str, int]:
 
 
 if not os.path.isfile(path := ".//config.toml"):
-    path = F"{os.path.dirname(__file__)}{path}"
+    path = os.path.join(os.path.dirname(__file__), "config.toml")
 elif not os.path.isfile(path):
     logger.warning("NOT FIND CONFIGURATION: <config.toml>")
 with open(path, "rb") as f:
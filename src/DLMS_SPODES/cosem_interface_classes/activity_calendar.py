@@ -123,6 +123,7 @@ class DayProfileTable(cdt.Array):
 
 class ActivityCalendar(ic.COSEMInterfaceClasses):
     """DLMS UA 1000-1 Ed. 14 4.5.5 Activity calendar"""
+    __slots__ = tuple()
     CLASS_ID = classID.ACTIVITY_CALENDAR
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("calendar_name_active", cdt.OctetString),
@@ -255,16 +256,16 @@ class ActivityCalendar(ic.COSEMInterfaceClasses):
     def get_index_with_attributes(self, in_init_order: bool = False) -> Iterator[tuple[int, cdt.CommonDataType | None]]:
         """ override common method """
         if in_init_order:
-            return iter(((1, self.get_attr(1)),
-                        (2, self.get_attr(2)),
-                        (5, self.get_attr(5)),
-                        (4, self.get_attr(4)),
-                        (3, self.get_attr(3)),
-                        (6, self.get_attr(6)),
-                        (9, self.get_attr(9)),
-                        (8, self.get_attr(8)),
-                        (7, self.get_attr(7)),
-                        (10, self.get_attr(10))))
+            return iter(((1, self.get_attr_link(1)),
+                        (2, self.get_attr_link(2)),
+                        (5, self.get_attr_link(5)),
+                        (4, self.get_attr_link(4)),
+                        (3, self.get_attr_link(3)),
+                        (6, self.get_attr_link(6)),
+                        (9, self.get_attr_link(9)),
+                        (8, self.get_attr_link(8)),
+                        (7, self.get_attr_link(7)),
+                        (10, self.get_attr_link(10))))
         else:
             return super(ActivityCalendar, self).get_index_with_attributes()
 
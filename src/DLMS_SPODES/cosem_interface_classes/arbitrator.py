@@ -9,6 +9,7 @@ class Actions(cdt.Array):
 
 class ActorPermissions(cdt.BitString):
     """TODO: """
+    __slots__ = tuple()
 
 
 class PermissionsTable(cdt.Array):
@@ -19,6 +20,7 @@ class PermissionsTable(cdt.Array):
 
 class ActorActionWeight(cdt.LongUnsigned):
     """TODO: make any thing"""
+    __slots__ = tuple()
 
 
 class ActorWeightingList(cdt.Array):
@@ -31,6 +33,7 @@ class WeightingsTable(cdt.Array):
 
 class MostRecentRequest(cdt.BitString):
     """TODO: """
+    __slots__ = tuple()
 
 
 class MostRecentRequestTable(cdt.Array):
@@ -45,6 +48,7 @@ class RequestAction(cdt.Structure):
 
 class Arbitrator(ic.COSEMInterfaceClasses):
     """DLMS UA 1000-1 Ed. 14 4.5.12 Arbitrator"""
+    __slots__ = tuple()
     CLASS_ID = classID.ARBITRATOR
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("actions", Actions),
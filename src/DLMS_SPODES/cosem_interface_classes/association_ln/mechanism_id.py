@@ -2,6 +2,7 @@ from ...types import cdt
 
 
 class MechanismIdElement(cdt.Enum, elements=tuple(range(8))):
+    __slots__ = tuple()
     TAG = b'\x11'
 
 
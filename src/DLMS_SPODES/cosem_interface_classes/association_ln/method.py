@@ -3,3 +3,4 @@ from ...types import cdt
 
 class ReplyToHLSAuthentication(cdt.OctetString):
     """"""  # todo: make validate by contents
+    __slots__ = tuple()
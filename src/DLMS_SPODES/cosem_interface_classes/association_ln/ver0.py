@@ -1,15 +1,19 @@
+from dataclasses import dataclass, field
 from enum import IntFlag, auto
+from itertools import chain
+from typing import Any, Self, Type
 from ... import exceptions as exc
 from ..__class_init__ import *
 from ...types import choices, cosemObjectInstanceId
 from ...types.implementations import arrays, enums, bitstrings, long_unsigneds, structs
 from ... import pdu_enums as pdu
 from . import mechanism_id, authentication_mechanism_name
-import method
+from . import method
 
 
 class AccessMode(cdt.Enum, elements=(0, 1, 2, 3)):
     """ TODO: """
+    __slots__ = tuple()
     def is_writable(self) -> bool:
         return True if int(self) >= 2 else False
 
@@ -17,7 +21,42 @@ class AccessMode(cdt.Enum, elements=(0, 1, 2, 3)):
         return True if int(self) in (1, 3) else False
 
 
-class AttributeAccessItem(cdt.Structure):
+class ObservedStructure:
+    """ mixin for object_list element parts: call cb_post_set after in place change. Keep access rights matrix of ObjectListType actual """
+    def _notify(self):
+        if hasattr(self, "cb_post_set"):
+            self.cb_post_set()
+
+    def __setitem__(self, key: int, value: cdt.CommonDataType):
+        super(ObservedStructure, self).__setitem__(key, value)
+        self._notify()
+
+
+class ObservedArray(ObservedStructure):
+    """ ObservedStructure with change by array methods """
+    def append(self, element: cdt.CommonDataType | None | Any = None):
+        super(ObservedArray, self).append(element)
+        self._notify()
+
+    def insert(self, index: int, element: cdt.CommonDataType):
+        super(ObservedArray, self).insert(index, element)
+        self._notify()
+
+    def remove(self, element: cdt.CommonDataType):
+        super(ObservedArray, self).remove(element)
+        self._notify()
+
+    def pop(self, index: int = -1) -> cdt.CommonDataType:
+        element = super(ObservedArray, self).pop(index)
+        self._notify()
+        return element
+
+    def clear(self):
+        super(ObservedArray, self).clear()
+        self._notify()
+
+
+class AttributeAccessItem(ObservedStructure, cdt.Structure):
     """ Implemented attribute and it access . Use in Association LN """
     DEFAULT = b'\x02\x03\x0f\x01\x16\x00\x00'
     attribute_id: cdt.Integer
@@ -25,86 +64,160 @@ class AttributeAccessItem(cdt.Structure):
     access_selectors: choices.access_selectors
 
 
-class AttributeAccessDescriptor(cdt.Array):
+class AttributeAccessDescriptor(ObservedArray, cdt.Array):
     """ Array of attribute_access_item """
     TYPE = AttributeAccessItem
 
 
-class MethodAccessItem(cdt.Structure):
+class MethodAccessItem(ObservedStructure, cdt.Structure):
     """ Implemented method and it access . Use in Association LN """
     method_id: cdt.Integer
     access_mode: cdt.Boolean
 
 
-class MethodAccessDescriptor(cdt.Array):
+class MethodAccessDescriptor(ObservedArray, cdt.Array):
     """ Contain all implemented methods """
     TYPE = MethodAccessItem
 
 
-class AccessRight(cdt.Structure):
+class AccessRight(ObservedStructure, cdt.Structure):
     """ TODO: """
     attribute_access: AttributeAccessDescriptor
     method_access: MethodAccessDescriptor
 
 
-class ObjectListElement(structs.ObjectListElement, access_rights=AccessRight):
+class ObjectListElement(ObservedStructure, structs.ObjectListElement, access_rights=AccessRight):
     """ Visible COSEM objects with their class_id, version, logical name and the access rights to their attributes and methods within the given application association"""
 
 
+_ABSENT_ACCESS = 0xff
+"""marker of absent attribute or method index in access rights matrix"""
+_ATTRIBUTE_ACCESSES = tuple(pdu.AttributeAccess)
+_METHOD_ACCESSES = tuple(pdu.MethodAccess)
+
+
+def get_access_row(items: AttributeAccessDescriptor | MethodAccessDescriptor) -> bytes:
+    """return access modes by attribute(method) index. Absent index is _ABSENT_ACCESS"""
+    row = bytearray()
+    for id_, mode in (item.values[:2] for item in items):
+        if (i := int(id_)) < 0:
+            continue
+        elif i >= len(row):
+            row.extend(bytes((_ABSENT_ACCESS,)) * (i + 1 - len(row)))
+        row[i] = int(mode)
+    return bytes(row)
+
+
 class ObjectListType(arrays.SelectionAccess):
     """ Array of object_list_element. The range for the client_SAP is 0…0x7F. The range for the server_SAP is 0x000…0x3FFF."""
     TYPE = ObjectListElement
     __getitem__: ObjectListElement
+    WRITABLE_MODES: frozenset[int] = frozenset((2, 3))
+    generation: int
+    """increment by each change of elements. For invalidate access rights matrix and caches depending on object list"""
+    __matrix: dict[bytes, tuple[ObjectListElement, bytes, bytes]]
+    """access rights matrix: LN -> (element, attribute access modes, method access modes) by index. First element in list order by LN duplicates"""
+    __class_index: dict[int, list[ObjectListElement]]
+    """class_id -> elements"""
+    __matrix_generation: int = -1
+    """generation of matrix, build by first request after change. In place change of elements increment generation by cb_post_set of their parts"""
+
+    def __init__(self, value: bytes | list | None | Self = None, type_: Type[cdt.CommonDataType] = None):
+        self.generation = 0
+        super(ObjectListType, self).__init__(value, type_)
+
+    def __getstate__(self):
+        """without matrix, callbacks of elements not kept"""
+        state = super(ObjectListType, self).__getstate__()
+        for name in ("_ObjectListType__matrix", "_ObjectListType__class_index", "_ObjectListType__matrix_generation"):
+            state.pop(name, None)
+        return state
+
+    def __touch(self):
+        self.generation += 1
+
+    def __get_matrix(self) -> dict[bytes, tuple[ObjectListElement, bytes, bytes]]:
+        if self.__matrix_generation != self.generation:
+            self.__matrix = dict()
+            self.__class_index = dict()
+            touch = self.__touch
+            for element in self.values:
+                access_rights = element.access_rights
+                for part in (element, element.class_id, element.logical_name, access_rights, access_rights.attribute_access, access_rights.method_access):
+                    part.register_cb_post_set(touch)
+                for item in chain(access_rights.attribute_access, access_rights.method_access):
+                    item.register_cb_post_set(touch)
+                    item.values[0].register_cb_post_set(touch)
+                    item.values[1].register_cb_post_set(touch)
+                self.__matrix.setdefault(element.logical_name.contents, (
+                    element,
+                    get_access_row(element.access_rights.attribute_access),
+                    get_access_row(element.access_rights.method_access)))
+                self.__class_index.setdefault(int(element.class_id), list()).append(element)
+            self.__matrix_generation = self.generation
+        return self.__matrix
+
+    def append(self, element: ObjectListElement | None | Any = None):
+        super(ObjectListType, self).append(element)
+        self.generation += 1
+
+    def insert(self, index: int, element: ObjectListElement):
+        super(ObjectListType, self).insert(index, element)
+        self.generation += 1
+
+    def remove(self, element: ObjectListElement):
+        super(ObjectListType, self).remove(element)
+        self.generation += 1
+
+    def pop(self, index: int = -1) -> ObjectListElement:
+        element = super(ObjectListType, self).pop(index)
+        self.generation += 1
+        return element
+
+    def clear(self):
+        super(ObjectListType, self).clear()
+        self.generation += 1
+
+    def __get_row(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId) -> tuple[ObjectListElement, bytes, bytes]:
+        if (row := self.__get_matrix().get(ln.contents)) is None:
+            raise exc.NoObject(F"not find {ln} in object_list")
+        else:
+            return row
+
+    def get_element(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId) -> ObjectListElement:
+        """return object_list_element by logical name"""
+        return self.__get_row(ln)[0]
+
+    def get_elements_by_class_id(self, value: int) -> tuple[ObjectListElement, ...]:
+        self.__get_matrix()
+        return tuple(self.__class_index.get(value, ()))
 
     def is_writable(self, ln: cst.LogicalName, indexes: set[int]) -> bool:
         """ index - DLMS object attribute index.
          True: AccessRight is WriteOnly or ReadAndWrite """
-        el: ObjectListElement = next(filter(lambda it: it.logical_name == ln, self), None)
-        if el is None:
-            raise exc.NoObject(F"not find {ln} in object_list")
-        item: AttributeAccessItem
+        row = self.__get_row(ln)[1]
         for index in indexes:
-            for item in el.access_rights.attribute_access:
-                if int(item.attribute_id) == index:
-                    if int(item.access_mode) not in (2, 3):
-                        return False
-                    else:
-                        break
-                else:
-                    continue
-            else:
+            if index >= len(row) or row[index] == _ABSENT_ACCESS:
                 raise ValueError(F"not find in {ln} attribute index: {index}")
+            elif row[index] not in self.WRITABLE_MODES:
+                return False
         return True
 
-    def __get_access_right(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId) -> AccessRight:
-        """return object_list_element of object_list AssociationLN"""
-        el: ObjectListElement = next(filter(lambda it: it.logical_name == ln, self), None)
-        if el is None:
-            raise exc.NoObject(F"not find {ln} in object_list")
-        else:
-            return el.access_rights
-
-    def get_attr_access(self, ln: cst.LogicalName, index: int) -> pdu.AttributeAccess:
+    def get_attr_access(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId, index: int) -> pdu.AttributeAccess:
         """ index - DLMS object attribute index """
-        for item in self.__get_access_right(ln).attribute_access:  # item: AttributeAccessItem
-            item: AttributeAccessItem
-            if int(item.attribute_id) == index:
-                return pdu.AttributeAccess(int(item.access_mode))
-            else:
-                continue
+        row = self.__get_row(ln)[1]
+        if index < len(row) and (mode := row[index]) != _ABSENT_ACCESS:
+            return _ATTRIBUTE_ACCESSES[mode]
         else:
             raise ValueError(F"not find in {ln} attribute index: {index}")
 
-    def get_meth_access(self, ln: cst.LogicalName | ut.CosemObjectInstanceId, index: int) -> pdu.MethodAccess:
+    def get_meth_access(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId, index: int) -> pdu.MethodAccess:
         """ index - DLMS object method index """
-        for item in self.__get_access_right(ln).method_access:  # item: MethodAccessItem
-            item: MethodAccessItem
-            if int(item.method_id) == index:
-                return pdu.MethodAccess(int(item.access_mode))
-            else:
-                continue
+        row = self.__get_row(ln)[2]
+        if index < len(row) and (mode := row[index]) != _ABSENT_ACCESS:
+            return _METHOD_ACCESSES[mode]
         else:
-            raise ValueError(F"not find in {ln} attribute index: {index}")
+            raise ValueError(F"not find in {ln} method index: {index}")
 
 
 class AssociatedPartnersType(cdt.Structure):
@@ -141,6 +254,7 @@ class XDLMSContextType(cdt.Structure):
 
 class AssociationStatus(cdt.Enum, elements=(0, 1, 2)):
     """ Enum of access mode for methods """
+    __slots__ = tuple()
 
 
 class ClassList(cdt.Array):
@@ -169,6 +283,7 @@ class Representation(IntFlag):
 
 class LLCSecret(cdt.OctetString):
     """ representation for secret """
+    __slots__ = tuple()
     __representation: Representation = Representation.HEX
     # used for set class property from instance
 
@@ -212,6 +327,7 @@ class LLCSecret(cdt.OctetString):
 
 
 class LLCSecretHigh(LLCSecret):
+    __slots__ = tuple()
     DEFAULT = b'0000000000000000'
 
     def validation(self):
@@ -248,11 +364,12 @@ class Data(ut.Data):
                 4: ut.SequenceElement('Full object information', ObjectId)}
 
 
+@dataclass
 class SelectiveAccessDescriptor(ut.SelectiveAccessDescriptor):
     """ Selective access specification always starts with an access selector, followed by an access-specific access parameter list.
-    Specified IS/IEC 62056-53 : 2006, 7.4.1.6 Selective access """
-    access_selector: AccessSelector
-    access_parameters: Data
+    Specified IS/IEC 62056-53 : 2006, 7.4.1.6 Selective access. Default is <All information> """
+    access_selector: AccessSelector = field(default_factory=AccessSelector)
+    access_parameters: Data = field(default_factory=cdt.NullData)
     ELEMENTS = (ut.SequenceElement('access_selector', AccessSelector),
                 ut.SequenceElement('access_parameters', Data))
 
@@ -267,6 +384,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
     """ COSEM logical devices able to establish application associations within a COSEM context using logical name referencing, model the associations
     through instances of the “Association LN” class. A COSEM logical device has one instance of this IC for each association
     the device is able to support"""
+    __slots__ = tuple()
     CLASS_ID = classID.ASSOCIATION_LN
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("object_list", ObjectListType, selective_access=SelectiveAccessDescriptor),
@@ -289,7 +407,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
         self.set_attr(5, None)
         self.set_attr(8, None)
         # init secret after set authentication_mechanism_name(6)
-        self._cbs_attr_post_init.update({
+        self._add_cbs_attr_post_init({
             2: self.__set_to_collection,
             5: self.__check_dlms_version_with_collection,
             6: self.__init_secret,
@@ -339,10 +457,22 @@ class AssociationLN(ic.COSEMInterfaceClasses):
     def remove_object(self) -> ObjectListElement:
         return self.get_meth(4)
 
+    def get_attr_access(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId, index: int) -> pdu.AttributeAccess:
+        """ index - DLMS object attribute index. Search in object_list index """
+        self.__check_empty_object_list()
+        return self.get_attr_link(2).get_attr_access(ln, index)
+
+    def get_meth_access(self, ln: cst.LogicalName | cosemObjectInstanceId.CosemObjectInstanceId, index: int) -> pdu.MethodAccess:
+        """ index - DLMS object method index. Search in object_list index """
+        self.__check_empty_object_list()
+        return self.get_attr_link(2).get_meth_access(ln, index)
+
     def __set_to_collection(self):
         """add object to collection if it absense"""
-        self.object_list.selective_access = SelectiveAccessDescriptor()
-        for obj_list_el in self.object_list:
+        object_list = self.get_attr_link(2)
+        if object_list.selective_access is None:
+            object_list.selective_access = SelectiveAccessDescriptor()
+        for obj_list_el in object_list:
             obj_list_el: ObjectListElement
             self.collection.add_if_missing(
                 class_id=ut.CosemClassId(int(obj_list_el.class_id)),
@@ -354,7 +484,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
         """check for existing mechanism ID else ERASE setting"""
         if self.authentication_mechanism_name is None:
             self.clear_attr(7)
-            self._cbs_attr_post_init[7] = self.__check_mechanism_id_existing
+            self._add_cbs_attr_post_init({7: self.__check_mechanism_id_existing})
         else:
             """nothing do it"""
 
@@ -385,12 +515,14 @@ class AssociationLN(ic.COSEMInterfaceClasses):
                 match association.object_list:
                     case ObjectListType():
                         ret = list()
+                        used = set()
                         for obj_list_type in association.object_list:
                             try:
                                 obj = self.collection.get_object(obj_list_type)
-                                if obj in ret:
+                                if obj in used:
                                     print(F'Double intersection {obj}')
                                 else:
+                                    used.add(obj)
                                     ret.append(obj)
                             except exc.NoObject as e:
                                 print(F'DLMS object not append to client object list. {e}')
@@ -410,18 +542,18 @@ class AssociationLN(ic.COSEMInterfaceClasses):
         """ with selection for object_list. TODO: Copypast ProfileGeneric"""
         descriptor: ut.CosemAttributeDescriptor = super(AssociationLN, self).get_attr_descriptor(value)
         if value == 2 and with_selection:
-            return CosemAttributeDescriptorWithSelection((descriptor, self.object_list.selective_access))
+            return CosemAttributeDescriptorWithSelection(descriptor, self.object_list.selective_access)
         else:
             return descriptor
 
     def get_objects(self) -> list[ic.COSEMInterfaceClasses]:
         ret = list()
-        for el in self.object_list:
+        for el in self.get_attr_link(2):
             ret.append(self.collection.get_object(el.logical_name))
         return ret
 
     def __check_empty_object_list(self):
-        if self.object_list is None:
+        if self.get_attr_link(2) is None:
             raise exc.ITEApplication(F"empty <{self.get_attr_element(2).NAME}> in {self}")
 
     def is_readable(self,
@@ -429,8 +561,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
                     index: int,
                     security_policy: pdu.SecurityPolicy = pdu.SecurityPolicyVer0.NOTHING
                     ) -> bool:
-        self.__check_empty_object_list()
-        match self.object_list.get_attr_access(ln, index):
+        match self.get_attr_access(ln, index):
             case pdu.AttributeAccess.NO_ACCESS | pdu.AttributeAccess.WRITE_ONLY | pdu.AttributeAccess.AUTHENTICATED_WRITE_ONLY:
                 return False
             case pdu.AttributeAccess.READ_ONLY | pdu.AttributeAccess.READ_AND_WRITE:
@@ -457,8 +588,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
                     index: int,
                     security_policy: pdu.SecurityPolicy = pdu.SecurityPolicyVer0.NOTHING
                     ) -> bool:
-        self.__check_empty_object_list()
-        match self.object_list.get_attr_access(ln, index):
+        match self.get_attr_access(ln, index):
             case pdu.AttributeAccess.NO_ACCESS | pdu.AttributeAccess.READ_ONLY | pdu.AttributeAccess.AUTHENTICATED_READ_ONLY:
                 return False
             case pdu.AttributeAccess.WRITE_ONLY | pdu.AttributeAccess.READ_AND_WRITE:
@@ -485,8 +615,7 @@ class AssociationLN(ic.COSEMInterfaceClasses):
                       m_id: mechanism_id.MechanismIdElement = None
                       ) -> bool:
         """for ver 0 and 1 only"""
-        self.__check_empty_object_list()
-        match self.object_list.get_meth_access(ln, index):
+        match self.get_meth_access(ln, index):
             case pdu.MethodAccess.NO_ACCESS:
                 return False
             case pdu.MethodAccess.ACCESS:
@@ -8,6 +8,7 @@ from . import authentication_mechanism_name
 
 class AccessMode(cdt.Enum, elements=tuple(range(7))):
     """Version 0 extension"""
+    __slots__ = tuple()
     def is_writable(self) -> bool:
         return True if int(self) in (2, 3, 5, 6) else False
 
@@ -17,65 +18,39 @@ class AccessMode(cdt.Enum, elements=tuple(range(7))):
 
 class AccessModeMeth(cdt.Enum, elements=(0, 1, 2)):
     """ Enum of access mode for methods """
+    __slots__ = tuple()
 
 
-# TODO: make as subclass of ver0
-class AttributeAccessItem(cdt.Structure):
+class AttributeAccessItem(ver0.AttributeAccessItem, access_mode=AccessMode):
     """ Implemented attribute and it access . Use in Association LN """
-    attribute_id: cdt.Integer
-    access_mode: AccessMode
-    access_selectors: choices.access_selectors
+    DEFAULT = None
 
 
-class AttributeAccessDescriptor(cdt.Array):
+class AttributeAccessDescriptor(ver0.AttributeAccessDescriptor):
     """ Array of attribute_access_item """
     TYPE = AttributeAccessItem
 
 
-# TODO: make as subclass of ver0
-class MethodAccessItem(cdt.Structure):
+class MethodAccessItem(ver0.MethodAccessItem, access_mode=AccessModeMeth):
     """ Implemented method and it access . Use in Association LN """
-    method_id: cdt.Integer
-    access_mode: AccessModeMeth
 
 
-class MethodAccessDescriptor(cdt.Array):
+class MethodAccessDescriptor(ver0.MethodAccessDescriptor):
     """ Contain all implemented methods """
     TYPE = MethodAccessItem
 
 
-class AccessRight(cdt.Structure):
+class AccessRight(ver0.AccessRight, attribute_access=AttributeAccessDescriptor, method_access=MethodAccessDescriptor):
     """ TODO: """
-    attribute_access: AttributeAccessDescriptor
-    method_access: MethodAccessDescriptor
 
 
-class ObjectListElement(structs.ObjectListElement, access_rights=AccessRight):
+class ObjectListElement(ver0.ObjectListElement, access_rights=AccessRight):
     """"""
 
 
 class ObjectListType(ver0.ObjectListType):
     TYPE = ObjectListElement
-
-    def is_writable(self, ln: cst.LogicalName, indexes: set[int]) -> bool:
-        """ index - DLMS object attribute index.
-         True: AccessRight is WriteOnly or ReadAndWrite """
-        el: ObjectListElement = next(filter(lambda it: it.logical_name == ln, self), None)
-        if el is None:
-            raise exc.NoObject(F"not find {ln} in object_list")
-        item: AttributeAccessItem
-        for index in indexes:
-            for item in el.access_rights.attribute_access:
-                if int(item.attribute_id) == index:
-                    if int(item.access_mode) not in (2, 3, 5, 6):
-                        return False
-                    else:
-                        break
-                else:
-                    continue
-            else:
-                raise ValueError(F"not find in {ln} attribute index: {index}")
-        return True
+    WRITABLE_MODES = frozenset((2, 3, 5, 6))
 
 
 class ContextNameType(cdt.AXDR, ver0.ApplicationContextName):
@@ -94,6 +69,7 @@ class AssociationLN(ver0.AssociationLN):
     """ COSEM logical devices able to establish application associations within a COSEM context using logical name referencing, model the associations
     through instances of the “Association LN” class. A COSEM logical device has one instance of this IC for each association
     the device is able to support"""
+    __slots__ = tuple()
     VERSION = Version.V1
     A_ELEMENTS = (ic.ICAElement("object_list", ObjectListType, selective_access=ver0.SelectiveAccessDescriptor),
                   ver0.AssociationLN.get_attr_element(3),
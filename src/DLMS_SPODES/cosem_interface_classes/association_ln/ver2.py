@@ -6,6 +6,7 @@ class AssociationLN(ver1.AssociationLN):
     """ COSEM logical devices able to establish application associations within a COSEM context using logical name referencing, model the associations
     through instances of the “Association LN” class. A COSEM logical device has one instance of this IC for each association
     the device is able to support"""
+    __slots__ = tuple()
     VERSION = Version.V2
 
     def characteristics_init(self):
@@ -3,6 +3,7 @@ from ..__class_init__ import *
 
 class AssociationSN(ic.COSEMInterfaceClasses):
     """dummy class"""
+    __slots__ = tuple()
     CLASS_ID = classID.ASSOCIATION_SN
 
     def __new__(cls, *args, **kwargs):
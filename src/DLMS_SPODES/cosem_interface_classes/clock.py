@@ -5,6 +5,7 @@ from ..types.implementations import integers
 
 class ClockStatus(cdt.Unsigned):
     """ interpreted as 8 bit string """
+    __slots__ = tuple()
 
     # TODO: finish write as bit_string
     def __str__(self):
@@ -28,10 +29,12 @@ class ClockStatus(cdt.Unsigned):
 class DaylightSavingsDeviation(cdt.Integer, min=-120, max=120):
     """Contains the number of minutes by which the deviation in generalized time must be corrected at daylight savings begin.
     Deviation range of up to ± 120 min"""
+    __slots__ = tuple()
 
 
 class ClockBase(cdt.Enum, elements=(0, 1, 2, 3, 4, 5)):
     """ Defines where the basic timing information comes from. """
+    __slots__ = tuple()
 
 
 class PresetAdjustingTime(cdt.Structure):
@@ -45,6 +48,7 @@ class PresetAdjustingTime(cdt.Structure):
 
 class ShiftTime(cdt.Long, min=-900, max=900):
     """ Limited Long -900..900 """
+    __slots__ = tuple()
 
 
 class Clock(ic.COSEMInterfaceClasses):
@@ -55,8 +59,10 @@ class Clock(ic.COSEMInterfaceClasses):
     generalized time reference.
     It also handles the daylight saving function in that way; i.e. it modifies the deviation of local time to GMT depending on the attributes.
     The start and end point of that function is normally set once. An internal algorithm calculates the real switch point depending on these settings. """
+    __slots__ = tuple()
     CLASS_ID = classID.CLOCK
     VERSION = Version.V0
+    cardinality = (0, 1)
     A_ELEMENTS = (ic.ICAElement("time", cst.OctetStringDateTime, classifier=ic.Classifier.DYNAMIC),
                   ic.ICAElement("time_zone", cdt.Long, -720, 840),
                   ic.ICAElement("status", ClockStatus, classifier=ic.Classifier.DYNAMIC),
@@ -73,7 +79,7 @@ class Clock(ic.COSEMInterfaceClasses):
                   ic.ICMElement("shift_time", ShiftTime))
 
     def characteristics_init(self):
-        self.cardinality = (0, 1)
+        """nothing do it"""
 
     @property
     def time(self) -> cst.OctetStringDateTime:
@@ -4,13 +4,20 @@ usage of those definitions in the COSEM environment. All codes, which are not ex
 reserved for future use."""
 from __future__ import annotations
 import os
+import sys
 import copy
+import pickle
+import hashlib
+import json
+from bisect import bisect_right
+from multiprocessing import shared_memory
 from struct import pack
 import datetime
 from dataclasses import dataclass
+from contextlib import contextmanager
 from itertools import count, chain
 from functools import reduce, cached_property, lru_cache
-from typing import TypeAlias, Iterator, Type, Self, Callable, Literal
+from typing import TypeAlias, Iterator, Iterable, Type, Self, Callable, Literal
 import logging
 from ..version import AppVersion
 from ..types import (
@@ -28,7 +35,7 @@ from .activity_calendar import ActivityCalendar
 from .arbitrator import Arbitrator
 from .association_ln import mechanism_id
 from .association_sn.ver0 import AssociationSN as AssociationSNVer0
-from .association_ln.ver0 import AssociationLN as AssociationLNVer0, ObjectListElement
+from .association_ln.ver0 import AssociationLN as AssociationLNVer0, ObjectListElement, ObjectListType
 from .association_ln.ver1 import AssociationLN as AssociationLNVer1
 from .association_ln.ver2 import AssociationLN as AssociationLNVer2
 from .push_setup.ver0 import PushSetup as PushSetupVer0
@@ -64,6 +71,7 @@ from .single_action_schedule import SingleActionSchedule
 from .special_days_table import SpecialDaysTable
 from .tcp_udp_setup import TCPUDPSetup
 from .. import exceptions as exc
+from .. import settings
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 from ..relation_to_OBIS import get_name
@@ -72,7 +80,7 @@ from ..cosem_interface_classes.overview import Version, CountrySpecificIdentifie
 from ..enums import TagsName
 from . import obis as o
 from .. import pdu_enums as pdu
-from ..config_parser import config
+from ..config_parser import config, get_values
 from ..obis import media_id
 
 LNContaining: TypeAlias = bytes | str | cst.LogicalName | cdt.Structure | ut.CosemAttributeDescriptor | ut.CosemAttributeDescriptorWithSelection \
@@ -540,31 +548,61 @@ __func_map_for_create.update({
 func_maps["KPZ1"]: FUNC_MAP = get_func_map(__func_map_for_create)
 
 
+_MANUFACTURE_RANGES: tuple[bytes, ...] = (
+    bytes(256),
+    bytes(128 <= i <= 199 for i in range(256)),
+    bytes(128 <= i <= 199 or i == 240 for i in range(256)),
+    bytes(128 <= i <= 254 for i in range(256)),
+    bytes(128 <= i <= 254 for i in range(256)),
+    bytes(128 <= i <= 254 for i in range(256)))
+"""flags of manufacturer specific values by groups A..F. DLMS UA 1000-1 Ed. 14 Table 54"""
+
+
+def get_class_map(contents: bytes, func_map: FUNC_MAP) -> dict[int, CosemClassMap]:
+    """fallback chain of func_map by LN contents: manufacture objects in BCDE, other in CDE, CD, BCDE, D groups"""
+    r = _MANUFACTURE_RANGES
+    if r[1][contents[1]] or r[2][contents[2]] or r[3][contents[3]] or r[4][contents[4]] or r[5][contents[5]]:
+        return func_map.get(contents[:5], common_interface_class_map)
+    a = contents[:1]
+    return (
+        func_map.get(a + contents[2:5])
+        or func_map.get(a + contents[2:4])
+        or func_map.get(contents[:5])
+        or func_map.get(a + contents[3:4], common_interface_class_map)
+    )
+
+
 def get_type(class_id: CosemClassId,
              version: cdt.Unsigned | None,
              ln: cst.LogicalName,
              func_map: FUNC_MAP) -> Type[InterfaceClass]:
     """use DLMS UA 1000-1 Ed. 14 Table 54"""
-    if (128 <= ln.b <= 199) or (128 <= ln.c <= 199) or ln.c == 240 or (128 <= ln.d <= 254) or (128 <= ln.e <= 254) or (128 <= ln.f <= 254):
-        # try search in BCDE group for manufacture object before in CDE
-        c_m = func_map.get((ln.contents[:5]), common_interface_class_map)
-    else:
-        # try search in CDE group
-        c_m = func_map.get((ln.contents[:1]+ln.contents[2:5]), None)
-        if not c_m:
-            # try search in CD group
-            c_m = func_map.get((ln.contents[:1]+ln.contents[2:4]), None)
-            if not c_m:
-                # try search in BCDE group
-                c_m = func_map.get((ln.contents[:5]), None)
-                if not c_m:
-                    # try search in C group
-                    c_m = func_map.get((ln.contents[:1]+ln.contents[3:4]), common_interface_class_map)
-    return get_interface_class(class_map=c_m,
+    return get_interface_class(class_map=get_class_map(ln.contents, func_map),
                                c_id=class_id,
                                ver=version)
 
 
+NAMES_AND_TYPES_CACHE_SIZE: int = 10_000
+"""bound of capture objects names and types cache"""
+_names_and_types: dict[tuple, tuple[tuple[str, ...], Type[cdt.CommonDataType]]] = dict()
+"""(class, LN contents, attribute index, data index, attribute type, language) -> (names, type). Common for all collections"""
+
+
+def _get_name_and_type(obj: InterfaceClass,
+                       attr_index: int,
+                       data_index: int,
+                       data_type: Type[cdt.CommonDataType]) -> tuple[tuple[str, ...], Type[cdt.CommonDataType]]:
+    names = [get_name(obj.logical_name), str(obj.get_attr_element(attr_index))]
+    if data_index != 0 and issubclass(data_type, cdt.Structure):
+        if len(data_type.ELEMENTS) < data_index:
+            raise ValueError(F"can't create buffer_struct_type for {obj}, got {data_index=} in struct {data_type.__name__}, expected 1..{len(data_type.ELEMENTS)}")
+        else:
+            el: cdt.StructElement = data_type.ELEMENTS[data_index - 1]
+            names.append(el.NAME)
+            data_type = el.TYPE
+    return tuple(names), data_type
+
+
 class Collection:
     __dlms_ver: int
     __manufacturer: bytes | None
@@ -576,6 +614,14 @@ class Collection:
     __const_objs: int
     __spec: str
     __collection_ver: AppVersion | None
+    __types: dict[tuple[int, int, bytes], Type[InterfaceClass]]
+    TYPES_CACHE_SIZE: int = 10_000
+    """bound of resolved types cache by (class_id, version, LN)"""
+    __generation: int
+    """increment by add or remove objects"""
+    __attr_trees: dict[tuple, tuple[int, ObjectListType, int, dict]]
+    """get_attr_tree arguments with language -> (collection generation, object_list, object_list generation, tree)"""
+    __transaction: ic.Transaction | None
 
     def __init__(self,
                  country: CountrySpecificIdentifiers = CountrySpecificIdentifiers.RUSSIA,
@@ -590,6 +636,10 @@ class Collection:
         self.__server_ver = dict()
         """key: instance of 0.b.2.0.1.255, value AppVersion"""
         self.__spec = "DLMS_6"
+        self.__types = dict()
+        self.__generation = 0
+        self.__attr_trees = dict()
+        self.__transaction = None
         self.__container = dict()
         """ all DLMS objects container with obis key """
         ldn_obj = self.add(
@@ -619,7 +669,7 @@ class Collection:
             new_collection.__container[obj.logical_name.contents] = new_obj
             new_obj.collection = new_collection
             if obj.CLASS_ID == classID.ASSOCIATION_LN:
-                if max_ass is None or (obj.object_list and len(max_ass.object_list) < len(obj.object_list)):
+                if max_ass is None or ((object_list := obj.get_attr_link(2)) and len(max_ass.get_attr_link(2)) < len(object_list)):
                     max_ass = obj
         obj_for_set = max_ass.get_objects()
         ass_id: int = max_ass.logical_name.e
@@ -644,6 +694,65 @@ class Collection:
                     obj_for_set.append(obj)
         return new_collection
 
+    def to_snapshot(self) -> bytes:
+        """serialize to compact bytes: header, objects classes with attributes encoding. Restore by from_snapshot without XML parsing"""
+        objects = list()
+        for obj in self.__container.values():
+            objects.append((
+                obj.__class__,
+                obj.logical_name.contents,
+                tuple((i, value.encoding) for i in range(2, obj.get_attr_length() + 1) if (value := obj.get_attr_link(i)) is not None)))
+        return pickle.dumps((
+            self.__country,
+            self.__dlms_ver,
+            self.__manufacturer,
+            self.__country_ver,
+            self.__collection_ver,
+            None if self.__server_type is None else self.__server_type.encoding,
+            objects
+        ), pickle.HIGHEST_PROTOCOL)
+
+    def __reduce__(self):
+        """pickle as snapshot, objects callbacks and runtime types created again by restore"""
+        return self.__class__.from_snapshot, (self.to_snapshot(),)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes | memoryview) -> Self:
+        """create collection from to_snapshot result"""
+        country, dlms_ver, manufacturer, country_ver, collection_ver, server_type, objects = pickle.loads(data)
+        new = cls(country)
+        new.set_dlms_ver(dlms_ver)
+        new.set_manufacturer(manufacturer)
+        new.set_country_ver(country_ver)
+        new.set_collection_ver(collection_ver)
+        if server_type is not None:
+            new.set_server_type(cdt.get_instance_and_pdu_from_value(server_type)[0])
+        new.set_spec()
+        values: list[tuple[InterfaceClass, int, bytes]] = list()
+        for obj_class, ln, attrs in objects:
+            new_obj: InterfaceClass = obj_class(cst.LogicalName(bytearray(ln)))
+            new.__container[ln] = new_obj
+            new_obj.collection = new
+            values.extend((new_obj, i, encoding) for i, encoding in attrs)
+        attempts: iter = count(3, -1)
+        """ attempts counter, as from_xml """
+        while values and next(attempts):
+            failed = list()
+            for new_obj, i, encoding in values:
+                try:
+                    new_obj.set_attr(i, encoding)
+                except ut.UserfulTypesException as e:
+                    new_obj.set_attr_force(i, cdt.get_instance_and_pdu_from_value(encoding)[0])
+                    logger.warning(F"set to {new_obj} attr: {i} forced value. {e}.")
+                except Exception as e:
+                    if (value := new_obj.get_attr(i)) is None or value.encoding != encoding:
+                        failed.append((new_obj, i, encoding))
+                        logger.info(F"can't set {new_obj} attr: {i} from snapshot, try after. {e}")
+            values = failed
+        for new_obj, i, _ in values:
+            logger.error(F"Can't fill {new_obj} attr: {i} from snapshot")
+        return new
+
     @property
     def dlms_ver(self):
         return self.__dlms_ver
@@ -866,44 +975,47 @@ class Collection:
                             continue
                         indexes: list[int] = list()
                         """ got attributes indexes for current object """
-                        for attr in obj.findall('attribute'):
-                            index: str = attr.attrib.get('index')
-                            if index.isdigit():
-                                indexes.append(int(index))
-                            else:
-                                raise ValueError(F'ERROR: for {new_object.logical_name if new_object is not None else ""} got index {index} and it is not digital')
-                            try:
-                                match len(attr.text), new_object.get_attr_element(indexes[-1]).DATA_TYPE:
-                                    case 1 | 2, ut.CHOICE():
-                                        if new_object.get_attr(indexes[-1]) is None:
-                                            new_object.set_attr(indexes[-1], int(attr.text))
-                                        else:
-                                            """not need set"""
-                                    case 1 | 2, data_type if data_type.TAG[0] == int(attr.text): """ ordering by old"""
-                                    case 1 | 2, data_type:                                       raise ValueError(F'Got {attr.text} attribute Tag, expected {data_type}')
-                                    case _:
-                                        record_time: str = attr.attrib.get('record_time')
-                                        if record_time is not None:
-                                            new_object.set_record_time(indexes[-1], bytes.fromhex(record_time))
-                                        new_object.set_attr(indexes[-1], bytes.fromhex(attr.text))
-                                obj.remove(attr)
-                            except ut.UserfulTypesException as e:
-                                if attr.attrib.get("forced", None):
-                                    new_object.set_attr_force(indexes[-1], cdt.get_common_data_type_from(int(attr.text).to_bytes(1, "big"))())
-                                logger.warning(F"set to {new_object} attr: {indexes[-1]} forced value after. {e}.")
-                            except exc.NoObject as e:
-                                logger.error(F"Can't fill {new_object} attr: {indexes[-1]}. Skip. {e}.")
-                                break
-                            except exc.ITEApplication as e:
-                                logger.error(F"Can't fill {new_object} attr: {indexes[-1]}. {e}")
-                            except IndexError:
-                                logger.error(F'Object "{new_object}" not has attr: {index}')
-                            except TypeError as e:
-                                logger.error(F'Object {new_object} attr:{index} do not write, encoding wrong : {e}')
-                            except ValueError as e:
-                                logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
-                            except AttributeError as e:
-                                logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                        with new.begin(strict=False) as tr:
+                            for attr in obj.findall('attribute'):
+                                index: str = attr.attrib.get('index')
+                                if index.isdigit():
+                                    indexes.append(int(index))
+                                else:
+                                    raise ValueError(F'ERROR: for {new_object.logical_name if new_object is not None else ""} got index {index} and it is not digital')
+                                try:
+                                    match len(attr.text), new_object.get_attr_element(indexes[-1]).DATA_TYPE:
+                                        case 1 | 2, ut.CHOICE():
+                                            if new_object.get_attr(indexes[-1]) is None:
+                                                new_object.set_attr(indexes[-1], int(attr.text))
+                                            else:
+                                                """not need set"""
+                                        case 1 | 2, data_type if data_type.TAG[0] == int(attr.text): """ ordering by old"""
+                                        case 1 | 2, data_type:                                       raise ValueError(F'Got {attr.text} attribute Tag, expected {data_type}')
+                                        case _:
+                                            record_time: str = attr.attrib.get('record_time')
+                                            if record_time is not None:
+                                                new_object.set_record_time(indexes[-1], bytes.fromhex(record_time))
+                                            new_object.set_attr(indexes[-1], bytes.fromhex(attr.text))
+                                    obj.remove(attr)
+                                except ut.UserfulTypesException as e:
+                                    if attr.attrib.get("forced", None):
+                                        new_object.set_attr_force(indexes[-1], cdt.get_common_data_type_from(int(attr.text).to_bytes(1, "big"))())
+                                    logger.warning(F"set to {new_object} attr: {indexes[-1]} forced value after. {e}.")
+                                except exc.NoObject as e:
+                                    logger.error(F"Can't fill {new_object} attr: {indexes[-1]}. Skip. {e}.")
+                                    break
+                                except exc.ITEApplication as e:
+                                    logger.error(F"Can't fill {new_object} attr: {indexes[-1]}. {e}")
+                                except IndexError:
+                                    logger.error(F'Object "{new_object}" not has attr: {index}')
+                                except TypeError as e:
+                                    logger.error(F'Object {new_object} attr:{index} do not write, encoding wrong : {e}')
+                                except ValueError as e:
+                                    logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                                except AttributeError as e:
+                                    logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                        for e in tr.errors:
+                            logger.error(F"Can't fill {new_object}: {e}")
                         if len(obj.findall('attribute')) == 0:
                             objects.remove(obj)
                     logger.info(F'Not parsed DLMS objects: {len(objects)}')
@@ -934,44 +1046,47 @@ class Collection:
                         except ValueError as e:
                             logger.error(F'Object {obj.attrib["name"]} not created. {version=} {ln=}: {e}')
                             continue
-                        for attr in obj.findall("attr"):
-                            i: int = int(attr.attrib.get("i"))
-                            try:
-                                if len(attr.text) <= 2:  # set only type with default value
-                                    data_type = new_object.get_attr_element(i).DATA_TYPE
-                                    if isinstance(data_type, ut.CHOICE):
-                                        new_object.set_attr(i, int(attr.text))
-                                    elif data_type == int(attr.text):
-                                        """ ordering by old"""
-                                    else:
-                                        raise ValueError(F'Got {attr.text} attribute Tag, expected {data_type}')
-                                else:  # set common value
-                                    new_object.set_attr(i, bytes.fromhex(attr.text))
-                                    if new_object.CLASS_ID == classID.ASSOCIATION_LN and i == 2:  # setup new objects from AssociationLN.object_list
-                                        for obj_el in new_object.object_list:
-                                            obj_el: ObjectListElement
-                                            new.add_if_missing(
-                                                class_id=obj_el.class_id,
-                                                version=obj_el.version,
-                                                logical_name=obj_el.logical_name)
-                                obj.remove(attr)
-                            except ut.UserfulTypesException as e:
-                                if attr.attrib.get("forced", None):
-                                    new_object.set_attr_force(i, cdt.get_common_data_type_from(int(attr.text).to_bytes(1, "big"))())
-                                logger.warning(F"set to {new_object} attr: {i} forced value after. {e}.")
-                            except exc.NoObject as e:
-                                logger.error(F"Can't fill {new_object} attr: {i}. Skip. {e}.")
-                                break
-                            except exc.ITEApplication as e:
-                                logger.error(F"Can't fill {new_object} attr: {i}. {e}")
-                            except IndexError:
-                                logger.error(F'Object "{new_object}" not has attr: {i}')
-                            except TypeError as e:
-                                logger.error(F'Object {new_object} attr:{i} do not write, encoding wrong : {e}')
-                            except ValueError as e:
-                                logger.error(F'Object {new_object} attr:{i} do not fill: {e}')
-                            except AttributeError as e:
-                                logger.error(F'Object {new_object} attr:{i} do not fill: {e}')
+                        with new.begin(strict=False) as tr:
+                            for attr in obj.findall("attr"):
+                                i: int = int(attr.attrib.get("i"))
+                                try:
+                                    if len(attr.text) <= 2:  # set only type with default value
+                                        data_type = new_object.get_attr_element(i).DATA_TYPE
+                                        if isinstance(data_type, ut.CHOICE):
+                                            new_object.set_attr(i, int(attr.text))
+                                        elif data_type == int(attr.text):
+                                            """ ordering by old"""
+                                        else:
+                                            raise ValueError(F'Got {attr.text} attribute Tag, expected {data_type}')
+                                    else:  # set common value
+                                        new_object.set_attr(i, bytes.fromhex(attr.text))
+                                        if new_object.CLASS_ID == classID.ASSOCIATION_LN and i == 2:  # setup new objects from AssociationLN.object_list
+                                            for obj_el in new_object.object_list:
+                                                obj_el: ObjectListElement
+                                                new.add_if_missing(
+                                                    class_id=obj_el.class_id,
+                                                    version=obj_el.version,
+                                                    logical_name=obj_el.logical_name)
+                                    obj.remove(attr)
+                                except ut.UserfulTypesException as e:
+                                    if attr.attrib.get("forced", None):
+                                        new_object.set_attr_force(i, cdt.get_common_data_type_from(int(attr.text).to_bytes(1, "big"))())
+                                    logger.warning(F"set to {new_object} attr: {i} forced value after. {e}.")
+                                except exc.NoObject as e:
+                                    logger.error(F"Can't fill {new_object} attr: {i}. Skip. {e}.")
+                                    break
+                                except exc.ITEApplication as e:
+                                    logger.error(F"Can't fill {new_object} attr: {i}. {e}")
+                                except IndexError:
+                                    logger.error(F'Object "{new_object}" not has attr: {i}')
+                                except TypeError as e:
+                                    logger.error(F'Object {new_object} attr:{i} do not write, encoding wrong : {e}')
+                                except ValueError as e:
+                                    logger.error(F'Object {new_object} attr:{i} do not fill: {e}')
+                                except AttributeError as e:
+                                    logger.error(F'Object {new_object} attr:{i} do not fill: {e}')
+                        for e in tr.errors:
+                            logger.error(F"Can't fill {new_object}: {e}")
                         if len(obj.findall("attr")) == 0:
                             objects.remove(obj)
                     logger.info(F'Not parsed DLMS objects: {len(objects)}')
@@ -1235,7 +1350,7 @@ class Collection:
                     """skip DYNAMIC attributes"""
                 elif not col.is_writable(obj.logical_name, i, 3):
                     """skip not writable"""
-                elif col.get_object(obj.logical_name).get_attr(i) == attr:
+                elif col.get_object(obj.logical_name).get_attr_link(i) == attr:
                     """skip not changed attr value"""
                 elif isinstance(attr, cdt.Array) and len(attr) == 0:
                     """skip empty arrays"""
@@ -1315,6 +1430,7 @@ class Collection:
         match self.dlms_ver:
             case 6: self.__spec = "DLMS_6"
             case _: raise ValueError(F"unsupport {self.dlms_ver=}")
+        self.__types.clear()
         if self.country == CountrySpecificIdentifiers.RUSSIA:
             if self.country_ver == AppVersion(3, 0):
                 self.__spec = "SPODES_3"
@@ -1349,19 +1465,32 @@ class Collection:
     def __len__(self):
         return len(self.__container)
 
+    def get_type(self, class_id: CosemClassId,
+                 version: cdt.Unsigned,
+                 ln: cst.LogicalName) -> Type[InterfaceClass]:
+        """get_type by collection specification with bounded cache"""
+        key = (int(class_id), int(version), ln.contents)
+        if (ret := self.__types.get(key)) is None:
+            ret = get_type(class_id, version, ln, func_maps[self.__spec])
+            if len(self.__types) >= self.TYPES_CACHE_SIZE:
+                self.__types.clear()
+            self.__types[key] = ret
+        return ret
+
     def add(self, class_id: CosemClassId,
             version: cdt.Unsigned | None,
             logical_name: cst.LogicalName) -> InterfaceClass:
         """ append new DLMS object to collection with return it"""
         try:
-            new_object = get_type(
+            new_object = self.get_type(
                 class_id=class_id,
                 version=self.find_version(class_id) if version is None else version,
-                ln=logical_name,
-                func_map=func_maps[self.__spec])(logical_name)
+                ln=logical_name)(logical_name)
             new_object.collection = self
             self.__container[logical_name.contents] = new_object
-            logger.info(F'Create {new_object}')
+            self.__generation += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(F'Create {new_object}')
             return new_object
         except ValueError as e:
             raise ValueError(F"error getting DLMS object instance with {class_id=} {version=} {logical_name=}: {e}")
@@ -1399,6 +1528,7 @@ class Collection:
                 return False
             case ic.COSEMInterfaceClasses() if logical_name != cst.LogicalName("0.0.42.0.0.255"):
                 self.__container.pop(logical_name.contents)
+                self.__generation += 1
                 return True
             case _:
                 logger.warning(F'Dont remove with: {logical_name}')
@@ -1425,12 +1555,17 @@ class Collection:
         else:
             return None
 
-    def filter_by_ass(self, ass_id: int) -> list[InterfaceClass]:
-        """return only association objects"""
+    def filter_by_ass(self, ass_id: int, keys: tuple[CosemClassId | media_id.MediaId | LNPattern, ...] = None) -> list[InterfaceClass]:
+        """return only association objects, filtered by <keys> as get_filtered. With class_id in keys candidates got from object_list index"""
+        object_list = self.getASSOCIATION(ass_id).get_attr_link(2)
+        if keys and (c_ids := dict.fromkeys(k for k in keys if isinstance(k, CosemClassId))):
+            elements = chain.from_iterable(object_list.get_elements_by_class_id(int(c_id)) for c_id in c_ids)
+        else:
+            elements = object_list
         ret = list()
-        for olt in self.getASSOCIATION(ass_id).object_list:
+        for olt in elements:
             ret.append(self.__get_object(olt.logical_name.contents))
-        return ret
+        return get_filtered(ret, keys) if keys else ret
 
     def get_objects_list(self, value: enums.ClientSAP) -> list[ic.COSEMInterfaceClasses]:
         for association in self.get_objects_by_class_id(classID.ASSOCIATION_LN):
@@ -1460,7 +1595,7 @@ class Collection:
             raise exc.NoObject(F"not found at least one DLMS Objects from collection with {values=}")
 
     def get_objects_by_class_id(self, value: int | CosemClassId) -> list[InterfaceClass]:
-        class_id = CosemClassId(value)
+        class_id = value if isinstance(value, CosemClassId) else CosemClassId(value)
         return list(filter(lambda obj: obj.CLASS_ID == class_id, self.__container.values()))
 
     def get_objects_descriptions(self) -> list[tuple[cst.LogicalName, cdt.LongUnsigned, cdt.Unsigned]]:
@@ -1479,16 +1614,44 @@ class Collection:
                         ret[list_type.logical_name].add(int(attr_access.attribute_id))
         return ret
 
+    @property
+    def transaction(self) -> ic.Transaction | None:
+        """current transaction of attributes changes"""
+        return self.__transaction
+
+    @contextmanager
+    def begin(self, strict: bool = True) -> Iterator[ic.Transaction]:
+        """transaction for bulk set_attr of collection objects: post init callbacks run once by exit, all changes(with added or removed objects)
+        rollback by error. Not strict keep changes with failed callbacks in Transaction.errors. Nested call join to current transaction"""
+        if self.__transaction is not None:
+            yield self.__transaction
+            return
+        tr = self.__transaction = ic.Transaction(strict)
+        container = dict(self.__container)
+        try:
+            yield tr
+            tr.commit()
+        except BaseException:
+            tr.rollback()
+            if container.keys() != self.__container.keys():
+                self.__container.clear()
+                self.__container.update(container)
+                self.__generation += 1
+            raise
+        finally:
+            self.__transaction = None
+
     def copy_obj_attr_values_from(self, other: InterfaceClass) -> bool:
-        """ copy all attributes value from other and return bool result """
+        """ copy all attributes value from other and return bool result. Object not changed by error """
         try:
             obj: InterfaceClass = self.__get_object(other.get_obis())
-            for i, attr in other.get_index_with_attributes(in_init_order=True):
-                if i == 1:
-                    continue
-                else:
-                    if attr is not None:
-                        obj.set_attr(i, attr.encoding)
+            with self.begin():
+                for i, attr in other.get_index_with_attributes(in_init_order=True):
+                    if i == 1:
+                        continue
+                    else:
+                        if attr is not None:
+                            obj.set_attr(i, attr.encoding)
             return True
         except exc.NoObject as e:
             return False
@@ -1703,69 +1866,61 @@ class Collection:
         else:
             raise ValueError(F"absent association with {client_sap}")
 
-    @lru_cache(maxsize=1000)
     def is_readable(self, ln: cst.LogicalName,
                     index: int,
                     association_id: int,
                     security_policy: pdu.SecurityPolicy = pdu.SecurityPolicyVer0.NOTHING
                     ) -> bool:
+        """by access rights matrix of association"""
         return self.getASSOCIATION(association_id).is_readable(
             ln=ln,
             index=index,
             security_policy=security_policy
         )
 
-    @lru_cache(maxsize=1000)
     def is_writable(self, ln: cst.LogicalName,
                     index: int,
                     association_id: int,
                     security_policy: pdu.SecurityPolicy = pdu.SecurityPolicyVer0.NOTHING
                     ) -> bool:
+        """by access rights matrix of association"""
         return self.getASSOCIATION(association_id).is_writable(
             ln=ln,
             index=index,
             security_policy=security_policy
         )
 
-    @lru_cache(maxsize=1000)
     def is_accessible(self, ln: cst.LogicalName,
                       index: int,
                       association_id: int,
                       m_id: mechanism_id.MechanismIdElement = None
                       ) -> bool:
-        """for ver 0 and 1 only"""
-
+        """for ver 0 and 1 only. By access rights matrix of association"""
         return self.getASSOCIATION(association_id).is_accessible(
             ln=ln,
             index=index,
             m_id=m_id
         )
 
-    @lru_cache(maxsize=100)
     def get_name_and_type(self, value: structs.CaptureObjectDefinition) -> tuple[list[str], Type[cdt.CommonDataType]]:
-        """ return names and type of element from collection"""
-        names: list[str] = list()
+        """ return names and type of element from collection. Cached by element signature for all collections"""
         obj = self.__get_object(value.logical_name.contents)
-        names.append(get_name(obj.logical_name))
         attr_index = int(value.attribute_index)
         data_index = int(value.data_index)
         data_type: Type[cdt.CommonDataType] = obj.get_attr_data_type(attr_index)
-        names.append(str(obj.get_attr_element(attr_index)))
-        if data_index == 0:
-            pass
-        elif issubclass(data_type, cdt.Structure):
-            if len(data_type.ELEMENTS) < data_index:
-                raise ValueError(F"can't create buffer_struct_type for {self}, got {data_index=} in struct {data_type.__name__}, expected 1..{len(data_type.ELEMENTS)}")
-            else:
-                el: cdt.StructElement = data_type.ELEMENTS[data_index - 1]
-                names.append(el.NAME)
-                data_type = el.TYPE
-        elif isinstance(obj, ProfileGeneric) and attr_index == 2:
+        if (data_index != 0
+                and not issubclass(data_type, cdt.Structure)
+                and isinstance(obj, ProfileGeneric)
+                and attr_index == 2):
             """according to DLMS UA 1000-1 Ed 14. ProfileGeneric.capture_object.data_index annex"""
             return self.get_name_and_type(obj.capture_objects[data_index - 1])  # todo: is recurse need rewrite here
-        else:
-            pass
-        return names, data_type
+        key = (obj.__class__, obj.logical_name.contents, attr_index, data_index, data_type, settings.get_current_language())
+        if (names_and_type := _names_and_types.get(key)) is None:
+            if len(_names_and_types) >= NAMES_AND_TYPES_CACHE_SIZE:
+                _names_and_types.clear()
+            names_and_type = _names_and_types[key] = _get_name_and_type(obj, attr_index, data_index, data_type)
+        names, data_type = names_and_type
+        return list(names), data_type
 
     def get_attr_tree(self,
                       ass_id: int,
@@ -1773,13 +1928,35 @@ class Collection:
                       obj_filter: tuple[CosemClassId | media_id.MediaId, ...] = None,
                       sort_mode: SortMode = "",
                       af_mode: Literal["l", "r", "w", "lr", "lw", "wr", "lrw"] = "l"):
-        """af_mode(attribute filter mode): l-reduce logical_name, r-show only readable, w-show only writeable"""
+        """af_mode(attribute filter mode): l-reduce logical_name, r-show only readable, w-show only writeable.
+        Return copy of cached tree while objects of collection and object_list of association not changed"""
+        key = (ass_id, obj_mode, obj_filter, sort_mode, af_mode, settings.get_current_language())
+        object_list = self.getASSOCIATION(ass_id).get_attr_link(2)
+        match self.__attr_trees.get(key):
+            case generation, cached_list, list_generation, tree if (
+                    generation == self.__generation
+                    and cached_list is object_list
+                    and list_generation == object_list.generation):
+                return self.__copy_tree(tree)
+        tree = self.__get_attr_tree(ass_id, obj_mode, obj_filter, sort_mode, af_mode)
+        self.__attr_trees[key] = (self.__generation, object_list, object_list.generation, tree)
+        return self.__copy_tree(tree)
+
+    @classmethod
+    def __copy_tree(cls, tree: dict) -> dict:
+        """copy of tree dicts and attribute indexes lists, objects without copy"""
+        return {k: cls.__copy_tree(v) if isinstance(v, dict) else list(v) for k, v in tree.items()}
+
+    def __get_attr_tree(self,
+                        ass_id: int,
+                        obj_mode: ObjectTreeMode,
+                        obj_filter: tuple[CosemClassId | media_id.MediaId, ...] | None,
+                        sort_mode: SortMode,
+                        af_mode: Literal["l", "r", "w", "lr", "lw", "wr", "lrw"]):
         without_ln = True if "l" in af_mode else False
         only_read = True if "r" in af_mode else False
         only_write = True if "w" in af_mode else False
-        filtered = self.filter_by_ass(ass_id)
-        if obj_filter:
-            filtered = get_filtered(filtered, obj_filter)
+        filtered = self.filter_by_ass(ass_id, obj_filter)
         ret = get_object_tree(
             objects=get_sorted(
                 objects=filtered,
@@ -1999,38 +2176,43 @@ def from_xml4(filename: str) -> tuple[list[Collection], UsedAttributes, bool]:
                     else:
                         objs.append(col.get_object(logical_name))
                 used[logical_name] = set()
+                values: list[tuple[int, str | list]] = list()
                 for attr in obj.findall("attr"):
                     index: int = int(attr.attrib.get("index"))
                     used[logical_name].add(index)
-                    try:
-                        match attr.attrib.get("type", "simple"):
-                            case "simple":
-                                for new_object in objs:
-                                    new_object.set_attr(index, attr.text)
-                            case "array" | "struct":
-                                stack = [(list(), iter(attr))]
-                                while stack:
-                                    v1, v2 = stack[-1]
-                                    v = next(v2, None)
-                                    if v is None:
-                                        stack.pop()
-                                    elif v.tag == "simple":
-                                        v1.append(v.text)
-                                    else:
-                                        v1.append(list())
-                                        stack.append((v1[-1], iter(v)))
-                                for new_object in objs:
-                                    new_object.set_attr(index, v1)
-                    except exc.ITEApplication as e:
-                        logger.error(F"Can't fill {new_object} attr: {index}. {e}")
-                    except IndexError:
-                        logger.error(F'Object "{new_object}" not has attr: {index}')
-                    except TypeError as e:
-                        logger.error(F'Object {new_object} attr:{index} do not write, encoding wrong : {e}')
-                    except ValueError as e:
-                        logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
-                    except AttributeError as e:
-                        logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                    match attr.attrib.get("type", "simple"):
+                        case "simple":
+                            values.append((index, attr.text))
+                        case "array" | "struct":
+                            stack = [(list(), iter(attr))]
+                            while stack:
+                                v1, v2 = stack[-1]
+                                v = next(v2, None)
+                                if v is None:
+                                    stack.pop()
+                                elif v.tag == "simple":
+                                    v1.append(v.text)
+                                else:
+                                    v1.append(list())
+                                    stack.append((v1[-1], iter(v)))
+                            values.append((index, v1))
+                for new_object in objs:
+                    with new_object.collection.begin(strict=False) as tr:
+                        for index, value in values:
+                            try:
+                                new_object.set_attr(index, value)
+                            except exc.ITEApplication as e:
+                                logger.error(F"Can't fill {new_object} attr: {index}. {e}")
+                            except IndexError:
+                                logger.error(F'Object "{new_object}" not has attr: {index}')
+                            except TypeError as e:
+                                logger.error(F'Object {new_object} attr:{index} do not write, encoding wrong : {e}')
+                            except ValueError as e:
+                                logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                            except AttributeError as e:
+                                logger.error(F'Object {new_object} attr:{index} do not fill: {e}')
+                    for e in tr.errors:
+                        logger.error(F"Can't fill {new_object}: {e}")
         case _ as error:
             raise exc.VersionError(error, additional='Xml')
     return cols, used, bool(int(objects.findtext("verified", default="0")))
@@ -2043,36 +2225,224 @@ if config is not None:
         raise exc.TomlKeyError(F"not find {e} in [DLMS.collection]<path>")
 
 
+@dataclass(frozen=True)
+class TemplateEntry:
+    """template file of library, replace os.DirEntry for persisted index"""
+    path: str
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+def _version_key(value: AppVersion) -> tuple[int, int, int, str]:
+    """sorting key of library versions. Patch absence is less than any patch, without additional is less than with it"""
+    return value.major, value.minor, -1 if value.patch is None else value.patch, value.additional
+
+
+class TypeVersions:
+    """sorted versions of one server type with bisect search"""
+    __slots__ = ("keys", "versions", "entries")
+    keys: list[tuple[int, int, int, str]]
+    versions: list[AppVersion]
+    entries: dict[AppVersion, TemplateEntry]
+
+    def __init__(self, entries: dict[AppVersion, TemplateEntry]):
+        self.entries = entries
+        self.versions = sorted(entries.keys(), key=_version_key)
+        self.keys = [_version_key(v) for v in self.versions]
+
+    def __getstate__(self):
+        return self.entries
+
+    def __setstate__(self, state: dict[AppVersion, TemplateEntry]):
+        self.__init__(state)
+
+    def select_nearest(self, ver: AppVersion) -> AppVersion | None:
+        """left nearest in minor branch, as AppVersion.select_nearest"""
+        if (i := bisect_right(self.keys, _version_key(ver))) != 0 and self.keys[i - 1][:2] == (ver.major, ver.minor):
+            return self.versions[i - 1]
+        else:
+            return None
+
+    def get(self, ver: AppVersion) -> TemplateEntry | None:
+        if (f := self.entries.get(ver)) is not None:
+            return f
+        elif (searched_version := self.select_nearest(ver)) is not None:
+            return self.entries[searched_version]
+        else:
+            return None
+
+
+class LibraryIndex:
+    """persisted index of templates library <path>/<manufacturer>/<server type hex>/<version>.typ. Validate by modification time of directories and
+    size with modification time of templates"""
+    VERSION: int = 2
+    """format of persisted index"""
+    __path: str
+    __index_path: str | None
+    __dirs: dict[str, int]
+    """directory: st_mtime_ns of it"""
+    __files: dict[str, tuple[int, int]]
+    """template: st_size, st_mtime_ns of it"""
+    __container: dict[bytes, dict[bytes, TypeVersions]]
+
+    def __init__(self, path: str, index_path: str | None = None):
+        self.__path = os.path.abspath(path)
+        self.__index_path = index_path
+        self.__dirs = dict()
+        self.__files = dict()
+        self.__container = dict()
+        if not self.load():
+            self.scan()
+            self.save()
+
+    @property
+    def container(self) -> dict[bytes, dict[bytes, TypeVersions]]:
+        return self.__container
+
+    def is_valid(self) -> bool:
+        """check modification time of all library directories and templates"""
+        if not self.__dirs:
+            return False
+        try:
+            for path, mtime in self.__dirs.items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            for path, (size, mtime) in self.__files.items():
+                if ((st := os.stat(path)).st_size, st.st_mtime_ns) != (size, mtime):
+                    return False
+            return True
+        except OSError:
+            return False
+
+    def scan(self):
+        """build index from library directories"""
+        dirs: dict[str, int] = {self.__path: os.stat(self.__path).st_mtime_ns}
+        files: dict[str, tuple[int, int]] = dict()
+        with os.scandir(self.__path) as ms:
+            for m in ms:
+                if len(m.name) == 3 and m.is_dir():
+                    dirs[m.path] = m.stat().st_mtime_ns
+                    with os.scandir(m) as ts:
+                        for t in ts:
+                            if t.is_dir():
+                                dirs[t.path] = t.stat().st_mtime_ns
+                                with os.scandir(t) as vs:
+                                    for ver in vs:
+                                        if ver.is_file() and ver.name.partition(".typ")[1] == ".typ":
+                                            files[ver.path] = ((st := ver.stat()).st_size, st.st_mtime_ns)
+        self.__dirs = dirs
+        self.__files = files
+        self.__build()
+        logger.info(F"scan templates library: {self.__path}")
+
+    def __build(self):
+        """container from directories and templates paths"""
+        container: dict[bytes, dict[bytes, dict[AppVersion, TemplateEntry]]] = dict()
+        for path in self.__dirs:
+            match os.path.relpath(path, self.__path).split(os.sep):
+                case [os.curdir]:
+                    """library root"""
+                case [m]:
+                    container.setdefault(m.encode("ascii"), dict())
+                case [m, t]:
+                    container.setdefault(m.encode("ascii"), dict()).setdefault(bytes.fromhex(t), dict())
+        for path in self.__files:
+            m, t, name = os.path.relpath(path, self.__path).split(os.sep)
+            container[m.encode("ascii")][bytes.fromhex(t)][AppVersion.from_str(name.partition(".typ")[0])] = TemplateEntry(path)
+        self.__container = {m: {t: TypeVersions(entries) for t, entries in types.items()} for m, types in container.items()}
+
+    def load(self) -> bool:
+        """load persisted index, return True if it valid"""
+        if self.__index_path is None or not os.path.isfile(self.__index_path):
+            return False
+        try:
+            with open(self.__index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data["version"] != self.VERSION or data["path"] != self.__path:
+                return False
+            self.__dirs = {str(path): int(mtime) for path, mtime in data["dirs"].items()}
+            self.__files = {str(path): (int(size), int(mtime)) for path, (size, mtime) in data["files"].items()}
+            self.__build()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(F"can't load templates library index {self.__index_path}: {e}")
+            self.__dirs = dict()
+            self.__files = dict()
+            return False
+        return self.is_valid()
+
+    def save(self):
+        if self.__index_path is not None:
+            try:
+                with open(tmp := F"{self.__index_path}.tmp", "w", encoding="utf-8") as file:
+                    json.dump({
+                        "version": self.VERSION,
+                        "path": self.__path,
+                        "dirs": self.__dirs,
+                        "files": self.__files}, file)
+                os.replace(tmp, self.__index_path)
+            except OSError as e:
+                logger.warning(F"can't save templates library index {self.__index_path}: {e}")
+
+    def refresh(self, force: bool = False) -> bool:
+        """rescan library if it changed, return True if index rebuilt"""
+        if force or not self.is_valid():
+            self.scan()
+            self.save()
+            return True
+        else:
+            return False
+
+    def get_entry(self, m: bytes, t: cdt.CommonDataType, ver: AppVersion) -> TemplateEntry:
+        if (man := self.__container.get(m)) is None:
+            raise exc.NoConfig(F"no support manufacturer: {m.decode('utf-8', errors='strict')}")
+        elif (type_ := man.get(t.encoding)) is None:
+            raise exc.NoConfig(F"no support type {t.to_str()}, with manufacturer: {m.decode('utf-8', errors='strict')}")
+        elif (f := type_.get(ver)) is None:
+            raise exc.NoConfig(F"no support version {ver} with manufacturer: {m.decode('utf-8', errors='strict')}, type: {t.to_str()}")
+        else:
+            return f
+
+
+def get_library_index_path(path: str) -> str:
+    """from [DLMS.collection]<index> or user cache directory, created only for owner"""
+    if (ret := get_values("DLMS", "collection", "index")) is not None:
+        return ret
+    else:
+        cache = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        os.makedirs(cache_dir := os.path.join(cache, "DLMS_SPODES"), mode=0o700, exist_ok=True)
+        return os.path.join(cache_dir, F"library_{hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]}.json")
+
+
 @lru_cache(1)
-def get_manufactures_container() -> dict[bytes, dict[bytes, dict[AppVersion, os.DirEntry]]]:
-    ret: dict[bytes, dict[bytes, dict[AppVersion, os.DirEntry]]] = dict()
-    with os.scandir(__collection_path) as ms:
-        for m in ms:
-            if len(m.name) == 3 and m.is_dir():
-                ret[man := m.name.encode("ascii")] = dict()
-                with os.scandir(m) as ts:
-                    for t in ts:
-                        if t.is_dir():
-                            ret[man][server_type := bytes.fromhex(t.name)] = dict()
-                            with os.scandir(t) as vs:
-                                for ver in vs:
-                                    if ver.is_file() and (v := ver.name.partition(".typ"))[1] == ".typ":
-                                        ret[man][server_type][AppVersion.from_str(v[0])] = ver
-    return ret
+def get_library() -> LibraryIndex:
+    return LibraryIndex(__collection_path, get_library_index_path(__collection_path))
+
+
+def refresh_library(force: bool = False) -> bool:
+    """pick up templates library changes without restart, return True if changed"""
+    if get_library().refresh(force):
+        get_manufactures_container.cache_clear()
+        get_dir_entry.cache_clear()
+        get.cache_clear()
+        return True
+    else:
+        return False
+
+
+@lru_cache(1)
+def get_manufactures_container() -> dict[bytes, dict[bytes, dict[AppVersion, TemplateEntry]]]:
+    return {m: {t: type_.entries for t, type_ in types.items()} for m, types in get_library().container.items()}
 
 
 @lru_cache(maxsize=100)
-def get_dir_entry(m: bytes, t: cdt.CommonDataType, ver: AppVersion) -> os.DirEntry:
+def get_dir_entry(m: bytes, t: cdt.CommonDataType, ver: AppVersion) -> TemplateEntry:
     """one recursion collection get way. ret: file, is_searched"""  # todo: make <ver> handle non SemVer from CDT
-    if (man := get_manufactures_container().get(m)) is None:
-        raise exc.NoConfig(F"no support manufacturer: {m.decode('utf-8', errors='strict')}")
-    elif (type_ := man.get(t.encoding)) is None:
-        raise exc.NoConfig(F"no support type {t.to_str()}, with manufacturer: {m.decode('utf-8', errors='strict')}")
-    elif (f := type_.get(ver)) is None:
-        if searched_version := ver.select_nearest(type_.keys()):
-            return type_.get(searched_version)
-        else:
-            raise exc.NoConfig(F"no support version {ver} with manufacturer: {m.decode('utf-8', errors='strict')}, type: {t.to_str()}")
+    f = get_library().get_entry(m, t, ver)
     logger.info(F"got collection from library by path: {f.path}")
     return f
 
@@ -2094,6 +2464,98 @@ def get_collection(
     return ret
 
 
+class SharedTemplates:
+    """templates snapshots pool in shared memory for worker processes. Publisher create it by <keys> of library, workers attach by <name> and build collections without XML parsing.
+    It reduce start time of workers, not memory: each worker restore own template by first request, collections of worker are copies with static values linked with it
+    (see COSEMInterfaceClasses.copy), so worker keep one template for many collections.
+    Memory layout: directory length(4 bytes), pickled directory {manufacturer: {type encoding: TypeVersions(version: (offset, length))}}, snapshots"""
+    __shm: shared_memory.SharedMemory
+    __directory: dict[bytes, dict[bytes, TypeVersions]]
+    __templates: dict[tuple[int, int], Collection]
+    """offset, length: template"""
+    __is_owner: bool
+
+    def __init__(self, name: str):
+        """attach to exist pool"""
+        if sys.version_info >= (3, 13):
+            self.__shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self.__shm = shared_memory.SharedMemory(name=name)  # register in tracker of publisher for fork and spawn workers
+        self.__is_owner = False
+        self.__templates = dict()
+        size = int.from_bytes(self.__shm.buf[:4], "big")
+        with self.__shm.buf[4: 4 + size] as buf:
+            self.__directory = pickle.loads(buf)
+
+    @classmethod
+    def create(cls, keys: Iterable[tuple[bytes, cdt.CommonDataType, AppVersion]] = None, name: str = None) -> Self:
+        """publish templates by <keys>(manufacturer, server type, server version), all library if None"""
+        if keys is None:
+            keys = ((m, cdt.get_instance_and_pdu_from_value(t)[0], ver) for m, types in get_library().container.items() for t, type_ in types.items() for ver in type_.versions)
+        snapshots: dict[str, bytes] = dict()
+        directory: dict[bytes, dict[bytes, dict[AppVersion, str]]] = dict()
+        for m, t, ver in keys:
+            f = get_dir_entry(m, t, ver)
+            if f.path not in snapshots:
+                snapshots[f.path] = get(m, t, ver).to_snapshot()
+            directory.setdefault(m, dict()).setdefault(t.encoding, dict())[AppVersion.from_str(f.name.partition(".typ")[0])] = f.path
+        offset = 0
+        positions: dict[str, tuple[int, int]] = dict()
+        for path, snapshot in snapshots.items():
+            positions[path] = offset, len(snapshot)
+            offset += len(snapshot)
+        header = pickle.dumps(
+            {m: {t: TypeVersions({ver: positions[path] for ver, path in versions.items()}) for t, versions in types.items()} for m, types in directory.items()},
+            pickle.HIGHEST_PROTOCOL)
+        start = 4 + len(header)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=start + offset)
+        shm.buf[:start] = len(header).to_bytes(4, "big") + header
+        for path, snapshot in snapshots.items():
+            pos = start + positions[path][0]
+            shm.buf[pos: pos + len(snapshot)] = snapshot
+        logger.info(F"published {len(snapshots)} templates to shared memory {shm.name}: {shm.size} bytes")
+        shm.close()
+        new = cls(shm.name)
+        new.__is_owner = True
+        return new
+
+    @property
+    def name(self) -> str:
+        return self.__shm.name
+
+    def get_template(self, m: bytes, t: cdt.CommonDataType, ver: AppVersion) -> Collection:
+        """caching template restored from shared memory, one for all collections of process"""
+        if (man := self.__directory.get(m)) is None:
+            raise exc.NoConfig(F"no support manufacturer: {m.decode('utf-8', errors='strict')}")
+        elif (type_ := man.get(t.encoding)) is None:
+            raise exc.NoConfig(F"no support type {t.to_str()}, with manufacturer: {m.decode('utf-8', errors='strict')}")
+        elif (pos := type_.get(ver)) is None:
+            raise exc.NoConfig(F"no support version {ver} with manufacturer: {m.decode('utf-8', errors='strict')}, type: {t.to_str()}")
+        elif (ret := self.__templates.get(pos)) is None:
+            offset = 4 + int.from_bytes(self.__shm.buf[:4], "big") + pos[0]
+            with self.__shm.buf[offset: offset + pos[1]] as buf:
+                ret = self.__templates[pos] = Collection.from_snapshot(buf)
+        return ret
+
+    def get_collection(self, manufacturer: bytes, server_type: cdt.CommonDataType, server_ver: AppVersion) -> Collection:
+        """get copy of collection, as get_collection"""
+        ret = self.get_template(manufacturer, server_type, server_ver).copy()
+        ret.set_server_type(server_type)
+        return ret
+
+    def close(self):
+        """detach, and release shared memory by publisher"""
+        self.__shm.close()
+        if self.__is_owner:
+            self.__shm.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 def get_ln_contents(value: LNContaining) -> bytes:
     """return LN as bytes[6] for use in any searching"""
     match value:
@@ -2202,35 +2664,39 @@ class LNPattern:
     ((y-z), ...) - set of simple values with range(from y to z)
     example: "a.0.(1,2,3).(0-64).0.f"
     """
-    __values: list[int, set[int]]
+    ANY: int = (1 << 256) - 1
+    """mask of skipped group"""
+    __masks: tuple[int, int, int, int, int, int]
+    """256-bit mask of allowed values for each group"""
 
     def __init__(self, value: str):
-        self.__values = [-1, -1, -1, -1, -1, -1]
+        masks = [self.ANY] * 6
         for i, val in enumerate(value.split('.', maxsplit=5)):
             if len(val) == 1 and (ord(val) == 97+i):
                 continue
             elif val.isdigit():
-                self.__values[i] = int(val)
-                if not (0 <= self.__values[i] <= 255):
+                if not (0 <= (el := int(val)) <= 255):
                     raise ValueError(F"in {value=} got element {val=}, expected 0..255")
+                masks[i] = 1 << el
             elif val.startswith('(') and val.endswith(')'):
-                el: set[int] = set()
+                mask = 0
                 val = val.replace('(', "").replace(')', "")
                 for j in val.split(","):
                     j = j.replace(" ", '')
                     match j.count('-'):
                         case 0:
-                            el.add(self.__simple_validate(j))
+                            mask |= 1 << self.__simple_validate(j)
                         case 1:
                             start, end = j.split("-")
-                            el.update(range(
-                                self.__simple_validate(start),
-                                self.__simple_validate(end)+1))
+                            start, end = self.__simple_validate(start), self.__simple_validate(end)
+                            if start <= end:
+                                mask |= ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
                         case err:
                             raise ValueError(F"got a lot of <-> in pattern: {value}, expected one")
-                self.__values[i] = el
+                masks[i] = mask
             else:
                 raise ValueError(F"got wrong symbol: {val} in pattern")
+        self.__masks = tuple(masks)
 
     @staticmethod
     def __simple_validate(value: str) -> int:
@@ -2239,43 +2705,74 @@ class LNPattern:
         else:
             raise ValueError(F"got not valid element: {value} in pattern, expected 0..255")
 
-    def __eq__(self, other: cst.LogicalName):
-        for i, j in zip(self.__values, other):
-            if i == j or (i == -1):
-                continue
-            elif isinstance(i, set) and j in i:
-                continue
-            else:
-                return False
-        return True
+    @property
+    def masks(self) -> tuple[int, int, int, int, int, int]:
+        return self.__masks
+
+    def match(self, value: bytes) -> bool:
+        """by LN contents"""
+        m = self.__masks
+        return bool((m[0] >> value[0]) & (m[1] >> value[1]) & (m[2] >> value[2]) & (m[3] >> value[3]) & (m[4] >> value[4]) & (m[5] >> value[5]) & 1)
+
+    def __eq__(self, other: Self | cst.LogicalName | bytes):
+        if isinstance(other, LNPattern):
+            return self.__masks == other.masks
+        return self.match(other if isinstance(other, bytes) else other.contents)
+
+    def __hash__(self):
+        return hash(self.__masks)
+
+
+class LNPatterns:
+    """compiled union of patterns. For each group value table of bits of the patterns that allow it. LN matched if AND of six tables is not 0"""
+    __tables: tuple[tuple[int, ...], ...]
+
+    def __init__(self, patterns: Iterable[LNPattern]):
+        tables = [[0] * 256 for _ in range(6)]
+        for k, pattern in enumerate(patterns):
+            bit = 1 << k
+            for table, mask in zip(tables, pattern.masks):
+                for v in range(256):
+                    if (mask >> v) & 1:
+                        table[v] |= bit
+        self.__tables = tuple(map(tuple, tables))
+
+    def __contains__(self, value: cst.LogicalName | bytes) -> bool:
+        if not isinstance(value, bytes):
+            value = value.contents
+        t = self.__tables
+        return (t[0][value[0]] & t[1][value[1]] & t[2][value[2]] & t[3][value[3]] & t[4][value[4]] & t[5][value[5]]) != 0
 
 
 def get_filtered(objects: list[InterfaceClass],
                  keys: tuple[CosemClassId | media_id.MediaId | LNPattern, ...]) -> list[InterfaceClass]:
-    c_ids: list[CosemClassId] = list()
-    media: list[int] = list()
-    group: list[int] = list()
+    """objects matched with all kinds of keys: any of class_id, any of media(by group A), any of relation group, any of pattern"""
+    c_ids: set[CosemClassId] = set()
+    media: set[int] = set()
+    group: set[int] = set()
     patterns: list[LNPattern] = list()
     medias = tuple(m.subgroup for m in RelationGroups)
     for k in keys:
         if isinstance(k, CosemClassId):
-            c_ids.append(k)
+            c_ids.add(k)
         elif isinstance(k, RelationGroup):
             if (s_g := k.subgroup) in medias:
-                media.append(s_g)
+                media.update(k._value if isinstance(k._value, tuple) else (k._value,))
             else:
-                group.append(s_g)
+                group.add(s_g)
         elif isinstance(k, LNPattern):
             patterns.append(k)
+    compiled = LNPatterns(patterns) if patterns else None
     new_list = list()
     for obj in objects:
-        if c_ids and not obj.CLASS_ID in c_ids:
+        ln = obj.logical_name
+        if c_ids and obj.CLASS_ID not in c_ids:
             continue
-        elif group and get_relation_group(obj.logical_name).subgroup not in group:
+        elif media and ln.contents[0] not in media:
             continue
-        elif media and get_media_id(obj.logical_name) not in media:
+        elif group and get_relation_group(ln).subgroup not in group:
             continue
-        elif obj.logical_name not in patterns:
+        elif compiled and ln.contents not in compiled:
             continue
         new_list.append(obj)
     return new_list
@@ -2285,391 +2782,293 @@ RelationGroup: TypeAlias = media_id.Abstract | media_id.Electricity | media_id.H
 RelationGroups: tuple[media_id.MediaId, ...] = (media_id.ABSTRACT, media_id.ELECTRICITY, media_id.HCA, media_id.GAS, media_id.THERMAL, media_id.WATER)
 
 
-@lru_cache(maxsize=1000)
+def get_mask(value: int | Iterable[int]) -> int:
+    """256-bit mask of values"""
+    if isinstance(value, int):
+        return 1 << value
+    else:
+        ret = 0
+        for v in value:
+            ret |= 1 << v
+        return ret
+
+
+def _rule(result: RelationGroup | tuple, **condition: int | Iterable[int]) -> tuple[dict[str, int | tuple[int, ...]], RelationGroup | tuple]:
+    """relation group rule: <condition> by LN groups b..f, <result> is group or nested rules, if nested not matched result is media"""
+    return {field: value if isinstance(value, int) else tuple(value) for field, value in condition.items()}, result
+
+
+def _electricity_quantities() -> tuple:
+    groups = (
+        media_id.ACTIVE_POWER_PLUS, media_id.ACTIVE_POWER_MINUS, media_id.REACTIVE_POWER_PLUS, media_id.REACTIVE_POWER_MINUS,
+        media_id.REACTIVE_POWER_QI, media_id.REACTIVE_POWER_QII, media_id.REACTIVE_POWER_QIII, media_id.REACTIVE_POWER_QIV,
+        media_id.APPARENT_POWER_PLUS, media_id.APPARENT_POWER_MINUS, media_id.CURRENT, media_id.VOLTAGE,
+        media_id.POWER_FACTOR, media_id.SUPPLY_FREQUENCY, media_id.ACTIVE_POWER_SUM, media_id.ACTIVE_POWER_DIFF,
+        media_id.ACTIVE_POWER_QI, media_id.ACTIVE_POWER_QII, media_id.ACTIVE_POWER_QIII, media_id.ACTIVE_POWER_QIV)
+    return tuple(_rule(group, c=(i, i + 20, i + 40, i + 60)) for i, group in enumerate(groups, 1))
+
+
+RELATION_RULES: dict[tuple[int, ...], tuple[RelationGroup, tuple]] = {
+    (0,): (media_id.ABSTRACT, (
+        _rule((
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES, d=1),
+            _rule(media_id.OTHER_ABSTRACT_GENERAL_PURPOSE_OBIS_CODES, d=(2, 9))), c=0),
+        _rule((_rule(media_id.CLOCK_OBJECTS, d=range(0, 7)),), c=1),
+        _rule((_rule(media_id.MODEM_CONFIGURATION_AND_RELATED_OBJECTS, d=(0, 1, 2)),), c=2),
+        _rule(media_id.SCRIPT_TABLE_OBJECTS, c=10, d=0, e=chain((0, 1), range(100, 112), (125,))),
+        _rule(media_id.SPECIAL_DAYS_TABLE_OBJECTS, c=11, d=0),
+        _rule(media_id.SCHEDULE_OBJECTS, c=12, d=0),
+        _rule(media_id.ACTIVITY_CALENDAR_OBJECTS, c=13, d=0),
+        _rule(media_id.REGISTER_ACTIVATION_OBJECTS, c=14, d=0),
+        _rule(media_id.SINGLE_ACTION_SCHEDULE_OBJECTS, c=15, d=0, e=range(0, 8)),
+        _rule((
+            _rule(media_id.REGISTER_OBJECTS_MONITOR, d=0),
+            _rule(media_id.REGISTER_OBJECTS_MONITOR, d=1, e=range(0, 10)),
+            _rule(media_id.PARAMETER_MONITOR_OBJECTS, d=2)), c=16),
+        _rule(media_id.LIMITER_OBJECTS, c=17, d=0),
+        _rule(media_id.ARRAY_MANAGER_OBJECT, c=18, d=0),
+        _rule((
+            _rule(media_id.PAYMENT_METERING_RELATED_OBJECTS, d=range(0, 10), e=0),
+            _rule(media_id.PAYMENT_METERING_RELATED_OBJECTS, d=range(10, 50)),
+            _rule(media_id.PAYMENT_METERING_RELATED_OBJECTS, d=range(50, 60), e=(1, 2))), c=19),
+        _rule(media_id.IEC_LOCAL_PORT_SETUP_OBJECTS, c=20, d=0, e=(0, 1)),
+        _rule(media_id.STANDARD_READOUT_PROFILE_OBJECTS, c=21, d=0),
+        _rule(media_id.IEC_HDLC_SETUP_OBJECTS, c=22, d=0, e=0),
+        _rule((
+            _rule(media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS, d=(0, 1, 2), e=0),
+            _rule(media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS, d=3)), c=23),
+        _rule((
+            _rule(media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS, d=(0, 1, 4, 5, 6), e=0),
+            _rule(media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS, d=(2, 8, 9))), c=24),
+        _rule(media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS, c=31, d=0, e=0),
+        _rule((
+            _rule(media_id.OBJECTS_TO_SET_UP_DATA_EXCHANGE_OVER_THE_INTERNET, d=chain(range(0, 8), range(10, 16)), e=0),
+            _rule(media_id.OBJECTS_TO_SET_UP_PUSH_SETUP, d=9, e=0)), c=25),
+        _rule(media_id.OBJECTS_FOR_SETTING_UP_DATA_EXCHANGE_USING_S_FSK_PLC, c=26, d=(0, 1, 2, 3, 5, 6), e=0),
+        _rule(media_id.OBJECTS_FOR_SETTING_UP_THE_ISO_IEC_8802_2_LLC_LAYER, c=27, d=(0, 1, 2), e=0),
+        _rule(media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROWBAND_OFDM_PLC_FOR_PRIME_NETWORKS, c=28, d=range(0, 8), e=0),
+        _rule(media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROW_BAND_OFDM_PLC_FOR_G3_PLC_NETWORKS, c=29, d=(0, 1, 2), e=0),
+        _rule(media_id.ZIGBEE_SETUP_OBJECTS, c=30, d=range(0, 5)),
+        _rule(media_id.OBJECTS_FOR_SETTING_UP_AND_MANAGING_DATA_EXCHANGE_USING_ISO_IEC_14908_PLC_NETWORKS, c=32, d=range(0, 4), e=0),
+        _rule(media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_HS_PLC_ISO_IEC_12139_1_ISO_EC_12139_1_NETWORKS, c=33, d=range(0, 4), e=0),
+        _rule(media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_WI_SUN_NETWORKS, c=34, d=range(0, 4), e=0),
+        _rule(media_id.ASSOCIATION_OBJECTS, c=40, b=0, d=0),
+        _rule(media_id.SAP_ASSIGNMENT_OBJECT, c=41, b=0, d=0, e=0),
+        _rule(media_id.COSEM_LOGICAL_DEVICE_NAME_OBJECT, c=42, b=0, d=0, e=0),
+        _rule((
+            _rule(media_id.INFORMATION_SECURITY_RELATED_OBJECTS, b=0, d=0),
+            _rule(media_id.INFORMATION_SECURITY_RELATED_OBJECTS, d=(1, 2))), c=43),
+        _rule((
+            _rule((
+                _rule(media_id.IMAGE_TRANSFER_OBJECTS, d=0),
+                _rule(media_id.FUNCTION_CONTROL_OBJECTS, d=1),
+                _rule(media_id.COMMUNICATION_PORT_PROTECTION_OBJECTS, d=2)), b=0),), c=44),
+        _rule(media_id.UTILITY_TABLE_OBJECTS, c=65, d=__range63),
+        _rule(media_id.COMPACT_DATA_OBJECTS, c=66, d=0),
+        _rule((
+            _rule((
+                _rule(media_id.DEVICE_ID_OBJECTS, e=__range10_and_255),
+                _rule(media_id.METERING_POINT_ID_OBJECTS, e=10)), d=1),
+            _rule(media_id.PARAMETER_CHANGES_AND_CALIBRATION_OBJECTS, d=2),
+            _rule((
+                _rule(media_id.I_O_CONTROL_SIGNAL_OBJECTS, e=range(0, 5)),
+                _rule(media_id.DISCONNECT_CONTROL_OBJECTS, e=10),
+                _rule(media_id.ARBITRATOR_OBJECTS, e=range(20, 30))), d=3),
+            _rule(media_id.STATUS_OF_INTERNAL_CONTROL_SIGNALS_OBJECTS, d=4, e=range(0, 5)),
+            _rule(media_id.INTERNAL_OPERATING_STATUS_OBJECTS, d=5, e=range(0, 5)),
+            _rule(media_id.BATTERY_ENTRIES_OBJECTS, d=6, e=range(0, 7)),
+            _rule(media_id.POWER_FAILURE_MONITORING_OBJECTS, d=7, e=range(0, 22)),
+            _rule(media_id.OPERATING_TIME_OBJECTS, d=8, e=__range63),
+            _rule(media_id.ENVIRONMENT_RELATED_PARAMETERS_OBJECTS, d=9, e=(0, 1, 2)),
+            _rule(media_id.STATUS_REGISTER_OBJECTS, d=10, e=range(1, 11)),
+            _rule(media_id.EVENT_CODE_OBJECTS, d=11, e=range(0, 100)),
+            _rule(media_id.COMMUNICATION_PORT_LOG_PARAMETER_OBJECTS, d=12, e=range(0, 7)),
+            _rule(media_id.CONSUMER_MESSAGE_OBJECTS, d=13, e=(0, 1)),
+            _rule(media_id.CURRENTLY_ACTIVE_TARIFF_OBJECTS, d=14, e=range(0, 16)),
+            _rule(media_id.EVENT_COUNTER_OBJECTS, d=15, e=range(0, 100)),
+            _rule(media_id.PROFILE_ENTRY_DIGITAL_SIGNATURE_OBJECTS, d=16, e=range(0, 10)),
+            _rule(media_id.PROFILE_ENTRY_COUNTER_OBJECTS, d=17, e=range(0, 128)),
+            _rule(media_id.METER_TAMPER_EVENT_RELATED_OBJECTS, d=20),
+            _rule(media_id.ABSTRACT_MANUFACTURER_SPECIFIC, d=range(50, 100))), c=96),
+        _rule((
+            _rule(media_id.ERROR_REGISTER_OBJECTS, d=97, e=__range10_and_255),
+            _rule(media_id.ALARM_REGISTER_FILTER_DESCRIPTOR_OBJECTS, d=98, e=chain(range(0, 30), (255,)))), c=97),
+        _rule(media_id.GENERAL_LIST_OBJECTS, c=98),
+        _rule((
+            _rule(media_id.ABSTRACT_DATA_PROFILE_OBJECTS, d=(1, 2, 12, 13, 14, 15, 16, 17, 18)),
+            _rule(media_id.ABSTRACT_DATA_PROFILE_OBJECTS, d=3, e=0),
+            _rule(media_id.EVENT_LOG_OBJECTS, d=98)), c=99),
+        _rule(media_id.INACTIVE_OBJECTS, c=127, d=0))),
+    (1,): (media_id.ELECTRICITY, (
+        _rule((
+            _rule(media_id.ID_NUMBERS_ELECTRICITY, d=0, e=__range10_and_255),
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_EL, d=1),
+            _rule(media_id.OTHER_ELECTRICITY_RELATED_GENERAL_PURPOSE_OBJECTS, d=(2, 3, 4, 6, 7, 8, 9, 10)),
+            _rule(media_id.MEASUREMENT_ALGORITHM, d=11, e=range(1, 8))), c=0),
+        *_electricity_quantities(),
+        _rule((
+            _rule(media_id.ELECTRICITY_METERING_POINT_ID_OBJECTS, d=1, e=__range10_and_255),
+            _rule(media_id.ELECTRICITY_RELATED_STATUS_OBJECTS, d=5, e=range(0, 6)),
+            _rule(media_id.ELECTRICITY_RELATED_STATUS_OBJECTS, d=10, e=range(0, 4))), c=96),
+        _rule(media_id.LIST_OBJECTS_ELECTRICITY, c=98),
+        _rule((
+            _rule(media_id.THRESHOLD_VALUES, c=__c1, e=__range63),
+            _rule(media_id.THRESHOLD_VALUES, c=__table44, e=__range120_and_124_127)), d=range(31, 46), f=__range100_and_255),
+        _rule((
+            _rule((
+                _rule(media_id.REGISTER_MONITOR_OBJECTS, c=__c1, e=__range63),
+                _rule(media_id.REGISTER_MONITOR_OBJECTS, c=__c2, e=__range120_and_124_127)), d=(31, 35, 39, 4, 5, 14, 15, 24, 25)),), f=__range100_and_255))),
+    (4,): (media_id.HCA, (
+        _rule((
+            _rule(media_id.ID_NUMBERS_HCA, d=0, e=__range10_and_255),
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_HCA, d=1, e=(1, 2, 10, 11)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_HCA, d=2, e=range(0, 4)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_HCA, d=4, e=range(0, 7)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_HCA, d=5, e=(10, 11)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_HCA, d=8, e=(0, 4, 6)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_HCA, d=9, e=(1, 2, 3))), c=0),
+        _rule((
+            _rule(media_id.MEASURED_VALUES_HCA_CONSUMPTION, d=(0, 6), f=255),
+            _rule(media_id.MEASURED_VALUES_HCA_CONSUMPTION, d=range(1, 6), f=__range100_and_101_125_and_255)), c=(1, 2), e=0),
+        _rule(media_id.MEASURED_VALUES_HCA_TEMPERATURE, c=range(3, 8), d=(0, 4, 5, 6), e=255, f=255),
+        _rule(media_id.ERROR_REGISTER_OBJECTS_HCA, c=97, d=97),
+        _rule(media_id.LIST_OBJECTS_HCA, c=98),
+        _rule(media_id.DATA_PROFILE_OBJECTS_HCA, c=99, d=1))),
+    (5, 6): (media_id.THERMAL, (
+        _rule((
+            _rule(media_id.ID_NUMBERS_THERMAL, d=0, e=__range10_and_255),
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_THERMAL, d=1, e=(1, 2, 10, 11)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_THERMAL, d=2, e=chain(range(0, 5), range(10, 14))),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_THERMAL, d=4, e=(1, 2, 3)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_THERMAL, d=5, e=chain(range(1, 10), range(21, 25))),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_THERMAL, d=8, e=chain(range(0, 8), range(11, 15), range(21, 26), range(31, 35))),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_THERMAL, d=9, e=(1, 2, 3))), c=0),
+        _rule((
+            _rule((
+                _rule(media_id.MEASURED_VALUES_THERMAL_CONSUMPTION, d=(0, 1, 2, 3, 7), f=255),
+                _rule(media_id.MEASURED_VALUES_THERMAL_CONSUMPTION, d=(3, 8, 9), f=__range100_and_101_125_and_255),
+                _rule(media_id.MEASURED_VALUES_THERMAL_CONSUMPTION, d=(1, 2, 4, 5, 12, 13, 14, 15), f=range(0, 126))), e=range(0, 10)),
+            _rule(media_id.MEASURED_VALUES_THERMAL_CONSUMPTION, d=6, e=255, f=255)), c=range(1, 8)),
+        _rule((
+            _rule((
+                _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, c=range(1, 8), d=(5, 15)),
+                _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, c=(8, 9), d=(1, 4, 5, 12, 13, 14, 15))), f=__range100_and_101_125_and_255),
+            _rule((
+                _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, d=0, f=255),
+                _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, d=(4, 5, 14, 15), f=chain(range(0, 100), range(101, 126))),
+                _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, d=(6, 7, 10, 11), f=255)), c=range(10, 14)),
+            _rule(media_id.MEASURED_VALUES_THERMAL_ENERGY, c=range(1, 14), d=range(20, 26), f=255)), e=range(0, 10)),
+        _rule(media_id.ERROR_REGISTER_OBJECTS_THERMAL, c=97, d=97, e=(0, 1, 2)),
+        _rule(media_id.LIST_OBJECTS_THERMAL, c=98),
+        _rule((
+            _rule(media_id.DATA_PROFILE_OBJECTS_THERMAL, d=(1, 2), e=(1, 2, 3)),
+            _rule(media_id.DATA_PROFILE_OBJECTS_THERMAL, d=3, e=1),
+            _rule(media_id.DATA_PROFILE_OBJECTS_THERMAL, d=99)), c=99, f=255))),
+    (7,): (media_id.GAS, (
+        _rule((
+            _rule(media_id.ID_NUMBERS_GAS, d=0, e=__range10_and_255),
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_GAS, d=1),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_GAS, d=chain(range(2, 5), range(6, 16)))), c=0),
+        _rule(media_id.INTERNAL_OPERATING_STATUS_OBJECTS_GAS, c=96, d=5, e=range(0, 10)),
+        _rule((
+            _rule(media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES, d=(24, 25, 26, 42, 43, 44, 63, 64, 65, 81, 82, 83), f=chain(range(0, 100), range(101, 127))),
+            _rule(media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES, d=chain(range(6, 24), range(27, 33), range(45, 51), range(66, 72), range(84, 90)), f=255),
+            _rule(media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES, d=chain(range(33, 42), range(52, 63), range(72, 81), range(90, 99)), f=chain(__range100_and_101_125_and_255, (126,)))),
+            c=chain(range(1, 9), range(11, 17), range(21, 27), range(31, 36), range(61, 66)), e=__range63),
+        _rule((
+            _rule(media_id.MEASURED_VALUES_GAS_FLOW_RATE, d=chain((0, 1, 2, 13), range(15, 31), range(35, 51), range(55, 71)), f=255),
+            _rule(media_id.MEASURED_VALUES_GAS_FLOW_RATE, d=chain(range(31, 35), range(51, 55)), f=chain(__range100_and_101_125_and_255, (126,)))), c=42, e=0),
+        _rule(media_id.MEASURED_VALUES_GAS_PROCESS_VALUES, c=chain((41, 42), range(44, 50)), d=(0, 2, 3, 10, 11, 13), e=0, f=255),
+        _rule((
+            _rule(media_id.CONVERSION_RELATED_FACTORS_AND_COEFFICIENTS_GAS, d=(0, 2, 3, 10, 11), e=chain((0, 1), range(11, 29)), f=255),
+            _rule(media_id.CALCULATION_METHODS_GAS, d=12, e=range(0, 20), f=255)), c=range(51, 56)),
+        _rule((
+            _rule(media_id.NATURAL_GAS_ANALYSIS, d=(8, 9), e=0),
+            _rule(media_id.NATURAL_GAS_ANALYSIS, d=chain(range(10, 21), range(60, 85)), e=chain((0, 1), range(11, 29)))), c=70, f=255),
+        _rule(media_id.LIST_OBJECTS_GAS, c=98))),
+    (8, 9): (media_id.WATER, (
+        _rule((
+            _rule(media_id.ID_NUMBERS_WATER, d=0, e=__range10_and_255),
+            _rule(media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_WATER, d=1, e=(1, 2, 10, 11, 12)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_WATER, d=2, e=(0, 3)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_WATER, d=(5, 7), e=1),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_WATER, d=8, e=(1, 6)),
+            _rule(media_id.GENERAL_PURPOSE_OBJECTS_WATER, d=9, e=(1, 2, 3))), c=0),
+        _rule((
+            _rule(media_id.MEASURED_VALUES_WATER_CONSUMPTION, d=(0, 1, 2, 3, 6), f=255),
+            _rule(media_id.MEASURED_VALUES_WATER_CONSUMPTION, d=range(1, 6), f=chain(range(0, 100), range(101, 126)))), c=1, e=range(0, 13)),
+        _rule((
+            _rule(media_id.MEASURED_VALUES_WATER_MONITORING_VALUES, d=(0, 1, 2, 3, 6), f=255),
+            _rule(media_id.MEASURED_VALUES_WATER_MONITORING_VALUES, d=range(1, 6), f=chain(range(0, 100), range(101, 126)))), c=(2, 3), e=range(0, 13)),
+        _rule(media_id.ERROR_REGISTER_OBJECTS_WATER, c=97, d=97),
+        _rule(media_id.LIST_OBJECTS_WATER, c=98),
+        _rule(media_id.DATA_PROFILE_OBJECTS_WATER, c=99, d=1)))
+}
+"""DLMS UA 1000-1 Ed 14. Relation groups by media: {group A values: (media, rules)}. Rules are checked in order, first matched is result, media if nothing matched"""
+
+
+class RelationGroupTable:
+    """compiled RELATION_RULES. Lookup by group A, C, D arrays, rest conditions as 256-bit masks of groups E, F, B in few rows"""
+    __FIELDS = {"b": 1, "c": 2, "d": 3, "e": 4, "f": 5}
+    __ANY: int = (1 << 256) - 1
+    __media: tuple[tuple[RelationGroup, tuple[tuple[tuple[tuple[int, int, int, RelationGroup | None], ...], ...] | None, ...]], ...]
+    """by A: media, by C: None(no rules) or by D: rows(E mask, F mask, B mask, group)"""
+
+    def __init__(self, rules: dict[tuple[int, ...], tuple[RelationGroup, tuple]]):
+        no_rules = (media_id.OTHER_MEDIA, (None,) * 256)
+        media = [no_rules] * 256
+        rows_cache: dict[tuple, tuple] = dict()
+        for a_values, (default, media_rules) in rules.items():
+            flatten = tuple(self.__flatten(media_rules, [self.__ANY] * 6))
+            c_masks = tuple(m[2] for m, _ in flatten)
+            paths = tuple((m[3], (m[4], m[5], m[1], group)) for m, group in flatten)
+            by_c = list()
+            by_c_cache: dict[tuple[int, ...], tuple] = dict()
+            for c in range(256):
+                if not (c_paths := tuple(i for i, mask in enumerate(c_masks) if (mask >> c) & 1)):
+                    by_c.append(None)
+                elif (by_d := by_c_cache.get(c_paths)) is not None:
+                    by_c.append(by_d)
+                else:
+                    by_d = list()
+                    for d in range(256):
+                        rows = tuple(row for d_mask, row in map(paths.__getitem__, c_paths) if (d_mask >> d) & 1)
+                        by_d.append(rows_cache.setdefault(rows, rows))
+                    by_c.append(by_c_cache.setdefault(c_paths, tuple(by_d)))
+            for a in a_values:
+                media[a] = (default, tuple(by_c))
+        self.__media = tuple(media)
+
+    @classmethod
+    def __flatten(cls, rules: tuple, masks: list[int]) -> Iterator[tuple[list[int], RelationGroup | None]]:
+        """rules tree to ordered paths. After nested rules add path with None for stop search by outer condition"""
+        for condition, result in rules:
+            new = list(masks)
+            for field, value in condition.items():
+                new[cls.__FIELDS[field]] &= get_mask(value)
+            if 0 in new:
+                continue
+            elif isinstance(result, tuple):
+                yield from cls.__flatten(result, new)
+                yield new, None
+            else:
+                yield new, result
+
+    def get(self, value: bytes) -> RelationGroup:
+        """by LN contents"""
+        default, by_c = self.__media[value[0]]
+        if (by_d := by_c[value[2]]) is not None:
+            for e, f, b, group in by_d[value[3]]:
+                if (e >> value[4]) & (f >> value[5]) & (b >> value[1]) & 1:
+                    return default if group is None else group
+        return default
+
+
+relation_groups = RelationGroupTable(RELATION_RULES)
+
+
 def get_relation_group(ln: cst.LogicalName) -> RelationGroup:
-    if ln.a == media_id.ABSTRACT:
-        if ln.c == 0:
-            if ln.d == 1:
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES
-            elif ln.d in (2, 9):
-                return media_id.OTHER_ABSTRACT_GENERAL_PURPOSE_OBIS_CODES
-        elif ln.c == 1:
-            if ln.d in (0, 1, 2, 3, 4, 5, 6):
-                return media_id.CLOCK_OBJECTS
-        elif ln.c == 2:
-            if ln.d in (0, 1, 2):
-                return media_id.MODEM_CONFIGURATION_AND_RELATED_OBJECTS
-        elif ln.c == 10 and ln.d == 0 and ln.e in (0, 1, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 125):
-            return media_id.SCRIPT_TABLE_OBJECTS
-        elif ln.c == 11 and ln.d == 0:
-            return media_id.SPECIAL_DAYS_TABLE_OBJECTS
-        elif ln.c == 12 and ln.d == 0:
-            return media_id.SCHEDULE_OBJECTS
-        elif ln.c == 13 and ln.d == 0:
-            return media_id.ACTIVITY_CALENDAR_OBJECTS
-        elif ln.c == 14 and ln.d == 0:
-            return media_id.REGISTER_ACTIVATION_OBJECTS
-        elif ln.c == 15 and ln.d == 0 and ln.e in (0, 1, 2, 3, 4, 5, 6, 7):
-            return media_id.SINGLE_ACTION_SCHEDULE_OBJECTS
-        elif ln.c == 16:
-            if ln.d == 0 or (ln.d == 1 and ln.e in range(0, 10)):
-                return media_id.REGISTER_OBJECTS_MONITOR
-            elif ln.d == 2:
-                return media_id.PARAMETER_MONITOR_OBJECTS
-        elif ln.c == 17 and ln.d == 0:
-            return media_id.LIMITER_OBJECTS
-        elif ln.c == 18 and ln.d == 0:
-            return media_id.ARRAY_MANAGER_OBJECT
-        elif ln.c == 19:
-            if (ln.d in range(0, 10) and ln.e == 0) or ln.d in range(10, 50) or ln.d in (range(50, 60) and ln.e in (1, 2)):
-                return media_id.PAYMENT_METERING_RELATED_OBJECTS
-        elif ln.c == 20 and ln.d == 0 and ln.e in (0, 1):
-            return media_id.IEC_LOCAL_PORT_SETUP_OBJECTS
-        elif ln.c == 21 and ln.d == 0:
-            return media_id.STANDARD_READOUT_PROFILE_OBJECTS
-        elif ln.c == 22 and ln.d == 0 and ln.e == 0:
-            return media_id.IEC_HDLC_SETUP_OBJECTS
-        elif ln.c == 23:
-            if (ln.d in 0, 1, 2 and ln.e == 0) or ln.d == 3:
-                return media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS
-        elif ln.c == 24:
-            if (ln.d in (0, 1, 4, 5, 6) and ln.e == 0) or (ln.d in (2, 8, 9)):
-                return media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS
-        elif ln.c == 31 and ln.d == 0 and ln.e == 0:
-            return media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS
-        elif ln.c == 25:
-            if ln.d in (0, 1, 2, 3, 4, 5, 6, 7, 10, 11, 12, 13, 14, 15) and ln.e == 0:
-                return media_id.OBJECTS_TO_SET_UP_DATA_EXCHANGE_OVER_THE_INTERNET
-            elif ln.d == 9 and ln.e == 0:
-                return media_id.OBJECTS_TO_SET_UP_PUSH_SETUP
-        elif ln.c == 26 and ln.d in (0, 1, 2, 3, 5, 6) and ln.e == 0:
-            return media_id.OBJECTS_FOR_SETTING_UP_DATA_EXCHANGE_USING_S_FSK_PLC
-        elif ln.c == 27 and ln.d in (0, 1, 2) and ln.e == 0:
-            return media_id.OBJECTS_FOR_SETTING_UP_THE_ISO_IEC_8802_2_LLC_LAYER
-        elif ln.c == 28 and ln.d in (0, 1, 2, 3, 4, 5, 6, 7) and ln.e == 0:
-            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROWBAND_OFDM_PLC_FOR_PRIME_NETWORKS
-        elif ln.c == 29 and ln.d in (0, 1, 2) and ln.e == 0:
-            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROW_BAND_OFDM_PLC_FOR_G3_PLC_NETWORKS
-        elif ln.c == 30 and ln.d in (0, 1, 2, 3, 4):
-            return media_id.ZIGBEE_SETUP_OBJECTS
-        elif ln.c == 32 and ln.d in (0, 1, 2, 3) and ln.e == 0:
-            return media_id.OBJECTS_FOR_SETTING_UP_AND_MANAGING_DATA_EXCHANGE_USING_ISO_IEC_14908_PLC_NETWORKS
-        elif ln.c == 33 and ln.d in (0, 1, 2, 3) and ln.e == 0:
-            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_HS_PLC_ISO_IEC_12139_1_ISO_EC_12139_1_NETWORKS
-        elif ln.c == 34 and ln.d in (0, 1, 2, 3) and ln.e == 0:
-            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_WI_SUN_NETWORKS
-        elif ln.c == 40 and ln.b == 0 and ln.d == 0:
-            return media_id.ASSOCIATION_OBJECTS
-        elif ln.c == 41 and ln.b == 0 and ln.d == 0 and ln.e == 0:
-            return media_id.SAP_ASSIGNMENT_OBJECT
-        elif ln.c == 42 and ln.b == 0 and ln.d == 0 and ln.e == 0:
-            return media_id.COSEM_LOGICAL_DEVICE_NAME_OBJECT
-        elif ln.c == 43:
-            if (ln.b == 0 and ln.d == 0) or ln.d in (1, 2):
-                return media_id.INFORMATION_SECURITY_RELATED_OBJECTS
-        elif ln.c == 44:
-            if ln.b == 0:
-                if ln.d == 0:
-                    return media_id.IMAGE_TRANSFER_OBJECTS
-                elif ln.d == 1:
-                    return media_id.FUNCTION_CONTROL_OBJECTS
-                elif ln.d == 2:
-                    return media_id.COMMUNICATION_PORT_PROTECTION_OBJECTS
-        elif ln.c == 65 and ln.d in __range63:
-            return media_id.UTILITY_TABLE_OBJECTS
-        elif ln.c == 66 and ln.d == 0:
-            return media_id.COMPACT_DATA_OBJECTS
-        elif ln.c == 96:
-            if ln.d == 1:
-                if ln.e in __range10_and_255:
-                    return media_id.DEVICE_ID_OBJECTS
-                elif ln.e == 10:
-                    return media_id.METERING_POINT_ID_OBJECTS
-            elif ln.d == 2:
-                return media_id.PARAMETER_CHANGES_AND_CALIBRATION_OBJECTS
-            elif ln.d == 3:
-                if ln.e in (0, 1, 2, 3, 4):
-                    return media_id.I_O_CONTROL_SIGNAL_OBJECTS
-                elif ln.e == 10:
-                    return media_id.DISCONNECT_CONTROL_OBJECTS
-                elif ln.e in range(20, 30):
-                    return media_id.ARBITRATOR_OBJECTS
-            elif ln.d == 4 and ln.e in (0, 1, 2, 3, 4):
-                return media_id.STATUS_OF_INTERNAL_CONTROL_SIGNALS_OBJECTS
-            elif ln.d == 5 and ln.e in (0, 1, 2, 3, 4):
-                return media_id.INTERNAL_OPERATING_STATUS_OBJECTS
-            elif ln.d == 6 and ln.e in (0, 1, 2, 3, 4, 5, 6):
-                return media_id.BATTERY_ENTRIES_OBJECTS
-            elif ln.d == 7 and ln.e in range(0, 22):
-                return media_id.POWER_FAILURE_MONITORING_OBJECTS
-            elif ln.d == 8 and ln.e in __range63:
-                return media_id.OPERATING_TIME_OBJECTS
-            elif ln.d == 9 and ln.e in (0, 1, 2):
-                return media_id.ENVIRONMENT_RELATED_PARAMETERS_OBJECTS
-            elif ln.d == 10 and ln.e in range(1, 11):
-                return media_id.STATUS_REGISTER_OBJECTS
-            elif ln.d == 11 and ln.e in range(0, 100):
-                return media_id.EVENT_CODE_OBJECTS
-            elif ln.d == 12 and ln.e in range(0, 7):
-                return media_id.COMMUNICATION_PORT_LOG_PARAMETER_OBJECTS
-            elif ln.d == 13 and ln.e in (0, 1):
-                return media_id.CONSUMER_MESSAGE_OBJECTS
-            elif ln.d == 14 and ln.e in range(0, 16):
-                return media_id.CURRENTLY_ACTIVE_TARIFF_OBJECTS
-            elif ln.d == 15 and ln.e in range(0, 100):
-                return media_id.EVENT_COUNTER_OBJECTS
-            elif ln.d == 16 and ln.e in range(0, 10):
-                return media_id.PROFILE_ENTRY_DIGITAL_SIGNATURE_OBJECTS
-            elif ln.d == 17 and ln.e in range(0, 128):
-                return media_id.PROFILE_ENTRY_COUNTER_OBJECTS
-            elif ln.d == 20:
-                return media_id.METER_TAMPER_EVENT_RELATED_OBJECTS
-            elif ln.d in range(50, 100):
-                return media_id.ABSTRACT_MANUFACTURER_SPECIFIC
-        elif ln.c == 97:
-            if ln.d == 97 and ln.e in __range10_and_255:
-                return media_id.ERROR_REGISTER_OBJECTS
-            elif ln.d == 98 and (ln.e in chain(range(0, 30), (255,))):
-                return media_id.ALARM_REGISTER_FILTER_DESCRIPTOR_OBJECTS
-        elif ln.c == 98:
-            return media_id.GENERAL_LIST_OBJECTS
-        elif ln.c == 99:
-            if ln.d in (1, 2, 12, 13, 14, 15, 16, 17, 18) or (ln.d == 3 and ln.e == 0):
-                return media_id.ABSTRACT_DATA_PROFILE_OBJECTS
-            if ln.d == 98:
-                return media_id.EVENT_LOG_OBJECTS
-        elif ln.c == 127 and ln.d == 0:
-            return media_id.INACTIVE_OBJECTS
-        else:
-            return media_id.ABSTRACT
-    elif ln.a == media_id.ELECTRICITY:
-        if ln.c == 0:
-            if ln.d == 0 and ln.e in __range10_and_255:
-                return media_id.ID_NUMBERS_ELECTRICITY
-            elif ln.d == 1:
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_EL
-            elif ln.d in (2, 3, 4, 6, 7, 8, 9, 10):
-                return media_id.OTHER_ELECTRICITY_RELATED_GENERAL_PURPOSE_OBJECTS
-            elif ln.d == 11 and ln.e in (1, 2, 3, 4, 5, 6, 7):
-                return media_id.MEASUREMENT_ALGORITHM
-        elif ln.c in (1, 21, 41, 61):
-            return media_id.ACTIVE_POWER_PLUS
-        elif ln.c in (2, 22, 42, 62):
-            return media_id.ACTIVE_POWER_MINUS
-        elif ln.c in (3, 23, 43, 63):
-            return media_id.REACTIVE_POWER_PLUS
-        elif ln.c in (4, 24, 44, 64):
-            return media_id.REACTIVE_POWER_MINUS
-        elif ln.c in (5, 25, 45, 65):
-            return media_id.REACTIVE_POWER_QI
-        elif ln.c in (6, 26, 46, 66):
-            return media_id.REACTIVE_POWER_QII
-        elif ln.c in (7, 27, 47, 67):
-            return media_id.REACTIVE_POWER_QIII
-        elif ln.c in (8, 28, 48, 68):
-            return media_id.REACTIVE_POWER_QIV
-        elif ln.c in (9, 29, 49, 69):
-            return media_id.APPARENT_POWER_PLUS
-        elif ln.c in (10, 30, 50, 70):
-            return media_id.APPARENT_POWER_MINUS
-        elif ln.c in (11, 31, 51, 71):
-            return media_id.CURRENT
-        elif ln.c in (12, 32, 52, 72):
-            return media_id.VOLTAGE
-        elif ln.c in (13, 33, 53, 73):
-            return media_id.POWER_FACTOR
-        elif ln.c in (14, 34, 54, 74):
-            return media_id.SUPPLY_FREQUENCY
-        elif ln.c in (15, 35, 55, 75):
-            return media_id.ACTIVE_POWER_SUM
-        elif ln.c in (16, 36, 56, 76):
-            return media_id.ACTIVE_POWER_DIFF
-        elif ln.c in (17, 37, 57, 77):
-            return media_id.ACTIVE_POWER_QI
-        elif ln.c in (18, 38, 58, 78):
-            return media_id.ACTIVE_POWER_QII
-        elif ln.c in (19, 39, 59, 79):
-            return media_id.ACTIVE_POWER_QIII
-        elif ln.c in (20, 40, 60, 80):
-            return media_id.ACTIVE_POWER_QIV
-        elif ln.c == 96:
-            if ln.d == 1 and ln.e in __range10_and_255:
-                return media_id.ELECTRICITY_METERING_POINT_ID_OBJECTS
-            elif ln.d == 5 and ln.e in (0, 1, 2, 3, 4, 5):
-                return media_id.ELECTRICITY_RELATED_STATUS_OBJECTS
-            elif ln.d == 10 and ln.e in (0, 1, 2, 3):
-                return media_id.ELECTRICITY_RELATED_STATUS_OBJECTS
-        elif ln.c == 98:
-            return media_id.LIST_OBJECTS_ELECTRICITY
-        elif ln.d in range(31, 46) and ln.f in __range100_and_255:
-            if ln.c in __c1 and ln.e in __range63:
-                return media_id.THRESHOLD_VALUES
-            elif ln.c in __table44 and ln.e in __range120_and_124_127:
-                return media_id.THRESHOLD_VALUES
-        elif ln.f in __range100_and_255:
-            if ln.d in (31, 35, 39, 4, 5, 14, 15, 24, 25):
-                if ln.c in __c1 and ln.e in __range63:
-                    return media_id.REGISTER_MONITOR_OBJECTS
-                elif ln.c in __c2 and ln.e in __range120_and_124_127:
-                    return media_id.REGISTER_MONITOR_OBJECTS
-        else:
-            return media_id.ELECTRICITY
-    elif ln.a == media_id.HCA:
-        if ln.c == 0:
-            if ln.d == 0 and ln.e in __range10_and_255:
-                return media_id.ID_NUMBERS_HCA
-            elif ln.d == 1 and ln.e in (1, 2, 10, 11):
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_HCA
-            elif ln.d == 2 and ln.e in (0, 1, 2, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
-            elif ln.d == 4 and ln.e in (0, 1, 2, 3, 4, 5, 6):
-                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
-            elif ln.d == 5 and ln.e in (10, 11):
-                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
-            elif ln.d == 8 and ln.e in (0, 4, 6):
-                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
-            elif ln.d == 9 and ln.e in (1, 2, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
-        elif ln.c in (1, 2) and ln.e == 0:
-            if ln.d in (0, 6) and ln.f == 255:
-                return media_id.MEASURED_VALUES_HCA_CONSUMPTION
-            elif ln.d in (1, 2, 3, 4, 5) and ln.f in __range100_and_101_125_and_255:
-                return media_id.MEASURED_VALUES_HCA_CONSUMPTION
-        elif ln.c in range(3, 8) and ln.d in (0, 4, 5, 6) and ln.e == 255 and ln.f == 255:
-            return media_id.MEASURED_VALUES_HCA_TEMPERATURE
-        elif ln.c == 97 and ln.d == 97:
-            return media_id.ERROR_REGISTER_OBJECTS_HCA
-        elif ln.c == 98:
-            return media_id.LIST_OBJECTS_HCA
-        elif ln.c == 99 and ln.d == 1:
-            return media_id.DATA_PROFILE_OBJECTS_HCA
-        else:
-            return media_id.HCA
-    elif ln.a == media_id.THERMAL:
-        if ln.c == 0:
-            if ln.d == 0 and ln.e in __range10_and_255:
-                return media_id.ID_NUMBERS_THERMAL
-            elif ln.d == 1 and ln.e in (1, 2, 10, 11):
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_THERMAL
-            elif ln.d == 2 and ln.e in chain(range(0, 5), range(10, 14)):
-                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
-            elif ln.d == 4 and ln.e in (1, 2, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
-            elif ln.d == 5 and ln.e in chain(range(1, 10), range(21, 25)):
-                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
-            elif ln.d == 8 and ln.e in chain(range(0, 8), range(11, 15), range(21, 26), range(31, 35)):
-                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
-            elif ln.d == 9 and ln.e in (1, 2, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
-        elif ln.c in range(1, 8):
-            if ln.e in range(10):
-                if ln.d in (0, 1, 2, 3, 7) and ln.f == 255:
-                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
-                elif ln.d in (3, 8, 9) and ln.f in __range100_and_101_125_and_255:
-                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
-                elif ln.d in (1, 2, 4, 5, 12, 13, 14, 15) and ln.f in chain(range(100), range(100, 126)):
-                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
-            elif ln.d == 6 and ln.e == 255 and ln.f == 255:
-                return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
-        elif ln.e in range(10):
-            if ln.f in __range100_and_101_125_and_255:
-                if ln.c in range(1, 8) and ln.d in (5, 15):
-                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
-                elif ln.c in (8, 9) and ln.d in (1, 4, 5, 12, 13, 14, 15):
-                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
-            elif ln.c in range(10, 14):
-                if ln.d == 0 and ln.f == 255:
-                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
-                elif ln.d in (4, 5, 14, 15) and ln.f in chain(range(100), range(101, 126)):
-                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
-                elif ln.d in (6, 7, 10, 11) and ln.f == 255:
-                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
-            elif ln.c in range(1, 14) and (ln.d in range(20, 26)) and ln.f == 255:
-                return media_id.MEASURED_VALUES_THERMAL_ENERGY
-        elif ln.c == 97 and ln.d == 97 and ln.e in (0, 1, 2):
-            return media_id.ERROR_REGISTER_OBJECTS_THERMAL
-        elif ln.c == 98:
-            return media_id.LIST_OBJECTS_THERMAL
-        elif ln.c == 99 and ln.f == 255:
-            if ln.d in (1, 2) and ln.e in (1, 2, 3):
-                return media_id.DATA_PROFILE_OBJECTS_THERMAL
-            elif ln.d == 3 and ln.e == 1:
-                return media_id.DATA_PROFILE_OBJECTS_THERMAL
-            elif ln.d == 99:
-                return media_id.DATA_PROFILE_OBJECTS_THERMAL
-        else:
-            return media_id.THERMAL
-    elif media_id.GAS == ln.a:
-        if ln.c == 0:
-            if ln.d == 0 and ln.e in __range10_and_255:
-                return media_id.ID_NUMBERS_GAS
-            elif ln.d == 1:
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_GAS
-            elif ln.d in (2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15):
-                return media_id.GENERAL_PURPOSE_OBJECTS_GAS
-        elif ln.c == 96 and ln.d == 5 and (ln.e in range(10)):
-            return media_id.INTERNAL_OPERATING_STATUS_OBJECTS_GAS
-        elif ln.c in chain(range(1, 9), range(11, 17), range(21, 27), range(31, 36), range(61, 66)) and ln.e in __range63:
-            if ln.d in (24, 25, 26, 42, 43, 44, 63, 64, 65, 81, 82, 83) and ln.f in chain(range(100), range(101, 127)):
-                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
-            elif ln.d in chain(range(6, 24), range(27, 33), range(45, 51), range(66, 72), range(84, 90)) and ln.f == 255:
-                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
-            elif ln.d in chain(range(33, 42), range(52, 63), range(72, 81), range(90, 99)) and ln.f in chain(__range100_and_101_125_and_255, (126,)):
-                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
-        elif ln.c == 42 and ln.e == 0:
-            if ln.d in chain(0, 1, 2, 13, range(15, 19), range(19, 31), range(35, 51), range(55, 71)) and ln.f == 255:
-                return media_id.MEASURED_VALUES_GAS_FLOW_RATE
-            elif ln.d in chain(range(31, 35), range(51, 55)) and ln.f in chain(__range100_and_101_125_and_255, (126,)):
-                return media_id.MEASURED_VALUES_GAS_FLOW_RATE
-        elif ln.c in chain((41, 42), range(44, 50)) and ln.d in (0, 2, 3, 10, 11, 13, range(15, 92)) and ln.e == 0 and ln.f == 255:
-            return media_id.MEASURED_VALUES_GAS_PROCESS_VALUES
-        elif ln.c in range(51, 56):
-            if ln.d in (0, 2, 3, 10, 11) and ln.e in chain((0, 1), range(11, 29)) and ln.f == 255:
-                return media_id.CONVERSION_RELATED_FACTORS_AND_COEFFICIENTS_GAS
-            elif ln.d == 12 and ln.e in range(20) and ln.f == 255:
-                return media_id.CALCULATION_METHODS_GAS
-        elif ln.c == 70 and ln.f == 255:
-            if ln.d in (8, 9) and ln.e == 0:
-                return media_id.NATURAL_GAS_ANALYSIS
-            elif ln.d in chain(range(10, 21), range(60, 85)) and ln.e in chain((0, 1), range(11, 29)):
-                return media_id.NATURAL_GAS_ANALYSIS
-        elif ln.c == 98:
-            return media_id.LIST_OBJECTS_GAS
-        else:
-            return media_id.GAS
-    elif ln.a == media_id.WATER:
-        if ln.c == 0:
-            if ln.d == 0 and ln.e in __range10_and_255:
-                return media_id.ID_NUMBERS_WATER
-            elif ln.d == 1 and ln.e in (1, 2, 10, 11, 12):
-                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_WATER
-            elif ln.d == 2 and ln.e in (0, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
-            elif ln.d in (5, 7) and ln.e == 1:
-                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
-            elif ln.d == 8 and ln.e in (1, 6):
-                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
-            elif ln.d == 9 and ln.e in (1, 2, 3):
-                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
-        elif ln.c == 1 and ln.e in range(0, 13):
-            if ln.d in (0, 1, 2, 3, 6) and ln.f == 255:
-                return media_id.MEASURED_VALUES_WATER_CONSUMPTION
-            elif ln.d in range(1, 6) and ln.f in chain(range(100), range(101, 126)):
-                return media_id.MEASURED_VALUES_WATER_CONSUMPTION
-        elif ln.c in (2, 3) and ln.e in range(0, 13):
-            if ln.d in (0, 1, 2, 3, 6) and ln.f == 255:
-                return media_id.MEASURED_VALUES_WATER_MONITORING_VALUES
-            elif ln.d in range(1, 6) and ln.f in chain(range(100), range(101, 126)):
-                return media_id.MEASURED_VALUES_WATER_MONITORING_VALUES
-        elif ln.c == 97 and ln.d == 97:
-            return media_id.ERROR_REGISTER_OBJECTS_WATER
-        elif ln.c == 98:
-            return media_id.LIST_OBJECTS_WATER
-        elif ln.c == 99 and ln.d == 1:
-            return media_id.DATA_PROFILE_OBJECTS_WATER
-        else:
-            return media_id.WATER
-    return media_id.OTHER_MEDIA
+    return relation_groups.get(ln.contents)
 
 
 DLMSObjectContainer: TypeAlias = Collection | list[InterfaceClass] | filter
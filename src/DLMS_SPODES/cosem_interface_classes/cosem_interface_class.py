@@ -95,6 +95,10 @@ _LN_ELEMENT = ICAElement(
 """" first element for each COSEM Interface Class"""
 
 
+_CONSTANT_ATTRIBUTES = frozenset(('VERSION', 'CLASS_ID', 'A_ELEMENTS', 'M_ELEMENTS'))
+"""class attributes not changeable in instance"""
+
+
 class ObjectValidationError(exc.DLMSException):
     """use in validation method of COSEMInterfaceClasses"""
     def __init__(self,
@@ -106,6 +110,137 @@ class ObjectValidationError(exc.DLMSException):
         self.i = i
 
 
+class _EmptyCallbacks:
+    """read only callbacks container of objects without callbacks, shared by all. Own dict created in object by first add"""
+    __slots__ = tuple()
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+    def __contains__(self, i: int):
+        return False
+
+    def __getitem__(self, i: int):
+        raise KeyError(i)
+
+    def get(self, i: int, default=None):
+        return default
+
+    def pop(self, i: int, *default):
+        if default:
+            return default[0]
+        raise KeyError(i)
+
+
+_EMPTY_CALLBACKS = _EmptyCallbacks()
+
+
+class Transaction:
+    """changes of attributes by set_attr inside Collection.transaction. Post init callbacks deferred to commit(or set of other attribute of object, callback
+    can define it type) and run once by attribute, all changes rollback by error. Not strict keep changes with failed callbacks in errors, as set_attr
+    without transaction"""
+    max_passes: int = 3
+    """attempts for callbacks waiting of other callbacks(EmptyObj, NoObject)"""
+    strict: bool
+    errors: list[ObjectValidationError]
+    """failed callbacks of not strict transaction"""
+    __states: dict[tuple[int, int], tuple["COSEMInterfaceClasses", int, cdt.CommonDataType | None, bytes | None, bool]]
+    """(id(obj), index) -> (object, index, origin value, origin encoding, origin shared)"""
+    __deferred: dict[int, tuple["COSEMInterfaceClasses", dict[int, None]]]
+    """id(obj) -> (object, indexes) of post init callbacks in order of initiation"""
+    __popped: list[tuple[dict[int, Callable], int, Callable]]
+    """callbacks popped inside transaction for restore by rollback"""
+
+    def __init__(self, strict: bool = True):
+        self.strict = strict
+        self.errors = list()
+        self.__states = dict()
+        self.__deferred = dict()
+        self.__popped = list()
+
+    def __len__(self):
+        return len(self.__states)
+
+    def record(self, obj: "COSEMInterfaceClasses", i: int):
+        """keep origin attribute state before first change"""
+        if (key := (id(obj), i)) not in self.__states:
+            value = obj.get_attr_link(i)
+            self.__states[key] = (obj, i, value, None if value is None else value.encoding, obj.is_shared(i))
+
+    def defer(self, obj: "COSEMInterfaceClasses", i: int):
+        """post init callback to commit"""
+        if (item := self.__deferred.get(id(obj))) is None:
+            item = self.__deferred[id(obj)] = (obj, dict())
+        item[1][i] = None
+
+    def flush(self, obj: "COSEMInterfaceClasses", i: int):
+        """run deferred callbacks of object before set <i> attribute. Failed by absence of other attributes(objects) wait commit"""
+        if (item := self.__deferred.get(id(obj))) is not None and (indexes := [j for j in item[1] if j != i]):
+            for j in indexes:
+                del item[1][j]
+            if len(item[1]) == 0:
+                del self.__deferred[id(obj)]
+            for j in indexes:
+                if self.__run(obj, j) is not None:
+                    self.defer(obj, j)
+
+    def __run(self, obj: "COSEMInterfaceClasses", i: int) -> exc.ITEApplication | None:
+        """return error of callback for repeat"""
+        if cb_func := obj._cbs_attr_post_init.get(i, None):
+            try:
+                cb_func()
+            except exc.ITEApplication as e:
+                return e
+            except (IndexError, TypeError, ValueError, AttributeError) as e:
+                if self.strict:
+                    raise
+                self.errors.append(ObjectValidationError(obj.logical_name, i, F"post init callback failed: {e}"))
+                return None
+            self.pop_callback(obj._cbs_attr_post_init, i)
+        return None
+
+    def pop_callback(self, callbacks: dict[int, Callable], i: int):
+        if (cb_func := callbacks.pop(i, None)) is not None:
+            self.__popped.append((callbacks, i, cb_func))
+
+    def commit(self):
+        """run deferred callbacks, with deferred by callbacks. Callbacks failed by absence of other attributes(objects) repeat after others"""
+        pending: list[tuple["COSEMInterfaceClasses", int]] = list()
+        for _ in range(self.max_passes):
+            failed = list()
+            amount = 0
+            while pending or self.__deferred:
+                for obj, indexes in self.__deferred.values():
+                    pending.extend((obj, i) for i in indexes)
+                self.__deferred.clear()
+                obj, i = pending.pop(0)
+                amount += 1
+                if (e := self.__run(obj, i)) is not None:
+                    failed.append((obj, i, e))
+            if len(failed) == 0:
+                return
+            elif len(failed) == amount:
+                break
+            pending = [(obj, i) for obj, i, _ in failed]
+        if self.strict:
+            obj, i, e = failed[0]
+            raise ObjectValidationError(obj.logical_name, i, F"post init callback failed: {e}")
+        else:
+            self.errors.extend(ObjectValidationError(obj.logical_name, i, F"post init callback failed: {e}") for obj, i, e in failed)
+
+    def rollback(self):
+        for callbacks, i, cb_func in reversed(self.__popped):
+            callbacks[i] = cb_func
+        for obj, i, value, encoding, shared in reversed(self.__states.values()):
+            obj._restore_attr(i, value, encoding, shared)
+        self.__popped.clear()
+        self.__deferred.clear()
+        self.__states.clear()
+
+
 class COSEMInterfaceClasses(ABC):
     CLASS_ID: classID
     VERSION: overview.Version | None = None
@@ -113,79 +248,126 @@ class COSEMInterfaceClasses(ABC):
     attribute of an “Association LN” / ”Association SN” object. Within one logical device, all instances of a certain class must be of the same version."""
     A_ELEMENTS: tuple[ICAElement, ...]
     M_ELEMENTS: tuple[ICMElement, ...] = tuple()  # empty if class not has the methods
-    cardinality: tuple[int, int | None]
+    cardinality: tuple[int, int | None] = (0, None)
+    """ (min, max). default is (0, None) from 0 to infinity. If min == max then they are value.   
+    Specifies the number of instances of the class within a logical device. value The class shall be 
+    instantiated exactly “value” times. min...max. The class shall be instantiated at least “min.” times 
+    and at most “max.” times. If min. is zero (0) then the class is optional, otherwise (min. > 0) "min." 
+    instantiations of the class are mandatory. """
     __attributes: list[cdt.CommonDataType | None]
-    __specific_methods: tuple[cdt.CommonDataType, ...] = None
-    _cbs_attr_post_init: dict[int, Callable]
-    __record_time: list[cdt.DateTime | None]  # TODO: make to int
+    __specific_methods: tuple[cdt.CommonDataType, ...] | None
+    _cbs_attr_post_init: dict[int, Callable] | _EmptyCallbacks
+    """container with callbacks for post initial attribute by index, for add use _add_cbs_attr_post_init"""
+    _cbs_attr_before_init: dict[int, Callable] | _EmptyCallbacks
+    """container with callbacks for before initial attribute by index, for add use _add_cbs_attr_before_init"""
+    __record_time: list[cdt.DateTime | None] | None  # TODO: make to int
+    __shared: int
+    """bit mask of attribute indexes linked with other object values, copy by first access"""
+    __linking: int
+    """attribute index in post init callback of linked value by copy, get_attr return link for it"""
+    _BOUND_VALUES: frozenset[int] = frozenset()
+    """attribute indexes with post init callbacks bound to value, copied without link"""
+    _DEFAULTS: int = 0
+    """bit mask of attribute indexes with default value"""
+    __pending: int
+    """bit mask of attribute indexes with default value not created yet. Create by first access"""
     collection: Any  # col.Collection | None
+    __slots__ = ("__attributes", "__specific_methods", "_cbs_attr_post_init", "_cbs_attr_before_init", "__record_time", "__shared", "__linking", "__pending",
+                 "collection")
 
     def __init__(self, logical_name: cst.LogicalName | bytes | str):
-        self.collection = None
-        # """ TODO: """
-        self.cardinality = (0, None)
-        """ (min, max). default is (0, None) from 0 to infinity. If min == max then they are value.   
-        Specifies the number of instances of the class within a logical device. value The class shall be 
-        instantiated exactly “value” times. min...max. The class shall be instantiated at least “min.” times 
-        and at most “max.” times. If min. is zero (0) then the class is optional, otherwise (min. > 0) "min." 
-        instantiations of the class are mandatory. """
-
         self.__attributes = [_LN_ELEMENT.DATA_TYPE(logical_name), *[None] * len(self.A_ELEMENTS)]
         """ Attributes container """
+        self.__specific_methods = None
+        self._cbs_attr_post_init = _EMPTY_CALLBACKS
+        self._cbs_attr_before_init = _EMPTY_CALLBACKS
+        self.__record_time = None
+        self.__shared = 0
+        self.__linking = 0
+        self.__pending = self._DEFAULTS
+        """attributes with default value and specific methods created by first access"""
+        self.collection = None
+        self.characteristics_init()
 
-        if self.M_ELEMENTS is not None:
-            self.__specific_methods = tuple(el.DATA_TYPE() for el in self.M_ELEMENTS)
-            """Specific methods container"""
-
-        self._cbs_attr_post_init = dict()
-        """container with callbacks for post initial attribute by index"""
-
-        self._cbs_attr_before_init = dict()
-        """container with callbacks for before initial attribute by index"""
-
-        self.__record_time = [None] * len(self.A_ELEMENTS)
-
-        # init all attributes with default value
-        for i in range(2, len(self.A_ELEMENTS)+2):
-            default = self.get_attr_element(i).default
-            if default is not None:
-                self.set_attr(i, default)
+    def _add_cbs_attr_post_init(self, callbacks: dict[int, Callable]):
+        """add post init callbacks by attribute index, own container created by first add"""
+        if self._cbs_attr_post_init is _EMPTY_CALLBACKS:
+            self._cbs_attr_post_init = dict()
+        self._cbs_attr_post_init.update(callbacks)
 
-        self.characteristics_init()
+    def _add_cbs_attr_before_init(self, callbacks: dict[int, Callable]):
+        """add before init callbacks by attribute index, own container created by first add"""
+        if self._cbs_attr_before_init is _EMPTY_CALLBACKS:
+            self._cbs_attr_before_init = dict()
+        self._cbs_attr_before_init.update(callbacks)
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls.hash_ = next(_n_class)
+        if (elements := getattr(cls, "A_ELEMENTS", None)) is not None:
+            cls._DEFAULTS = sum(1 << i for i in range(2, len(elements)+2) if cls.get_attr_element(i).default is not None)
         # print(cls.__name__)
 
+    def __create_default(self, i: int):
+        """create pending default value without callbacks, as in initiation"""
+        self.__pending &= ~(1 << i)
+        self.__attributes[i-1] = self.get_attr_element(i).DATA_TYPE(self.get_attr_element(i).default)
+
+    def __create_defaults(self):
+        while self.__pending:
+            self.__create_default(self.__pending.bit_length() - 1)
+
     def copy(self, source: Self, association_id: int = 3):
-        """copy object according by association"""
+        """copy object according by association. STATIC attributes linked with source values(copy by first access)"""
         for i, value in source.get_index_with_attributes():
             el = self.get_attr_element(i)
             if i == 1 or value is None or (not isinstance(el.DATA_TYPE, ut.CHOICE) and el.classifier == Classifier.DYNAMIC):
                 continue
-            else:
-                if source.collection is not None and self.get_attr_element(i).classifier == Classifier.STATIC and not source.collection.is_writable(ln=self.logical_name,
-                                                                                                                                                    index=i,
-                                                                                                                                                    association_id=association_id):
-                    # Todo: may be callbacks inits remove?
-                    if cb_func := self._cbs_attr_before_init.get(i, None):
-                        cb_func(value)                    # Todo: 'a' as 'new_value' in set_attr are can use?
-                        self._cbs_attr_before_init.pop(i)
-                    self.__attributes[i-1] = value
-                    if cb_func := self._cbs_attr_post_init.get(i, None):
-                        cb_func()
-                        self._cbs_attr_post_init.pop(i)
-                else:
-                    if isinstance(arr := self.__attributes[i-1], cdt.Array):
-                        arr.set_type(value.TYPE)
+            elif el.classifier == Classifier.STATIC and i not in self._BOUND_VALUES and (
+                    self.__is_linkable(i)
+                    or (source.collection is not None and not source.collection.is_writable(ln=self.logical_name,
+                                                                                             index=i,
+                                                                                             association_id=association_id))):
+                if cb_func := self._cbs_attr_before_init.get(i, None):
+                    cb_func(value)                    # Todo: 'a' as 'new_value' in set_attr are can use?
+                    self._cbs_attr_before_init.pop(i)
+                self.__pending &= ~(1 << i)
+                self.__attributes[i-1] = value
+                self.__shared |= 1 << i
+                source.__shared |= 1 << i
+                if cb_func := self._cbs_attr_post_init.get(i, None):
+                    self.__linking = i
                     try:
-                        self.set_attr(
-                            index=i,
-                            value=value.encoding,
-                            data_type=source.get_attr(i).__class__)
-                    except exc.EmptyObj as e:
-                        logger.warning(F"can't copy {self} attr={i}, skipped. {e}")
+                        cb_func()
+                    finally:
+                        self.__linking = 0
+                    self._cbs_attr_post_init.pop(i)
+            else:
+                if isinstance(arr := self.get_attr(i), cdt.Array):
+                    arr.set_type(value.TYPE)
+                try:
+                    self.set_attr(
+                        index=i,
+                        value=value.encoding,
+                        data_type=value.__class__)
+                except exc.EmptyObj as e:
+                    logger.warning(F"can't copy {self} attr={i}, skipped. {e}")
+
+    def __is_linkable(self, i: int) -> bool:
+        """attribute value can be replaced by link: initial value without callbacks"""
+        if (value := self.__attributes[i-1]) is None:
+            return True
+        else:
+            return not hasattr(value, "cb_post_set") and not hasattr(value, "cb_preset")
+
+    def is_shared(self, i: int) -> bool:
+        """True if attribute value linked with other object(copy on write)"""
+        return bool(self.__shared & (1 << i))
+
+    def __unshare(self, i: int):
+        """replace linked attribute value by own copy"""
+        self.__attributes[i-1] = self.__attributes[i-1].copy()
+        self.__shared &= ~(1 << i)
 
     @classmethod
     def get_attr_element(cls, i: int) -> ICAElement:
@@ -204,9 +386,25 @@ class COSEMInterfaceClasses(ABC):
         """ initiate all attributes and methods of class """
 
     def get_attr(self, index: int) -> Any | None:
+        """value of attribute. Linked value replaced by own copy before return, it can be changed in place"""
         if index > (max_l := self.get_attr_length()):
             raise IndexError(F"for {self} got attribute index: {index}, expected 0..{max_l}")
         elif index >= 1:
+            if self.__pending & (1 << index):
+                self.__create_default(index)
+            elif self.__shared & (1 << index) and index != self.__linking:
+                self.__unshare(index)
+            return self.__attributes[index-1]
+        else:
+            raise IndexError(F"not support {index=} as attribute")
+
+    def get_attr_link(self, index: int) -> Any | None:
+        """value of attribute without copy of linked value. Only for read, don't change it"""
+        if index > (max_l := self.get_attr_length()):
+            raise IndexError(F"for {self} got attribute index: {index}, expected 0..{max_l}")
+        elif index >= 1:
+            if self.__pending & (1 << index):
+                self.__create_default(index)
             return self.__attributes[index-1]
         else:
             raise IndexError(F"not support {index=} as attribute")
@@ -214,14 +412,16 @@ class COSEMInterfaceClasses(ABC):
     def set_attr_force(self,
                        index: int,
                        value: cdt.CommonDataType):
+        self.__pending &= ~(1 << index)
         self.__attributes[index-1] = value
         """use for change official types to custom(not valid)"""
+        self.__shared &= ~(1 << index)
 
     def encode(self,
                index: int,
                value: str | int) -> cdt.CommonDataType | None:
         """encode attribute value from string if possible, else return None(for CHOICE variant)"""
-        if (attr := self.get_attr(index)) is None:
+        if (attr := self.get_attr_link(index)) is None:
             data_type = self.get_attr_element(index).DATA_TYPE
             if isinstance(data_type, ut.CHOICE):
                 return None
@@ -231,36 +431,64 @@ class COSEMInterfaceClasses(ABC):
             ret = attr.copy()
             return ret.set(value)
 
+    def __get_transaction(self) -> Transaction | None:
+        return None if self.collection is None else self.collection.transaction
+
     def set_attr(self,
                  index: int,
                  value=None,
                  data_type: cdt.CommonDataType = None):
         value = self.get_attr_element(index).default if value is None else value
         data_type = self.get_attr_element(index).DATA_TYPE if data_type is None else data_type
+        if self.__pending & (1 << index):
+            self.__create_default(index)
+        if (tr := self.__get_transaction()) is not None:
+            tr.flush(self, index)
+            tr.record(self, index)
         if self.__attributes[index-1] is None:
             new_value = data_type(value)
             if cb_func := self._cbs_attr_before_init.get(index, None):
                 cb_func(new_value)
-                self._cbs_attr_before_init.pop(index)
+                if tr is None:
+                    self._cbs_attr_before_init.pop(index)
+                else:
+                    tr.pop_callback(self._cbs_attr_before_init, index)
             self.__attributes[index-1] = new_value
-            if cb_func := self._cbs_attr_post_init.get(index, None):
+            if tr is not None:
+                tr.defer(self, index)
+            elif cb_func := self._cbs_attr_post_init.get(index, None):
                 cb_func()
                 self._cbs_attr_post_init.pop(index)
             else:
                 """without callback post init"""
         else:
+            if self.__shared & (1 << index):
+                self.__unshare(index)
             self.__attributes[index-1].set(value)
 
+    def _restore_attr(self, i: int, value: cdt.CommonDataType | None, encoding: bytes | None, shared: bool):
+        """rollback of Transaction: return origin value(linked) or origin encoding of changed value"""
+        self.__pending &= ~(1 << i)
+        self.__attributes[i-1] = value
+        if shared:
+            self.__shared |= 1 << i
+        else:
+            self.__shared &= ~(1 << i)
+            if value is not None and value.encoding != encoding:
+                value.set(encoding)
+
     def set_attr_link(self, index: int, link: cdt.CommonDataType):
         # self.__attributes[index - 1] = link  # TODO: without validate now for pass load_objects
         if isinstance(link, self.get_attr_element(index).DATA_TYPE):
+            self.__pending &= ~(1 << index)
             self.__attributes[index-1] = link
+            self.__shared &= ~(1 << index)
         else:
             raise ValueError(F'get wrong link: {link} for {self} attr: {index}')
 
     def get_attr_data_type(self, index: int) -> Type[cdt.CommonDataType] | ut.CHOICE:
         """search data_type attribute value"""
-        value: cdt.CommonDataType = self.get_attr(index)
+        value: cdt.CommonDataType = self.get_attr_link(index)
         if value is not None:
             return value.__class__
         else:
@@ -269,24 +497,35 @@ class COSEMInterfaceClasses(ABC):
     def clear_attr(self, i: int):
         """use in template"""
         if i > 1:
+            self.__pending &= ~(1 << i)
             self.__attributes[i-1] = None
+            self.__shared &= ~(1 << i)
         else:
             raise ValueError(F'not support clear {self} attr: {i}')
 
+    def __get_methods(self) -> tuple[cdt.CommonDataType, ...] | None:
+        if self.__specific_methods is None and self.M_ELEMENTS is not None:
+            self.__specific_methods = tuple(el.DATA_TYPE() for el in self.M_ELEMENTS)
+            """Specific methods container"""
+        return self.__specific_methods
+
     def get_meth(self, index: int) -> Any:
         if index >= 1:
-            return self.__specific_methods[index-1]
+            return self.__get_methods()[index-1]
         else:
             raise IndexError(F'not support {index=} as attribute')
 
     def get_record_time(self, index: int) -> cdt.DateTime | None:
-        return self.__record_time[index-2]
+        return None if self.__record_time is None else self.__record_time[index-2]
 
     def set_record_time(self, index: int, value: str | bytes | cdt.DateTime):
+        if self.__record_time is None:
+            self.__record_time = [None] * len(self.A_ELEMENTS)
         self.__record_time[index-2] = cdt.DateTime(value)
 
-    def get_index_with_attributes(self) -> Iterator[tuple[int, cdt.CommonDataType | None]]:
-        """ if by initiation order is True then need override method for concrete class"""
+    def get_index_with_attributes(self, in_init_order: bool = False) -> Iterator[tuple[int, cdt.CommonDataType | None]]:
+        """ if by initiation order is True then need override method for concrete class. Linked values without copy as get_attr_link, only for read """
+        self.__create_defaults()
         return iter(zip(range(1, self.get_attr_length()+1), self.__attributes))
 
     def get_attr_length(self) -> int:
@@ -295,7 +534,7 @@ class COSEMInterfaceClasses(ABC):
 
     @property
     def it_index_with_meth(self) -> Iterator[tuple[int, cdt.CommonDataType]]:
-        return iter(zip(range(1, 20), self.__specific_methods))
+        return iter(zip(range(1, 20), self.__get_methods()))
 
     @property
     def logical_name(self) -> cst.LogicalName:
@@ -307,9 +546,9 @@ class COSEMInterfaceClasses(ABC):
         return self.logical_name < other.logical_name
 
     def __setattr__(self, key, value):
-        match key:
-            case 'VERSION' | 'CLASS_ID' | 'A_ELEMENTS' | 'M_ELEMENTS' as prop: raise ValueError(F"Don't support set {prop}")
-            case _:                                                            super().__setattr__(key, value)
+        if key in _CONSTANT_ATTRIBUTES:
+            raise ValueError(F"Don't support set {key}")
+        super().__setattr__(key, value)
 
     def __getitem__(self, item) -> cdt.CommonDataType:
         """ get attribute value by index, start with 1 """
@@ -318,7 +557,8 @@ class COSEMInterfaceClasses(ABC):
         return self.get_attr(item)
 
     def __iter__(self) -> Iterator[cdt.CommonDataType]:
-        """ return attributes iterator"""
+        """ return attributes iterator. Linked values without copy as get_attr_link, only for read """
+        self.__create_defaults()
         return iter(self.__attributes)
 
     def __str__(self):
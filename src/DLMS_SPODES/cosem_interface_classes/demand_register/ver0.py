@@ -17,6 +17,7 @@ class DemandRegister(ic.COSEMInterfaceClasses):
                   ic.ICAElement("number_of_periods", cdt.LongUnsigned, min=1, default=1))
     M_ELEMENTS = ic.ICMElement("reset", integers.Only0),
     scaler_unit_not_settable: bool
+    __slots__ = ("scaler_unit_not_settable",)
 
     @property
     def current_average_value(self) -> choices.RegisterValues:
@@ -51,9 +52,9 @@ class DemandRegister(ic.COSEMInterfaceClasses):
         return self.get_attr(9)
 
     def characteristics_init(self):
-        self._cbs_attr_post_init.update({2: lambda: self.__set_value_data_type(2),
-                                         3: lambda: self.__set_value_data_type(3),
-                                         4: self.__set_value_scaler_unit})
+        self._add_cbs_attr_post_init({2: lambda: self.__set_value_data_type(2),
+                                      3: lambda: self.__set_value_data_type(3),
+                                      4: self.__set_value_scaler_unit})
 
         self.scaler_unit_not_settable = False
         """ usability scaler unit flag. if True then it not used"""
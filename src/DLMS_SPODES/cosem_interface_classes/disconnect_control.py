@@ -6,11 +6,13 @@ from ..config_parser import get_message
 
 class ControlState(cdt.Enum, elements=(0, 1, 2)):
     """ Shows the internal state of the disconnect control object. """
+    __slots__ = tuple()
 
 
 class ControlMode(cdt.Enum, elements=tuple(chain(range(7), range(129, 135)))):
     """ Configures the behaviour of the disconnect control object for all triggers. Local disconnection is always possible.
     To suppress local disconnection, the corresponding trigger must be inhibited. """
+    __slots__ = tuple()
 
     def get_letters(self) -> str:
         """return transition litters"""
@@ -34,12 +36,14 @@ class ControlMode(cdt.Enum, elements=tuple(chain(range(7), range(129, 135)))):
 class OutputState(cdt.Boolean):
     """ Shows the actual physical state of the disconnect unit, i.e. if an electricity breaker or a gas valve is open or closed. TRUE = connected, FALSE = disconnected.
     In electricity metering, the supply is connected when the disconnector device is closed. In gas and water metering, the supply is connected when the valve is open """
+    __slots__ = tuple()
     def __str__(self):
         return get_message("$disconnected$") if self.contents == b'\x00' else get_message("$connected$")
 
 
 class DisconnectControl(ic.COSEMInterfaceClasses):
     """DLMS UA 1000-1 Ed. 14 4.5.8 Disconnect control"""
+    __slots__ = tuple()
     CLASS_ID = classID.DISCONNECT_CONTROL
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("output_state", OutputState, classifier=ic.Classifier.DYNAMIC),
@@ -7,6 +7,7 @@ class ExtendedRegister(register.Register, ic.COSEMInterfaceClasses):
     """ A “Register” object stores a process value or a status value with its associated unit. The register object knows
     the nature of the process value or of the status value. The nature of the value is described by the attribute
     “logical name” using the OBIS identification system. """
+    __slots__ = tuple()
     CLASS_ID = classID.EXT_REGISTER
     VERSION = Version.V0
     A_ELEMENTS = (register.Register.get_attr_element(2),
@@ -20,6 +20,7 @@ class QualityOfService(cdt.Structure):
 
 class GPRSModemSetup(ic.COSEMInterfaceClasses):
     """ This IC allow setting up GPRS modems, by handling all data necessary data for modem management. """
+    __slots__ = tuple()
     CLASS_ID = classID.GPRS_MODEM_SETUP
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("APN", cdt.OctetString),
@@ -4,18 +4,22 @@ from ...config_parser import get_message
 
 class Status(cdt.Enum, elements=tuple(range(6))):
     """ Indicates the registration status of the  modem. """
+    __slots__ = tuple()
 
 
 class CSAttachment(cdt.Enum, elements=(0, 1, 2)):
     """ Indicates the current circuit switched status."""
+    __slots__ = tuple()
 
 
 class PSStatus(cdt.Enum, elements=tuple(range(5))):
     """ Indicates the packet switched status of the modem. """
+    __slots__ = tuple()
 
 
 class SignalQuality(cdt.Unsigned):
     """for string report"""
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         value = int(self)
         if value == 0:
@@ -53,6 +57,7 @@ class GSMDiagnostic(ic.COSEMInterfaceClasses):
     """ The GSM/GPRS network is undergoing constant changes in terms of registration status, signal quality etc. It is necessary to monitor and log the relevant parameters in order
      to obtain diagnostic information that allows identifying communication problems in the network. An instance of the 'GSM diagnostic' class stores parameters of the GSM/GPRS
      network necessary for analysing the operation of the network."""
+    __slots__ = tuple()
     CLASS_ID = classID.GSM_DIAGNOSTIC
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("operator", cdt.VisibleString, classifier=ic.Classifier.DYNAMIC),
@@ -4,6 +4,7 @@ from . import ver0
 
 class PSStatus(cdt.Enum, elements=tuple(range(7))):
     """ Indicates the packet switched status of the modem. """
+    __slots__ = tuple()
 
 
 class CellInfoType(cdt.Structure):
@@ -27,6 +28,7 @@ class AdjacentCells(cdt.Array):
 
 
 class GSMDiagnostic(ver0.GSMDiagnostic):
+    __slots__ = tuple()
     A_ELEMENTS = (ver0.GSMDiagnostic.get_attr_element(2),
                   ver0.GSMDiagnostic.get_attr_element(3),
                   ver0.GSMDiagnostic.get_attr_element(4),
@@ -2,6 +2,7 @@ from ..__class_init__ import *
 
 
 class GSMDiagnostic(ic.COSEMInterfaceClasses):
+    __slots__ = tuple()
     def __new__(cls, *args, **kwargs):
         raise ValueError(F"version: {__name__[-1]} of {cls.__class__.__name__} not support framework")
 
@@ -2,6 +2,7 @@ from ..__class_init__ import *
 
 
 class IECHDLCSetup(ic.COSEMInterfaceClasses):
+    __slots__ = tuple()
     CLASS_ID = classID.IEC_HDLC_SETUP
 
     def __new__(cls, *args, **kwargs):
@@ -3,6 +3,7 @@ from ...types import cdt
 
 class ImageTransferStatus(cdt.Enum, elements=tuple(range(8))):
     """ Holds the status of the Image transfer process. """
+    __slots__ = tuple()
 
 
 TRANSFER_NOT_INITIATED = ImageTransferStatus(0)
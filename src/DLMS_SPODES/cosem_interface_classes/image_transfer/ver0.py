@@ -37,6 +37,7 @@ class ImageTransfer(ic.COSEMInterfaceClasses):
     CLASS_ID = classID.IMAGE_TRANSFER
     VERSION = Version.V0
     __blocks_for_update: list[bytearray]
+    __slots__ = ("__blocks_for_update",)
     A_ELEMENTS = (ic.ICAElement("image_block_size", cdt.DoubleLongUnsigned),
                   ic.ICAElement("image_transferred_blocks_status", cdt.BitString, classifier=ic.Classifier.DYNAMIC),
                   ic.ICAElement("image_first_not_transferred_block_number", cdt.DoubleLongUnsigned, classifier=ic.Classifier.DYNAMIC),
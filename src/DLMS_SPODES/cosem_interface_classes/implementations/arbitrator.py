@@ -9,6 +9,7 @@ match settings.get_current_language():
 
 class SPODES3Arbitrator(Arbitrator):
     """Cosem3 7.3.18"""
+    __slots__ = tuple()
     actors = (actors.MANUAL,
               actors.LOCAL_1,
               actors.LOCAL_2,
@@ -8,23 +8,27 @@ from ... import exceptions as exc
 
 
 class DataStatic(Data):
+    __slots__ = tuple()
     A_ELEMENTS = Data.get_attr_element(2).get_change(classifier=ic.Classifier.STATIC),
 
 
 class DataDynamic(Data):
+    __slots__ = tuple()
     A_ELEMENTS = Data.get_attr_element(2).get_change(classifier=ic.Classifier.DYNAMIC),
 
 
 class DataNotSpecific(Data):
+    __slots__ = tuple()
     A_ELEMENTS = Data.get_attr_element(2).get_change(classifier=ic.Classifier.NOT_SPECIFIC),
 
 
 class LDN(DataStatic):
     """for ldn"""
+    __slots__ = tuple()
     A_ELEMENTS = Data.get_attr_element(2).get_change(data_type=impl.octet_string.LDN),
 
     def characteristics_init(self):
-        self._cbs_attr_post_init.update(
+        self._add_cbs_attr_post_init(
             {2: lambda: self.collection.set_manufacturer(self.value.contents[:3])}
         )
 
@@ -35,8 +39,9 @@ class LDN(DataStatic):
 
 class ActiveFirmwareId(Data):
     """for keep version in collection"""
+    __slots__ = tuple()
     def characteristics_init(self):
-        self._cbs_attr_post_init.update({2: self.__register_value_preset})
+        self._add_cbs_attr_post_init({2: self.__register_value_preset})
 
     def __register_value_preset(self):
         """need for start control"""
@@ -57,20 +62,24 @@ class ActiveFirmwareId(Data):
 
 class Unsigned(DataDynamic):
     """ with value type: Unsigned """
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=cdt.Unsigned),
 
 
 class OctetStringDateTime(DataDynamic):
     """ with value type: Unsigned """
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=cst.OctetStringDateTime),
 
 
 class OpeningBody(DataDynamic):
     """ RU. 0.0.96.51.0.255. СТО_34.01-5.1-006-2019v3. E 12.1 """
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=cdt.Unsigned),
 
 
 class SealUnsigned(cdt.Unsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         def get_name(value: int):
             """ СПОДЭСv.3 Е.12.5"""
@@ -84,11 +93,13 @@ class SealUnsigned(cdt.Unsigned):
 
 class SealStatus(DataDynamic):
     """ RU. 0.0.96.51.5.255. СТО_34.01-5.1-006-2019v3. E 12.1 """
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.A_ELEMENTS[0].get_change(data_type=SealUnsigned),
 
 
 class TerminalsCoverOpeningState(DataDynamic):
     """ RU. 0.0.96.51.1.255. СТО_34.01-5.1-006-2019v3. E 12.2 """
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=cdt.Unsigned),
 
 
@@ -100,10 +111,12 @@ class BitMapData(cdt.Structure):
 
 class ITEBitMap(DataStatic):
     """ITE 0.128.96.13.1.255. Use for send struct lcd screen bitmap(BMP) with start/stop period to server"""
+    __slots__ = tuple()
     A_ELEMENTS = Data.get_attr_element(2).get_change(data_type=BitMapData),
 
 
 class ChannelNumberValue(cdt.Unsigned):
+    __slots__ = tuple()
     @property
     def channel(self) -> enu.ChannelNumber:
         return enu.ChannelNumber(int(self) & 0b0000_0111)
@@ -129,6 +142,7 @@ class ChannelNumberValue(cdt.Unsigned):
 
 class CommunicationPortParameter(Data):
     """ RU. 0.0.96.12.4.255. СТО_34.01-5.1-006-2019v3. 13.10. Определение номера порта по которому установлено соединение"""
+    __slots__ = tuple()
     A_ELEMENTS = ic.ICAElement("value", ChannelNumberValue, default=enu.ChannelNumber.OPTO_P1 + (enu.Interface.OPTO << 3), classifier=ic.Classifier.DYNAMIC),
 
     @property
@@ -139,211 +153,253 @@ class CommunicationPortParameter(Data):
 
 class AnyDateTime(DataDynamic):
     """for a-anotation DLMS UA 1000-1 Ed. 14 Table 60"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=choices.any_date_time),
 
 
 class VoltageEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.voltage_events.get_report(int(self))
 
 
 class SPODES3VoltageEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.2 События, связанные с напряжением"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=VoltageEventValues),
 
 
 class CurrentEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.current_events.get_report(int(self))
 
 
 class SPODES3CurrentEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.3 События, связанные с током"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=CurrentEventValues),
 
 
 class CommutationEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.commutation_events.get_report(int(self))
 
 
 class SPODES3CommutationEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.4 События, связанные с вкл./выкл. ПУ, коммутации реле нагрузки"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=CommutationEventValues),
 
 
 class ProgrammingEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.programming_events.get_report(int(self))
 
 
 class SPODES3ProgrammingEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.5 События программирования параметров ПУ"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=ProgrammingEventValues),
 
 
 class ExternalEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.external_impact_events.get_report(int(self))
 
 
 class SPODES3ExternalEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.6 События внешних воздействий"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=ExternalEventValues),
 
 
 class CommunicationEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.communication_events.get_report(int(self))
 
 
 class SPODES3CommunicationEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.7 Коммуникационные события"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=CommunicationEventValues),
 
 
 class AccessEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.access_events.get_report(int(self))
 
 
 class SPODES3AccessEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.8 События контроля доступа"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=AccessEventValues),
 
 
 class SelfDiagnosticEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.self_diagnostics_events.get_report(int(self))
 
 
 class SPODES3SelfDiagnosticEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.9 Коды событий для журнала самодиагностики"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=SelfDiagnosticEventValues),
 
 
 class ReactivePowerEventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.reactive_power_events.get_report(int(self))
 
 
 class SPODES3ReactivePowerEvent(DataDynamic):
     """СТО_34.01-5.1-006-2019v3 Д.10 События по превышению реактивной мощности"""
+    __slots__ = tuple()
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=ReactivePowerEventValues),
 
 
 class PowerQuality2EventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.power_quality_status_2.get_report(int(self))
 
 
 class SPODES3PowerQuality2Event(DataNotSpecific):
     """СТО_34.01-5.1-006-2019v3 E.1 Статус качества сети (журнал качества сети)"""
+    __slots__ = tuple()
     A_ELEMENTS = DataNotSpecific.get_attr_element(2).get_change(data_type=PowerQuality2EventValues),
 
 
 class PowerQuality1EventValues(cdt.LongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.power_quality_status_1.get_report(int(self))
 
 
 class SPODES3PowerQuality1Event(DataNotSpecific):
     """СТО_34.01-5.1-006-2019v3 E.2 Статус качества сети (профиль суточных показаний)"""
+    __slots__ = tuple()
     A_ELEMENTS = DataNotSpecific.get_attr_element(2).get_change(data_type=PowerQuality1EventValues),
 
 
 # KPZ implements
 class KPZ1VoltageEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.voltage_events.get_report(int(self))
 
 
 class KPZ1SPODES3VoltageEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.2 События, связанные с напряжением with bag in value type"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1VoltageEventValues),
 
 
 class KPZ1CurrentEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.current_events.get_report(int(self))
 
 
 class KPZ1SPODES3CurrentEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.3 События, связанные с током"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1CurrentEventValues),
 
 
 class KPZ1CommutationEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.commutation_events.get_report(int(self))
 
 
 class KPZ1SPODES3CommutationEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.4 События, связанные с вкл./выкл. ПУ, коммутации реле нагрузки"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1CommutationEventValues),
 
 
 class KPZ1ProgrammingEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.programming_events.get_report(int(self))
 
 
 class KPZ1SPODES3ProgrammingEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.5 События программирования параметров ПУ"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1ProgrammingEventValues),
 
 
 class KPZ1ExternalEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.external_impact_events.get_report(int(self))
 
 
 class KPZ1SPODES3ExternalEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.6 События внешних воздействий"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1ExternalEventValues),
 
 
 class KPZ1CommunicationEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.communication_events.get_report(int(self))
 
 
 class KPZ1SPODES3CommunicationEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.7 Коммуникационные события"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1CommunicationEventValues),
 
 
 class KPZ1AccessEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.access_events.get_report(int(self))
 
 
 class KPZ1SPODES3AccessEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.8 События контроля доступа"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1AccessEventValues),
 
 
 class KPZ1SelfDiagnosticEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.self_diagnostics_events.get_report(int(self))
 
 
 class KPZ1SPODES3SelfDiagnosticEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.9 Коды событий для журнала самодиагностики"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1SelfDiagnosticEventValues),
 
 
 class KPZ1ReactivePowerEventValues(cdt.DoubleLongUnsigned):
+    __slots__ = tuple()
     def get_report(self, with_unit: bool = True) -> str:
         return ev.reactive_power_events.get_report(int(self))
 
 
 class KPZ1SPODES3ReactivePowerEvent(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Д.10 События по превышению реактивной мощности"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZ1ReactivePowerEventValues),
 
 
 class SPODES3MeasurementPeriodValue(cdt.Unsigned):
+    __slots__ = tuple()
     def validate(self):
         super(SPODES3MeasurementPeriodValue, self).validate()
         values: tuple[int, ...] = (1, 2, 3, 5, 10, 15, 20, 30, 60)
@@ -353,15 +409,18 @@ class SPODES3MeasurementPeriodValue(cdt.Unsigned):
 
 class SPODES3MeasurementPeriod(DataStatic):
     """СТО_34.01-5.1-006-2019v3 Г.2 Программируемые параметры и функции. Пункт 14"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=SPODES3MeasurementPeriodValue),
 
 
 class DLMSDeviceIDObject(DataStatic):
     """DLMS UA 1000-1 Ed. 14. 6.2.42 Device ID objects"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=choices.device_id_object),
 
 
 class SPODES3SPODESVersionValue(cdt.OctetString):
+    __slots__ = tuple()
     def __init__(self, value="332e30"):
         super(SPODES3SPODESVersionValue, self).__init__(value)
         match AppVersion.from_str(self.contents.decode("utf-8")):
@@ -372,11 +431,13 @@ class SPODES3SPODESVersionValue(cdt.OctetString):
 
 class SPODES3SPODESVersion(DLMSDeviceIDObject):
     """СТО_34.01-5.1-006-2019v3 Г.1 Примечание 2"""
+    __slots__ = tuple()
     A_ELEMENTS = DLMSDeviceIDObject.get_attr_element(2).get_change(data_type=SPODES3SPODESVersionValue),
 
 
 class SPODES3IDNotSpecific(DLMSDeviceIDObject):
     """СТО_34.01-5.1-006-2019v3 13.1. Чтение расширенных паспортных данных ПУ. Для специфических идентификаторов"""
+    __slots__ = tuple()
     A_ELEMENTS = DLMSDeviceIDObject.get_attr_element(2).get_change(classifier=ic.Classifier.NOT_SPECIFIC),
 
 
@@ -388,4 +449,5 @@ class KPZGSMPingIPValue(cdt.Structure):
 
 class KPZGSMPingIP(DataStatic):
     """Проприетарный объект"""
+    __slots__ = tuple()
     A_ELEMENTS = DataStatic.get_attr_element(2).get_change(data_type=KPZGSMPingIPValue),
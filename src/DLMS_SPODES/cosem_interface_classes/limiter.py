@@ -40,6 +40,7 @@ class Limiter(ic.COSEMInterfaceClasses):
         The threshold value can be normal or emergency threshold. The emergency threshold is activated via the emergency profile defined by emergency profile id, activation start
     time, and duration. The emergency profile id element is matched to an emergency profile group id: this mechanism enables the activation of the emergency threshold only
     for a specific emergency group. """
+    __slots__ = tuple()
     CLASS_ID = classID.LIMITER
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("monitored_value", structs.ValueDefinition),
@@ -56,8 +57,8 @@ class Limiter(ic.COSEMInterfaceClasses):
     def characteristics_init(self):
         self.set_attr(6, None)
         self.set_attr(7, None)
-        self._cbs_attr_post_init.update({2: self.__set_threshold_scaler_unit})
-        self._cbs_attr_before_init.update({
+        self._add_cbs_attr_post_init({2: self.__set_threshold_scaler_unit})
+        self._add_cbs_attr_before_init({
             3: lambda value: self.__validate_threshold_scaler_unit(3, value),
             4: lambda value: self.__validate_threshold_scaler_unit(4, value),
             5: lambda value: self.__validate_threshold_scaler_unit(5, value)})
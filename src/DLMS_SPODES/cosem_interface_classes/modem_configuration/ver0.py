@@ -19,6 +19,7 @@ class InitializationString(cdt.Array):
 class ModemProfileElement(cdt.OctetString):
     """ TODO: can be OK, CONNECT, RING, NO CARRIER, ERROR, CONNECT 1 200, NO DIAL TONE, BUSY, NO ANSWER, CONNECT 600, CONNECT 2 400, CONNECT 4 800, CONNECT 9 600, CONNECT 14 400,
     CONNECT 28 800, CONNECT 36 600, CONNECT 56 000"""
+    __slots__ = tuple()
 
     def __init__(self, value: bytes = b'OK'.hex()):
         super(ModemProfileElement, self).__init__(value)
@@ -42,6 +43,7 @@ class ModemProfile(cdt.Array):
 class PSTNModemConfiguration(ic.COSEMInterfaceClasses):
     """ An  instance of the 'PSTN modem configuration' IC stores data related to the initialization of modems, which are used for data transfer from/to a device. Several modems
     can be configured."""
+    __slots__ = tuple()
     CLASS_ID = classID.MODEM_CONFIGURATION
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("comm_speed", CommSpeed, 0, 9, 5),
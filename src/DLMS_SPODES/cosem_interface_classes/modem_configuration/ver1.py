@@ -19,6 +19,7 @@ class InitializationString(cdt.Array):
 
 class ModemConfigurationVer1(ic.COSEMInterfaceClasses):
     """ This IC allow modelling the configuration and initialisation of modems used for data transfer from/to a device. Several modems can be configured."""
+    __slots__ = tuple()
     CLASS_ID = ut.CosemClassId(27)
     VERSION = Version.V1
     A_ELEMENTS = (ver0.PSTNModemConfiguration.get_attr_element(2),
@@ -4,10 +4,12 @@ from ...types.implementations import integers
 
 class ServerAddress(cdt.OctetString):
     """"""
+    __slots__ = tuple()
 
 
 class AuthenticationMethod(cdt.Enum, elements=(0, 1, 2)):
     """Defines the authentication mode used for NTP protocol"""
+    __slots__ = tuple()
 
 
 class AuthenticationKey(cdt.Structure):
@@ -23,6 +25,7 @@ class AuthenticationKeys(cdt.Array):
 
 class NTPSetup(ic.COSEMInterfaceClasses):
     """DLMS UA 1000-1 Ed 14, 4.9.7 NTP setup"""
+    __slots__ = tuple()
     CLASS_ID = classID.NTP_SETUP
     VERSION = Version.V0
     A_ELEMENTS = (
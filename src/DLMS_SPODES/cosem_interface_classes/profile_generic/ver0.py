@@ -3,6 +3,7 @@ from ..__class_init__ import *
 
 class ProfileGeneric(ic.COSEMInterfaceClasses):
     """dummy class"""
+    __slots__ = tuple()
     CLASS_ID = classID.PROFILE_GENERIC
 
     def __new__(cls, *args, **kwargs):
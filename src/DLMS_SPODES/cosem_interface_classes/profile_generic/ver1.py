@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from typing import Type, Iterator
 from ... import cosem_interface_classes
 from ..register import Register
@@ -22,6 +23,7 @@ class SortMethod(cdt.Enum, elements=(1, 2, 3, 4, 5, 6)):
     space for the new entry. If the profile is sorted, a call to capture () will store the new entry at the appropriate position in the buffer, moving
     all following entries and probably losing the least interesting entry. If the new entry would enter the buffer after the last entry and if the
     buffer is already full, the new entry will not be retained at all. """
+    __slots__ = tuple()
 
 
 class CaptureObjects(cdt.Array):
@@ -31,6 +33,7 @@ class CaptureObjects(cdt.Array):
 
 class FromEntry(cdt.DoubleLongUnsigned, min=1):
     """ Access selector value for selective access to the object_list attribute """
+    __slots__ = tuple()
 
 
 class EntryDescriptor(cdt.Structure):
@@ -51,6 +54,76 @@ class AccessSelector(ut.Unsigned8):
             raise ValueError(F'The {self.__class__.__name__} got {int(self)}, expected 1..2')
 
 
+@cdt.dynamic_type
+def get_entry_type(elements: tuple[cdt.StructElement, ...]) -> Type[cdt.Structure]:
+    """buffer entry by capture objects names and types"""
+    class Entry(cdt.Structure, metaclass=cdt.DynamicType):
+        """ The number and the order of the elements of the structure holding the entries is the same as in the definition of the capture_objects.
+            The buffer is filled by auto captures or by subsequent calls of the method (capture). The sequence of the entries within the array is ordered
+            according to the sort method specified. Default: The buffer is empty after reset.
+            REMARK 1 Reading the entire buffer delivers only those entries, which are “in use”.
+            REMARK 2 The value of a captured object may be replaced by “null-data” if it can be unambiguously recovered from the previous value
+            (e.g. for time: if it can be calculated from the previous value and capture_period; or for a value: if it is equal to the previous value). """
+        ELEMENTS = elements
+
+    return Entry
+
+
+@cdt.dynamic_type
+def get_range_descriptor_type(value_type: Type[cdt.CommonDataType]) -> Type[cdt.Structure]:
+    class RangeDescriptor(cdt.Structure, metaclass=cdt.DynamicType):
+        # cb_preset = TODO: make check 'selected_values' from self.capture_objects or
+        # cb_post_set = TODO: make check 'selected_values' from self.capture_objects
+        DEFAULT = b'\x02\x04\x02\x04\x12\x00\x01\x09\x06\x00\x00\x01\x00\x00\xff\x0f\x02\x12\x00\x00\x09\x0c\x07\xe4\x01\x01\xff\xff\xff\xff\xff\x80\x00\xff' \
+                  b'\x09\x0c\x07\xe4\x01\x02\xff\xff\xff\xff\xff\x80\x00\xff\x01\x00'
+        restricting_object: structs.CaptureObjectDefinition
+        from_value: value_type
+        to_value: value_type
+        selected_values: CaptureObjects
+
+    return RangeDescriptor
+
+
+@cdt.dynamic_type
+def get_access_parameters_type(value_type: Type[cdt.CommonDataType]) -> Type[ut.Data]:
+    class Data(ut.Data, metaclass=cdt.DynamicType):
+        restricting_object: structs.CaptureObjectDefinition
+        from_value: cdt.SimpleDataType
+        to_value: cdt.SimpleDataType
+        selected_values: CaptureObjects
+        from_entry: FromEntry
+        to_entry: cdt.DoubleLongUnsigned
+        from_selected_value: cdt.LongUnsigned
+        to_selected_value: cdt.LongUnsigned
+        ELEMENTS = {1: ut.SequenceElement('range_descriptor', get_range_descriptor_type(value_type)),
+                    2: ut.SequenceElement('entry_descriptor', EntryDescriptor)}
+
+    return Data
+
+
+@cdt.dynamic_type
+def get_selective_access_descriptor_type(value_type: Type[cdt.CommonDataType]) -> Type[ut.SelectiveAccessDescriptor]:
+    @dataclass
+    class SelectiveAccessDescriptor(ut.SelectiveAccessDescriptor, metaclass=cdt.DynamicType):
+        """ default is entry_descriptor with all entries and capture objects """
+        access_selector: AccessSelector = field(default_factory=AccessSelector)
+        access_parameters: get_access_parameters_type(value_type) = field(default_factory=EntryDescriptor)
+        ELEMENTS = (ut.SequenceElement('access_selector', AccessSelector),
+                    ut.SequenceElement('access_parameters', get_access_parameters_type(value_type)))
+
+    return SelectiveAccessDescriptor
+
+
+@cdt.dynamic_type
+def get_attr_descriptor_with_selection_type(value_type: Type[cdt.CommonDataType]) -> Type[ut.CosemAttributeDescriptorWithSelection]:
+    class CosemAttributeDescriptorWithSelection(ut.CosemAttributeDescriptorWithSelection, metaclass=cdt.DynamicType):
+        access_selection: get_selective_access_descriptor_type(value_type)
+        ELEMENTS = (ut.SequenceElement('cosem_attribute_descriptor', ut.CosemAttributeDescriptor),
+                    ut.SequenceElement('access_selection', get_selective_access_descriptor_type(value_type)))
+
+    return CosemAttributeDescriptorWithSelection
+
+
 class ProfileGeneric(ic.COSEMInterfaceClasses):
     """ The “Profile generic” class defines a generalized concept to store dynamic process values of capture objects. Capture objects are appropriate
     attributes or element of (an) attribute(s) of COSEM objects. The capture objects are collected periodically or occasionally.
@@ -74,7 +147,8 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
     """ obis of scaler profile for this profile if need """
     buffer_capture_objects: CaptureObjects
     range_descriptor: Type[cdt.Structure] = None
-    attr_descriptor_with_selection: Type[ut.CosemAttributeDescriptorWithSelection] = None
+    attr_descriptor_with_selection: Type[ut.CosemAttributeDescriptorWithSelection] | None
+    __slots__ = ("buffer_capture_objects", "attr_descriptor_with_selection")
     A_ELEMENTS = (ic.ICAElement("buffer", arrays.SelectionAccess, classifier=ic.Classifier.DYNAMIC),
                   ic.ICAElement("capture_objects", CaptureObjects),
                   ic.ICAElement("capture_period", cdt.DoubleLongUnsigned),
@@ -89,11 +163,12 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
         self.set_attr(BUFFER, None)
         self.buffer.register_cb_preset(lambda _: self.__create_buffer_struct_type())  # value not used for creating struct type
 
-        self._cbs_attr_post_init.update({CAPTURE_OBJECTS: self.__create_buffer_struct_type,
-                                         SORT_OBJECT: self.__create_selective_access_descriptor})
+        self._add_cbs_attr_post_init({CAPTURE_OBJECTS: self.__create_buffer_struct_type,
+                                      SORT_OBJECT: self.__create_selective_access_descriptor})
 
         self.buffer_capture_objects = self.capture_objects
         """ objects for buffer. Change with access_selection """
+        self.attr_descriptor_with_selection = None
 
     @property
     def buffer(self) -> arrays.SelectionAccess:
@@ -139,7 +214,7 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
         if value == BUFFER and with_selection:
             if self.attr_descriptor_with_selection is None:
                 self.__create_selective_access_descriptor()
-            return self.attr_descriptor_with_selection((descriptor.contents, self.buffer.selective_access.contents))
+            return self.attr_descriptor_with_selection(descriptor, self.buffer.selective_access)
         else:
             return descriptor
 
@@ -152,7 +227,7 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
             raise ValueError(F"{self}: create buffer Struct type, not set <capture_object> attribute. Need initiate <capture_objects> before")
         for el_value in self.capture_objects:
             el_value: structs.CaptureObjectDefinition
-            obj = self.collection.add_if_missing(class_id=ut.CosemClassId(el_value.class_id.contents),
+            obj = self.collection.add_if_missing(class_id=ut.CosemClassId(int(el_value.class_id)),
                                                  version=None,
                                                  logical_name=el_value.logical_name)
             el_value.set_name(self.collection.get_name_and_type(el_value)[0][-1])
@@ -171,23 +246,14 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
                     case _ as err:                                                raise ValueError(F'access_selection out of range, got {err}, must be (0..2)')
             case None:
                 self.clear_attr(CAPTURE_OBJECTS)
-                self._cbs_attr_post_init[CAPTURE_OBJECTS] = self.__create_buffer_struct_type
+                self._add_cbs_attr_post_init({CAPTURE_OBJECTS: self.__create_buffer_struct_type})
                 raise exc.EmptyObj(F"need set <sort_object> before for {self}")
         buffer_elements: list[cdt.StructElement] = list()
         for el_value in self.buffer_capture_objects:
             names, type_ = self.collection.get_name_and_type(el_value)
             buffer_elements.append(cdt.StructElement(NAME=". ".join(names), TYPE=type_))
 
-        class Entry(cdt.Structure):
-            """ The number and the order of the elements of the structure holding the entries is the same as in the definition of the capture_objects.
-                The buffer is filled by auto captures or by subsequent calls of the method (capture). The sequence of the entries within the array is ordered
-                according to the sort method specified. Default: The buffer is empty after reset.
-                REMARK 1 Reading the entire buffer delivers only those entries, which are “in use”.
-                REMARK 2 The value of a captured object may be replaced by “null-data” if it can be unambiguously recovered from the previous value
-                (e.g. for time: if it can be calculated from the previous value and capture_period; or for a value: if it is equal to the previous value). """
-            ELEMENTS = tuple(buffer_elements)
-
-        self.buffer.set_type(Entry)
+        self.buffer.set_type(get_entry_type(tuple(buffer_elements)))
 
     def __create_selective_access_descriptor(self):
         """ Available after got sort object. TODO: need rewrite. maybe replace to collection level. Wrong used sort_obj, it can be any element from capture_objects"""
@@ -197,41 +263,8 @@ class ProfileGeneric(ic.COSEMInterfaceClasses):
         else:
             exc.NoObject(F"got {self.sort_object.class_id=}, expected {sort_obj.CLASS_ID=} from collection")
 
-        class RangeDescriptor(cdt.Structure):
-            # cb_preset = TODO: make check 'selected_values' from self.capture_objects or
-            # cb_post_set = TODO: make check 'selected_values' from self.capture_objects
-            DEFAULT = b'\x02\x04\x02\x04\x12\x00\x01\x09\x06\x00\x00\x01\x00\x00\xff\x0f\x02\x12\x00\x00\x09\x0c\x07\xe4\x01\x01\xff\xff\xff\xff\xff\x80\x00\xff' \
-                      b'\x09\x0c\x07\xe4\x01\x02\xff\xff\xff\xff\xff\x80\x00\xff\x01\x00'
-            restricting_object: structs.CaptureObjectDefinition
-            from_value: value_type
-            to_value: value_type
-            selected_values: CaptureObjects
-
-        class Data(ut.Data):
-            restricting_object: structs.CaptureObjectDefinition
-            from_value: cdt.SimpleDataType
-            to_value: cdt.SimpleDataType
-            selected_values: CaptureObjects
-            from_entry: FromEntry
-            to_entry: cdt.DoubleLongUnsigned
-            from_selected_value: cdt.LongUnsigned
-            to_selected_value: cdt.LongUnsigned
-            ELEMENTS = {1: ut.SequenceElement('range_descriptor', RangeDescriptor),
-                        2: ut.SequenceElement('entry_descriptor', EntryDescriptor)}
-
-        class SelectiveAccessDescriptor(ut.SelectiveAccessDescriptor):
-            access_selector: AccessSelector
-            access_parameters: Data
-            ELEMENTS = (ut.SequenceElement('access_selector', AccessSelector),
-                        ut.SequenceElement('access_parameters', Data))
-
-        class CosemAttributeDescriptorWithSelection(ut.CosemAttributeDescriptorWithSelection):
-            access_selection: SelectiveAccessDescriptor
-            ELEMENTS = (ut.SequenceElement('cosem_attribute_descriptor', ut.CosemAttributeDescriptor),
-                        ut.SequenceElement('access_selection', SelectiveAccessDescriptor))
-
-        self.attr_descriptor_with_selection = CosemAttributeDescriptorWithSelection
-        self.buffer.selective_access = SelectiveAccessDescriptor()
+        self.attr_descriptor_with_selection = get_attr_descriptor_with_selection_type(value_type)
+        self.buffer.selective_access = get_selective_access_descriptor_type(value_type)()
 
     def get_capture_object_names(self) -> list[str]:
         """ return all capture object names from collection """
@@ -3,6 +3,7 @@ from ..__class_init__ import *
 
 class PushSetup(ic.COSEMInterfaceClasses):
     """dummy class"""
+    __slots__ = tuple()
     CLASS_ID = classID.PUSH_SETUP
 
     def __new__(cls, *args, **kwargs):
@@ -31,10 +31,12 @@ class PushObjectList(cdt.Array):
 
 class TransportServiceType(cdt.Enum, elements=tuple(chain(range(9), range(200, 256)))):  # TODO: elements 200.. is manufacturer specific
     """"""
+    __slots__ = tuple()
 
 
 class MessageType(cdt.Enum, elements=tuple(chain((0, 1), range(128, 256)))):  # TODO: elements 128.. is manufacturer specific
     """"""
+    __slots__ = tuple()
 
 
 class SendDestinationAndMethod(cdt.Structure):
@@ -56,6 +58,7 @@ class RepetitionDelay(cdt.Structure):
 
 class PushOperationMethod(cdt.Enum, elements=(0, 1, 2)):
     """"""
+    __slots__ = tuple()
 
 
 class ConfirmationParameters(cdt.Structure):
@@ -88,6 +91,7 @@ class PushProtectionParameters(cdt.Array):
 
 class PushSetup(ic.COSEMInterfaceClasses):
     """ DLMS UA 1000-1 Ed. 14 4.4.8.2 Push setup"""
+    __slots__ = tuple()
     CLASS_ID = classID.PUSH_SETUP
     VERSION = Version.V2
     A_ELEMENTS = (ic.ICAElement("push_object_list", PushObjectList),
@@ -10,6 +10,7 @@ class Register(ic.COSEMInterfaceClasses):
     CLASS_ID = classID.REGISTER
     VERSION = Version.V0
     scaler_unit_not_settable: bool
+    __slots__ = ("scaler_unit_not_settable",)
     A_ELEMENTS = (ic.ICAElement("value", choices.register, classifier=ic.Classifier.NOT_SPECIFIC),
                   ic.ICAElement("scaler_unit", cdt.ScalUnitType))
     M_ELEMENTS = (
@@ -17,8 +18,8 @@ class Register(ic.COSEMInterfaceClasses):
         ic.ICMElement("next_period", integers.Only0))
 
     def characteristics_init(self):
-        self._cbs_attr_post_init.update({2: self.__set_value_data_type,
-                                         3: self.__set_value_scaler_unit})
+        self._add_cbs_attr_post_init({2: self.__set_value_data_type,
+                                      3: self.__set_value_scaler_unit})
 
         self.scaler_unit_not_settable = False
         """ usability scaler unit flag. if True then it not used"""
@@ -23,6 +23,7 @@ class Actions(cdt.Array):
 class RegisterMonitor(ic.COSEMInterfaceClasses):
     """ DLMS UA 1000-1 Ed.14. 4.5.6. This IC allows modelling the function of monitoring of values modelled by “Data”, “Register”, “Extended register” or “Demand register” objects.
     It allows specifying thresholds, the value monitored, and a set of scripts (see 4.5.2) that are executed when the value monitored crosses a threshold """
+    __slots__ = tuple()
     CLASS_ID = classID.REGISTER_MONITOR
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("thresholds", Thresholds),
@@ -31,7 +32,7 @@ class RegisterMonitor(ic.COSEMInterfaceClasses):
 
     def characteristics_init(self):
         self.set_attr(2, None)
-        self._cbs_attr_post_init.update({3: self.__set_threshold_type})
+        self._add_cbs_attr_post_init({3: self.__set_threshold_type})
 
     @property
     def thresholds(self) -> Thresholds:
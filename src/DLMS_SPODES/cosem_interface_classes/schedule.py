@@ -5,6 +5,7 @@ from .__class_init__ import *
 
 class Index(cdt.LongUnsigned, min=1, max=9999):
     """ LongUnsigned type with validation """
+    __slots__ = ("__cb_get_indexes",)
     __cb_get_indexes: Callable
     DEFAULT = 1
 
@@ -132,16 +133,18 @@ class Schedule(ic.COSEMInterfaceClasses):
      Daylight saving
      If the clock is put forward, then all scripts, which fall into the forwarding interval (and would therefore get lost) are executed.
      If the clock is put back, re-execution of the scripts, which fall into the backwarding interval is suppressed. """
+    __slots__ = tuple()
     CLASS_ID = classID.SCHEDULE
     VERSION = Version.V0
     A_ELEMENTS = ic.ICAElement("entries", Entries),
     M_ELEMENTS = (ic.ICMElement("enable_disable", DataED),
                   ic.ICMElement("insert", ScheduleTableEntry),
                   ic.ICMElement("delete", DataDelete))
+    _BOUND_VALUES = frozenset((2,))
 
     def characteristics_init(self):
         self.set_attr(2, None)
-        self._cbs_attr_post_init.update({2: self.__set_index_cbs})
+        self._add_cbs_attr_post_init({2: self.__set_index_cbs})
 
     @property
     def entries(self) -> Entries:
@@ -4,6 +4,7 @@ from ..types import choices
 
 class ServiceId(cdt.Enum, elements=(1, 2)):
     """defines which action to be applied to the referenced object."""
+    __slots__ = tuple()
 
 
 class ActionSpecification(cdt.Structure):
@@ -39,6 +40,7 @@ class ScriptTable(ic.COSEMInterfaceClasses):
     action_specifications. An action_specification activates a method of a COSEM object or modifies attributes of a COSEM object within the logical
     device. A specific script may be activated by other COSEM objects within the same logical device or from the outside. If two scripts have to be
     executed at the same time instance, then the one with the smaller index is executed first """
+    __slots__ = tuple()
     CLASS_ID = classID.SCRIPT_TABLE
     VERSION = Version.V0
     A_ELEMENTS = ic.ICAElement("scripts", Scripts),
@@ -46,7 +48,7 @@ class ScriptTable(ic.COSEMInterfaceClasses):
 
     def characteristics_init(self):
         self.set_attr(2, None)
-        self._cbs_attr_post_init.update({2: self.__set_script_identifier_cbs})
+        self._add_cbs_attr_post_init({2: self.__set_script_identifier_cbs})
 
     @property
     def scripts(self) -> Scripts:
@@ -3,15 +3,18 @@ from ..__class_init__ import *
 
 class SecurityPolicy(cdt.Enum, elements=tuple(range(16))):
     """ Enforces authentication and/or encrypting algorithm provided with security_suite """
+    __slots__ = tuple()
 
 
 class SecuritySuite(cdt.Enum, elements=tuple(range(16))):
     """Specifies authentication, encryption and key transport algorithm"""
+    __slots__ = tuple()
     AES_GCM_128_AUT_ENCR_AND_AES_128_KEY_WRAP = 0
 
 
 class KeyID(cdt.Enum, elements=(0, 1, 2)):
     """Use only in KeyData structure"""
+    __slots__ = tuple()
 
 
 class KeyData(cdt.Structure):
@@ -29,6 +32,7 @@ class SecuritySetup(ic.COSEMInterfaceClasses):
     """ Instances of the “Security setup” IC contain the necessary information on the security suite in use and the security policy applicable between the server and a client
     and/or third party indentify by their respective system titles. They also provide methods to increase the level of security and to manage symmetric keys, asymmetric key pairs
      and certificates """
+    __slots__ = tuple()
     CLASS_ID = classID.SECURITY_SETUP
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("security_policy", SecurityPolicy, 0, 3, 0),
@@ -6,18 +6,22 @@ from ...types import choices
 class SecurityPolicyVer1(cdt.FlagMixin, cdt.Enum, elements=tuple(range(8))):
     """ Enforces authentication and/or encryption and/or digital signature using the security algorithms available within security suite. It applies independently for requests and
      responses. When enum value is interpreted as an unsigned, the meaning of each bit is as shown below """
+    __slots__ = tuple()
 
 
 class CertificateEntity(cdt.Enum, elements=(0, 1, 2, 3)):
     """TODO:"""
+    __slots__ = tuple()
 
 
 class CertificateType(cdt.Enum, elements=(0, 1, 2, 3)):
     """TODO:"""
+    __slots__ = tuple()
 
 
 class SecuritySuite(ver0.SecuritySuite, elements=(0, 1, 2)):
     """Version 0 extension"""
+    __slots__ = tuple()
     AES_GCM_128_AUT_ENCR_ECDSA_P_256_DIG_SIGN_ECDH_P_256_KEY_AGR_SHA_256_HASH_V44_COMPR_AND_AES_128_KEY_WRAP = 1
     AES_GCM_256_AUT_ENCR_ECDSA_P_384_DIG_SIGN_ECDH_P_384_KEY_AGR_SHA_384_HASH_V44_COMPR_AND_AES_256_KEY_WRAP = 2
 
@@ -39,6 +43,7 @@ class Certificates(cdt.Array):
 
 class KeyID(cdt.Enum, elements=(0, 1, 2, 3)):
     """Version 0 extension"""
+    __slots__ = tuple()
 
 
 class KeyTransferData(cdt.Structure):
@@ -65,6 +70,7 @@ class KeyAgreement(cdt.Array):
 
 class KeyPair(cdt.Enum, elements=(0, 1, 2)):
     """TODO:"""
+    __slots__ = tuple()
 
 
 class CertificateIdentificationByEntity(cdt.Structure):
@@ -82,6 +88,7 @@ class CertificateIdentificationBySerial(cdt.Structure):
 
 class CertificateIdentificationType(cdt.Enum, elements=(0, 1)):
     """TODO:"""
+    __slots__ = tuple()
 
 
 class CertificationIdentificationOption(ut.CHOICE):
@@ -99,6 +106,7 @@ class CertificateIdentification(choices.StructureMixin, cdt.Structure):
 
 
 class SecuritySetup(ver0.SecuritySetup):
+    __slots__ = tuple()
     VERSION = Version.V1
     A_ELEMENTS = (ic.ICAElement("security_policy", SecurityPolicyVer1),
                   ic.ICAElement("security_suite", SecuritySuite),
@@ -4,6 +4,7 @@ from ..types.implementations import structs
 
 class TYPE(cdt.Enum, elements=(1, 2, 3, 4, 5)):
     """"""
+    __slots__ = tuple()
 
 
 class ExecutionTimeDate(cdt.Structure):
@@ -21,6 +22,7 @@ class ExecutionTime(cdt.Array):
 class SingleActionSchedule(ic.COSEMInterfaceClasses):
     """ This IC allows modelling the execution of periodic actions within a meter. Such actions are not necessarily linked to tariffication
     (see “Activity calendar” or “Schedule”).  """
+    __slots__ = tuple()
     CLASS_ID = classID.SINGLE_ACTION_SCHEDULE
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("executed_script", structs.ActionItem),
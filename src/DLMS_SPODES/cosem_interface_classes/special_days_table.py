@@ -49,16 +49,17 @@ class Entries(cdt.Array):
 class SpecialDaysTable(ic.COSEMInterfaceClasses):
     """ The interface class allows defining dates, which will override normal switching behaviour for special days. The interface class works in
     conjunction with the class "Schedule" or "Activity calendar" and the linking data item is day_id """
+    __slots__ = tuple()
     CLASS_ID = classID.SPECIAL_DAYS_TABLE
     VERSION = Version.V0
     A_ELEMENTS = ic.ICAElement("entries", Entries),
     M_ELEMENTS = (ic.ICMElement("insert", SpecDayEntry),
                   ic.ICMElement("delete", cdt.LongUnsigned))  # Todo: was Delete.with_cb(None, self.entries.get_indexes)
+    _BOUND_VALUES = frozenset((2,))
+    cardinality = (0, 1)
 
     def characteristics_init(self):
-        self.cardinality = (0, 1)
-
-        self._cbs_attr_post_init.update({2: self.__set_delete})
+        self._add_cbs_attr_post_init({2: self.__set_delete})
         self.set_attr(2, None)
 
     @property
@@ -9,6 +9,7 @@ class TCPUDPSetup(ic.COSEMInterfaceClasses):
      On the other hand, COSEM TCP  or UDP based transport layer may be capable to support more than one TCP or UDP connections, between a physical device and several peer physical
      devices hosting COSEM APs.
      When a COSEM physical device supports various data link layers - for example Ethernet and PPP - an instance of the TCP-UDP setup object is necessary for each of them. """
+    __slots__ = tuple()
     CLASS_ID = classID.TCP_UDP_SETUP
     VERSION = Version.V0
     A_ELEMENTS = (ic.ICAElement("TCP_UDP_port", cdt.LongUnsigned, default=4059),
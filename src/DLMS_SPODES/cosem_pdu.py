@@ -1,93 +1,559 @@
-from __future__ import annotations
-from typing import Dict, Type, Union
-from abc import ABC, abstractmethod
+""" ACSE and xDLMS APDUs according to COSEMpdu_GB83.asn. xDLMS by A-XDR with Sequence, Choice and SEQUENCE_OF of types.cosem_pdu, ACSE by BER components.
+Parsed values are views of source buffer, payload (Data, raw-data) not copied. Ciphered and general APDUs not supported """
+from typing import Self
 from struct import pack
+from .types.cosem_pdu import (Buffer, Simple, UT, Sequence, Choice, ChoiceElement, OPTIONAL, SEQUENCE_OF, NULL, BOOLEAN, Integer8, Integer16, Unsigned8, Unsigned16,
+                              Unsigned32, OctetString, OctetString6, EncodedData, create_buf, decide_len, encode_length, get_length_pos)
+from .enums import XDLMSAPDU as Tag, ACSEAPDU, GetRequest as GetRequestTag, SetRequest as SetRequestTag, ActionRequest as ActionRequestTag
+from .pdu_enums import GetResponse as GetResponseTag, SetResponse as SetResponseTag, ActionResponse as ActionResponseTag
 
 
-_services: Dict[int, Type[Union[AARE, ]]] = dict()
-""" COSEM Services dictionary """
+class InvokeIdAndPriority(Unsigned8):
+    """ invoke-id(bits 0..3), service-class(bit 6), priority(bit 7) """
 
 
-class Tag:
-    """ APDU tag TODO: """
-    value: int
+class LongInvokeIdAndPriority(Unsigned32):
+    """ long-invoke-id(bits 0..23), self-descriptive(28), processing-option(29), service-class(30), priority(31) """
 
-    def __init__(self, value: int):
-        self.value = value
 
-    def __get__(self, instance, owner: COSEMPdu) -> int:
-        return self.value
+class DataAccessResult(Unsigned8):
+    """ pdu_enums.DataAccessResult """
 
-    def __set__(self, instance, value):
-        raise ValueError("Tag no supported change")
 
+class ActionResult(Unsigned8):
+    """ pdu_enums.ActionResult """
 
-class COSEMPdu(ABC):
-    """ TODO: """
-    tag: Tag
 
-    def __init__(self, content: bytearray):
-        if content.pop(0) != self.tag:
-            raise ValueError(F'Wrong {self.__class__.__name__} tag, expected {self.tag}')
-        length = content.pop(0)
-        if len(content) != length:
-            raise ValueError(F'Wrong PDU length, expected {length}, got {len(content)}')
+class Conformance(Simple):
+    """ [APPLICATION 31] IMPLICIT BIT STRING(SIZE(24)) in BER encoding inside A-XDR: 5F 1F 04 00 and 3 octets of bits """
+    HEADER: bytes = b'\x5f\x1f\x04\x00'
 
-    def __init_subclass__(cls, **kwargs):
-        """ register subclass in _types with unique tag  """
-        super().__init_subclass__(**kwargs)
-        if hasattr(cls, 'tag'):
-            _services.setdefault(cls.tag, cls)
-        else:
-            """ Handler for subclass without tag """
+    @classmethod
+    def __len__(cls) -> int:
+        return 7
+
+    @classmethod
+    def get(cls, buf: Buffer) -> Self:
+        new = super().get(buf)
+        if new.contents[:4] != cls.HEADER:
+            raise ValueError(F"got conformance header {new.contents[:4].hex(' ')}, expected {cls.HEADER.hex(' ')}")
+        return new
+
+    @classmethod
+    def from_int(cls, value: int) -> Self:
+        """ value is bit string, bit 0 of conformance is most significant """
+        return cls(memoryview(cls.HEADER + value.to_bytes(3, "big")))
 
     @classmethod
-    def from_content(cls, content: bytearray):
-        tag = content[0]
-        service = _services.get(tag, None)(content)
-        if service is None:
-            raise ValueError(F'service with tag:{tag} is absence in Service Dictionary')
-        else:
-            return service
+    def from_str(cls, value: str) -> Self:
+        return cls.from_int(int(value, 2))
+
+    def __int__(self):
+        return int.from_bytes(self.contents[4:], "big")
+
+    def __str__(self):
+        return F"{int(self):024b}"
+
+
+class CosemAttributeDescriptor(Sequence):
+    class_id: Unsigned16
+    instance_id: OctetString6
+    attribute_id: Integer8
+
+
+class CosemMethodDescriptor(Sequence):
+    class_id: Unsigned16
+    instance_id: OctetString6
+    method_id: Integer8
+
+
+class SelectiveAccessDescriptor(Sequence):
+    access_selector: Unsigned8
+    access_parameters: EncodedData
+
+
+class CosemAttributeDescriptorWithSelection(Sequence):
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    access_selection: OPTIONAL(SelectiveAccessDescriptor)
+
+
+class DataBlockSA(Sequence):
+    """ DataBlock-SA, use in SET and ACTION """
+    last_block: BOOLEAN
+    block_number: Unsigned32
+    raw_data: OctetString
+
+
+class GetDataResult(Choice):
+    ELEMENTS = (
+        ChoiceElement("data", 0, EncodedData),
+        ChoiceElement("data-access-result", 1, DataAccessResult))
+
+
+class DataBlockGResult(Choice):
+    ELEMENTS = (
+        ChoiceElement("raw-data", 0, OctetString),
+        ChoiceElement("data-access-result", 1, DataAccessResult))
+
+
+class DataBlockG(Sequence):
+    last_block: BOOLEAN
+    block_number: Unsigned32
+    result: DataBlockGResult
+
+
+class InitiateRequest(Sequence):
+    dedicated_key: OPTIONAL(OctetString)
+    response_allowed: OPTIONAL(BOOLEAN)
+    """ DEFAULT TRUE, encoded as OPTIONAL """
+    proposed_quality_of_service: OPTIONAL(Integer8)
+    proposed_dlms_version_number: Unsigned8
+    proposed_conformance: Conformance
+    client_max_receive_pdu_size: Unsigned16
+
+
+class InitiateResponse(Sequence):
+    negotiated_quality_of_service: OPTIONAL(Integer8)
+    negotiated_dlms_version_number: Unsigned8
+    negotiated_conformance: Conformance
+    server_max_receive_pdu_size: Unsigned16
+    vaa_name: Integer16
+
+
+class ConfirmedServiceError(Sequence):
+    """ service by enums.ConfirmedServiceError, error by enums.ServiceError and it enumerated value """
+    service: Unsigned8
+    service_error: Unsigned8
+    value: Unsigned8
+
+
+class DataNotification(Sequence):
+    long_invoke_id_and_priority: LongInvokeIdAndPriority
+    date_time: OctetString
+    notification_body: EncodedData
+
+
+class GetRequestNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    access_selection: OPTIONAL(SelectiveAccessDescriptor)
+
+
+class GetRequestNext(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    block_number: Unsigned32
+
+
+class GetRequestWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    attribute_descriptor_list: SEQUENCE_OF(CosemAttributeDescriptorWithSelection)
+
+
+class GetRequest(Choice):
+    ELEMENTS = (
+        ChoiceElement("get-request-normal", GetRequestTag.NORMAL, GetRequestNormal),
+        ChoiceElement("get-request-next", GetRequestTag.NEXT, GetRequestNext),
+        ChoiceElement("get-request-with-list", GetRequestTag.WITH_LIST, GetRequestWithList))
+
+
+class SetRequestNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    access_selection: OPTIONAL(SelectiveAccessDescriptor)
+    value: EncodedData
+
+
+class SetRequestWithFirstDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    access_selection: OPTIONAL(SelectiveAccessDescriptor)
+    datablock: DataBlockSA
+
+
+class SetRequestWithDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    datablock: DataBlockSA
+
+
+class SetRequestWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    attribute_descriptor_list: SEQUENCE_OF(CosemAttributeDescriptorWithSelection)
+    value_list: SEQUENCE_OF(EncodedData)
+
+
+class SetRequestWithListAndFirstDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    attribute_descriptor_list: SEQUENCE_OF(CosemAttributeDescriptorWithSelection)
+    datablock: DataBlockSA
+
+
+class SetRequest(Choice):
+    ELEMENTS = (
+        ChoiceElement("set-request-normal", SetRequestTag.SET_REQUEST_NORMAL, SetRequestNormal),
+        ChoiceElement("set-request-with-first-datablock", SetRequestTag.SET_REQUEST_FIRST_DATABLOCK, SetRequestWithFirstDatablock),
+        ChoiceElement("set-request-with-datablock", SetRequestTag.SET_REQUEST_WITH_DATABLOCK, SetRequestWithDatablock),
+        ChoiceElement("set-request-with-list", SetRequestTag.SET_REQUEST_WITH_LIST, SetRequestWithList),
+        ChoiceElement("set-request-with-list-and-first-datablock", SetRequestTag.SET_REQUEST_WITH_LIST_AND_WITH_FIRST_DATABLOCK, SetRequestWithListAndFirstDatablock))
+
+
+class EventNotificationRequest(Sequence):
+    time: OPTIONAL(OctetString)
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    attribute_value: EncodedData
+
+
+class ActionRequestNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_method_descriptor: CosemMethodDescriptor
+    method_invocation_parameters: OPTIONAL(EncodedData)
+
+
+class ActionRequestNextPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    block_number: Unsigned32
+
+
+class ActionRequestWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_method_descriptor_list: SEQUENCE_OF(CosemMethodDescriptor)
+    method_invocation_parameters: SEQUENCE_OF(EncodedData)
+
+
+class ActionRequestWithFirstPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_method_descriptor: CosemMethodDescriptor
+    pblock: DataBlockSA
+
+
+class ActionRequestWithListAndFirstPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    cosem_method_descriptor_list: SEQUENCE_OF(CosemMethodDescriptor)
+    pblock: DataBlockSA
+
+
+class ActionRequestWithPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    pblock: DataBlockSA
+
+
+class ActionRequest(Choice):
+    ELEMENTS = (
+        ChoiceElement("action-request-normal", ActionRequestTag.NORMAL, ActionRequestNormal),
+        ChoiceElement("action-request-next-pblock", ActionRequestTag.NEXT_PBLOCK, ActionRequestNextPblock),
+        ChoiceElement("action-request-with-list", ActionRequestTag.WITH_LIST, ActionRequestWithList),
+        ChoiceElement("action-request-with-first-pblock", ActionRequestTag.WITH_FIRST_PBLOCK, ActionRequestWithFirstPblock),
+        ChoiceElement("action-request-with-list-and-first-pblock", ActionRequestTag.WITH_LIST_AND_FIRST_PBLOCK, ActionRequestWithListAndFirstPblock),
+        ChoiceElement("action-request-with-pblock", ActionRequestTag.WITH_PBLOCK, ActionRequestWithPblock))
+
+
+class GetResponseNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: GetDataResult
+
+
+class GetResponseWithDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: DataBlockG
+
+
+class GetResponseWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: SEQUENCE_OF(GetDataResult)
+
+
+class GetResponse(Choice):
+    ELEMENTS = (
+        ChoiceElement("get-response-normal", GetResponseTag.NORMAL, GetResponseNormal),
+        ChoiceElement("get-response-with-datablock", GetResponseTag.WITH_DATABLOCK, GetResponseWithDatablock),
+        ChoiceElement("get-response-with-list", GetResponseTag.WITH_LIST, GetResponseWithList))
+
+
+class SetResponseNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: DataAccessResult
+
+
+class SetResponseDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    block_number: Unsigned32
+
+
+class SetResponseLastDatablock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: DataAccessResult
+    block_number: Unsigned32
+
+
+class SetResponseLastDatablockWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: SEQUENCE_OF(DataAccessResult)
+    block_number: Unsigned32
+
+
+class SetResponseWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    result: SEQUENCE_OF(DataAccessResult)
+
+
+class SetResponse(Choice):
+    ELEMENTS = (
+        ChoiceElement("set-response-normal", SetResponseTag.NORMAL, SetResponseNormal),
+        ChoiceElement("set-response-datablock", SetResponseTag.DATABLOCK, SetResponseDatablock),
+        ChoiceElement("set-response-last-datablock", SetResponseTag.LAST_DATABLOCK, SetResponseLastDatablock),
+        ChoiceElement("set-response-last-datablock-with-list", SetResponseTag.LAST_DATABLOCK_WITH_LIST, SetResponseLastDatablockWithList),
+        ChoiceElement("set-response-with-list", SetResponseTag.WITH_LIST, SetResponseWithList))
+
+
+class ActionResponseWithOptionalData(Sequence):
+    result: ActionResult
+    return_parameters: OPTIONAL(GetDataResult)
+
+
+class ActionResponseNormal(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    single_response: ActionResponseWithOptionalData
+
+
+class ActionResponseWithPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    pblock: DataBlockSA
+
+
+class ActionResponseWithList(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    list_of_responses: SEQUENCE_OF(ActionResponseWithOptionalData)
+
+
+class ActionResponseNextPblock(Sequence):
+    invoke_id_and_priority: InvokeIdAndPriority
+    block_number: Unsigned32
+
+
+class ActionResponse(Choice):
+    ELEMENTS = (
+        ChoiceElement("action-response-normal", ActionResponseTag.NORMAL, ActionResponseNormal),
+        ChoiceElement("action-response-with-pblock", ActionResponseTag.WITH_PBLOCK, ActionResponseWithPblock),
+        ChoiceElement("action-response-with-list", ActionResponseTag.WITH_LIST, ActionResponseWithList),
+        ChoiceElement("action-response-next-pblock", ActionResponseTag.NEXT_PBLOCK, ActionResponseNextPblock))
+
+
+class ExceptionServiceError(Choice):
+    """ pdu_enums.ExceptionServiceError """
+    ELEMENTS = (
+        ChoiceElement("operation-not-possible", 1, NULL),
+        ChoiceElement("service-not-supported", 2, NULL),
+        ChoiceElement("other-reason", 3, NULL),
+        ChoiceElement("pdu-too-long", 4, NULL),
+        ChoiceElement("deciphering-error", 5, NULL),
+        ChoiceElement("invocation-counter-error", 6, Unsigned32))
+
+
+class ExceptionResponse(Sequence):
+    state_error: Unsigned8
+    """ pdu_enums.StateError """
+    service_error: ExceptionServiceError
+
+
+def get_tlv(tag: int, value: bytes | memoryview) -> bytes:
+    """ return BER encoding of value """
+    return pack("B", tag) + encode_length(len(value)) + bytes(value)
+
+
+def get_tlv_value(value: memoryview | bytes, tag: int) -> memoryview:
+    """ return view of BER encoded value with check of tag """
+    value = memoryview(value)
+    if value[0] != tag:
+        raise ValueError(F"got tag {value[0]}, expected {tag}")
+    length, pos = get_length_pos(value, 1)
+    if pos + length != len(value):
+        raise ValueError(F"got BER length {length}, expected {len(value) - pos}")
+    return value[pos:]
+
+
+class ACSE(UT):
+    """ ACSE APDU: BER components after APPLICATION tag, kept as views of contents by context tag in receiving order """
+    components: dict[int, memoryview | bytes]
+    USER_INFORMATION: int = 0xBE
+    """ [30] EXPLICIT Association-information: OCTET STRING with xDLMS APDU """
+
+    def __init__(self, value: dict[int, memoryview | bytes]):
+        self.components = value
+
+    @classmethod
+    def get(cls, buf: Buffer) -> Self:
+        """ parse from length, APPLICATION tag is parsed by APDU """
+        length = buf.get_length()
+        end = buf.get_pos() + length
+        components = dict()
+        while buf.get_pos() < end:
+            tag = buf.get_uint8()
+            components[tag] = buf.read(buf.get_length())
+        if buf.get_pos() != end:
+            raise ValueError(F"got {cls.__name__} components length {buf.get_pos() - end + length}, expected {length}")
+        return cls(components)
+
+    def __get_content_length(self) -> int:
+        return sum(1 + decide_len(len(value)) + len(value) for value in self.components.values())
+
+    def put(self, buf: Buffer) -> int:
+        ret = buf.put_len(self.__get_content_length())
+        for tag, value in self.components.items():
+            ret += buf.put_int(tag) + buf.put_len(len(value)) + buf.write(value, len(value))
+        return ret
+
+    def __len__(self):
+        return decide_len(length := self.__get_content_length()) + length
+
+    @classmethod
+    def from_str(cls, value: str) -> Self:
+        """ input as hex code of components """
+        return cls.get(Buffer(memoryview(encode_length(len(data := bytes.fromhex(value))) + data)))
+
+    @classmethod
+    def default(cls) -> Self:
+        return cls(dict())
+
+    def __str__(self):
+        return F"{self.__class__.__name__}: " + ", ".join(F"{tag:02X}: {bytes(value).hex(' ')}" for tag, value in self.components.items())
+
+    def __bytes__(self):
+        return bytes(create_buf(self).buf)
+
+    def __getitem__(self, item: int) -> memoryview | bytes:
+        return self.components[item]
+
+    def __eq__(self, other: Self):
+        return self.__class__ == other.__class__ and {tag: bytes(value) for tag, value in self.components.items()} == {tag: bytes(value) for tag, value in other.components.items()}
 
     @property
-    @abstractmethod
-    def info(self) -> bytes:
-        """ return info. All services, objects etc... TODO: """
+    def user_information(self) -> "APDU | None":
+        """ xDLMS APDU from user-information, it parsed without copy """
+        if (value := self.components.get(self.USER_INFORMATION)) is None:
+            return None
+        return APDU.get(Buffer(get_tlv_value(value, 0x04)))
 
-    def content(self) -> bytes:
-        return pack('BB', self.tag, len(self.info)) + self.info
+    @staticmethod
+    def get_user_information(value: UT) -> bytes:
+        """ return component content with xDLMS APDU """
+        return get_tlv(0x04, bytes(APDU(value)))
 
 
-class ACSE(COSEMPdu, ABC):
-    """ TODO: """
+class AARQ(ACSE):
+    PROTOCOL_VERSION: int = 0x80
+    APPLICATION_CONTEXT_NAME: int = 0xA1
+    CALLED_AP_TITLE: int = 0xA2
+    CALLING_AP_TITLE: int = 0xA6
+    SENDER_ACSE_REQUIREMENTS: int = 0x8A
+    MECHANISM_NAME: int = 0x8B
+    CALLING_AUTHENTICATION_VALUE: int = 0xAC
+    IMPLEMENTATION_INFORMATION: int = 0x9D
+
+    @classmethod
+    def new(cls, user_information: InitiateRequest,
+            application_context_name: bytes = b'\x60\x85\x74\x05\x08\x01\x01',
+            mechanism_name: bytes = None,
+            authentication_value: bytes = None) -> Self:
+        """ with context name OID, mechanism name OID and password. Default context is LN without ciphering """
+        components = {cls.APPLICATION_CONTEXT_NAME: get_tlv(0x06, application_context_name)}
+        if mechanism_name is not None:
+            components[cls.SENDER_ACSE_REQUIREMENTS] = b'\x07\x80'
+            components[cls.MECHANISM_NAME] = mechanism_name
+            components[cls.CALLING_AUTHENTICATION_VALUE] = get_tlv(0x80, authentication_value)
+        components[cls.USER_INFORMATION] = cls.get_user_information(user_information)
+        return cls(components)
+
+    @property
+    def application_context_name(self) -> memoryview:
+        """ OID content """
+        return get_tlv_value(self.components[self.APPLICATION_CONTEXT_NAME], 0x06)
+
+    @property
+    def mechanism_name(self) -> memoryview | None:
+        """ OID content """
+        return None if (value := self.components.get(self.MECHANISM_NAME)) is None else memoryview(value)
+
+    @property
+    def authentication_value(self) -> memoryview | None:
+        """ charstring of calling-authentication-value """
+        return None if (value := self.components.get(self.CALLING_AUTHENTICATION_VALUE)) is None else get_tlv_value(value, 0x80)
 
 
 class AARE(ACSE):
-    """ TODO: """
-    tag = Tag(61)
+    PROTOCOL_VERSION: int = 0x80
+    APPLICATION_CONTEXT_NAME: int = 0xA1
+    RESULT: int = 0xA2
+    RESULT_SOURCE_DIAGNOSTIC: int = 0xA3
+    RESPONDING_AP_TITLE: int = 0xA4
+    RESPONDER_ACSE_REQUIREMENTS: int = 0x88
+    MECHANISM_NAME: int = 0x89
+    RESPONDING_AUTHENTICATION_VALUE: int = 0xAA
+    IMPLEMENTATION_INFORMATION: int = 0x9D
 
-    def __init__(self, content: bytearray):
-        super(AARE, self).__init__(content)
+    @classmethod
+    def new(cls, user_information: InitiateResponse | ConfirmedServiceError | None,
+            result: int = 0,
+            source: int = 1,
+            diagnostic: int = 0,
+            application_context_name: bytes = b'\x60\x85\x74\x05\x08\x01\x01') -> Self:
+        """ result by enums.AssociationResult, source 1 is acse-service-user, 2 is acse-service-provider. Without user_information for rejection by ACSE """
+        components = {
+            cls.APPLICATION_CONTEXT_NAME: get_tlv(0x06, application_context_name),
+            cls.RESULT: get_tlv(0x02, pack("B", result)),
+            cls.RESULT_SOURCE_DIAGNOSTIC: get_tlv(0xA0 | source, get_tlv(0x02, pack("B", diagnostic)))}
+        if user_information is not None:
+            components[cls.USER_INFORMATION] = cls.get_user_information(user_information)
+        return cls(components)
 
     @property
-    def info(self) -> bytes:
-        return bytes()
+    def result(self) -> int:
+        """ enums.AssociationResult """
+        return get_tlv_value(self.components[self.RESULT], 0x02)[0]
 
+    @property
+    def diagnostic(self) -> tuple[int, int]:
+        """ source(1 is acse-service-user, 2 is acse-service-provider) and diagnostic value """
+        value = memoryview(self.components[self.RESULT_SOURCE_DIAGNOSTIC])
+        source = value[0] & 0b11111
+        return source, get_tlv_value(get_tlv_value(value, value[0]), 0x02)[0]
 
-class AARQ(ACSE):
-    """ TODO: """
-    tag = Tag(60)
 
-    def __init__(self, content: bytearray):
-        super(AARQ, self).__init__(content)
+class RLRQ(ACSE):
+    REASON: int = 0x80
 
     @property
-    def info(self) -> bytes:
-        return bytes()
+    def reason(self) -> int | None:
+        return None if (value := self.components.get(self.REASON)) is None else value[0]
+
+
+class RLRE(RLRQ):
+    """ same components as RLRQ """
+
+
+class APDU(Choice):
+    """ ACSE and xDLMS APDU by tag """
+    ELEMENTS = (
+        ChoiceElement("initiateRequest", Tag.INITIATE_REQUEST, InitiateRequest),
+        ChoiceElement("initiateResponse", Tag.INITIATE_RESPONSE, InitiateResponse),
+        ChoiceElement("confirmedServiceError", Tag.CONFIRMED_SERVICE_ERROR, ConfirmedServiceError),
+        ChoiceElement("data-notification", Tag.DATA_NOTIFICATION, DataNotification),
+        ChoiceElement("aarq", ACSEAPDU.AARQ, AARQ),
+        ChoiceElement("aare", ACSEAPDU.AARE, AARE),
+        ChoiceElement("rlre", ACSEAPDU.RLRE, RLRE),
+        ChoiceElement("rlrq", ACSEAPDU.RLRQ, RLRQ),
+        ChoiceElement("get-request", Tag.GET_REQUEST, GetRequest),
+        ChoiceElement("set-request", Tag.SET_REQUEST, SetRequest),
+        ChoiceElement("event-notification-request", Tag.EVENT_NOTIFICATION_REQUEST, EventNotificationRequest),
+        ChoiceElement("action-request", Tag.ACTION_REQUEST, ActionRequest),
+        ChoiceElement("get-response", Tag.GET_RESPONSE, GetResponse),
+        ChoiceElement("set-response", Tag.SET_RESPONSE, SetResponse),
+        ChoiceElement("action-response", Tag.ACTION_RESPONSE, ActionResponse),
+        ChoiceElement("exception-response", Tag.EXCEPTION_RESPONSE, ExceptionResponse))
 
 
-if __name__ == '__main__':
-    a = COSEMPdu.from_content(bytearray((61,3,1,2,4)))
-    b = a.content().hex(' ')
-    print(a)
+def decode(value: bytes | bytearray | memoryview) -> APDU:
+    """ return APDU with views of value, all value must be used """
+    buf = Buffer(memoryview(value))
+    apdu = APDU.get(buf)
+    if buf.get_pos() != len(value):
+        raise ValueError(F"got APDU length {buf.get_pos()}, expected {len(value)}")
+    return apdu
@@ -247,9 +247,9 @@ class Conformance(IntFlag):
     PARAMETERIZED_ACCESS = 0b100_0000_0000_0000_0000
     GET = 0b1000_0000_0000_0000_0000
     SET = 0b1_0000_0000_0000_0000_0000
-    SELECTIVE_ACCESS = 0b10_0000_0000_0000_0000
-    EVENT_NOTIFICATION = 0b100_0000_0000_0000_0000
-    ACTION = 0b1000_0000_0000_0000_0000
+    SELECTIVE_ACCESS = 0b10_0000_0000_0000_0000_0000
+    EVENT_NOTIFICATION = 0b100_0000_0000_0000_0000_0000
+    ACTION = 0b1000_0000_0000_0000_0000_0000
 
     @cached_property
     def content(self) -> bytes:
@@ -334,6 +334,13 @@ class AARQapdu(IntEnum):
     USER_INFORMATION = 30
 
 
+class GetRequest(IntEnum):
+    """COSEMpdu_GB83.asn Get-Request"""
+    NORMAL = 1
+    NEXT = 2
+    WITH_LIST = 3
+
+
 class SetRequest(IntEnum):
     """COSEMpdu_GB83.asn Set-Request"""
     SET_REQUEST_NORMAL = 1
@@ -1,10 +1,14 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from struct import unpack, pack
-from functools import cached_property
-from typing import Deque
+from functools import cached_property, lru_cache
+from binascii import crc_hqx
+from collections import deque
+from typing import Deque, Iterator, Callable, TYPE_CHECKING
 from enum import IntFlag
 import logging
+if TYPE_CHECKING:
+    from .negotiation import Negotiation
 
 logger = logging.getLogger(__name__)
 logger.level = logging.INFO
@@ -25,7 +29,8 @@ class Format:
     and consists of three subfields referred to as the format type subfield, the segmentation subfield and the frame length subfield. The format of the frame format field is as
     follows, ISO/IEC 13239:2002(E), 4.9 Frame format field, Type 3 :
         Type(4 bits) - Segmentation(1 bit) - Length(11 bit) """
-    __content: bytes
+    __value: int
+    """ format field as one integer, subfields got by masks """
 
     def __init__(self, content: bytes = None,
                  is_segmentation: bool = None,
@@ -34,7 +39,7 @@ class Format:
             if len(content) != 2:
                 raise ValueError(F'Wrong length Frame format type, must be 2, got {len(content)}')
             else:
-                self.__content = content
+                self.__value = content[0] << 8 | content[1]
                 if self.type != 0xA:
                     raise FormatDataError(F'Frame format type not according HDLC Type 3, must be 0xA, got {hex(self.type)}')
         else:
@@ -44,27 +49,36 @@ class Format:
                     value |= 0b1010_1_00000000000
                 else:
                     value |= 0b1010_0_00000000000
-                self.__content = pack('>H', value)
+                self.__value = value
             else:
                 raise ValueError(F'Frame length overflow, max be 2048, got {length}')
 
+    @classmethod
+    def from_view(cls, value: memoryview | bytes, pos: int = 1) -> Format:
+        """ parse from position by one integer without coping of value """
+        new = cls.__new__(cls)
+        new.__value = value[pos] << 8 | value[pos + 1]
+        if new.__value >> 12 != 0xA:
+            raise FormatDataError(F'Frame format type not according HDLC Type 3, must be 0xA, got {hex(new.__value >> 12)}')
+        return new
+
     @property
     def content(self) -> bytes:
-        return self.__content
+        return pack('>H', self.__value)
 
-    @cached_property
+    @property
     def type(self) -> int:
         """ Must be 0b1010 in first 4 bits """
-        return self.__content[0] >> 4
+        return self.__value >> 12
 
-    @cached_property
+    @property
     def length(self) -> int:
         """ return length of frame. Mask 11bit. """
-        return unpack('>H', self.__content)[0] & 0b0000_0_111_11111111
+        return self.__value & 0b0000_0_111_11111111
 
-    @cached_property
+    @property
     def is_segmentation(self) -> bool:
-        return bool(self.__content[0] & 0b00001000)
+        return bool(self.__value & 0b0000_1_000_00000000)
 
     def __str__(self):
         return F'Type 3: length-{self.length} {"segmentation" if self.is_segmentation else ""}'
@@ -149,19 +163,43 @@ class Address:
             else:
                 raise ValueError(F"got {length=}, but lower address is absense, expected (0..16383)")
 
+    @classmethod
+    @lru_cache(maxsize=1000)
+    def from_content(cls, content: bytes) -> Address:
+        """ interned address by content, shared between frames. Address is immutable """
+        return cls(content)
+
+    @classmethod
+    @lru_cache(maxsize=1000)
+    def get(cls, upper_address: int,
+            lower_address: int = None,
+            length: AddressLength = AddressLength.AUTO) -> Address:
+        """ interned address by upper, lower and length """
+        return cls.from_content(cls(upper_address=upper_address, lower_address=lower_address, length=length).content)
+
     @classmethod
     def from_frame(cls, value: bytearray) -> Address:
         for it in (0, 1, 3):
             if value[it] % 2 == 1:
                 match it:
-                    case 0: new = cls(bytes(value[:1])); break
-                    case 1: new = cls(bytes(value[:2])); break
-                    case 3: new = cls(bytes(value[:4])); break
+                    case 0: new = cls.from_content(bytes(value[:1])); break
+                    case 1: new = cls.from_content(bytes(value[:2])); break
+                    case 3: new = cls.from_content(bytes(value[:4])); break
         else:
             raise ValueError('HDLC source address wrong, not found end bit')
         del value[:len(new)]
         return new
 
+    @classmethod
+    def from_view(cls, value: memoryview | bytes, pos: int) -> tuple[Address, int]:
+        """ return address from position and position after it """
+        for length in (1, 2, 4):
+            if pos + length > len(value):
+                break
+            elif value[pos + length - 1] & 1:
+                return cls.from_content(bytes(value[pos:pos + length])), pos + length
+        raise ValueError('HDLC source address wrong, not found end bit')
+
     @property
     def content(self) -> bytes:
         return self.__content
@@ -534,20 +572,20 @@ class Control(IntFlag):
     """ Request initialization mode """
 
     def __add__(self, other):
-        return Control(self.value + other)
+        return get_control(self.value + other)
 
     def __or__(self, other):
-        return Control(self.value | other)
+        return get_control(self.value | other)
 
     def __and__(self, other):
-        return Control(self.value & other)
+        return get_control(self.value & other)
 
     def __str__(self):
         return F'{_type[self.value & 0b11]} {self.name}'
 
     @classmethod
     def from_frame(cls, value: bytearray) -> Control:
-        return Control(value.pop(0))
+        return _CONTROLS[value.pop(0)]
 
     @property
     def content(self) -> bytes:
@@ -588,7 +626,8 @@ class Control(IntFlag):
 
     @classmethod
     def next_send_sequence(cls, value: Control) -> Control:
-        return Control(((value & 0xF0 | (value + 0x2) & 0xE) & 0xFF) & 0xFF)
+        value = int(value)
+        return _CONTROLS[value & 0xF0 | value + 0x2 & 0xE]
         # value &= 0b1111111_0  # make info from other TODO: is it a gurux bug???
         # if value.is_info():
         #     return Control(value & 0b11110001 | (value + 0x2) & 0b00001110)
@@ -597,13 +636,26 @@ class Control(IntFlag):
 
     @classmethod
     def next_receiver_sequence(cls, value: Control) -> Control:
-        return Control(((value & 0xFF) + 0x20 | 0x10 | value & 0xE) & 0xFF)
+        value = int(value)
+        return _CONTROLS[((value & 0xFF) + 0x20 | 0x10 | value & 0xE) & 0xFF]
         # if value.is_info() or value.is_supervisory():
         #     return Control(value & 0b00011111 | 0x10 | (value + 0x20) & 0b11100000)
         # else:
         #     raise ValueError(F'Increase sender supporting only for information and supervisory type, got {value}')
 
 
+_CONTROLS: tuple[Control, ...] = tuple(Control(i) for i in range(256))
+""" all control field values, index is value. Lookup instead of IntFlag creation in hot path """
+
+
+def get_control(value: int) -> Control:
+    """ return Control from table or by IntFlag if out of octet """
+    if 0 <= value < 256:
+        return _CONTROLS[value]
+    else:
+        return Control(value)
+
+
 _CCITT = (0x0000, 0x1189, 0x2312, 0x329B, 0x4624, 0x57AD, 0x6536, 0x74BF, 0x8C48, 0x9DC1, 0xAF5A, 0xBED3, 0xCA6C, 0xDBE5, 0xE97E, 0xF8F7,
           0x1081, 0x0108, 0x3393, 0x221A, 0x56A5, 0x472C, 0x75B7, 0x643E, 0x9CC9, 0x8D40, 0xBFDB, 0xAE52, 0xDAED, 0xCB64, 0xF9FF, 0xE876,
           0x2102, 0x308B, 0x0210, 0x1399, 0x6726, 0x76AF, 0x4434, 0x55BD, 0xAD4A, 0xBCC3, 0x8E58, 0x9FD1, 0xEB6E, 0xFAE7, 0xC87C, 0xD9F5,
@@ -622,8 +674,14 @@ _CCITT = (0x0000, 0x1189, 0x2312, 0x329B, 0x4624, 0x57AD, 0x6536, 0x74BF, 0x8C48
           0xF78F, 0xE606, 0xD49D, 0xC514, 0xB1AB, 0xA022, 0x92B9, 0x8330, 0x7BC7, 0x6A4E, 0x58D5, 0x495C, 0x3DE3, 0x2C6A, 0x1EF1, 0x0F78)
 
 
+_REVERSED: bytes = bytes(int(F"{i:08b}"[::-1], 2) for i in range(256))
+""" bytes with reversed bits order. CRC-16/X.25 is reflected CRC-CCITT, calculate it by binascii.crc_hqx with reversed input and result """
+
+
 class CRC:
+    """ CRC-16/X.25: polynomial 0x1021 reflected, init 0xFFFF, xor out 0xFFFF. State is not reflected register of crc_hqx """
     __content: bytes
+    INIT: int = 0xFFFF
 
     def __init__(self, content: bytes = None,
                  message: bytes = None):
@@ -633,10 +691,18 @@ class CRC:
             else:
                 self.__content = content
         else:
-            value = 0xFFFF
-            for i in message:
-                value = ((value >> 8) ^ _CCITT[(value ^ i) & 0xFF]) & 0xFFFF
-            self.__content = pack('H', ~value & 0xFFFF)
+            self.__content = self.from_state(self.update(self.INIT, message)).content
+
+    @staticmethod
+    def update(state: int, message: bytes | bytearray | memoryview) -> int:
+        """ return state after message for continue calculating """
+        if isinstance(message, memoryview):
+            message = message.tobytes()
+        return crc_hqx(message.translate(_REVERSED), state)
+
+    @classmethod
+    def from_state(cls, state: int) -> CRC:
+        return cls(content=pack('H', ~(_REVERSED[state & 0xFF] << 8 | _REVERSED[state >> 8]) & 0xFFFF))
 
     @classmethod
     def from_frame(cls, value: bytearray, message: bytes = None) -> CRC:
@@ -655,6 +721,12 @@ class CRC:
         return self.__content.hex(' ')
 
 
+@lru_cache(maxsize=1000)
+def get_header_state(header: bytes) -> int:
+    """ CRC state after frame header(format, addresses, control). Use for HCS and continue to FCS """
+    return CRC.update(CRC.INIT, header)
+
+
 class Info(ABC):
 
     @property
@@ -698,26 +770,9 @@ class Frame:
             self.__format = Format(bytes(content[1:3]))
             if self.__format.length + 2 > len(content):  # 2 is length of flags(7e) in begin and end of frame
                 raise NotEnoughDataError(F'Frame length not according by it data: got frame with length {len(content)}, but length field is {self.__format.length}')
-            else:
-                content.pop(0)      # remove start flag
-            if content[self.__format.length] != _FLAG:
-                raise ValueError('Wrong length or HDLC end flag')
-            else:
-                remaining_frame_data: bytearray = content[2:self.__format.length]
-                """ for parsing in part """
-                self.__destination_address = Address.from_frame(remaining_frame_data)
-                self.__source_address = Address.from_frame(remaining_frame_data)
-                self.__control = Control.from_frame(remaining_frame_data)
-                if len(remaining_frame_data) == 2:  # info is absence
-                    self.__hcs = None
-                    self.__info = bytes()
-                else:
-                    self.__hcs = CRC.from_frame(value=remaining_frame_data,
-                                                message=self.__header_sequence)
-                    self.__info = bytes(remaining_frame_data[:-2])
-                self.__fcs = CRC.from_frame(value=remaining_frame_data[-2:],
-                                            message=self.__frame_sequence)
-                del content[:self.__format.length]
+            with memoryview(content)[:self.__format.length + 2] as view:
+                self.__parse(view)
+            del content[:self.__format.length + 1]  # keep end flag, it may be start flag of next frame
         else:
             self.__destination_address = DA
             self.__source_address = SA
@@ -729,11 +784,51 @@ class Frame:
                 self.__format = Format(is_segmentation=is_segmentation,
                                        length=len(self.__destination_address) + len(self.__source_address) + 5)
                 self.__hcs = None
+                state = get_header_state(self.__header_sequence)
             else:
                 self.__format = Format(is_segmentation=is_segmentation,
                                        length=len(self.__destination_address) + len(self.__source_address) + len(self.__info) + 7)
-                self.__hcs = CRC(message=self.__header_sequence)
-            self.__fcs = CRC(message=self.__frame_sequence)
+                state = get_header_state(self.__header_sequence)
+                self.__hcs = CRC.from_state(state)
+                state = CRC.update(state, self.__hcs.content + self.__info)
+            self.__fcs = CRC.from_state(state)
+
+    def __parse(self, value: memoryview | bytes):
+        """ parse by offsets from start flag to end flag, format already parsed """
+        if value[-1] != _FLAG:
+            raise ValueError('Wrong length or HDLC end flag')
+        self.__destination_address, pos = Address.from_view(value, 3)
+        self.__source_address, pos = Address.from_view(value, pos)
+        self.__control = _CONTROLS[value[pos]]
+        pos += 1
+        state = get_header_state(bytes(value[1:pos]))
+        match len(value) - pos:
+            case 3:  # FCS and end flag, info is absence
+                self.__hcs = None
+                self.__info = bytes()
+            case 4 | 5:
+                raise ValueError(F'Wrong frame length {len(value)}')
+            case _:
+                self.__hcs = CRC(content=bytes(value[pos:pos + 2]))
+                if CRC.from_state(state).content != self.__hcs.content:
+                    raise ValueError('Wrong CRC')
+                self.__info = bytes(value[pos + 2:-3])
+                state = CRC.update(state, value[pos:-3])
+        self.__fcs = CRC(content=bytes(value[-3:-1]))
+        if CRC.from_state(state).content != self.__fcs.content:
+            raise ValueError('Wrong CRC')
+
+    @classmethod
+    def from_view(cls, value: memoryview | bytes) -> Frame:
+        """ Frame from start flag to end flag without coping of value """
+        if value[0] != _FLAG:
+            raise ValueError('Wrong start flag')
+        new = cls.__new__(cls)
+        new.__format = Format.from_view(value)
+        if new.__format.length + 2 != len(value):
+            raise ValueError(F'Frame length not according by it data: got frame with length {len(value)}, but length field is {new.__format.length}')
+        new.__parse(value)
+        return new
 
     def get_header(self) -> tuple[Address, Address]:
         """ return SA, DA for reusing """
@@ -742,8 +837,10 @@ class Frame:
     @classmethod
     def try_from(cls, value: bytearray) -> Frame | None:
         """ Search of HDLC start flag and return Frame and value remains for next searching. If wrong frame when return value with out start flag for parsing """
-        while len(value) != 0 and value[0] != _FLAG:  # remove all bytes before flag
-            value.pop(0)
+        if (start := value.find(_FLAG)) == -1:
+            value.clear()
+        else:
+            del value[:start]  # remove all bytes before flag
         if len(value) < 9:  # where 9 is min length of HDLC frame type-3
             return None
         else:
@@ -835,6 +932,195 @@ class Frame:
         return info
 
 
+class Reassembler:
+    """ Join info of segmented information frames while they are received. Info handed to consumer by send sequence order, frames after the gap kept until it's filled,
+    duplicates (retransmitted frames) skipped. Sequence compared by N(S) without P/F bit, it differs inside window """
+    __consumer: Callable[[bytes], None]
+    __buffer: bytearray | None
+    __expected: int | None
+    """ N(S) of next frame """
+    __pending: dict[int, Frame]
+    """ frames after the gap by N(S) """
+    __consumed: Deque[int]
+    """ N(S) of last window consumed frames for find duplicates """
+    is_complete: bool
+
+    def __init__(self, consumer: Callable[[bytes], None] = None,
+                 window: int = 1,
+                 expected: int = None):
+        if consumer is None:
+            self.__buffer = bytearray()
+            self.__consumer = self.__buffer.extend
+        else:
+            self.__buffer = None
+            self.__consumer = consumer
+        self.__expected = expected
+        self.__pending = dict()
+        self.__consumed = deque(maxlen=window)
+        self.is_complete = False
+
+    @property
+    def info(self) -> bytearray:
+        """ joined info for default consumer """
+        if self.__buffer is None:
+            raise AttributeError("info handed to consumer")
+        return self.__buffer
+
+    @property
+    def expected(self) -> int | None:
+        """ N(S) of waited frame, use for N(R) in RR or REJ """
+        return self.__expected
+
+    def feed(self, frame: Frame) -> bool:
+        """ return TRUE if APDU is complete """
+        if not frame.control.is_info():
+            logger.warning(F'Frame {frame} not handled and deleted')
+        elif self.is_complete:
+            logger.warning(F'Frame {frame} after end of APDU deleted')
+        else:
+            send_sequence = frame.control >> 1 & 0b111
+            if self.__expected is None or send_sequence == self.__expected:
+                self.__consume(frame)
+                while not self.is_complete and (frame := self.__pending.pop(self.__expected, None)) is not None:
+                    self.__consume(frame)
+            elif send_sequence in self.__consumed or (send_sequence - self.__expected) % 8 >= self.__consumed.maxlen:
+                logger.info(F'Frame N(S)={send_sequence} is duplicate, skipped')
+            else:
+                logger.info(F'Frame N(S)={send_sequence} out of sequence, expected N(S)={self.__expected}')
+                self.__pending[send_sequence] = frame
+        return self.is_complete
+
+    def __consume(self, frame: Frame):
+        self.__consumer(frame.info)
+        self.__consumed.append(send_sequence := frame.control >> 1 & 0b111)
+        self.__expected = send_sequence + 1 & 0b111
+        if not frame.is_segmentation:
+            self.is_complete = True
+            self.__pending.clear()
+
+
+class Segmenter:
+    """ Build information frames of APDU into one preallocated buffer by header templates. Frames of every window returned as one memoryview for single write """
+    __addresses: bytes
+    __templates: dict[tuple[int, bool, int], tuple[bytes, int]]
+    """ start flag + format + DA + SA + control + HCS and CRC state after it by frame length, segmentation and control """
+    max_info: int
+    window: int
+
+    def __init__(self, DA: Address, SA: Address,
+                 max_info: int = 128,
+                 window: int = 1):
+        self.__addresses = DA.content + SA.content
+        self.__templates = dict()
+        self.max_info = max_info
+        self.window = window
+
+    @classmethod
+    def from_negotiation(cls, DA: Address, SA: Address, value: Negotiation) -> Segmenter:
+        return cls(DA, SA, value.max_info_transmit, value.window_transmit)
+
+    def __get_template(self, length: int, is_segmentation: bool, control: int) -> tuple[bytes, int]:
+        if (template := self.__templates.get((length, is_segmentation, control))) is None:
+            header = Format(is_segmentation=is_segmentation, length=length).content + self.__addresses + pack('B', control)
+            hcs = CRC.from_state(state := get_header_state(header)).content
+            template = self.__templates[length, is_segmentation, control] = pack('B', _FLAG) + header + hcs, CRC.update(state, hcs)
+        return template
+
+    def build(self, apdu: bytes | bytearray | memoryview, control: Control) -> tuple[list[memoryview], Control]:
+        """ return frames by windows and control of last frame. Control is first frame send sequence, poll bit is set in last frame of every window.
+        Info written to buffer from APDU view, reversed bits copy of APDU used only for FCS """
+        if len(apdu) == 0:
+            raise ValueError("APDU is empty")
+        header_length = len(self.__addresses) + 6  # flag + format + addresses + control + HCS
+        amount = (len(apdu) + self.max_info - 1) // self.max_info
+        buf = bytearray(amount * (header_length + 3) + len(apdu))  # 3 is FCS + end flag
+        view = memoryview(buf)
+        apdu_view = memoryview(apdu)
+        reversed_apdu = memoryview((apdu_view.tobytes() if isinstance(apdu, memoryview) else apdu).translate(_REVERSED))
+        windows: list[memoryview] = list()
+        value = int(control)
+        pos = window_start = 0
+        for i, start in enumerate(range(0, len(apdu), self.max_info), start=1):
+            end = min(start + self.max_info, len(apdu))
+            is_window_end = i % self.window == 0 or i == amount
+            value = value | 0x10 if is_window_end else value & 0xEF
+            template, state = self.__get_template(header_length + end - start + 1, i != amount, value)  # length without flags
+            buf[pos:pos + header_length] = template
+            pos += header_length
+            buf[pos:pos + end - start] = apdu_view[start:end]
+            pos += end - start
+            buf[pos:pos + 2] = CRC.from_state(crc_hqx(reversed_apdu[start:end], state)).content
+            buf[pos + 2] = _FLAG
+            pos += 3
+            if is_window_end:
+                windows.append(view[window_start:pos])
+                window_start = pos
+            if i != amount:
+                value = value & 0xF1 | (value + 2) & 0xE  # next send sequence
+        return windows, get_control(value)
+
+
+class Scanner:
+    """ Receive buffer of HDLC stream. Walk by read offset and yield complete Frames, wrong frames resynchronise by next flag.
+    Consumed bytes removed from buffer by COMPACT_SIZE amount only """
+    COMPACT_SIZE: int = 0x1000
+    MIN_FRAME_LENGTH: int = 9
+    """ flag + format + DA + SA + control + FCS + flag """
+    __buffer: bytearray
+    __pos: int
+    """ read offset """
+    errors: int
+    """ amount of wrong frames """
+
+    def __init__(self):
+        self.__buffer = bytearray()
+        self.__pos = 0
+        self.errors = 0
+
+    def feed(self, data: bytes | bytearray | memoryview):
+        """ append received data """
+        if self.__pos == len(self.__buffer):
+            self.__buffer.clear()
+            self.__pos = 0
+        elif self.__pos >= self.COMPACT_SIZE:
+            del self.__buffer[:self.__pos]
+            self.__pos = 0
+        self.__buffer.extend(data)
+
+    def __len__(self):
+        """ amount of not handled bytes """
+        return len(self.__buffer) - self.__pos
+
+    def get_frame(self) -> Frame | None:
+        """ return next complete Frame or None if need more data """
+        buf = self.__buffer
+        while (start := buf.find(_FLAG, self.__pos)) != -1:
+            self.__pos = start
+            if len(buf) - start < self.MIN_FRAME_LENGTH:
+                return None
+            if buf[start + 1] >> 4 != 0xA:  # not Type 3, may be end flag of previous frame
+                self.__pos += 1
+                continue
+            end = start + ((buf[start + 1] & 0b111) << 8 | buf[start + 2]) + 1
+            if end >= len(buf):
+                return None
+            try:
+                with memoryview(buf)[start:end + 1] as view:
+                    frame = Frame.from_view(view)
+                self.__pos = end  # keep end flag, it may be start flag of next frame
+                return frame
+            except (ValueError, FormatDataError) as e:
+                logger.info(F'Wrong Frame: {e}')
+                self.errors += 1
+                self.__pos += 1
+        self.__pos = len(buf)
+        return None
+
+    def __iter__(self) -> Iterator[Frame]:
+        while (frame := self.get_frame()) is not None:
+            yield frame
+
+
 if __name__ == '__main__':
     ad1 = Address(upper_address=0x3f,
                   lower_address=1)
@@ -0,0 +1,284 @@
+""" HDLC data link layer over asyncio transport with sliding window. IEC 62056-46, ISO/IEC 13239 """
+from __future__ import annotations
+import asyncio
+import inspect
+import logging
+import time
+from typing import Callable, Awaitable
+from .frame import Frame, Control, Address, Scanner, Segmenter, Reassembler, get_control
+from .negotiation import Negotiation
+from .tuning import Statistic
+
+logger = logging.getLogger(__name__)
+logger.level = logging.INFO
+
+_POLL: int = 0b000_1_00_00
+_RR: int = 0b000_0_00_01
+_RNR: int = 0b000_0_01_01
+_SUPERVISORY_MASK: int = 0b000_0_11_11
+
+
+def get_supervisory(kind: int, receive_sequence: int) -> Control:
+    """ return RR or RNR with N(R) and P/F bit """
+    return get_control(receive_sequence << 5 | _POLL | kind)
+
+
+class Station(asyncio.Protocol):
+    """ Common part of primary and secondary stations. Received frames of own address put to queue, I-frames sequence by V(S) and V(R).
+    APDU send by windows with waiting RR after each not last, window resend by RR with other N(R) or timeout """
+    DA: Address | None
+    SA: Address
+    negotiation: Negotiation
+    timeout: float = 3.0
+    retries: int = 3
+    rnr_delay: float = 0.1
+    """ wait before poll after RNR """
+    _transport: asyncio.Transport | None
+    _frames: asyncio.Queue[Frame | None]
+    _segmenter: Segmenter | None
+    _v_s: int
+    """ send state variable, N(S) of next I-frame """
+    _v_r: int
+    """ receive state variable, N(R) of next I-frame """
+    _last_window: memoryview | None
+    statistic: Statistic
+    __scanner: Scanner
+
+    def __init__(self, DA: Address | None, SA: Address,
+                 negotiation: Negotiation = None):
+        self.DA = DA
+        self.SA = SA
+        self.negotiation = Negotiation() if negotiation is None else negotiation
+        self._transport = None
+        self._frames = asyncio.Queue()
+        self._segmenter = None
+        self._v_s = self._v_r = 0
+        self._last_window = None
+        self.statistic = Statistic()
+        self.__scanner = Scanner()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self._transport = transport
+
+    def connection_lost(self, exc: Exception | None):
+        self._frames.put_nowait(None)
+
+    def data_received(self, data: bytes):
+        errors = self.__scanner.errors
+        self.__scanner.feed(data)
+        for frame in self.__scanner:
+            self.statistic.frames += 1
+            if self._is_for_me(frame):
+                self._frames.put_nowait(frame)
+            else:
+                logger.info(F"skip frame {frame.control.name} not for {self.SA}")
+        self.statistic.errors += self.__scanner.errors - errors
+
+    def _is_for_me(self, frame: Frame) -> bool:
+        return frame.is_for_me(self.DA, self.SA)
+
+    def _write(self, data: bytes | memoryview):
+        self._transport.write(data)
+
+    def _send(self, control: Control, info: bytes = b''):
+        self._write(Frame(DA=self.DA, SA=self.SA, control=control, info=info, is_segmentation=False).content)
+
+    def _reset(self):
+        """ begin of connection by negotiation """
+        self._v_s = self._v_r = 0
+        self._last_window = None
+        self._segmenter = Segmenter.from_negotiation(self.DA, self.SA, self.negotiation)
+
+    async def _receive(self, timeout: float | None) -> Frame:
+        frame = await asyncio.wait_for(self._frames.get(), timeout)
+        if frame is None:
+            self._frames.put_nowait(None)  # for other waiters
+            raise ConnectionError("connection lost")
+        return frame
+
+    def _handle_supervisory(self, frame: Frame):
+        """ resend last window if other side not received it """
+        if frame.control & _SUPERVISORY_MASK == _RR and frame.control >> 5 != self._v_s and self._last_window is not None:
+            logger.info(F"resend window by N(R)={frame.control >> 5}, V(S)={self._v_s}")
+            self.statistic.retransmissions += 1
+            self._write(self._last_window)
+        else:
+            logger.info(F"got {frame.control.name}, skipped")
+
+    async def _send_info(self, info: bytes):
+        """ send APDU by windows. Ack of last window is I-frame of other side """
+        windows, last = self._segmenter.build(info, get_control(self._v_r << 5 | self._v_s << 1))
+        for i, window in enumerate(windows[:-1], start=1):
+            await self.__write_and_ack(window, self._v_s + i * self._segmenter.window & 0b111)
+        self._last_window = windows[-1]
+        self._write(self._last_window)
+        self._v_s = (last >> 1) + 1 & 0b111
+
+    async def __write_and_ack(self, window: memoryview, expected: int):
+        """ write not last window and wait RR with next N(S) """
+        for i in range(self.retries):
+            if i != 0:
+                self.statistic.retransmissions += 1
+            self._write(window)
+            try:
+                while True:
+                    frame = await self._receive(self.timeout)
+                    if frame.control.is_info():
+                        logger.warning(F"got {frame.control.name} while wait RR, skipped")
+                    elif frame.control & _SUPERVISORY_MASK == _RNR:
+                        await asyncio.sleep(self.rnr_delay)
+                        self._send(get_supervisory(_RR, self._v_r))
+                    elif frame.control & _SUPERVISORY_MASK != _RR:
+                        logger.warning(F"got {frame.control.name} while wait RR, skipped")
+                    elif frame.control >> 5 == expected:
+                        return
+                    else:
+                        logger.info(F"resend window by N(R)={frame.control >> 5}, expected {expected}")
+                        break
+            except TimeoutError:
+                logger.info(F"timeout of RR, resend window")
+        raise TimeoutError(F"not received RR with N(R)={expected}")
+
+    async def _receive_info(self, frame: Frame = None) -> bytes:
+        """ receive APDU by windows, RR send after every not last window. Frame is first received I-frame """
+        reassembler = Reassembler(window=self.negotiation.window_receive, expected=self._v_r)
+        retries = 0
+        while True:
+            if frame is None:
+                try:
+                    frame = await self._receive(self.timeout)
+                except TimeoutError:
+                    if (retries := retries + 1) > self.retries:
+                        raise
+                    self.statistic.retransmissions += 1
+                    self._send(get_supervisory(_RR, reassembler.expected))
+                    continue
+            if not frame.control.is_info():
+                self._handle_supervisory(frame)
+            elif reassembler.feed(frame):
+                self._v_r = reassembler.expected
+                self._last_window = None  # other side got it
+                return bytes(reassembler.info)
+            elif frame.control.is_poll:
+                self._send(get_supervisory(_RR, reassembler.expected))
+            frame = None
+
+
+class Client(Station):
+    """ Primary station """
+    __lock: asyncio.Lock
+
+    def __init__(self, DA: Address, SA: Address,
+                 negotiation: Negotiation = None):
+        super().__init__(DA, SA, negotiation)
+        self.__lock = asyncio.Lock()
+
+    async def __command(self, control: Control, info: bytes = b'') -> Frame:
+        """ send unnumbered command and return response, command resend by timeout """
+        for i in range(self.retries):
+            if i != 0:
+                self.statistic.retransmissions += 1
+            self._send(control, info)
+            try:
+                while not (frame := await self._receive(self.timeout)).control.is_unnumbered():
+                    logger.info(F"got {frame.control.name} while wait response of {control.name}, skipped")
+                return frame
+            except TimeoutError:
+                logger.info(F"timeout of {control.name} response")
+        raise TimeoutError(F"not received response of {control.name} from {self.DA}")
+
+    async def connect(self):
+        """ SNRM/UA with negotiation of info length and window """
+        async with self.__lock:
+            frame = await self.__command(Control.SNRM_P, self.negotiation.content)
+            match frame.control:
+                case Control.UA_F:
+                    self.negotiation.set_from_UA(frame.info)
+                    self._reset()
+                    logger.info(F"connected {self.negotiation}")
+                case Control.DM_F:
+                    raise ConnectionRefusedError(F"got DM from {self.DA}")
+                case wrong:
+                    raise ConnectionError(F"got {wrong.name}, expected UA")
+
+    async def request(self, info: bytes) -> bytes:
+        """ send APDU and return response APDU """
+        async with self.__lock:
+            start = time.perf_counter()
+            await self._send_info(info)
+            response = await self._receive_info()
+            self.statistic.add_request(len(info) + len(response), time.perf_counter() - start)
+            return response
+
+    async def disconnect(self):
+        async with self.__lock:
+            frame = await self.__command(Control.DISC_P)
+            if frame.control not in (Control.UA_F, Control.DM_F):
+                raise ConnectionError(F"got {frame.control.name}, expected UA or DM")
+            self._segmenter = None
+
+
+class Server(Station):
+    """ Secondary station. Client address take from SNRM, APDU handled by handler, it may be coroutine function """
+    capability: Negotiation
+    """ max parameters of server """
+    handler: Callable[[bytes], bytes | Awaitable[bytes]]
+    __task: asyncio.Task | None
+
+    def __init__(self, SA: Address,
+                 handler: Callable[[bytes], bytes | Awaitable[bytes]],
+                 capability: Negotiation = None):
+        super().__init__(None, SA)
+        self.capability = Negotiation() if capability is None else capability
+        self.handler = handler
+        self.__task = None
+
+    def _is_for_me(self, frame: Frame) -> bool:
+        return frame.get_header()[0] == self.SA
+
+    def connection_made(self, transport: asyncio.Transport):
+        super().connection_made(transport)
+        self.__task = asyncio.get_running_loop().create_task(self.__serve())
+
+    def __negotiate(self, info: bytes):
+        proposal = Negotiation()
+        proposal.set_from_UA(info)
+        self.negotiation = Negotiation(
+            max_info_transmit=min(proposal.max_info_transmit, self.capability.max_info_transmit),
+            max_info_receive=min(proposal.max_info_receive, self.capability.max_info_receive),
+            window_transmit=min(proposal.window_transmit, self.capability.window_transmit),
+            window_receive=min(proposal.window_receive, self.capability.window_receive))
+
+    async def __serve(self):
+        try:
+            while True:
+                frame = await self._receive(None)
+                if self._segmenter is None:
+                    self.DA = frame.get_header()[1]
+                match frame.control:
+                    case Control.SNRM_P:
+                        self.DA = frame.get_header()[1]
+                        self.__negotiate(frame.info)
+                        self._send(Control.UA_F, self.negotiation.content)
+                        self._reset()
+                    case Control.DISC_P if self._segmenter is None:
+                        self._send(Control.DM_F)
+                    case Control.DISC_P:
+                        self._send(Control.UA_F)
+                        self._segmenter = None
+                    case _ if self._segmenter is None:
+                        logger.info(F"got {frame.control.name} in disconnected mode")
+                    case control if control & _SUPERVISORY_MASK == _RR and control >> 5 == self._v_s and control.is_poll:
+                        self._send(get_supervisory(_RR, self._v_r))  # request is lost, client resend it by N(R)
+                    case control if control.is_info():
+                        response = self.handler(await self._receive_info(frame))
+                        if inspect.isawaitable(response):
+                            response = await response
+                        await self._send_info(response)
+                    case _:
+                        self._handle_supervisory(frame)
+        except (ConnectionError, TimeoutError) as e:
+            logger.info(F"server {self.SA} stopped: {e}")
+        except Exception as e:
+            logger.error(F"server {self.SA} stopped by handler error, close connection: {e!r}", exc_info=e)
+            self._transport.close()
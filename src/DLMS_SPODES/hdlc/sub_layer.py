@@ -12,22 +12,24 @@ class LLC:
     __source_lsap: int
     __info: bytes
 
-    def __init__(self, content: bytearray = None,
+    def __init__(self, content: bytes | bytearray | memoryview = None,
                  message: bytes = None):
         if message is None:
-            self.__destination_lsap = content.pop(0)
+            self.__destination_lsap = content[0]
             if self.__destination_lsap not in (self.__DESTINATION__LSAP, self.__BROADCAST):
                 raise ValueError(F'Destination tag wrong, expected {hex(self.__DESTINATION__LSAP), hex(self.__BROADCAST)}, got {hex(self.__destination_lsap)}')
             else:
-                self.__source_lsap = content.pop(0)
+                self.__source_lsap = content[1]
                 if self.__source_lsap not in (self.__COMMAND, self.__RESPONSE):
                     raise ValueError(F'Destination tag wrong, expected {hex(self.__COMMAND)}, {hex(self.__RESPONSE)}, got {hex(self.__source_lsap)}')
                 else:
-                    quality = content.pop(0)
+                    quality = content[2]
                     if quality != self.__QUALITY:
                         raise ValueError(F'Quality tag wrong, expected {hex(self.__QUALITY)}, got {hex(quality)}')
                     else:
-                        self.__info = bytes(content)
+                        self.__info = bytes(content[3:])
+                        if isinstance(content, bytearray):
+                            del content[:3]  # consume header as before, content keep info
         else:
             self.__destination_lsap = self.__DESTINATION__LSAP
             self.__source_lsap = self.__COMMAND
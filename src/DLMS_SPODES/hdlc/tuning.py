@@ -0,0 +1,123 @@
+""" Adaptive choice of HDLC negotiation by measured link statistic: round-trip time, retransmissions and frame error rate. Goodput is APDU octets per second of requests """
+from __future__ import annotations
+from dataclasses import dataclass, asdict, fields
+from itertools import product
+import json
+import logging
+from typing import TYPE_CHECKING
+from .negotiation import Negotiation
+
+if TYPE_CHECKING:
+    from .link import Client
+
+logger = logging.getLogger(__name__)
+logger.level = logging.INFO
+
+MAX_INFOS: tuple[int, ...] = (128, 256, 512, 1024)
+WINDOWS: tuple[int, ...] = (1, 3, 7)
+
+
+@dataclass
+class Statistic:
+    """ counters of link with one negotiation. Float for aging of previous sessions """
+    requests: float = 0.0
+    octets: float = 0.0
+    """ APDU octets of requests and responses """
+    duration: float = 0.0
+    """ sum of requests round-trip time, s """
+    retransmissions: float = 0.0
+    """ resend of windows, SNRM, DISC and RR by timeout """
+    frames: float = 0.0
+    """ received frames """
+    errors: float = 0.0
+    """ received wrong frames """
+
+    def add_request(self, octets: int, duration: float):
+        self.requests += 1
+        self.octets += octets
+        self.duration += duration
+
+    def age(self, factor: float):
+        """ decrease weight of collected counters """
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) * factor)
+
+    @property
+    def rtt(self) -> float:
+        """ average request round-trip time, s """
+        return self.duration / self.requests if self.requests else 0.0
+
+    @property
+    def goodput(self) -> float:
+        """ octets per second """
+        return self.octets / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / (self.frames + self.errors) if self.frames + self.errors else 0.0
+
+    def __str__(self):
+        return F"goodput={self.goodput:.0f} B/s rtt={self.rtt * 1000:.1f} ms retransmissions={self.retransmissions:.0f} error_rate={self.error_rate:.3f}"
+
+
+class Tuner:
+    """ Choose negotiation for meter by maximal goodput of candidates. Not measured candidates tried first, one by connection. Statistic kept by meter key and candidate,
+    it persist by save and load """
+    candidates: tuple[tuple[int, int], ...]
+    """ max info field length and window """
+    memory: float
+    """ weight of previous sessions statistic at new session with same candidate """
+    __links: dict[str, dict[tuple[int, int], Statistic]]
+
+    def __init__(self, candidates: tuple[tuple[int, int], ...] = tuple(product(MAX_INFOS, WINDOWS)),
+                 memory: float = 0.5):
+        self.candidates = candidates
+        self.memory = memory
+        self.__links = dict()
+
+    def get_statistic(self, key: str, max_info: int, window: int) -> Statistic:
+        return self.__links.setdefault(key, dict()).setdefault((max_info, window), Statistic())
+
+    def get_choice(self, key: str) -> tuple[int, int]:
+        """ return max info field length and window for next connection """
+        statistics = self.__links.get(key, dict())
+        for candidate in self.candidates:
+            if candidate not in statistics or statistics[candidate].requests == 0:
+                return candidate
+        return max(self.candidates, key=lambda it: statistics[it].goodput)
+
+    def get_negotiation(self, key: str) -> Negotiation:
+        max_info, window = self.get_choice(key)
+        return Negotiation(max_info_transmit=max_info,
+                           max_info_receive=max_info,
+                           window_transmit=window,
+                           window_receive=window)
+
+    async def connect(self, key: str, client: Client):
+        """ connect client with chosen negotiation, client statistic collected to tuner up to next connect """
+        max_info, window = self.get_choice(key)
+        client.negotiation = self.get_negotiation(key)
+        client.statistic = self.get_statistic(key, max_info, window)
+        client.statistic.age(self.memory)
+        logger.info(F"{key}: connect with max info {max_info}, window {window}")
+        await client.connect()
+
+    def __str__(self):
+        return "\n".join(F"{key}: {max_info}/{window} {statistic}" for key, statistics in self.__links.items() for (max_info, window), statistic in statistics.items())
+
+    def save(self, path: str):
+        """ write statistic of meters to json file """
+        with open(path, "w") as f:
+            json.dump({key: [dict(max_info=max_info, window=window, **asdict(statistic)) for (max_info, window), statistic in statistics.items()]
+                       for key, statistics in self.__links.items()}, f, indent=1)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> Tuner:
+        """ tuner with saved statistic, kwargs for init """
+        new = cls(**kwargs)
+        with open(path, "r") as f:
+            for key, statistics in json.load(f).items():
+                for it in statistics:
+                    candidate = it.pop("max_info"), it.pop("window")
+                    new.__links.setdefault(key, dict())[candidate] = Statistic(**it)
+        return new
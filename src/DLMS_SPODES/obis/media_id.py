@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from itertools import count
-from ..config_parser import config
+from ..config_parser import get_values
 
 
-_mid_names = config["DLMS"]["media_id_name"]
+_mid_names = get_values("DLMS", "media_id_name")
 
 
 class MediaId(ABC):
@@ -58,6 +58,31 @@ class ActionResponse(IntEnum):
     NEXT_PBLOCK = 4
 
 
+class StateError(IntEnum):
+    """ExceptionResponse state-error"""
+    SERVICE_NOT_ALLOWED = 1
+    SERVICE_UNKNOWN = 2
+
+
+class ExceptionServiceError(IntEnum):
+    """ExceptionResponse service-error"""
+    OPERATION_NOT_POSSIBLE = 1
+    SERVICE_NOT_SUPPORTED = 2
+    OTHER_REASON = 3
+    PDU_TOO_LONG = 4
+    DECIPHERING_ERROR = 5
+    INVOCATION_COUNTER_ERROR = 6
+
+
+class Initiate(IntEnum):
+    """ServiceError initiate, use in InitiateResponse rejection"""
+    OTHER = 0
+    DLMS_VERSION_TOO_LOW = 1
+    INCOMPATIBLE_CONFORMANCE = 2
+    PDU_SIZE_TOO_SHORT = 3
+    REFUSED_BY_THE_VDE_HANDLER = 4
+
+
 class AttributeAccess(IntEnum):
     """use with version 0 and 1 AssociationLN"""
     NO_ACCESS = 0
@@ -0,0 +1,632 @@
+""" DLMS server simulator. Objects of Collection served by ACSE and xDLMS services with access rights of AssociationLN. IEC 62056-5-3 """
+from __future__ import annotations
+import asyncio
+import datetime
+import logging
+from . import cosem_pdu, enums, exceptions as exc, pdu_enums as pdu
+from .types.cosem_pdu import UT, Buffer, NULL, NULL_, TRUE, FALSE, Unsigned8, Unsigned16, Unsigned32, Integer16, OctetString, EncodedData
+from .types import cdt, cst
+from .types.implementations.enums import ClientSAP
+from .cosem_interface_classes.collection import Collection
+from .cosem_interface_classes.clock import Clock
+from .cosem_interface_classes.profile_generic.ver0 import ProfileGeneric as ProfileGenericVer0
+from .cosem_interface_classes.profile_generic.ver1 import ProfileGeneric as ProfileGenericVer1
+from .cosem_interface_classes.association_ln import mechanism_id
+from .hdlc.frame import Address
+from .hdlc.negotiation import Negotiation
+from .hdlc.sub_layer import LLC
+from .hdlc import link
+from .wrapper import transport
+from .wrapper.codec import Header
+
+logger = logging.getLogger(__name__)
+logger.level = logging.INFO
+
+_CONTEXT_NAME = b'\x60\x85\x74\x05\x08\x01'
+_MECHANISM_NAME = b'\x60\x85\x74\x05\x08\x02'
+_CURRENT_ASSOCIATION = bytes((0, 0, 40, 0, 0, 255))
+_DLMS_VERSION = Unsigned8.from_int(6)
+_LN_VAA_NAME = Integer16.from_int(7)
+_MIN_PDU = 12
+_GET_BLOCK_OVERHEAD = 12
+""" tag, choice, invoke_id, last_block, block_number, raw_data choice and max length of length """
+_RLRE = b'\x63\x03\x80\x01\x00'
+_LLC_RESPONSE = b'\xe6\xe7\x00'
+_GET_RESULTS = cosem_pdu.GetResponseWithList.__annotations__["result"]
+_SET_RESULTS = cosem_pdu.SetResponseWithList.__annotations__["result"]
+_SET_VALUES = cosem_pdu.SetRequestWithList.__annotations__["value_list"]
+_ACTION_RESULTS = cosem_pdu.ActionResponseWithList.__annotations__["list_of_responses"]
+_NO_RETURN_PARAMETERS = cosem_pdu.ActionResponseWithOptionalData.__annotations__["return_parameters"].default()
+_NO_QUALITY_OF_SERVICE = cosem_pdu.InitiateResponse.__annotations__["negotiated_quality_of_service"].default()
+
+
+def _get_conformance(value: cosem_pdu.Conformance | cdt.BitString) -> enums.Conformance:
+    """ from bit string, bit 0 is MSB of first octet """
+    return enums.Conformance(int(F"{int.from_bytes(value.contents[-3:], 'big'):024b}"[::-1], 2))
+
+
+def _get_conformance_content(value: enums.Conformance) -> cosem_pdu.Conformance:
+    return cosem_pdu.Conformance.from_int(int(F"{value:024b}"[::-1], 2))
+
+
+def _get_descriptor(value: cosem_pdu.CosemAttributeDescriptor | cosem_pdu.CosemMethodDescriptor) -> tuple[int, bytes, int]:
+    """ class_id, instance_id, attribute_id or method_id """
+    class_id, instance_id, index = value.values
+    return int(class_id), bytes(instance_id), int(index)
+
+
+def _get_selection(value: cosem_pdu.SelectiveAccessDescriptor | NULL) -> tuple[int, cdt.CommonDataType] | None:
+    """ selector and parameters of access-selection """
+    if value is NULL_:
+        return None
+    parameters, _ = cdt.get_instance_and_pdu_from_value(bytes(value.access_parameters))
+    return int(value.access_selector), parameters
+
+
+def _get_descriptors(value: list[cosem_pdu.CosemAttributeDescriptorWithSelection]) -> list[tuple[int, bytes, int, tuple | None]]:
+    """ class_id, instance_id, attribute_id and selection. Copied from request """
+    return [(*_get_descriptor(it.cosem_attribute_descriptor), _get_selection(it.access_selection.value)) for it in value]
+
+
+def _get_key(value: cdt.CommonDataType) -> int | bytes:
+    """ comparable key of buffer value for range_descriptor. Date-time without day of week, deviation and clock status """
+    if isinstance(value, cdt.Digital):
+        return int.from_bytes(value.contents, "big", signed=value.SIGNED)
+    elif len(contents := value.contents) == 12:
+        return contents[:4] + contents[5:9]
+    else:
+        return contents
+
+
+def get_exception_response(state: pdu.StateError, service: pdu.ExceptionServiceError) -> bytes:
+    return bytes(cosem_pdu.APDU(cosem_pdu.ExceptionResponse((Unsigned8.from_int(state), cosem_pdu.ExceptionServiceError(NULL_, service)))))
+
+
+def get_AARE(result: enums.AssociationResult,
+             diagnostic: enums.AcseServiceUser,
+             user_information: cosem_pdu.InitiateResponse | cosem_pdu.ConfirmedServiceError = None) -> bytes:
+    """ user_information: xDLMS InitiateResponse or ConfirmedServiceError """
+    return bytes(cosem_pdu.APDU(cosem_pdu.AARE.new(user_information, result, diagnostic=diagnostic)))
+
+
+def _get_datablock_response(invoke_id: cosem_pdu.InvokeIdAndPriority, last_block: bool, block_number: int, result: cosem_pdu.DataBlockGResult) -> bytes:
+    return bytes(cosem_pdu.APDU(cosem_pdu.GetResponse(cosem_pdu.GetResponseWithDatablock((
+        invoke_id,
+        cosem_pdu.DataBlockG((TRUE if last_block else FALSE, Unsigned32.from_int(block_number), result)))))))
+
+
+def _get_set_response(value: cosem_pdu.SetResponseNormal | cosem_pdu.SetResponseDatablock | cosem_pdu.SetResponseLastDatablock
+                      | cosem_pdu.SetResponseLastDatablockWithList | cosem_pdu.SetResponseWithList) -> bytes:
+    return bytes(cosem_pdu.APDU(cosem_pdu.SetResponse(value)))
+
+
+def get_buffer_selection(profile: ProfileGenericVer0 | ProfileGenericVer1, selector: int, parameters: cdt.CommonDataType) -> bytes:
+    """ encoding of buffer part by range_descriptor(1) or entry_descriptor(2) """
+    buffer, capture_objects = profile.buffer, profile.capture_objects
+    if not isinstance(buffer, cdt.Array) or capture_objects is None:
+        raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNAVAILABLE)
+    columns = [it.encoding for it in capture_objects]
+    try:
+        match selector:
+            case 1:
+                restricting_object, from_value, to_value, selected_values = parameters
+                column = columns.index(restricting_object.encoding)
+                low, high = _get_key(from_value), _get_key(to_value)
+                rows = [row for row in buffer if low <= _get_key(row[column]) <= high]
+                indexes = [columns.index(it.encoding) for it in selected_values] or None
+            case 2:
+                from_entry, to_entry, from_selected_value, to_selected_value = map(int, parameters)
+                rows = buffer.values[max(from_entry, 1) - 1: to_entry or None]
+                if from_selected_value <= 1 and to_selected_value in (0, len(columns)):
+                    indexes = None
+                else:
+                    indexes = range(max(from_selected_value, 1) - 1, to_selected_value or len(columns))
+            case _:
+                raise exc.ResultError(pdu.DataAccessResult.SCOPE_OF_ACCESS_VIOLATED, F"unknown selector {selector}")
+    except (ValueError, TypeError, IndexError) as e:
+        raise exc.ResultError(pdu.DataAccessResult.SCOPE_OF_ACCESS_VIOLATED, str(e))
+    ret = bytearray(b'\x01' + cdt.encode_length(len(rows)))
+    for row in rows:
+        if indexes is None:
+            ret += row.encoding
+        else:
+            ret += b'\x02' + cdt.encode_length(len(indexes))
+            for i in indexes:
+                ret += row[i].encoding
+    return bytes(ret)
+
+
+class Session:
+    """ Application association of one client with server. Handle ACSE and xDLMS APDU with objects of collection by access rights of association.
+    Supported: AARQ(no ciphering, lowest and low security), RLRQ, GET(normal, next, with-list), SET(normal, with datablock, with-list), ACTION(normal, with-list),
+    selective access to ProfileGeneric buffer. APDU parsed and built by cosem_pdu """
+    collection: Collection
+    client_SAP: int
+    association_id: int | None
+    conformance: enums.Conformance
+    """ negotiated, NONE without association """
+    max_pdu: int
+    """ max size of send APDU """
+    __get_block: memoryview | None
+    """ not sent rest of long GET response """
+    __get_block_number: int
+    __set_block: tuple[list[tuple[int, bytes, int, tuple | None]], bytearray, bool] | None
+    """ descriptors, received raw-data and is with-list of long SET """
+    __set_block_number: int
+
+    def __init__(self, collection: Collection, client_SAP: int):
+        self.collection = collection
+        self.client_SAP = client_SAP
+        try:
+            self.association_id = collection.get_association_id(ClientSAP(client_SAP))
+        except ValueError:
+            self.association_id = None
+            logger.warning(F"absent association for client SAP {client_SAP}")
+        self.__release()
+
+    def __release(self):
+        self.conformance = enums.Conformance.NONE
+        self.max_pdu = _MIN_PDU
+        self.__get_block = None
+        self.__get_block_number = 0
+        self.__set_block = None
+        self.__set_block_number = 0
+
+    @property
+    def is_associated(self) -> bool:
+        return self.conformance != enums.Conformance.NONE
+
+    def handle(self, apdu: bytes | memoryview) -> bytes:
+        """ return response APDU """
+        try:
+            request = cosem_pdu.decode(apdu).value
+            return self.__dispatch(request)
+        except (IndexError, ValueError, BufferError) as e:
+            logger.warning(F"wrong APDU {bytes(apdu[:10]).hex(' ')}: {e}")
+            match apdu[0] if len(apdu) else None:
+                case None | enums.ACSEAPDU.AARQ | enums.ACSEAPDU.RLRQ:
+                    return get_exception_response(pdu.StateError.SERVICE_UNKNOWN, pdu.ExceptionServiceError.OTHER_REASON)
+                case _ if not self.is_associated:
+                    return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.OPERATION_NOT_POSSIBLE)
+                case enums.XDLMSAPDU.GET_REQUEST | enums.XDLMSAPDU.SET_REQUEST | enums.XDLMSAPDU.ACTION_REQUEST:
+                    return get_exception_response(pdu.StateError.SERVICE_UNKNOWN, pdu.ExceptionServiceError.OTHER_REASON)
+                case _:
+                    return get_exception_response(pdu.StateError.SERVICE_UNKNOWN, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+
+    def __dispatch(self, request: UT) -> bytes:
+        match request:
+            case cosem_pdu.AARQ():
+                return self.__associate(request)
+            case cosem_pdu.RLRQ() if not isinstance(request, cosem_pdu.RLRE):
+                self.__release()
+                return _RLRE
+            case _ if not self.is_associated:
+                return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.OPERATION_NOT_POSSIBLE)
+            case cosem_pdu.GetRequest() if self.conformance & enums.Conformance.GET:
+                return self.__get(request.value)
+            case cosem_pdu.SetRequest() if self.conformance & enums.Conformance.SET:
+                return self.__set(request.value)
+            case cosem_pdu.ActionRequest() if self.conformance & enums.Conformance.ACTION:
+                return self.__action(request.value)
+            case cosem_pdu.GetRequest() | cosem_pdu.SetRequest() | cosem_pdu.ActionRequest():
+                return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+            case _:
+                return get_exception_response(pdu.StateError.SERVICE_UNKNOWN, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+
+    def __associate(self, aarq: cosem_pdu.AARQ) -> bytes:
+        self.__release()
+        if aarq.APPLICATION_CONTEXT_NAME not in aarq.components:
+            context_id = enums.ContextId.LN_NO_CIPHERING
+        else:
+            try:
+                context_id = name[-1] if (name := aarq.application_context_name)[:-1] == _CONTEXT_NAME else None
+            except ValueError as e:
+                logger.warning(F"wrong application-context-name: {e}")
+                context_id = None
+        if (name := aarq.mechanism_name) is None:
+            mechanism = int(mechanism_id.NONE)
+        else:
+            mechanism = name[-1] if name[:-1] == _MECHANISM_NAME else None
+        password = b'' if (value := aarq.authentication_value) is None else bytes(value)
+        try:
+            initiate = None if (user_information := aarq.user_information) is None else user_information.value
+        except ValueError as e:
+            logger.warning(F"unsupported user-information: {e}")
+            initiate = None
+        association = None if self.association_id is None else self.collection.getASSOCIATION(self.association_id)
+        if context_id != enums.ContextId.LN_NO_CIPHERING:
+            return get_AARE(enums.AssociationResult.REJECTED_PERMANENT, enums.AcseServiceUser.APPLICATION_CONTEXT_NAME_NOT_SUPPORTED)
+        elif association is None or not isinstance(initiate, cosem_pdu.InitiateRequest):
+            return get_AARE(enums.AssociationResult.REJECTED_PERMANENT, enums.AcseServiceUser.NO_REASON_GIVEN)
+        elif mechanism != int(association.authentication_mechanism_name.mechanism_id_element):
+            return get_AARE(enums.AssociationResult.REJECTED_PERMANENT,
+                            enums.AcseServiceUser.AUTHENTICATION_MECHANISM_NAME_REQUIRED if mechanism == int(mechanism_id.NONE) else enums.AcseServiceUser.AUTHENTICATION_MECHANISM_NAME_NOT_RECOGNISED)
+        elif mechanism > int(mechanism_id.LOW):
+            logger.warning(F"HLS not supported, association {self.association_id} rejected")
+            return get_AARE(enums.AssociationResult.REJECTED_PERMANENT, enums.AcseServiceUser.AUTHENTICATION_MECHANISM_NAME_NOT_RECOGNISED)
+        elif mechanism == int(mechanism_id.LOW) and (secret := association.LLS_secret) is not None and secret.contents and secret.contents != password:
+            return get_AARE(enums.AssociationResult.REJECTED_PERMANENT, enums.AcseServiceUser.AUTHENTICATION_FAILURE)
+        else:
+            return self.__initiate(initiate, association)
+
+    def __initiate(self, request: cosem_pdu.InitiateRequest, association) -> bytes:
+        context = association.xDLMS_context_info
+        conformance = _get_conformance(request.proposed_conformance) & _get_conformance(context.conformance)
+        max_pdu = int(request.client_max_receive_pdu_size) or 0xffff
+        if int(request.proposed_dlms_version_number) < int(_DLMS_VERSION):
+            error = pdu.Initiate.DLMS_VERSION_TOO_LOW
+        elif conformance == enums.Conformance.NONE:
+            error = pdu.Initiate.INCOMPATIBLE_CONFORMANCE
+        elif max_pdu < _MIN_PDU:
+            error = pdu.Initiate.PDU_SIZE_TOO_SHORT
+        else:
+            self.conformance = conformance
+            self.max_pdu = min(max_pdu, int(context.max_send_pdu_size))
+            logger.info(F"association {self.association_id} with client {self.client_SAP}: {conformance!r}, max PDU {self.max_pdu}")
+            return get_AARE(
+                result=enums.AssociationResult.ACCEPTED,
+                diagnostic=enums.AcseServiceUser.NULL,
+                user_information=cosem_pdu.InitiateResponse((
+                    _NO_QUALITY_OF_SERVICE,
+                    _DLMS_VERSION,
+                    _get_conformance_content(conformance),
+                    Unsigned16.from_int(int(context.max_receive_pdu_size)),
+                    _LN_VAA_NAME)))
+        return get_AARE(
+            result=enums.AssociationResult.REJECTED_PERMANENT,
+            diagnostic=enums.AcseServiceUser.NO_REASON_GIVEN,
+            user_information=cosem_pdu.ConfirmedServiceError((
+                Unsigned8.from_int(enums.ConfirmedServiceError.INITIATE_ERROR),
+                Unsigned8.from_int(enums.ServiceError.INITIATE),
+                Unsigned8.from_int(error))))
+
+    def __get_object(self, class_id: int, ln: bytes):
+        if ln == _CURRENT_ASSOCIATION:
+            obj = self.collection.getASSOCIATION(self.association_id)
+        elif self.collection.is_in_collection(ln):
+            obj = self.collection.get_object(ln)
+        else:
+            raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNDEFINED)
+        if int(obj.CLASS_ID) != class_id:
+            raise exc.ResultError(pdu.DataAccessResult.OBJECT_CLASS_INCONSISTENT)
+        return obj
+
+    def __check_access(self, is_allowed, ln: bytes, index: int):
+        """ is_allowed: access rights matrix method of collection """
+        try:
+            allowed = is_allowed(cst.LogicalName(bytearray(ln)), index, self.association_id)
+        except (exc.NoObject, ValueError):
+            raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNDEFINED)
+        if not allowed:
+            raise exc.ResultError(pdu.DataAccessResult.READ_WRITE_DENIED)
+
+    def __read(self, class_id: int, ln: bytes, index: int, selection: tuple | None) -> cosem_pdu.GetDataResult:
+        try:
+            obj = self.__get_object(class_id, ln)
+            self.__check_access(self.collection.is_readable, ln, index)
+            if selection is None:
+                if (value := obj.get_attr(index)) is None:
+                    raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNAVAILABLE)
+                return cosem_pdu.GetDataResult(EncodedData(memoryview(value.encoding)), 0)
+            elif (self.conformance & enums.Conformance.SELECTIVE_ACCESS
+                  and isinstance(obj, (ProfileGenericVer0, ProfileGenericVer1))
+                  and index == 2):
+                return cosem_pdu.GetDataResult(EncodedData(memoryview(get_buffer_selection(obj, *selection))), 0)
+            else:
+                raise exc.ResultError(pdu.DataAccessResult.SCOPE_OF_ACCESS_VIOLATED)
+        except exc.ResultError as e:
+            return cosem_pdu.GetDataResult(cosem_pdu.DataAccessResult.from_int(e.result), 1)
+
+    def __get(self, request: cosem_pdu.GetRequestNormal | cosem_pdu.GetRequestNext | cosem_pdu.GetRequestWithList) -> bytes:
+        invoke_id = request.invoke_id_and_priority
+        match request:
+            case cosem_pdu.GetRequestNormal():
+                result = self.__read(*_get_descriptor(request.cosem_attribute_descriptor), _get_selection(request.access_selection.value))
+                response = bytes(cosem_pdu.APDU(cosem_pdu.GetResponse(cosem_pdu.GetResponseNormal((invoke_id, result)))))
+                raw_data = result.value.contents
+            case cosem_pdu.GetRequestNext():
+                return self.__get_next(invoke_id, int(request.block_number))
+            case cosem_pdu.GetRequestWithList() if self.conformance & enums.Conformance.MULTIPLE_REFERENCES:
+                results = _GET_RESULTS([self.__read(*descriptor) for descriptor in _get_descriptors(request.attribute_descriptor_list.values)])
+                response = bytes(cosem_pdu.APDU(cosem_pdu.GetResponse(cosem_pdu.GetResponseWithList((invoke_id, results)))))
+                raw_data = memoryview(bytes(results))
+            case _:
+                return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+        self.__get_block = None
+        if len(response) <= self.max_pdu:
+            return response
+        elif self.conformance & enums.Conformance.BLOCK_TRANSFER_WITH_GET_OR_READ:
+            self.__get_block = raw_data
+            self.__get_block_number = 0
+            return self.__get_next(invoke_id, 0)
+        else:
+            return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.PDU_TOO_LONG)
+
+    def __get_next(self, invoke_id: cosem_pdu.InvokeIdAndPriority, block_number: int) -> bytes:
+        """ block_number: last received by client """
+        if self.__get_block is None:
+            return _get_datablock_response(invoke_id, True, block_number, cosem_pdu.DataBlockGResult(
+                cosem_pdu.DataAccessResult.from_int(pdu.DataAccessResult.NO_LONG_GET_IN_PROGRESS), 1))
+        elif block_number != self.__get_block_number:
+            self.__get_block = None
+            return _get_datablock_response(invoke_id, True, block_number, cosem_pdu.DataBlockGResult(
+                cosem_pdu.DataAccessResult.from_int(pdu.DataAccessResult.DATA_BLOCK_NUMBER_INVALID), 1))
+        size = self.max_pdu - _GET_BLOCK_OVERHEAD
+        block, rest = self.__get_block[:size], self.__get_block[size:]
+        self.__get_block_number += 1
+        self.__get_block = rest if len(rest) else None
+        return _get_datablock_response(invoke_id, self.__get_block is None, self.__get_block_number, cosem_pdu.DataBlockGResult(OctetString(block), 0))
+
+    def __write(self, class_id: int, ln: bytes, index: int, selection: tuple | None, value: bytes) -> pdu.DataAccessResult:
+        try:
+            obj = self.__get_object(class_id, ln)
+            self.__check_access(self.collection.is_writable, ln, index)
+            if selection is not None:
+                raise exc.ResultError(pdu.DataAccessResult.SCOPE_OF_ACCESS_VIOLATED)
+            try:
+                obj.set_attr(index, value)
+            except (ValueError, TypeError) as e:
+                logger.warning(F"{obj} set attr {index}: {e}")
+                raise exc.ResultError(pdu.DataAccessResult.TYPE_UNMATCHED)
+            except AttributeError as e:
+                logger.warning(F"{obj} set constant attr {index}: {e}")
+                raise exc.ResultError(pdu.DataAccessResult.READ_WRITE_DENIED)
+            except IndexError as e:
+                logger.warning(F"{obj} set attr {index}: {e}")
+                raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNAVAILABLE)
+            except exc.ITEApplication as e:
+                logger.warning(F"{obj} set attr {index} callback: {e}")
+                raise exc.ResultError(pdu.DataAccessResult.OTHER_REASON)
+            return pdu.DataAccessResult.SUCCESS
+        except exc.ResultError as e:
+            return e.result
+
+    def __write_list(self, descriptors: list[tuple[int, bytes, int, tuple | None]], values: list[EncodedData]) -> list[cosem_pdu.DataAccessResult]:
+        if len(descriptors) != len(values):
+            raise ValueError(F"got {len(values)} values, expected {len(descriptors)}")
+        return [cosem_pdu.DataAccessResult.from_int(self.__write(*descriptor, bytes(value))) for descriptor, value in zip(descriptors, values)]
+
+    def __set(self, request: cosem_pdu.SetRequestNormal | cosem_pdu.SetRequestWithFirstDatablock | cosem_pdu.SetRequestWithDatablock
+              | cosem_pdu.SetRequestWithList | cosem_pdu.SetRequestWithListAndFirstDatablock) -> bytes:
+        invoke_id = request.invoke_id_and_priority
+        match request:
+            case cosem_pdu.SetRequestNormal():
+                result = self.__write(*_get_descriptor(request.cosem_attribute_descriptor), _get_selection(request.access_selection.value), bytes(request.value))
+                return _get_set_response(cosem_pdu.SetResponseNormal((invoke_id, cosem_pdu.DataAccessResult.from_int(result))))
+            case cosem_pdu.SetRequestWithList() if self.conformance & enums.Conformance.MULTIPLE_REFERENCES:
+                results = self.__write_list(_get_descriptors(request.attribute_descriptor_list.values), request.value_list.values)
+                return _get_set_response(cosem_pdu.SetResponseWithList((invoke_id, _SET_RESULTS(results))))
+            case cosem_pdu.SetRequestWithFirstDatablock() if self.conformance & enums.Conformance.BLOCK_TRANSFER_WITH_SET_OR_WRITE:
+                descriptor = (*_get_descriptor(request.cosem_attribute_descriptor), _get_selection(request.access_selection.value))
+                self.__set_block = ([descriptor], bytearray(), False)
+                self.__set_block_number = 0
+                return self.__set_datablock(invoke_id, request.datablock)
+            case cosem_pdu.SetRequestWithListAndFirstDatablock() if self.conformance & enums.Conformance.BLOCK_TRANSFER_WITH_SET_OR_WRITE:
+                self.__set_block = (_get_descriptors(request.attribute_descriptor_list.values), bytearray(), True)
+                self.__set_block_number = 0
+                return self.__set_datablock(invoke_id, request.datablock)
+            case cosem_pdu.SetRequestWithDatablock() if self.__set_block is None:
+                return _get_set_response(cosem_pdu.SetResponseLastDatablock((
+                    invoke_id,
+                    cosem_pdu.DataAccessResult.from_int(pdu.DataAccessResult.NO_LONG_SET_IN_PROGRESS),
+                    request.datablock.block_number)))
+            case cosem_pdu.SetRequestWithDatablock():
+                return self.__set_datablock(invoke_id, request.datablock)
+            case _:
+                return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+
+    def __set_datablock(self, invoke_id: cosem_pdu.InvokeIdAndPriority, datablock: cosem_pdu.DataBlockSA) -> bytes:
+        block_number = datablock.block_number
+        descriptors, raw_data, is_list = self.__set_block
+        if int(block_number) != self.__set_block_number + 1:
+            self.__set_block = None
+            return _get_set_response(cosem_pdu.SetResponseLastDatablock((
+                invoke_id,
+                cosem_pdu.DataAccessResult.from_int(pdu.DataAccessResult.DATA_BLOCK_NUMBER_INVALID),
+                block_number)))
+        self.__set_block_number = int(block_number)
+        raw_data += datablock.raw_data.contents
+        if not datablock.last_block:
+            return _get_set_response(cosem_pdu.SetResponseDatablock((invoke_id, block_number)))
+        self.__set_block = None
+        if not is_list:
+            return _get_set_response(cosem_pdu.SetResponseLastDatablock((
+                invoke_id,
+                cosem_pdu.DataAccessResult.from_int(self.__write(*descriptors[0], bytes(raw_data))),
+                block_number)))
+        results = self.__write_list(descriptors, _SET_VALUES.get(Buffer(memoryview(raw_data))).values)
+        return _get_set_response(cosem_pdu.SetResponseLastDatablockWithList((invoke_id, _SET_RESULTS(results), block_number)))
+
+    def __invoke(self, class_id: int, ln: bytes, index: int, parameters: bytes | None) -> pdu.ActionResult:
+        try:
+            obj = self.__get_object(class_id, ln)
+            self.__check_access(self.collection.is_accessible, ln, index)
+            if parameters is not None:
+                try:
+                    parameters = obj.get_meth_element(index).DATA_TYPE(parameters)
+                except IndexError as e:
+                    logger.warning(F"{obj} method {index}: {e}")
+                    raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNAVAILABLE)
+                except (ValueError, TypeError) as e:
+                    logger.warning(F"{obj} method {index}: {e}")
+                    raise exc.ResultError(pdu.DataAccessResult.TYPE_UNMATCHED)
+            match obj, index:
+                case ProfileGenericVer0() | ProfileGenericVer1(), 1 if isinstance(obj.buffer, cdt.Array):
+                    obj.buffer.clear()
+                case Clock(), 6 if parameters is None:
+                    raise exc.ResultError(pdu.DataAccessResult.TYPE_UNMATCHED)
+                case Clock(), 6:
+                    """ shift of simulated time, host time if not set """
+                    now = datetime.datetime.now() if obj.time is None else obj.time.decode()
+                    obj.set_attr(2, now + datetime.timedelta(seconds=int(parameters)))
+                case _:
+                    logger.info(F"{obj} method {index} not supported by simulator")
+                    raise exc.ResultError(pdu.DataAccessResult.OBJECT_UNAVAILABLE)
+            return pdu.ActionResult.SUCCESS
+        except exc.ResultError as e:
+            return pdu.ActionResult(e.result)
+
+    def __get_action_result(self, descriptor: cosem_pdu.CosemMethodDescriptor, parameters: EncodedData | NULL) -> cosem_pdu.ActionResponseWithOptionalData:
+        result = self.__invoke(*_get_descriptor(descriptor), None if parameters is NULL_ else bytes(parameters))
+        return cosem_pdu.ActionResponseWithOptionalData((cosem_pdu.ActionResult.from_int(result), _NO_RETURN_PARAMETERS))
+
+    def __action(self, request: cosem_pdu.ActionRequestNormal | cosem_pdu.ActionRequestWithList | cosem_pdu.ActionRequestNextPblock
+                 | cosem_pdu.ActionRequestWithFirstPblock | cosem_pdu.ActionRequestWithListAndFirstPblock | cosem_pdu.ActionRequestWithPblock) -> bytes:
+        invoke_id = request.invoke_id_and_priority
+        match request:
+            case cosem_pdu.ActionRequestNormal():
+                response = cosem_pdu.ActionResponseNormal((
+                    invoke_id,
+                    self.__get_action_result(request.cosem_method_descriptor, request.method_invocation_parameters.value)))
+            case cosem_pdu.ActionRequestWithList() if self.conformance & enums.Conformance.MULTIPLE_REFERENCES:
+                descriptors, parameters = request.cosem_method_descriptor_list.values, request.method_invocation_parameters.values
+                if len(descriptors) != len(parameters):
+                    raise ValueError(F"got {len(parameters)} parameters, expected {len(descriptors)}")
+                response = cosem_pdu.ActionResponseWithList((
+                    invoke_id,
+                    _ACTION_RESULTS([self.__get_action_result(descriptor, value) for descriptor, value in zip(descriptors, parameters)])))
+            case _:
+                return get_exception_response(pdu.StateError.SERVICE_NOT_ALLOWED, pdu.ExceptionServiceError.SERVICE_NOT_SUPPORTED)
+        return bytes(cosem_pdu.APDU(cosem_pdu.ActionResponse(response)))
+
+
+class Meter(link.Server):
+    """ HDLC secondary station with Session of connected client. LLC header removed from request and added to response.
+    Association released with HDLC connection """
+    collection: Collection
+    __session: Session | None
+
+    def __init__(self, collection: Collection,
+                 SA: Address,
+                 capability: Negotiation = None):
+        super().__init__(SA, self.__handle, capability)
+        self.collection = collection
+        self.__session = None
+
+    def _reset(self):
+        super()._reset()
+        self.__session = None
+
+    @property
+    def session(self) -> Session | None:
+        return self.__session
+
+    def __handle(self, info: bytes) -> bytes:
+        try:
+            apdu = LLC(content=info).info
+        except (ValueError, IndexError) as e:
+            logger.warning(F"{self.SA} wrong LLC: {e}")
+            return _LLC_RESPONSE + get_exception_response(pdu.StateError.SERVICE_UNKNOWN, pdu.ExceptionServiceError.OTHER_REASON)
+        if self.__session is None:
+            self.__session = Session(self.collection, self.DA.upper)
+        return _LLC_RESPONSE + self.__session.handle(apdu)
+
+
+class WrapperMeter(transport.Server):
+    """ Wrapper server connection with Session for every client wPort. APDU to other server wPort not answered """
+    collection: Collection
+    wport: int
+    __sessions: dict[int, Session]
+
+    def __init__(self, collection: Collection,
+                 wport: int = 1,
+                 listener: transport.Listener = None):
+        super().__init__(self.__handle, listener)
+        self.collection = collection
+        self.wport = wport
+        self.__sessions = dict()
+
+    def get_session(self, client_wport: int) -> Session | None:
+        return self.__sessions.get(client_wport)
+
+    def __handle(self, header: Header, apdu: memoryview) -> bytes | None:
+        if header.destination != self.wport:
+            logger.info(F"skip APDU to wPort {header.destination}")
+            return None
+        if (session := self.__sessions.get(header.source)) is None:
+            session = self.__sessions[header.source] = Session(self.collection, header.source)
+        return session.handle(apdu)
+
+
+class PipeTransport(asyncio.Transport):
+    """ In-memory transport, written data delivered to peer protocol at next loop iteration. Use with connect_pipe """
+    peer: PipeTransport | None
+    __loop: asyncio.AbstractEventLoop
+    __protocol: asyncio.Protocol
+    __is_closing: bool
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, protocol: asyncio.Protocol):
+        super().__init__()
+        self.peer = None
+        self.__loop = loop
+        self.__protocol = protocol
+        self.__is_closing = False
+
+    def get_protocol(self) -> asyncio.Protocol:
+        return self.__protocol
+
+    def set_protocol(self, protocol: asyncio.Protocol):
+        self.__protocol = protocol
+
+    def write(self, data: bytes | bytearray | memoryview):
+        if not self.__is_closing:
+            self.__loop.call_soon(self.peer.__deliver, bytes(data))
+
+    def __deliver(self, data: bytes):
+        if not self.__is_closing:
+            self.__protocol.data_received(data)
+
+    def is_closing(self) -> bool:
+        return self.__is_closing
+
+    def close(self):
+        if not self.__is_closing:
+            self.__is_closing = True
+            self.__loop.call_soon(self.__protocol.connection_lost, None)
+            self.peer.close()
+
+    def abort(self):
+        self.close()
+
+
+def connect_pipe(a: asyncio.Protocol, b: asyncio.Protocol, factory: type[PipeTransport] = PipeTransport) -> tuple[PipeTransport, PipeTransport]:
+    """ connect two protocols by in-memory transports. Need running loop. Factory is subclass of PipeTransport for change of delivery, e.g. latency and loss """
+    loop = asyncio.get_running_loop()
+    transport_a, transport_b = factory(loop, a), factory(loop, b)
+    transport_a.peer, transport_b.peer = transport_b, transport_a
+    a.connection_made(transport_a)
+    b.connection_made(transport_b)
+    return transport_a, transport_b
+
+
+class Simulator:
+    """ Factory of Meter with common Collection for asyncio servers and in-memory pipes. For independent meters use Simulator with copy of collection """
+    collection: Collection
+    SA: Address
+    capability: Negotiation
+
+    def __init__(self, collection: Collection,
+                 SA: Address = None,
+                 capability: Negotiation = None):
+        self.collection = collection
+        self.SA = Address(upper_address=1) if SA is None else SA
+        self.capability = Negotiation() if capability is None else capability
+
+    def __call__(self) -> Meter:
+        """ protocol factory """
+        return Meter(self.collection, self.SA, self.capability)
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """ port 0 for free port, see sockets of result """
+        return await asyncio.get_running_loop().create_server(self, host, port)
+
+    def connect_pipe(self, protocol: asyncio.Protocol) -> Meter:
+        """ connect client protocol with new Meter without sockets """
+        meter = self()
+        connect_pipe(protocol, meter)
+        return meter
+
+    async def serve_wrapper(self, host: str = "127.0.0.1", port: int = 0, listener: transport.Listener = None) -> asyncio.Server:
+        """ TCP server with wrapper instead of HDLC. Server wPort is upper HDLC address """
+        listener = transport.Listener(max_connections=0xffff) if listener is None else listener
+        return await asyncio.get_running_loop().create_server(lambda: WrapperMeter(self.collection, self.SA.upper, listener), host, port)
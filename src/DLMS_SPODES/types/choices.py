@@ -80,10 +80,12 @@ restriction_value = RestrictionValue()
 
 class IdentifiedKeyInfoOptions(cdt.Enum, elements=(0, 1)):
     """"""
+    __slots__ = tuple()
 
 
 class KEKId(cdt.Enum, elements=(0,)):
     """"""
+    __slots__ = tuple()
 
 
 class WrappedKeyInfoOptions(cdt.Structure):
@@ -1,8 +1,11 @@
 from itertools import chain
 from dataclasses import dataclass
 from struct import pack, unpack
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from functools import wraps
+import copyreg
 from typing import Type, Any, Callable, TypeAlias, Self
+from types import MemberDescriptorType
 from collections import deque
 from math import log, ceil
 import datetime
@@ -92,6 +95,7 @@ def call_wrong_tag_in_value(value: bytes, expected: TAG):
 
 class CommonDataType(ABC):
     """ DLMS BlueBook(IEC 62056-6-2) 13.0 4.1.5 Common data types . X.690: OSI networking and system aspects – Abstract Syntax Notation One (ASN.1) """
+    __slots__ = ("cb_post_set", "cb_preset")
     cb_post_set: Callable
     cb_preset: Callable
     contents: bytes
@@ -161,11 +165,29 @@ class CommonDataType(ABC):
 
     def register_cb_post_set(self, func: Callable):
         """ register callback function for calling after <set>"""
-        self.__dict__['cb_post_set'] = func
+        object.__setattr__(self, 'cb_post_set', func)
 
     def register_cb_preset(self, func: Callable):
         """ register callback function for calling before <set>"""
-        self.__dict__['cb_preset'] = func
+        object.__setattr__(self, 'cb_preset', func)
+
+    def __getstate__(self):
+        """without callbacks, they belong to owner of value. Slots values as second item if exist, without overridden by property"""
+        match object.__getstate__(self):
+            case state, dict() as slots:
+                slots = {k: v for k, v in slots.items() if k not in ('cb_preset', 'cb_post_set') and isinstance(getattr(type(self), k), MemberDescriptorType)}
+                return (state, slots) if slots else state
+            case state:
+                return state
+
+    def __setstate__(self, state):
+        """ bypass __setattr__ restrictions """
+        match state:
+            case state, dict() as slots:
+                for k, v in slots.items():
+                    object.__setattr__(self, k, v)
+        if state:
+            self.__dict__.update(state)
 
     def to_str(self) -> str:
         """ represent value as string """
@@ -230,6 +252,7 @@ def get_instance_and_pdu_from_value(value: bytes | bytearray) -> tuple[CommonDat
 
 
 class SimpleDataType(CommonDataType, ABC):
+    __slots__ = ("contents",)
 
     def __setattr__(self, key, value):
         match key:
@@ -248,13 +271,15 @@ class SimpleDataType(CommonDataType, ABC):
         new_value = self._new_instance(value)
         if hasattr(self, 'cb_preset'):
             self.cb_preset(new_value)
-        self.__dict__['contents'] = new_value.contents
+        object.__setattr__(self, 'contents', new_value.contents)
         if hasattr(self, 'cb_post_set'):
             self.cb_post_set()
 
 
 class ConstantMixin:
     """override set method for SimpleDataType"""
+    __slots__ = tuple()
+
     def set(self, *args, **kwargs):
         raise AttributeError(F"not support <set> for {self.__class__.__name__} constant")
 
@@ -300,6 +325,7 @@ class __Array(ABC):
 
 
 class _String(ABC):
+    __slots__ = tuple()
     TAG: TAG
     DEFAULT: bytes = b''
     SIZE: int
@@ -337,11 +363,12 @@ class _String(ABC):
         return self.TAG + encode_length(len(self)) + self.contents
 
     def clear(self):
-        self.__dict__['contents'] = self.DEFAULT
+        object.__setattr__(self, 'contents', self.DEFAULT)
 
 
 class FlagMixin(ABC):
     """ Used for override Common Data Type as Flag data """
+    __slots__ = tuple()
     ELEMENTS: dict[int, str]
     contents: bytes
 
@@ -392,9 +419,11 @@ class FlagMixin(ABC):
 
 class Digital(ABC):
     """ Default value is 0 """
+    __slots__ = tuple()
     contents: bytes
     TAG: TAG
-    SCALER_UNIT = None  # ScalerUnitType | None
+    _SCALER_UNIT = None  # ScalerUnitType | None
+    """ default of SCALER_UNIT slot, from class attribute SCALER_UNIT of subclass """
     DEFAULT = None
     MIN: int | None = None
     MAX: int | None = None
@@ -404,8 +433,7 @@ class Digital(ABC):
     def __init__(self, value: bytes | bytearray | str | int | float | Self = None, scaler_unit=None):
         if value is None:
             value = self.DEFAULT
-        if scaler_unit:
-            self.__dict__['SCALER_UNIT'] = scaler_unit
+        object.__setattr__(self, 'SCALER_UNIT', scaler_unit if scaler_unit else self._SCALER_UNIT)
         match value:
             case bytes():
                 length_and_contents = value[1:]
@@ -424,7 +452,10 @@ class Digital(ABC):
         self.validate()
 
     def __init_subclass__(cls, **kwargs):
-        """initiate type.VALUE from subclass arg"""
+        """initiate type.VALUE from subclass arg. Class attribute SCALER_UNIT moved to default for slot"""
+        if "SCALER_UNIT" in cls.__dict__ and not isinstance(cls.SCALER_UNIT, MemberDescriptorType):
+            cls._SCALER_UNIT = cls.SCALER_UNIT
+            del cls.SCALER_UNIT
         cls.VALUE = kwargs.get("value")
         if isinstance(cls.VALUE, int):
             """nothing"""
@@ -465,9 +496,9 @@ class Digital(ABC):
 
     def clear(self):
         if self.DEFAULT:
-            self.__dict__['contents'] = self.__class__(self.DEFAULT).contents
+            object.__setattr__(self, 'contents', self.__class__(self.DEFAULT).contents)
         else:
-            self.__dict__['contents'] = bytes(self.LENGTH)
+            object.__setattr__(self, 'contents', bytes(self.LENGTH))
 
     @property
     def encoding(self) -> bytes:
@@ -491,13 +522,13 @@ class Digital(ABC):
             tmp = int.from_bytes(self.contents, "big")
             tmp <<= 1
             tmp &= 0x100**self.LENGTH - 1
-            self.__dict__["contents"] = tmp.to_bytes(self.LENGTH, "big")
+            object.__setattr__(self, "contents", tmp.to_bytes(self.LENGTH, "big"))
 
     def __rshift__(self, other):
         for i in range(other):
             tmp = int.from_bytes(self.contents, "big")
             tmp >>= 1
-            self.__dict__["contents"] = tmp.to_bytes(self.LENGTH, "big")
+            object.__setattr__(self, "contents", tmp.to_bytes(self.LENGTH, "big"))
 
     @property
     @abstractmethod
@@ -538,8 +569,8 @@ class Digital(ABC):
 
     def __setattr__(self, key, value):
         match key, value:
-            case 'SCALER_UNIT', ScalUnitType() if self.SCALER_UNIT is None:  self.__dict__['SCALER_UNIT'] = value
-            case 'SCALER_UNIT', None:                                        self.__dict__['SCALER_UNIT'] = None
+            case 'SCALER_UNIT', ScalUnitType() if self.SCALER_UNIT is None:  super().__setattr__(key, value)
+            case 'SCALER_UNIT', None:                                        super().__setattr__(key, None)
             case 'SCALER_UNIT', ScalUnitType() if self.SCALER_UNIT == value: """ double set Scaler Unit """
             case 'SCALER_UNIT', ScalUnitType():                              raise ValueError('Scaler Unit already set')
             case 'SCALER_UNIT', _ as error:                                  raise ValueError(F'Unknown type {error} for Scaler Unit')
@@ -562,6 +593,7 @@ class Digital(ABC):
 
 
 class Float(ABC):
+    __slots__ = tuple()
     contents: bytes
     TAG: TAG
 
@@ -658,6 +690,7 @@ class LIST(ABC):
 
 
 class __DateTime(ABC):
+    __slots__ = tuple()
     __len__: int
     _separators: tuple[str]
     contents: bytes
@@ -736,6 +769,7 @@ class __DateTime(ABC):
 
 class __Date(ABC):
     """ years, month, day setters/getters for Date and DateTime """
+    __slots__ = tuple()
     TAG: TAG
 
     @property
@@ -911,6 +945,7 @@ class __Date(ABC):
 
 class __Time(ABC):
     """ hour, minute, second, hundredths setters/getters for Time and DateTime """
+    __slots__ = tuple()
     contents: bytes
     TAG: TAG
 
@@ -1042,6 +1077,7 @@ class __Time(ABC):
 
 class NullData(SimpleDataType):
     """ An ordered sequence of octets (8 bit bytes) """
+    __slots__ = tuple()
     TAG = TAG(b'\x00')
 
     def __init__(self, value: bytes | str | Self = None):
@@ -1100,6 +1136,16 @@ class Array(__Array, ComplexDataType):
     def __str__(self):
         return F"{self.TAG if self.TYPE is None else self.TYPE.TAG}[{len(self.values)}]"
 
+    def copy(self) -> Self:
+        """ return copy of object, keep type of elements setting by set_type """
+        if "TYPE" in self.__dict__:
+            new = self.__class__()
+            new.__dict__["TYPE"] = self.TYPE
+            new.set(self.encoding)
+            return new
+        else:
+            return super(Array, self).copy()
+
     def append(self, element: CommonDataType | None | Any = None):
         """ append element to end """
         match element:
@@ -1157,6 +1203,27 @@ class Array(__Array, ComplexDataType):
 _struct_names = config["DLMS"]["struct_name"]
 
 
+class DynamicType(ABCMeta):
+    """metaclass of types created at runtime by dynamic_type factory, ex: Entry of ProfileGeneric buffer. Pickled as factory call"""
+    FACTORY: tuple[Callable, tuple]
+
+
+copyreg.pickle(DynamicType, lambda cls: cls.FACTORY)
+
+
+def dynamic_type(func: Callable[..., DynamicType]) -> Callable[..., DynamicType]:
+    """keep types by hashable factory arguments without eviction. Same arguments return same type, in other process too(after unpickling)"""
+    types: dict[tuple, DynamicType] = dict()
+
+    @wraps(func)
+    def factory(*args) -> DynamicType:
+        if (new := types.get(args)) is None:
+            new = types[args] = func(*args)
+            new.FACTORY = (factory, args)
+        return new
+    return factory
+
+
 @dataclass(frozen=True)
 class StructElement:
     NAME: str
@@ -1402,6 +1469,7 @@ class AXDR(ABC):
 
 class Boolean(SimpleDataType):
     """ boolean """
+    __slots__ = tuple()
     TAG = TAG(b'\x03')
 
     def __init__(self, value: bytes | bytearray | str | int | bool | float | datetime.datetime | datetime.time | Self = None):
@@ -1459,6 +1527,7 @@ class Boolean(SimpleDataType):
 
 class BitString(SimpleDataType):
     """ An ordered sequence of boolean values """
+    __slots__ = ("__length",)
     TAG = TAG(b'\x04')
     __length: int
     default: bytes | bytearray | str | int = b'\x04\x00'
@@ -1508,7 +1577,7 @@ class BitString(SimpleDataType):
         new_value = self._new_instance(value)
         if hasattr(self, 'cb_preset'):
             self.cb_preset(new_value)
-        self.__dict__['contents'] = new_value.contents
+        object.__setattr__(self, 'contents', new_value.contents)
         self.__length = len(new_value)
         if hasattr(self, 'cb_post_set'):
             self.cb_post_set()
@@ -1574,6 +1643,7 @@ class BitString(SimpleDataType):
 
 class DoubleLong(Digital, SimpleDataType):
     """ Integer32 -2 147 483 648… 2 147 483 647 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x05')
     SIGNED = True
     LENGTH = 4
@@ -1581,6 +1651,7 @@ class DoubleLong(Digital, SimpleDataType):
 
 class DoubleLongUnsigned(Digital, SimpleDataType):
     """ Unsigned32 0…4 294 967 295 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x06')
     SIGNED = False
     LENGTH = 4
@@ -1588,6 +1659,7 @@ class DoubleLongUnsigned(Digital, SimpleDataType):
 
 class OctetString(_String, SimpleDataType):
     """ An ordered sequence of octets (8 bit bytes) """
+    __slots__ = tuple()
     TAG = TAG(b'\x09')
 
     def from_str(self, value: str) -> bytes:
@@ -1642,6 +1714,7 @@ class OctetString(_String, SimpleDataType):
 
 class VisibleString(_String, SimpleDataType):
     """ An ordered sequence of octets (8 bit bytes) """
+    __slots__ = tuple()
     TAG = TAG(b'\x0A')
 
     def from_str(self, value: str) -> bytes:
@@ -1669,6 +1742,7 @@ class VisibleString(_String, SimpleDataType):
 
 class Utf8String(_String, SimpleDataType):
     """ An ordered sequence of characters encoded as UTF-8 """
+    __slots__ = tuple()
     TAG = TAG(b'\x0c')
 
     def from_str(self, value: str) -> bytes:
@@ -1692,6 +1766,7 @@ class Utf8String(_String, SimpleDataType):
 
 class Bcd(SimpleDataType):
     """ binary coded decimal """
+    __slots__ = tuple()
     TAG = TAG(TAG(b'\x0d'))
 
     def __init__(self, value: bytes | bytearray | str | int | Self = None):
@@ -1745,6 +1820,7 @@ class Bcd(SimpleDataType):
 
 class Integer(Digital, SimpleDataType):
     """ Integer8 -128…127"""
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x0f')
     SIGNED = True
     LENGTH = 1
@@ -1752,6 +1828,7 @@ class Integer(Digital, SimpleDataType):
 
 class Long(Digital, SimpleDataType):
     """ Integer16 -32 768…32 767 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x10')
     SIGNED = True
     LENGTH = 2
@@ -1759,6 +1836,7 @@ class Long(Digital, SimpleDataType):
 
 class Unsigned(Digital, SimpleDataType):
     """ Unsigned8 0…255 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x11')
     SIGNED = False
     LENGTH = 1
@@ -1766,6 +1844,7 @@ class Unsigned(Digital, SimpleDataType):
 
 class LongUnsigned(Digital, SimpleDataType):
     """ Unsigned16 0…65535"""
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x12')
     SIGNED = False
     LENGTH = 2
@@ -1799,6 +1878,7 @@ class CompactArray(__Array, ComplexDataType):
 
 class Long64(Digital, SimpleDataType):
     """ Integer64 - 2**63…2**63-1 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x14')
     SIGNED = True
     LENGTH = 8
@@ -1806,6 +1886,7 @@ class Long64(Digital, SimpleDataType):
 
 class Long64Unsigned(Digital, SimpleDataType):
     """ Unsigned64 0…2^64-1 """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x15')
     SIGNED = False
     LENGTH = 8
@@ -1813,6 +1894,7 @@ class Long64Unsigned(Digital, SimpleDataType):
 
 class Enum(SimpleDataType, ABC):
     """ The elements of the enumeration type are defined in the “Attribute description” section of a COSEM interface class specification """
+    __slots__ = tuple()
     contents: bytes
     TAG = TAG(b'\x16')
     ELEMENTS: dict[bytes, str] = None
@@ -1939,6 +2021,7 @@ class Float32(Float, SimpleDataType):
         - e is the exponent; it is 8 bits wide and the exponent bias is +127;
         - f is the fraction, it is 23 bits.
         Value = (-1)**s * 2**(e-127) * 1.f """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x17')
 
     def __len__(self): return 4
@@ -1961,6 +2044,7 @@ class Float64(Float, SimpleDataType):
         - e is the exponent; it is 11 bits wide and the exponent bias is +1023;
         - f is the fraction, it is 52 bits.
         Value = (-1)**s * 2**(e-1023) * 1.f """
+    __slots__ = ("SCALER_UNIT",)
     TAG = TAG(b'\x18')
 
     def __len__(self): return 8
@@ -2006,6 +2090,7 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
                 The exact meaning shall be explained in the manufacturer’s documentation.
             e Flag set to true: the transmitted time contains the daylight saving deviation (summer time).
                 Flag set to false: the transmitted time does not contain daylight saving deviation (normal time)."""
+    __slots__ = tuple()
     TAG = TAG(b'\x19')
     _separators = ('.', '.', '-', ' ', ':', ':', '.', ' ')
 
@@ -2161,6 +2246,7 @@ class Date(__DateTime, __Date, SimpleDataType):
             0xFF = not specified
         dayOfWeek: interpreted as unsigned range 1…7, 0xFF 1 is Monday
             0xFF = not specified"""
+    __slots__ = tuple()
     TAG = TAG(b'\x1a')
     _separators = ('.', '.', '-')
 
@@ -2202,6 +2288,7 @@ class Time(__DateTime, __Time, SimpleDataType):
     hundredths: interpreted as unsigned range 0…99, 0xFF
     For hour, minute, second and hundredths: 0xFF = not specified.
     For repetitive times the unused parts shall be set to “not specified”."""
+    __slots__ = tuple()
     TAG = TAG(b'\x1b')
     _separators = (':', ':', '.')
 
@@ -2265,6 +2352,7 @@ CommonDataTypes: TypeAlias = NullData | Array | Structure | Boolean | BitString
 
 
 class Unit(Enum, elements=tuple(range(1, 256))):
+    __slots__ = tuple()
     SCALERS: dict[bytes, int] = {it.to_bytes(1, "big"): 0 for it in range(1, 256)}
     """castom scaler depend from unit. initiate by 0 all"""
     if unit_table := config_parser.get_values("DLMS", "Unit"):
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Self, Type
 from dataclasses import dataclass
+from functools import lru_cache
 from struct import pack, pack_into, Struct
 from math import log
 from .byte_buffer import ByteBuffer
@@ -34,7 +35,7 @@ class Buffer(ByteBuffer):
         """ return common element length from buffer, with increasing by decoding according to 8.1.3 Length octets ITU-T Rec. X.690 (07/2002) """
         define_length = self.get_uint8()
         if define_length & 0b10000000:
-            return self.get_uint(define_length >> 1)
+            return self.get_uint(define_length & 0b01111111)
         else:
             return define_length
 
@@ -47,16 +48,22 @@ class Buffer(ByteBuffer):
         if length < 0x80:
             return self.put_int(length)
         elif length < 0x1_00:
-            _length1.pack_into(self.buf, 0,
+            self._check_space(2)
+            _length1.pack_into(self.buf, self.get_pos(),
                                0x81, length)
+            self.read(2)
             return 2
         elif length < 0x1_00_00:
-            _length2.pack_into(self.buf, 0,
+            self._check_space(3)
+            _length2.pack_into(self.buf, self.get_pos(),
                                0x82, length)
+            self.read(3)
             return 3
         elif length < 0x1_00_00_00_00:
-            _length4.pack_into(self.buf, 0,
+            self._check_space(5)
+            _length4.pack_into(self.buf, self.get_pos(),
                                0x84, length)
+            self.read(5)
             return 5
         else:
             amount = int(log(length, 256)) + 1
@@ -180,6 +187,12 @@ class Simple(UT, ABC):
     def __getitem__(self, item):
         return self.contents[item]
 
+    def __eq__(self, other: Self):
+        return self.__class__ == other.__class__ and self.contents == other.contents
+
+    def __hash__(self):
+        return hash(bytes(self.contents))
+
 
 class VarSizeMixin(Simple, ABC):
     def __len__(self) -> int:
@@ -503,7 +516,10 @@ class Sequence(UT):
         return F"{self.__class__.__name__} {Sequence.__name__}[{len(self.__annotations__)}]"
 
     def __bytes__(self):
-        raise ValueError("not impl")
+        return bytes(create_buf(self).buf)
+
+    def __eq__(self, other: Self):
+        return self.__class__ == other.__class__ and self.values == other.values
 
     def __getitem__(self, item):
         return self.values[item]
@@ -547,7 +563,10 @@ class _Optional(UT):
         return cls(NULL_)
 
     def __bytes__(self):
-        raise ValueError("not impl")
+        return bytes(create_buf(self).buf)
+
+    def __eq__(self, other: Self):
+        return self.__class__ == other.__class__ and self.value == other.value
 
     def __len__(self):
         return len(self.value) + 1
@@ -573,25 +592,31 @@ class ChoiceElement:
 class Choice(UT):
     """CHOICE"""
     value: UT
+    tag: int | None
+    """ for elements with common type, None is tag by type of value """
     ELEMENTS: tuple[ChoiceElement, ...]
 
-    def __init__(self, value: UT):
+    def __init__(self, value: UT, tag: int = None):
         self.value = value
+        self.tag = tag
 
     def validation(self):
         self._get_element_by_type(self.value.__class__)
 
+    def get_tag(self) -> int:
+        return self._get_element_by_type(self.value.__class__).tag if self.tag is None else self.tag
+
     @classmethod
     def get(cls, buf: Buffer) -> Self:
-        el = cls._get_element_by_tag(buf.get_uint8())
-        return cls(el.type.get(buf))
+        tag = buf.get_uint8()
+        return cls(cls._get_element_by_tag(tag).type.get(buf), tag)
 
     def put(self, buf: Buffer) -> int:
-        buf.put_int(self._get_element_by_type(self.value.__class__).tag)
+        buf.put_int(self.get_tag())
         return 1 + self.value.put(buf)
 
     def __str__(self):
-        el = self._get_element_by_type(self.value.__class__)
+        el = self._get_element_by_tag(self.get_tag())
         return F'{self.__class__.__name__}: {el.name}: {self.value}'
 
     @classmethod
@@ -600,9 +625,10 @@ class Choice(UT):
         tag: str
         if not tag.isdigit():
             raise ValueError(F"in {value}, got {tag=}, expected is digit")
-        return cls(cls._get_element_by_tag(int(tag)).type.from_str(value2))
+        return cls(cls._get_element_by_tag(int(tag)).type.from_str(value2), int(tag))
 
     @classmethod
+    @lru_cache(maxsize=1000)
     def _get_element_by_type(cls, value: Type[UT]) -> ChoiceElement:
         for el in cls.ELEMENTS:
             if issubclass(value, el.type):
@@ -611,6 +637,7 @@ class Choice(UT):
             raise ValueError(F"not find type: {value} in {cls.__name__}")
 
     @classmethod
+    @lru_cache(maxsize=1000)
     def _get_element_by_tag(cls, value: int) -> ChoiceElement:
         for el in cls.ELEMENTS:
             if value == el.tag:
@@ -619,7 +646,7 @@ class Choice(UT):
             raise ValueError(F"not find tag: {value} in {cls.__name__}")
 
     def __eq__(self, other: Self):
-        if self._get_element_by_type(self.value.__class__) == other._get_element_by_type(other.value.__class__) and self.value == other.value:
+        if self.__class__ == other.__class__ and self.get_tag() == other.get_tag() and self.value == other.value:
             return True
         else:
             return False
@@ -627,7 +654,7 @@ class Choice(UT):
     @classmethod
     def default(cls) -> Self:
         """choice 0 tag parameter"""
-        return cls(cls._get_element_by_tag(0).type.default())
+        return cls(cls._get_element_by_tag(0).type.default(), 0)
 
     def __bytes__(self):
         buf = Buffer.allocate(len(self))
@@ -638,7 +665,7 @@ class Choice(UT):
         return len(self.value) + 1
 
     def __getitem__(self, item):
-        raise self.value[item]
+        return self.value[item]
 
 
 class _SequenceOf(UT):
@@ -670,13 +697,16 @@ class _SequenceOf(UT):
         return cls([])
 
     def __bytes__(self):
-        raise ValueError("not impl")
+        return bytes(create_buf(self).buf)
+
+    def __eq__(self, other: Self):
+        return self.__class__ == other.__class__ and self.values == other.values
 
     def __len__(self):
         return decide_len(len(self.values)) + sum(map(len, self.values))
 
     def __getitem__(self, item):
-        raise self.values[item]
+        return self.values[item]
 
 
 def SEQUENCE_OF(value: Type[UT]) -> Type[_SequenceOf]:
@@ -717,3 +747,94 @@ Data.ELEMENTS = (
         ChoiceElement("time",                  27, OctetString4),
         ChoiceElement("dont-care",             255, NULL)
     )
+
+
+_DATA_FIXED_LENGTH: dict[int, int] = {0: 0, 3: 1, 5: 4, 6: 4, 13: 1, 15: 1, 16: 2, 17: 1, 18: 2, 20: 8, 21: 8, 22: 1, 23: 4, 24: 8, 25: 12, 26: 5, 27: 4, 255: 0}
+""" content length of fixed size Data by tag """
+_DATA_LENGTH_TAGS: tuple[int, ...] = (9, 10, 12)
+""" octet-string, visible-string, utf8-string """
+
+
+def get_length_pos(value: memoryview | bytes, pos: int) -> tuple[int, int]:
+    """ return length according to 8.1.3 Length octets ITU-T Rec. X.690 (07/2002) from position and position after it """
+    define_length = value[pos]
+    if define_length & 0b10000000:
+        amount = define_length & 0b01111111
+        return int.from_bytes(value[pos + 1: pos + 1 + amount], "big"), pos + 1 + amount
+    else:
+        return define_length, pos + 1
+
+
+def get_type_description_end(value: memoryview | bytes, pos: int) -> int:
+    """ return position after TypeDescription of compact-array """
+    remain = 1
+    while remain:
+        tag = value[pos]
+        pos += 1
+        remain -= 1
+        if tag == 1:  # array: number of elements and type description
+            pos += 2
+            remain += 1
+        elif tag == 2:  # structure: amount of type descriptions
+            amount, pos = get_length_pos(value, pos)
+            remain += amount
+    return pos
+
+
+def get_data_end(value: memoryview | bytes, pos: int) -> int:
+    """ return position after A-XDR Data from position without decoding """
+    remain = 1
+    try:
+        while remain:
+            tag = value[pos]
+            pos += 1
+            remain -= 1
+            if (length := _DATA_FIXED_LENGTH.get(tag)) is not None:
+                pos += length
+            elif tag == 1 or tag == 2:
+                amount, pos = get_length_pos(value, pos)
+                remain += amount
+            elif tag in _DATA_LENGTH_TAGS:
+                length, pos = get_length_pos(value, pos)
+                pos += length
+            elif tag == 4:  # bit-string with length in bits
+                length, pos = get_length_pos(value, pos)
+                pos += (length + 7) // 8
+            elif tag == 19:  # compact-array: type description and array contents
+                length, pos = get_length_pos(value, get_type_description_end(value, pos))
+                pos += length
+            else:
+                raise ValueError(F"got unknown Data tag {tag} in position {pos - 1}")
+    except IndexError:
+        raise BufferError(F"not enough data for Data, got {len(value)} bytes")
+    if pos > len(value):
+        raise BufferError(F"not enough data for Data, need {pos} bytes, got {len(value)}")
+    return pos
+
+
+class EncodedData(Simple):
+    """ Data in A-XDR encoding as view of buffer. Parsed by skip of content without decoding, decode it by Data or common_data_types if need """
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    @classmethod
+    def get(cls, buf: Buffer) -> Self:
+        pos = buf.get_pos()
+        return cls(buf.read(get_data_end(buf.buf, pos) - pos))
+
+    @classmethod
+    def from_str(cls, value: str) -> Self:
+        """ input as hex code """
+        return cls(memoryview(bytes.fromhex(value)))
+
+    @classmethod
+    def default(cls) -> Self:
+        """ null-data """
+        return cls(memoryview(b'\x00'))
+
+    def __str__(self):
+        return self.contents.hex(' ')
+
+    def get_data(self) -> Data:
+        return Data.get(Buffer(self.contents))
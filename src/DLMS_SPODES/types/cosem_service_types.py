@@ -5,6 +5,7 @@ import datetime
 
 class LogicalName(cdt.OctetString, size=6):
     """ Logical Name type. Default is CLock#1 """
+    __slots__ = tuple()
     __match_args__ = ('a', 'b', 'c', 'd', 'e', 'f')
     DEFAULT = b'\x00\x00\x01\x00\x00\xff'
 
@@ -92,6 +93,7 @@ class LogicalName(cdt.OctetString, size=6):
 
 class OctetStringDateTime(cdt.DateTime, tag=9, size=12):
     """ type Time in OctetString(SIZE(12)) """
+    __slots__ = tuple()
 
     def __init__(self, value: bytes | bytearray | str | int | datetime.datetime | datetime.date | datetime.time = b'\x09\x0c\x07\xe4\x01\x01\xff\xff\xff\xff\xff\x80\x00\xff'):
         match value:  # TODO: common for all OctetDateTimes
@@ -106,6 +108,7 @@ class OctetStringDateTime(cdt.DateTime, tag=9, size=12):
 
 class OctetStringDate(cdt.Date, tag=9, size=5):
     """ type Time in OctetString(SIZE(5)) """
+    __slots__ = tuple()
 
     def __init__(self, value: bytes | bytearray | str | int | datetime.datetime | datetime.date = b'\x09\x05\x07\xe4\x01\x01\xff'):
         match value:  # TODO: replace priority case
@@ -120,6 +123,7 @@ class OctetStringDate(cdt.Date, tag=9, size=5):
 
 class OctetStringTime(cdt.Time, tag=9, size=4):
     """ type Time in OctetString(SIZE(4)) """
+    __slots__ = tuple()
 
     def __init__(self, value: bytes | bytearray | str | int | datetime.datetime | datetime.time = b'\x09\x04\x00\x00\x00\x00'):
         match value:  # TODO: replace priority case
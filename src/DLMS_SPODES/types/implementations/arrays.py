@@ -7,6 +7,12 @@ class SelectionAccess(cdt.Array):
     selective_access: Any | None = None
     TYPE: cdt.Structure
 
+    def copy(self):
+        """ return copy with same selective access """
+        new = super(SelectionAccess, self).copy()
+        new.selective_access = self.selective_access
+        return new
+
     # @abstractmethod
     # def is_writable(self, ln: cst.LogicalName, indexes: set[int]) -> bool:
     #     """ index - DLMS object attribute index.
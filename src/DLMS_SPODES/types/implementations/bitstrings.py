@@ -6,6 +6,7 @@ base = get_values("DLMS", "Conformance")
 
 # TODO: join with cdt.FlagMixin
 class Conformance(cdt.BitString):
+    __slots__ = tuple()
     ELEMENTS = ("reserved-zero",
                 "general-protection",
                 "general-block-transfer",
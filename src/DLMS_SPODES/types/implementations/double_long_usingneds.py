@@ -3,11 +3,13 @@ from ...types import common_data_types as cdt
 
 class DoubleLongUnsignedSecond(cdt.DoubleLongUnsigned):
     """for second implementation"""
+    __slots__ = tuple()
     SCALER_UNIT = cdt.ScalUnitType((0, 7))
 
 
 class IPAddress(cdt.DoubleLongUnsigned):
     """with string parser"""
+    __slots__ = tuple()
 
     def from_str(self, value: str) -> bytes:
         """ create ip: integer from string type ddd.ddd.ddd.ddd, ex.: 127.0.0.1 """
@@ -4,6 +4,7 @@ from ...types import common_data_types as cdt
 class CommSpeed(cdt.Enum, elements=tuple(range(10))):
     """ The communication speed supported by the corresponding port. This communication speed can be overridden if the HDLC mode of a devive is entered through a special mode
     of another protocol. """
+    __slots__ = tuple()
 
     def decode(self) -> int:
         """ override enum key to enum value"""
@@ -38,19 +39,23 @@ class CommSpeed(cdt.Enum, elements=tuple(range(10))):
 
 class RestrictionType(cdt.Enum, elements=(0, 1, 2)):
     """"""
+    __slots__ = tuple()
 
 
 class KeyInfoType(cdt.Enum, elements=(0, 1, 2)):
     """"""
+    __slots__ = tuple()
 
 
 
 class ProtectionType(cdt.Enum, elements=(0, 1, 2, 3)):
     """"""
+    __slots__ = tuple()
 
 
 class ClientSAP(cdt.Enum, elements=(0, 1, 0x10, 0x20, 0x30, 0x40, 0x50, 0x60)):  # TODO: REWRITE elements here
     """ IEC 62056-46 2002 6.4.2.3 Reserved special HDLC addresses p.40. IS15952ver2 """
+    __slots__ = tuple()
     TAG = b'\x0f'
 
 
@@ -4,3 +4,4 @@ from ...types import common_data_types as cdt
 
 class Only0(cdt.Integer, value=0):
     """ Limited Integer only 0 """
+    __slots__ = tuple()
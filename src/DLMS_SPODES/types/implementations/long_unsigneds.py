@@ -4,6 +4,7 @@ from ...types import common_data_types as cdt, cosemClassID as classID
 
 class ClassId(cdt.LongUnsigned):
     """ Class ID type """
+    __slots__ = tuple()
     DEFAULT = 1
 
     def validate(self):
@@ -120,6 +121,7 @@ class ClassIDCDT:
 
 
 class ServerSAP(cdt.LongUnsigned):
+    __slots__ = tuple()
 
     def validate(self):
         if int.from_bytes(self.contents, 'big') > 0x3FFF:
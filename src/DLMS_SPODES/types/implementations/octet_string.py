@@ -3,5 +3,6 @@ from ...types import common_data_types as cdt
 
 class LDN(cdt.OctetString):
     """for ldn. todo: check length in initialisation"""
+    __slots__ = tuple()
     def manufacturer(self) -> bytes:
         return self.contents[:3]
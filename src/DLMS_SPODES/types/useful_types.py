@@ -929,6 +929,13 @@ class CosemAttributeDescriptor(Sequence):
     attribute_id: CosemObjectAttributeId
 
 
+@dataclass
+class CosemAttributeDescriptorWithSelection(Sequence):
+    """COSEMpdu_GB83 Cosem-Attribute-Descriptor-With-Selection"""
+    cosem_attribute_descriptor: CosemAttributeDescriptor
+    access_selection: SelectiveAccessDescriptor
+
+
 @dataclass
 class CosemMethodDescriptor(Sequence):
     class_id: CosemClassId
@@ -0,0 +1,119 @@
+""" Wrapper protocol data unit of COSEM transport layer for IPv4 networks: version, source wPort, destination wPort, length and APDU. IEC 62056-47 (DLMS UA 1000-2 7.3.3) """
+from __future__ import annotations
+from struct import Struct
+from typing import Iterator, NamedTuple
+from ..types.byte_buffer import ByteBuffer
+
+HEADER = Struct(">4H")
+""" version, source wPort, destination wPort, length of APDU """
+VERSION: int = 1
+MAX_APDU_LENGTH: int = 0xffff
+
+
+class Header(NamedTuple):
+    version: int
+    source: int
+    destination: int
+    length: int
+
+
+class Buffer(ByteBuffer):
+    """ Wrapper PDUs one after another in one buffer """
+    __slots__ = ByteBuffer.__slots__
+
+    def put_apdu(self, source: int, destination: int, apdu: bytes | memoryview) -> int:
+        """ write header and APDU to position, increase position """
+        if len(apdu) > MAX_APDU_LENGTH:
+            raise ValueError(F"got APDU length {len(apdu)}, expected not more {MAX_APDU_LENGTH}")
+        self._check_space(HEADER.size + len(apdu))
+        HEADER.pack_into(self.buf, self.get_pos(), VERSION, source, destination, len(apdu))
+        self.read(HEADER.size)
+        return HEADER.size + self.write(apdu, len(apdu))
+
+    def get_apdu(self) -> tuple[Header, memoryview]:
+        """ return header and APDU view from position, increase position """
+        header = Header._make(HEADER.unpack_from(self.buf, self.get_pos()))
+        if header.version != VERSION:
+            raise ValueError(F"got wrapper version {header.version}, expected {VERSION}")
+        self.read(HEADER.size)
+        return header, self.read(header.length)
+
+
+def get_pdu(source: int, destination: int, apdu: bytes | memoryview) -> memoryview:
+    """ return wrapper PDU in new buffer """
+    buf = Buffer.allocate(HEADER.size + len(apdu))
+    buf.put_apdu(source, destination, apdu)
+    return buf.buf
+
+
+class Decoder:
+    """ Receive buffer of wrapper stream for asyncio.BufferedProtocol: data received directly to buffer by get_buffer and buffer_updated.
+    APDU given as view of buffer, it valid until next get_buffer or feed """
+    INITIAL_SIZE: int = 0x1000
+    MIN_FREE: int = 0x100
+    __buffer: bytearray
+    __view: memoryview
+    __start: int
+    """ begin of not handled data """
+    __end: int
+    """ end of received data """
+    __required: int
+    """ length of incomplete PDU """
+
+    def __init__(self, size: int = INITIAL_SIZE):
+        self.__buffer = bytearray(size)
+        self.__view = memoryview(self.__buffer)
+        self.__start = self.__end = 0
+        self.__required = HEADER.size
+
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """ return free part of buffer. Not handled data moved to begin if free space not enough """
+        if self.__start == self.__end:
+            self.__start = self.__end = 0
+        elif len(self.__buffer) - self.__end < max(sizehint, self.MIN_FREE, self.__start + self.__required - self.__end):
+            length = self.__end - self.__start
+            self.__buffer[:length] = self.__buffer[self.__start:self.__end]
+            self.__start, self.__end = 0, length
+        if (size := max(self.__required, self.__end + self.MIN_FREE)) > len(self.__buffer):
+            buffer = bytearray(max(size, 2 * len(self.__buffer)))
+            buffer[:self.__end] = self.__view[:self.__end]
+            self.__buffer, self.__view = buffer, memoryview(buffer)
+        return self.__view[self.__end:]
+
+    def buffer_updated(self, nbytes: int):
+        self.__end += nbytes
+
+    def feed(self, data: bytes | bytearray | memoryview):
+        """ append received data, for not buffered protocols """
+        pos = 0
+        while pos < len(data):
+            free = self.get_buffer(len(data) - pos)
+            length = min(len(free), len(data) - pos)
+            free[:length] = data[pos:pos + length]
+            self.buffer_updated(length)
+            pos += length
+
+    def __len__(self):
+        """ amount of not handled bytes """
+        return self.__end - self.__start
+
+    def get_apdu(self) -> tuple[Header, memoryview] | None:
+        """ return header and APDU of next complete PDU or None if need more data """
+        if self.__end - self.__start < HEADER.size:
+            self.__required = HEADER.size
+            return None
+        header = Header._make(HEADER.unpack_from(self.__view, self.__start))
+        if header.version != VERSION:
+            raise ValueError(F"got wrapper version {header.version}, expected {VERSION}")
+        end = self.__start + HEADER.size + header.length
+        if end > self.__end:
+            self.__required = HEADER.size + header.length
+            return None
+        apdu = self.__view[self.__start + HEADER.size: end]
+        self.__start = end
+        self.__required = HEADER.size
+        return header, apdu
+
+    def __iter__(self) -> Iterator[tuple[Header, memoryview]]:
+        while (ret := self.get_apdu()) is not None:
+            yield ret
@@ -0,0 +1,212 @@
+""" COSEM wrapper transport over asyncio TCP streams and UDP datagrams. IEC 62056-47 """
+from __future__ import annotations
+import asyncio
+import inspect
+import logging
+from functools import partial
+from typing import Awaitable, Callable, TYPE_CHECKING
+from .codec import Header, Buffer, Decoder, get_pdu
+
+if TYPE_CHECKING:
+    from ..cosem_interface_classes.tcp_udp_setup import TCPUDPSetup
+
+logger = logging.getLogger(__name__)
+logger.level = logging.INFO
+
+Handler = Callable[[Header, memoryview | bytes], bytes | Awaitable[bytes] | None]
+""" return response APDU or None without response. APDU view valid only during call, coroutine function got bytes copy """
+
+
+def _run_later(tasks: set[asyncio.Future], response: Awaitable[None]):
+    """ keep task of awaitable response until done """
+    task = asyncio.ensure_future(response)
+    tasks.add(task)
+    task.add_done_callback(partial(_done, tasks))
+
+
+def _done(tasks: set[asyncio.Future], task: asyncio.Future):
+    tasks.discard(task)
+    if not task.cancelled() and (e := task.exception()) is not None:
+        logger.error(F"handler failed: {e!r}", exc_info=e)
+
+
+class Stream(asyncio.BufferedProtocol):
+    """ Common part of wrapper stream endpoints. Data received directly to Decoder buffer without copy """
+    _transport: asyncio.Transport | None
+    _decoder: Decoder
+
+    def __init__(self):
+        self._transport = None
+        self._decoder = Decoder()
+
+    def connection_made(self, transport: asyncio.Transport):
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._decoder.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int):
+        self._decoder.buffer_updated(nbytes)
+        try:
+            for header, apdu in self._decoder:
+                self._received(header, apdu)
+        except ValueError as e:
+            logger.warning(F"close connection: {e}")
+            self._transport.close()
+
+    def _received(self, header: Header, apdu: memoryview):
+        """ handle of complete APDU """
+
+    def _write(self, source: int, destination: int, apdu: bytes | memoryview):
+        self._transport.write(get_pdu(source, destination, apdu))
+
+
+class Client(Stream):
+    """ Client application process bound to wPort. Request wait response from server wPort """
+    source: int
+    destination: int
+    timeout: float
+    __response: asyncio.Future[bytes] | None
+    __lock: asyncio.Lock
+
+    def __init__(self, source: int = 0x10, destination: int = 1, timeout: float = 10.0):
+        super().__init__()
+        self.source = source
+        self.destination = destination
+        self.timeout = timeout
+        self.__response = None
+        self.__lock = asyncio.Lock()
+
+    def connection_lost(self, exc: Exception | None):
+        if self.__response is not None and not self.__response.done():
+            self.__response.set_exception(ConnectionError(F"connection lost: {exc}"))
+
+    def _received(self, header: Header, apdu: memoryview):
+        if header.source != self.destination or header.destination != self.source:
+            logger.info(F"skip APDU from {header.source} to {header.destination}")
+        elif self.__response is None or self.__response.done():
+            logger.info(F"unexpected APDU {bytes(apdu[:10]).hex(' ')}")
+        else:
+            self.__response.set_result(bytes(apdu))
+
+    async def request(self, apdu: bytes | memoryview) -> bytes:
+        """ send APDU and return response APDU """
+        async with self.__lock:
+            if self._transport is None or self._transport.is_closing():
+                raise ConnectionError("not connected")
+            self.__response = asyncio.get_running_loop().create_future()
+            self._write(self.source, self.destination, apdu)
+            try:
+                return await asyncio.wait_for(self.__response, self.timeout)
+            finally:
+                self.__response = None
+
+
+class Listener:
+    """ Common state of server connections: limits from TCPUDPSetup and active connections """
+    max_connections: int
+    inactivity_timeout: float
+    """ in seconds, 0 is without time-out """
+    connections: set[Server]
+
+    def __init__(self, max_connections: int = 1, inactivity_timeout: float = 180.0):
+        self.max_connections = max_connections
+        self.inactivity_timeout = inactivity_timeout
+        self.connections = set()
+
+    @classmethod
+    def from_setup(cls, setup: TCPUDPSetup) -> Listener:
+        new = cls()
+        if setup.nb_of_sim_conn is not None:
+            new.max_connections = int(setup.nb_of_sim_conn)
+        if setup.inactivity_time_out is not None:
+            new.inactivity_timeout = float(int(setup.inactivity_time_out))
+        return new
+
+
+class Server(Stream):
+    """ Server connection. APDU handled by handler, it may be coroutine function. Response send with swapped wPorts """
+    handler: Handler
+    listener: Listener
+    __timer: asyncio.TimerHandle | None
+    __copy: bool
+    """ APDU copy for coroutine function handler """
+    __tasks: set[asyncio.Future]
+
+    def __init__(self, handler: Handler, listener: Listener = None):
+        super().__init__()
+        self.handler = handler
+        self.listener = Listener(max_connections=0xffff) if listener is None else listener
+        self.__timer = None
+        self.__copy = inspect.iscoroutinefunction(handler)
+        self.__tasks = set()
+
+    def connection_made(self, transport: asyncio.Transport):
+        super().connection_made(transport)
+        if len(self.listener.connections) >= self.listener.max_connections:
+            logger.warning(F"refuse connection, {self.listener.max_connections} connections already")
+            transport.close()
+        else:
+            self.listener.connections.add(self)
+            self.__restart_timer()
+
+    def connection_lost(self, exc: Exception | None):
+        self.listener.connections.discard(self)
+        if self.__timer is not None:
+            self.__timer.cancel()
+
+    def __restart_timer(self):
+        if self.__timer is not None:
+            self.__timer.cancel()
+        if self.listener.inactivity_timeout:
+            self.__timer = asyncio.get_running_loop().call_later(self.listener.inactivity_timeout, self.__inactivity)
+
+    def __inactivity(self):
+        logger.info(F"close connection by inactivity time-out {self.listener.inactivity_timeout} s")
+        self._transport.close()
+
+    def _received(self, header: Header, apdu: memoryview):
+        self.__restart_timer()
+        response = self.handler(header, bytes(apdu) if self.__copy else apdu)
+        if inspect.isawaitable(response):
+            _run_later(self.__tasks, self.__send_later(header, response))
+        elif response is not None:
+            self._write(header.destination, header.source, response)
+
+    async def __send_later(self, header: Header, response: Awaitable[bytes]):
+        if (response := await response) is not None and not self._transport.is_closing():
+            self._write(header.destination, header.source, response)
+
+
+class Datagram(asyncio.DatagramProtocol):
+    """ Server by UDP: one wrapper PDU in datagram """
+    handler: Handler
+    _transport: asyncio.DatagramTransport | None
+    __copy: bool
+    """ APDU copy for coroutine function handler """
+    __tasks: set[asyncio.Future]
+
+    def __init__(self, handler: Handler):
+        self.handler = handler
+        self._transport = None
+        self.__copy = inspect.iscoroutinefunction(handler)
+        self.__tasks = set()
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]):
+        try:
+            header, apdu = Buffer.wrap(data).get_apdu()
+        except (ValueError, BufferError) as e:
+            logger.warning(F"wrong datagram from {addr}: {e}")
+            return
+        response = self.handler(header, bytes(apdu) if self.__copy else apdu)
+        if inspect.isawaitable(response):
+            _run_later(self.__tasks, self.__send_later(header, response, addr))
+        elif response is not None:
+            self._transport.sendto(get_pdu(header.destination, header.source, response), addr)
+
+    async def __send_later(self, header: Header, response: Awaitable[bytes], addr: tuple[str, int]):
+        if (response := await response) is not None:
+            self._transport.sendto(get_pdu(header.destination, header.source, response), addr)
@@ -1,7 +1,9 @@
 import os
+import pickle
 import time
 import unittest
-from src.DLMS_SPODES.types import cdt, cst, ut
+from src.DLMS_SPODES.types import cdt, cst, ut, cosemClassID as classID
+from src.DLMS_SPODES import pdu_enums as pdu
 from src.DLMS_SPODES.cosem_interface_classes import collection, overview
 from src.DLMS_SPODES.cosem_interface_classes.association_ln.authentication_mechanism_name import AuthenticationMechanismName
 from src.DLMS_SPODES import cosem_interface_classes
@@ -20,3 +22,82 @@ class TestType(unittest.TestCase):
     def test_authentication_name(self):
         auth_name = AuthenticationMechanismName.get_AARQ_mechanism_name(3, 2)
         self.assertEqual(auth_name, b'\x60\x85\x74\x05\x08\x03\x02')
+
+    def test_access_rights_matrix(self):
+        col = collection.Collection()
+        col.set_manufacturer(b"KPZ")
+        col.set_server_ver(0, AppVersion(1, 4, 0))
+        col.set_spec()
+        ass = col.add(class_id=classID.ASSOCIATION_LN,
+                      version=overview.Version.V1,
+                      logical_name=cst.LogicalName("0.0.40.0.3.255"))
+        el = (8, 0, "0.0.1.0.0.255", ([(1, 1, None), (2, 3, None), (3, 6, None)], [(1, 2), (6, 0)]))
+        ass.set_attr(2, [el])
+        ln = cst.LogicalName("0.0.1.0.0.255")
+        self.assertTrue(ass.is_readable(ln, 1))
+        self.assertFalse(ass.is_writable(ln, 1))
+        self.assertTrue(ass.is_writable(ln, 2))
+        self.assertFalse(ass.is_writable(ln, 3))
+        self.assertTrue(col.is_writable(ln, 2, 3))
+        self.assertRaises(ValueError, ass.is_readable, ln, 4)
+        self.assertRaises(NoObject, ass.is_readable, cst.LogicalName("0.0.1.0.1.255"), 2)
+        self.assertEqual(ass.get_meth_access(ln, 1), pdu.MethodAccess.AUTHENTICATED_ACCESS)
+        self.assertRaises(ValueError, ass.get_meth_access, ln, 2)
+        el = (8, 0, "0.0.1.0.0.255", ([(1, 1, None), (2, 1, None)], []))
+        ass.set_attr(2, [el])
+        self.assertFalse(ass.is_writable(ln, 2), "update by change object_list")
+        ass.object_list.append((1, 0, "0.0.42.0.0.255", ([(1, 1, None), (2, 3, None)], [])))
+        self.assertTrue(ass.is_writable(cst.LogicalName("0.0.42.0.0.255"), 2), "matrix rebuilt after append")
+        n = 100000
+        s = time.perf_counter()
+        for i in range(n):
+            col.is_writable(ln, 2, 3)
+        print(F"is_writable: {(time.perf_counter()-s)/n*1e6:.2f} us")
+
+    def test_object_list_index(self):
+        from src.DLMS_SPODES.cosem_interface_classes.association_ln import ver1
+        clock = (8, 0, "0.0.1.0.0.255", ([(1, 1, None), (2, 3, None)], [(1, 1)]))
+        ldn = (1, 0, "0.0.42.0.0.255", ([(1, 1, None), (2, 1, None)], []))
+        ol = ver1.ObjectListType([clock, ldn])
+        ln = cst.LogicalName("0.0.1.0.0.255")
+        self.assertTrue(ol.is_writable(ln, {2}))
+        self.assertFalse(ol.is_writable(ln, {1, 2}))
+        self.assertEqual(ol.get_meth_access(ln, 1), pdu.MethodAccess.ACCESS)
+        self.assertEqual(len(ol.get_elements_by_class_id(8)), 1)
+        ol.remove(ol.get_element(ln))
+        self.assertRaises(NoObject, ol.get_attr_access, ln, 2)
+        self.assertEqual(len(ol.get_elements_by_class_id(8)), 0)
+        ol.append(clock)
+        self.assertEqual(ol.get_attr_access(ln, 2), pdu.AttributeAccess.READ_AND_WRITE)
+        ol.set(ver1.ObjectListType([ldn]).encoding)
+        self.assertRaises(NoObject, ol.get_element, ln)
+        self.assertEqual(ol.get_attr_access(cst.LogicalName("0.0.42.0.0.255"), 2), pdu.AttributeAccess.READ_ONLY)
+        ol.append(clock)
+        ol.append(clock)
+        el = ol[1]
+        el.access_rights.attribute_access[1].access_mode.set(1)
+        self.assertEqual(ol.get_attr_access(ln, 2), pdu.AttributeAccess.READ_ONLY, "in place change of element")
+        ol[2].access_rights.attribute_access[1].access_mode.set(2)
+        self.assertEqual(ol.get_attr_access(ln, 2), pdu.AttributeAccess.READ_ONLY, "first element by list order")
+        el.access_rights.attribute_access.append((3, 3, None))
+        self.assertEqual(ol.get_attr_access(ln, 3), pdu.AttributeAccess.READ_AND_WRITE, "append to access rights")
+        el.logical_name.set("0.0.1.0.1.255")
+        self.assertEqual(ol.get_attr_access(ln, 2), pdu.AttributeAccess.WRITE_ONLY, "change logical name")
+        ol[2].class_id.set(1)
+        self.assertEqual(len(ol.get_elements_by_class_id(8)), 1)
+        ol = pickle.loads(pickle.dumps(ol))
+        ol[2].access_rights.attribute_access[1].access_mode.set(3)
+        self.assertEqual(ol.get_attr_access(ln, 2), pdu.AttributeAccess.READ_AND_WRITE, "after unpickling")
+        ol = ver1.ObjectListType([(1, 0, F"0.0.96.1.{i}.255", ([(1, 1, None), (2, 1, None)], [])) for i in range(200)])
+        ln = cst.LogicalName("0.0.96.1.199.255")
+        n = 10000
+        s = time.perf_counter()
+        for i in range(n):
+            ol.get_attr_access(ln, 2)
+        print(F"get_attr_access: {(time.perf_counter()-s)/n*1e6:.2f} us")
+        s = time.perf_counter()
+        for i in range(100):
+            ol[0].version.set(i % 2)
+            ol[0].access_rights.attribute_access[0].access_mode.set(i % 2)
+            ol.get_attr_access(ln, 2)
+        print(F"get_attr_access after change: {(time.perf_counter()-s)/100*1e6:.2f} us")
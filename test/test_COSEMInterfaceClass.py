@@ -13,6 +13,27 @@ class TestType(unittest.TestCase):
         obj.set_attr(2, cdt.Unsigned(8).encoding)
         self.assertEqual(2, len(list(obj.get_index_with_attributes())), "return amount")
 
+    def test_lazy_defaults(self):
+        """default values and methods created by first access equal with initiation"""
+        for cls in (collection.Data, collection.Register, collection.Clock, collection.ProfileGenericVer1, collection.ScriptTable):
+            obj = cls("0.0.1.0.0.255")
+            obj2 = cls("0.0.1.0.0.255")
+            for i in range(2, obj.get_attr_length() + 1):
+                el = obj.get_attr_element(i)
+                if el.default is not None and obj.get_attr(i) is not None:
+                    self.assertEqual(obj.get_attr(i), el.DATA_TYPE(el.default), F"{cls.__name__} attr {i}")
+            self.assertEqual(
+                [(i, None if v is None else v.encoding) for i, v in obj.get_index_with_attributes()],
+                [(i, None if v is None else v.encoding) for i, v in obj2.get_index_with_attributes()])
+            for i, m in obj.it_index_with_meth:
+                self.assertIs(obj.get_meth(i), m)
+            self.assertIsNone(obj.get_record_time(2))
+        obj = collection.ProfileGenericVer1("1.0.99.1.0.255")
+        obj.set_attr(8, 5)
+        self.assertEqual(obj.profile_entries, cdt.DoubleLongUnsigned(5), "set before access")
+        obj.clear_attr(7)
+        self.assertIsNone(obj.get_attr(7), "clear pending default")
+
     def test_nothing(self):
         col = collection.get_collection(
             manufacturer=b"KPZ",
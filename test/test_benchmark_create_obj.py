@@ -1,3 +1,5 @@
+import time
+import tracemalloc
 import unittest
 from itertools import permutations
 from struct import pack
@@ -16,8 +18,72 @@ class TestType(unittest.TestCase):
         class_id = classID.DATA
         version = cdt.Unsigned(0)
         buf = bytearray(6)
+        start = time.perf_counter()
         for i, j in permutations(range(100), 2):
             # coll.add(class_id=class_id, version=version, logical_name=cst.LogicalName(F"0.{i}.96.1.1.{j}"))
             # coll.add(class_id=class_id, version=version, logical_name=cst.LogicalName(bytearray((0, i, 96, 1, 1, j))))
             coll.add(class_id=class_id, version=version, logical_name=cst.LogicalName(pack(">8B", 9, 6, 0, i, 96, 1, 1, j)))
-        print(len(coll))
+        print(len(coll), F"created by {time.perf_counter() - start:.3f} s")
+
+    def test_get_type(self):
+        """compare get_class_map with reference fallback chain and creation time with resolving time"""
+        def get_class_map_reference(ln: cst.LogicalName, func_map):
+            if (128 <= ln.b <= 199) or (128 <= ln.c <= 199) or ln.c == 240 or (128 <= ln.d <= 254) or (128 <= ln.e <= 254) or (128 <= ln.f <= 254):
+                return func_map.get((ln.contents[:5]), collection.common_interface_class_map)
+            return (func_map.get((ln.contents[:1] + ln.contents[2:5]))
+                    or func_map.get((ln.contents[:1] + ln.contents[2:4]))
+                    or func_map.get((ln.contents[:5]))
+                    or func_map.get((ln.contents[:1] + ln.contents[3:4]), collection.common_interface_class_map))
+
+        values = (0, 1, 2, 3, 7, 11, 42, 94, 96, 98, 127, 128, 154, 199, 200, 240, 254, 255)
+        for name, func_map in collection.func_maps.items():
+            for a in (0, 1, 128):
+                for b, c, d, e in permutations(values, 4):
+                    ln = cst.LogicalName(bytearray((a, b, c, d, e, 255)))
+                    self.assertIs(collection.get_class_map(ln.contents, func_map), get_class_map_reference(ln, func_map), F"{name} {ln}")
+        coll = collection.Collection()
+        version = cdt.Unsigned(0)
+        lns = [cst.LogicalName(pack(">8B", 9, 6, 0, i, 96, 1, 1, j)) for i, j in permutations(range(100), 2)]
+        t0 = time.perf_counter()
+        for ln in lns:
+            coll.get_type(classID.DATA, version, ln)
+        t1 = time.perf_counter()
+        for ln in lns:
+            coll.get_type(classID.DATA, version, ln)
+        t2 = time.perf_counter()
+        for ln in lns:
+            coll.add(class_id=classID.DATA, version=version, logical_name=ln)
+        t3 = time.perf_counter()
+        print(F"resolve {len(lns)}: {t1 - t0:.3f} s, cached: {t2 - t1:.3f} s, create: {t3 - t2:.3f} s")
+        self.assertIs(coll.get_type(classID.DATA, version, lns[0]), collection.get_type(classID.DATA, version, lns[0], collection.func_maps["DLMS_6"]))
+        with self.assertRaises(ValueError):
+            coll.get_type(classID.REGISTER, version, cst.LogicalName("0.0.42.0.0.255"))
+
+    def test_memory(self):
+        """bytes by object. Objects without __dict__, callbacks containers created by first add only"""
+        lns = [cst.LogicalName(pack(">8B", 9, 6, 0, i, 96, 1, 1, j)) for i, j in permutations(range(100), 2)]
+        for name, create, limit in (
+            ("Data", lambda ln: collection.Data(ln), None),
+            ("Register", lambda ln: collection.Register(ln), None),
+            ("ProfileGeneric", lambda ln: collection.ProfileGenericVer1(ln), None),
+            ("Unsigned", lambda ln: cdt.Unsigned(5), 112),
+            ("OctetString", lambda ln: cdt.OctetString(bytearray(b"\x01\x02")), 108),
+            ("LogicalName", lambda ln: cst.LogicalName(bytearray(ln.contents)), 112)
+        ):
+            tracemalloc.start()
+            objects = [create(ln) for ln in lns]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print(F"{name}: {size / len(objects):.0f} bytes by object")
+            if limit:
+                self.assertFalse(hasattr(objects[0], "__dict__"), F"{name} without __dict__")
+                self.assertLess(size / len(objects), limit, F"{name} bytes by object, with list item and contents")
+        for obj in (collection.Data(lns[0]), collection.Register(lns[0]), collection.ProfileGenericVer1(lns[0])):
+            self.assertFalse(hasattr(obj, "__dict__"), F"{obj.__class__.__name__} without __dict__")
+        obj = collection.Data(lns[0])
+        self.assertIs(obj._cbs_attr_post_init, collection.Data(lns[1])._cbs_attr_post_init, "shared empty container, without creation by read")
+        self.assertIsNone(obj._cbs_attr_post_init.get(2))
+        obj._add_cbs_attr_post_init({2: print})
+        obj._add_cbs_attr_post_init({3: print})
+        self.assertEqual(obj._cbs_attr_post_init, {2: print, 3: print})
+        self.assertEqual(len(collection.Data(lns[1])._cbs_attr_post_init), 0, "other object keep empty container")
@@ -1,14 +1,440 @@
 import os
 import time
+import itertools
 import unittest
 from src.DLMS_SPODES.types import cdt, cst, ut, cosemClassID as classID, cosemObjectInstanceId as instanceId, cosemAttributeDescriptor as attrDesc
 from src.DLMS_SPODES.cosem_interface_classes import collection, overview
-from src.DLMS_SPODES import cosem_interface_classes
+from src.DLMS_SPODES import cosem_interface_classes, settings
 from src.DLMS_SPODES.obis import media_id
 from src.DLMS_SPODES.version import AppVersion
 from src.DLMS_SPODES.exceptions import NeedUpdate, NoObject
 
 
+def get_digest(col: collection.Collection) -> str:
+    """hash of all attributes encoding by logical name order"""
+    import hashlib
+    h = hashlib.sha1()
+    for obj in sorted(col, key=lambda it: it.logical_name.contents):
+        for i in range(1, obj.get_attr_length() + 1):
+            if (value := obj.get_attr_link(i)) is not None:
+                h.update(obj.logical_name.contents + bytes((i,)) + value.encoding)
+    return h.hexdigest()
+
+
+def get_shared_amount(col: collection.Collection) -> int:
+    """attributes linked with template"""
+    return sum(obj.is_shared(i) for obj in col for i in range(2, obj.get_attr_length() + 1))
+
+
+def build_from_shared(name: str, m: bytes, t: bytes, ver: str) -> tuple[float, int, int, str]:
+    """worker of process pool: time of first collection, maxrss(KB), objects amount, digest"""
+    import resource
+    start = time.perf_counter()
+    with collection.SharedTemplates(name) as pool:
+        col = pool.get_collection(m, cdt.OctetString(t), AppVersion.from_str(ver))
+        return time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(list(col)), get_digest(col)
+
+
+def build_from_xml(m: bytes, t: bytes, ver: str) -> tuple[float, int, int, str]:
+    """worker of process pool: time of first collection, maxrss(KB), objects amount, digest"""
+    import resource
+    start = time.perf_counter()
+    col = collection.get_collection(m, cdt.OctetString(t), AppVersion.from_str(ver))
+    return time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(list(col)), get_digest(col)
+
+
+def get_buffer(col: collection.Collection, ln: str) -> tuple[int, cdt.Array]:
+    """worker of process pool: objects amount and buffer of profile from collection"""
+    return len(list(col)), col.get_object(ln).buffer
+
+
+def get_relation_group_reference(ln) -> collection.RelationGroup:
+    """previous if-chain implementation"""
+    if ln.a == media_id.ABSTRACT:
+        if ln.c == 0:
+            if ln.d == 1:
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES
+            elif ln.d in (2, 9):
+                return media_id.OTHER_ABSTRACT_GENERAL_PURPOSE_OBIS_CODES
+        elif ln.c == 1:
+            if ln.d in (0, 1, 2, 3, 4, 5, 6):
+                return media_id.CLOCK_OBJECTS
+        elif ln.c == 2:
+            if ln.d in (0, 1, 2):
+                return media_id.MODEM_CONFIGURATION_AND_RELATED_OBJECTS
+        elif ln.c == 10 and ln.d == 0 and ln.e in (0, 1, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 125):
+            return media_id.SCRIPT_TABLE_OBJECTS
+        elif ln.c == 11 and ln.d == 0:
+            return media_id.SPECIAL_DAYS_TABLE_OBJECTS
+        elif ln.c == 12 and ln.d == 0:
+            return media_id.SCHEDULE_OBJECTS
+        elif ln.c == 13 and ln.d == 0:
+            return media_id.ACTIVITY_CALENDAR_OBJECTS
+        elif ln.c == 14 and ln.d == 0:
+            return media_id.REGISTER_ACTIVATION_OBJECTS
+        elif ln.c == 15 and ln.d == 0 and ln.e in (0, 1, 2, 3, 4, 5, 6, 7):
+            return media_id.SINGLE_ACTION_SCHEDULE_OBJECTS
+        elif ln.c == 16:
+            if ln.d == 0 or (ln.d == 1 and ln.e in range(0, 10)):
+                return media_id.REGISTER_OBJECTS_MONITOR
+            elif ln.d == 2:
+                return media_id.PARAMETER_MONITOR_OBJECTS
+        elif ln.c == 17 and ln.d == 0:
+            return media_id.LIMITER_OBJECTS
+        elif ln.c == 18 and ln.d == 0:
+            return media_id.ARRAY_MANAGER_OBJECT
+        elif ln.c == 19:
+            if (ln.d in range(0, 10) and ln.e == 0) or ln.d in range(10, 50) or ln.d in (range(50, 60) and ln.e in (1, 2)):
+                return media_id.PAYMENT_METERING_RELATED_OBJECTS
+        elif ln.c == 20 and ln.d == 0 and ln.e in (0, 1):
+            return media_id.IEC_LOCAL_PORT_SETUP_OBJECTS
+        elif ln.c == 21 and ln.d == 0:
+            return media_id.STANDARD_READOUT_PROFILE_OBJECTS
+        elif ln.c == 22 and ln.d == 0 and ln.e == 0:
+            return media_id.IEC_HDLC_SETUP_OBJECTS
+        elif ln.c == 23:
+            if (ln.d in 0, 1, 2 and ln.e == 0) or ln.d == 3:
+                return media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS
+        elif ln.c == 24:
+            if (ln.d in (0, 1, 4, 5, 6) and ln.e == 0) or (ln.d in (2, 8, 9)):
+                return media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS
+        elif ln.c == 31 and ln.d == 0 and ln.e == 0:
+            return media_id.OBJECTS_RELATED_TO_DATA_EXCHANGE_OVER_M_BUS
+        elif ln.c == 25:
+            if ln.d in (0, 1, 2, 3, 4, 5, 6, 7, 10, 11, 12, 13, 14, 15) and ln.e == 0:
+                return media_id.OBJECTS_TO_SET_UP_DATA_EXCHANGE_OVER_THE_INTERNET
+            elif ln.d == 9 and ln.e == 0:
+                return media_id.OBJECTS_TO_SET_UP_PUSH_SETUP
+        elif ln.c == 26 and ln.d in (0, 1, 2, 3, 5, 6) and ln.e == 0:
+            return media_id.OBJECTS_FOR_SETTING_UP_DATA_EXCHANGE_USING_S_FSK_PLC
+        elif ln.c == 27 and ln.d in (0, 1, 2) and ln.e == 0:
+            return media_id.OBJECTS_FOR_SETTING_UP_THE_ISO_IEC_8802_2_LLC_LAYER
+        elif ln.c == 28 and ln.d in (0, 1, 2, 3, 4, 5, 6, 7) and ln.e == 0:
+            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROWBAND_OFDM_PLC_FOR_PRIME_NETWORKS
+        elif ln.c == 29 and ln.d in (0, 1, 2) and ln.e == 0:
+            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_NARROW_BAND_OFDM_PLC_FOR_G3_PLC_NETWORKS
+        elif ln.c == 30 and ln.d in (0, 1, 2, 3, 4):
+            return media_id.ZIGBEE_SETUP_OBJECTS
+        elif ln.c == 32 and ln.d in (0, 1, 2, 3) and ln.e == 0:
+            return media_id.OBJECTS_FOR_SETTING_UP_AND_MANAGING_DATA_EXCHANGE_USING_ISO_IEC_14908_PLC_NETWORKS
+        elif ln.c == 33 and ln.d in (0, 1, 2, 3) and ln.e == 0:
+            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_HS_PLC_ISO_IEC_12139_1_ISO_EC_12139_1_NETWORKS
+        elif ln.c == 34 and ln.d in (0, 1, 2, 3) and ln.e == 0:
+            return media_id.OBJECTS_FOR_DATA_EXCHANGE_USING_WI_SUN_NETWORKS
+        elif ln.c == 40 and ln.b == 0 and ln.d == 0:
+            return media_id.ASSOCIATION_OBJECTS
+        elif ln.c == 41 and ln.b == 0 and ln.d == 0 and ln.e == 0:
+            return media_id.SAP_ASSIGNMENT_OBJECT
+        elif ln.c == 42 and ln.b == 0 and ln.d == 0 and ln.e == 0:
+            return media_id.COSEM_LOGICAL_DEVICE_NAME_OBJECT
+        elif ln.c == 43:
+            if (ln.b == 0 and ln.d == 0) or ln.d in (1, 2):
+                return media_id.INFORMATION_SECURITY_RELATED_OBJECTS
+        elif ln.c == 44:
+            if ln.b == 0:
+                if ln.d == 0:
+                    return media_id.IMAGE_TRANSFER_OBJECTS
+                elif ln.d == 1:
+                    return media_id.FUNCTION_CONTROL_OBJECTS
+                elif ln.d == 2:
+                    return media_id.COMMUNICATION_PORT_PROTECTION_OBJECTS
+        elif ln.c == 65 and ln.d in getattr(collection, '__range63'):
+            return media_id.UTILITY_TABLE_OBJECTS
+        elif ln.c == 66 and ln.d == 0:
+            return media_id.COMPACT_DATA_OBJECTS
+        elif ln.c == 96:
+            if ln.d == 1:
+                if ln.e in getattr(collection, '__range10_and_255'):
+                    return media_id.DEVICE_ID_OBJECTS
+                elif ln.e == 10:
+                    return media_id.METERING_POINT_ID_OBJECTS
+            elif ln.d == 2:
+                return media_id.PARAMETER_CHANGES_AND_CALIBRATION_OBJECTS
+            elif ln.d == 3:
+                if ln.e in (0, 1, 2, 3, 4):
+                    return media_id.I_O_CONTROL_SIGNAL_OBJECTS
+                elif ln.e == 10:
+                    return media_id.DISCONNECT_CONTROL_OBJECTS
+                elif ln.e in range(20, 30):
+                    return media_id.ARBITRATOR_OBJECTS
+            elif ln.d == 4 and ln.e in (0, 1, 2, 3, 4):
+                return media_id.STATUS_OF_INTERNAL_CONTROL_SIGNALS_OBJECTS
+            elif ln.d == 5 and ln.e in (0, 1, 2, 3, 4):
+                return media_id.INTERNAL_OPERATING_STATUS_OBJECTS
+            elif ln.d == 6 and ln.e in (0, 1, 2, 3, 4, 5, 6):
+                return media_id.BATTERY_ENTRIES_OBJECTS
+            elif ln.d == 7 and ln.e in range(0, 22):
+                return media_id.POWER_FAILURE_MONITORING_OBJECTS
+            elif ln.d == 8 and ln.e in getattr(collection, '__range63'):
+                return media_id.OPERATING_TIME_OBJECTS
+            elif ln.d == 9 and ln.e in (0, 1, 2):
+                return media_id.ENVIRONMENT_RELATED_PARAMETERS_OBJECTS
+            elif ln.d == 10 and ln.e in range(1, 11):
+                return media_id.STATUS_REGISTER_OBJECTS
+            elif ln.d == 11 and ln.e in range(0, 100):
+                return media_id.EVENT_CODE_OBJECTS
+            elif ln.d == 12 and ln.e in range(0, 7):
+                return media_id.COMMUNICATION_PORT_LOG_PARAMETER_OBJECTS
+            elif ln.d == 13 and ln.e in (0, 1):
+                return media_id.CONSUMER_MESSAGE_OBJECTS
+            elif ln.d == 14 and ln.e in range(0, 16):
+                return media_id.CURRENTLY_ACTIVE_TARIFF_OBJECTS
+            elif ln.d == 15 and ln.e in range(0, 100):
+                return media_id.EVENT_COUNTER_OBJECTS
+            elif ln.d == 16 and ln.e in range(0, 10):
+                return media_id.PROFILE_ENTRY_DIGITAL_SIGNATURE_OBJECTS
+            elif ln.d == 17 and ln.e in range(0, 128):
+                return media_id.PROFILE_ENTRY_COUNTER_OBJECTS
+            elif ln.d == 20:
+                return media_id.METER_TAMPER_EVENT_RELATED_OBJECTS
+            elif ln.d in range(50, 100):
+                return media_id.ABSTRACT_MANUFACTURER_SPECIFIC
+        elif ln.c == 97:
+            if ln.d == 97 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ERROR_REGISTER_OBJECTS
+            elif ln.d == 98 and (ln.e in itertools.chain(range(0, 30), (255,))):
+                return media_id.ALARM_REGISTER_FILTER_DESCRIPTOR_OBJECTS
+        elif ln.c == 98:
+            return media_id.GENERAL_LIST_OBJECTS
+        elif ln.c == 99:
+            if ln.d in (1, 2, 12, 13, 14, 15, 16, 17, 18) or (ln.d == 3 and ln.e == 0):
+                return media_id.ABSTRACT_DATA_PROFILE_OBJECTS
+            if ln.d == 98:
+                return media_id.EVENT_LOG_OBJECTS
+        elif ln.c == 127 and ln.d == 0:
+            return media_id.INACTIVE_OBJECTS
+        else:
+            return media_id.ABSTRACT
+    elif ln.a == media_id.ELECTRICITY:
+        if ln.c == 0:
+            if ln.d == 0 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ID_NUMBERS_ELECTRICITY
+            elif ln.d == 1:
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_EL
+            elif ln.d in (2, 3, 4, 6, 7, 8, 9, 10):
+                return media_id.OTHER_ELECTRICITY_RELATED_GENERAL_PURPOSE_OBJECTS
+            elif ln.d == 11 and ln.e in (1, 2, 3, 4, 5, 6, 7):
+                return media_id.MEASUREMENT_ALGORITHM
+        elif ln.c in (1, 21, 41, 61):
+            return media_id.ACTIVE_POWER_PLUS
+        elif ln.c in (2, 22, 42, 62):
+            return media_id.ACTIVE_POWER_MINUS
+        elif ln.c in (3, 23, 43, 63):
+            return media_id.REACTIVE_POWER_PLUS
+        elif ln.c in (4, 24, 44, 64):
+            return media_id.REACTIVE_POWER_MINUS
+        elif ln.c in (5, 25, 45, 65):
+            return media_id.REACTIVE_POWER_QI
+        elif ln.c in (6, 26, 46, 66):
+            return media_id.REACTIVE_POWER_QII
+        elif ln.c in (7, 27, 47, 67):
+            return media_id.REACTIVE_POWER_QIII
+        elif ln.c in (8, 28, 48, 68):
+            return media_id.REACTIVE_POWER_QIV
+        elif ln.c in (9, 29, 49, 69):
+            return media_id.APPARENT_POWER_PLUS
+        elif ln.c in (10, 30, 50, 70):
+            return media_id.APPARENT_POWER_MINUS
+        elif ln.c in (11, 31, 51, 71):
+            return media_id.CURRENT
+        elif ln.c in (12, 32, 52, 72):
+            return media_id.VOLTAGE
+        elif ln.c in (13, 33, 53, 73):
+            return media_id.POWER_FACTOR
+        elif ln.c in (14, 34, 54, 74):
+            return media_id.SUPPLY_FREQUENCY
+        elif ln.c in (15, 35, 55, 75):
+            return media_id.ACTIVE_POWER_SUM
+        elif ln.c in (16, 36, 56, 76):
+            return media_id.ACTIVE_POWER_DIFF
+        elif ln.c in (17, 37, 57, 77):
+            return media_id.ACTIVE_POWER_QI
+        elif ln.c in (18, 38, 58, 78):
+            return media_id.ACTIVE_POWER_QII
+        elif ln.c in (19, 39, 59, 79):
+            return media_id.ACTIVE_POWER_QIII
+        elif ln.c in (20, 40, 60, 80):
+            return media_id.ACTIVE_POWER_QIV
+        elif ln.c == 96:
+            if ln.d == 1 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ELECTRICITY_METERING_POINT_ID_OBJECTS
+            elif ln.d == 5 and ln.e in (0, 1, 2, 3, 4, 5):
+                return media_id.ELECTRICITY_RELATED_STATUS_OBJECTS
+            elif ln.d == 10 and ln.e in (0, 1, 2, 3):
+                return media_id.ELECTRICITY_RELATED_STATUS_OBJECTS
+        elif ln.c == 98:
+            return media_id.LIST_OBJECTS_ELECTRICITY
+        elif ln.d in range(31, 46) and ln.f in getattr(collection, '__range100_and_255'):
+            if ln.c in getattr(collection, '__c1') and ln.e in getattr(collection, '__range63'):
+                return media_id.THRESHOLD_VALUES
+            elif ln.c in getattr(collection, '__table44') and ln.e in getattr(collection, '__range120_and_124_127'):
+                return media_id.THRESHOLD_VALUES
+        elif ln.f in getattr(collection, '__range100_and_255'):
+            if ln.d in (31, 35, 39, 4, 5, 14, 15, 24, 25):
+                if ln.c in getattr(collection, '__c1') and ln.e in getattr(collection, '__range63'):
+                    return media_id.REGISTER_MONITOR_OBJECTS
+                elif ln.c in getattr(collection, '__c2') and ln.e in getattr(collection, '__range120_and_124_127'):
+                    return media_id.REGISTER_MONITOR_OBJECTS
+        else:
+            return media_id.ELECTRICITY
+    elif ln.a == media_id.HCA:
+        if ln.c == 0:
+            if ln.d == 0 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ID_NUMBERS_HCA
+            elif ln.d == 1 and ln.e in (1, 2, 10, 11):
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_HCA
+            elif ln.d == 2 and ln.e in (0, 1, 2, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
+            elif ln.d == 4 and ln.e in (0, 1, 2, 3, 4, 5, 6):
+                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
+            elif ln.d == 5 and ln.e in (10, 11):
+                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
+            elif ln.d == 8 and ln.e in (0, 4, 6):
+                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
+            elif ln.d == 9 and ln.e in (1, 2, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_HCA
+        elif ln.c in (1, 2) and ln.e == 0:
+            if ln.d in (0, 6) and ln.f == 255:
+                return media_id.MEASURED_VALUES_HCA_CONSUMPTION
+            elif ln.d in (1, 2, 3, 4, 5) and ln.f in getattr(collection, '__range100_and_101_125_and_255'):
+                return media_id.MEASURED_VALUES_HCA_CONSUMPTION
+        elif ln.c in range(3, 8) and ln.d in (0, 4, 5, 6) and ln.e == 255 and ln.f == 255:
+            return media_id.MEASURED_VALUES_HCA_TEMPERATURE
+        elif ln.c == 97 and ln.d == 97:
+            return media_id.ERROR_REGISTER_OBJECTS_HCA
+        elif ln.c == 98:
+            return media_id.LIST_OBJECTS_HCA
+        elif ln.c == 99 and ln.d == 1:
+            return media_id.DATA_PROFILE_OBJECTS_HCA
+        else:
+            return media_id.HCA
+    elif ln.a == media_id.THERMAL:
+        if ln.c == 0:
+            if ln.d == 0 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ID_NUMBERS_THERMAL
+            elif ln.d == 1 and ln.e in (1, 2, 10, 11):
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_THERMAL
+            elif ln.d == 2 and ln.e in itertools.chain(range(0, 5), range(10, 14)):
+                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
+            elif ln.d == 4 and ln.e in (1, 2, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
+            elif ln.d == 5 and ln.e in itertools.chain(range(1, 10), range(21, 25)):
+                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
+            elif ln.d == 8 and ln.e in itertools.chain(range(0, 8), range(11, 15), range(21, 26), range(31, 35)):
+                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
+            elif ln.d == 9 and ln.e in (1, 2, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_THERMAL
+        elif ln.c in range(1, 8):
+            if ln.e in range(10):
+                if ln.d in (0, 1, 2, 3, 7) and ln.f == 255:
+                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
+                elif ln.d in (3, 8, 9) and ln.f in getattr(collection, '__range100_and_101_125_and_255'):
+                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
+                elif ln.d in (1, 2, 4, 5, 12, 13, 14, 15) and ln.f in itertools.chain(range(100), range(100, 126)):
+                    return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
+            elif ln.d == 6 and ln.e == 255 and ln.f == 255:
+                return media_id.MEASURED_VALUES_THERMAL_CONSUMPTION
+        elif ln.e in range(10):
+            if ln.f in getattr(collection, '__range100_and_101_125_and_255'):
+                if ln.c in range(1, 8) and ln.d in (5, 15):
+                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
+                elif ln.c in (8, 9) and ln.d in (1, 4, 5, 12, 13, 14, 15):
+                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
+            elif ln.c in range(10, 14):
+                if ln.d == 0 and ln.f == 255:
+                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
+                elif ln.d in (4, 5, 14, 15) and ln.f in itertools.chain(range(100), range(101, 126)):
+                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
+                elif ln.d in (6, 7, 10, 11) and ln.f == 255:
+                    return media_id.MEASURED_VALUES_THERMAL_ENERGY
+            elif ln.c in range(1, 14) and (ln.d in range(20, 26)) and ln.f == 255:
+                return media_id.MEASURED_VALUES_THERMAL_ENERGY
+        elif ln.c == 97 and ln.d == 97 and ln.e in (0, 1, 2):
+            return media_id.ERROR_REGISTER_OBJECTS_THERMAL
+        elif ln.c == 98:
+            return media_id.LIST_OBJECTS_THERMAL
+        elif ln.c == 99 and ln.f == 255:
+            if ln.d in (1, 2) and ln.e in (1, 2, 3):
+                return media_id.DATA_PROFILE_OBJECTS_THERMAL
+            elif ln.d == 3 and ln.e == 1:
+                return media_id.DATA_PROFILE_OBJECTS_THERMAL
+            elif ln.d == 99:
+                return media_id.DATA_PROFILE_OBJECTS_THERMAL
+        else:
+            return media_id.THERMAL
+    elif media_id.GAS == ln.a:
+        if ln.c == 0:
+            if ln.d == 0 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ID_NUMBERS_GAS
+            elif ln.d == 1:
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_GAS
+            elif ln.d in (2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15):
+                return media_id.GENERAL_PURPOSE_OBJECTS_GAS
+        elif ln.c == 96 and ln.d == 5 and (ln.e in range(10)):
+            return media_id.INTERNAL_OPERATING_STATUS_OBJECTS_GAS
+        elif ln.c in itertools.chain(range(1, 9), range(11, 17), range(21, 27), range(31, 36), range(61, 66)) and ln.e in getattr(collection, '__range63'):
+            if ln.d in (24, 25, 26, 42, 43, 44, 63, 64, 65, 81, 82, 83) and ln.f in itertools.chain(range(100), range(101, 127)):
+                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
+            elif ln.d in itertools.chain(range(6, 24), range(27, 33), range(45, 51), range(66, 72), range(84, 90)) and ln.f == 255:
+                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
+            elif ln.d in itertools.chain(range(33, 42), range(52, 63), range(72, 81), range(90, 99)) and ln.f in itertools.chain(getattr(collection, '__range100_and_101_125_and_255'), (126,)):
+                return media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES
+        elif ln.c == 42 and ln.e == 0:
+            if ln.d in itertools.chain(0, 1, 2, 13, range(15, 19), range(19, 31), range(35, 51), range(55, 71)) and ln.f == 255:
+                return media_id.MEASURED_VALUES_GAS_FLOW_RATE
+            elif ln.d in itertools.chain(range(31, 35), range(51, 55)) and ln.f in itertools.chain(getattr(collection, '__range100_and_101_125_and_255'), (126,)):
+                return media_id.MEASURED_VALUES_GAS_FLOW_RATE
+        elif ln.c in itertools.chain((41, 42), range(44, 50)) and ln.d in (0, 2, 3, 10, 11, 13, range(15, 92)) and ln.e == 0 and ln.f == 255:
+            return media_id.MEASURED_VALUES_GAS_PROCESS_VALUES
+        elif ln.c in range(51, 56):
+            if ln.d in (0, 2, 3, 10, 11) and ln.e in itertools.chain((0, 1), range(11, 29)) and ln.f == 255:
+                return media_id.CONVERSION_RELATED_FACTORS_AND_COEFFICIENTS_GAS
+            elif ln.d == 12 and ln.e in range(20) and ln.f == 255:
+                return media_id.CALCULATION_METHODS_GAS
+        elif ln.c == 70 and ln.f == 255:
+            if ln.d in (8, 9) and ln.e == 0:
+                return media_id.NATURAL_GAS_ANALYSIS
+            elif ln.d in itertools.chain(range(10, 21), range(60, 85)) and ln.e in itertools.chain((0, 1), range(11, 29)):
+                return media_id.NATURAL_GAS_ANALYSIS
+        elif ln.c == 98:
+            return media_id.LIST_OBJECTS_GAS
+        else:
+            return media_id.GAS
+    elif ln.a == media_id.WATER:
+        if ln.c == 0:
+            if ln.d == 0 and ln.e in getattr(collection, '__range10_and_255'):
+                return media_id.ID_NUMBERS_WATER
+            elif ln.d == 1 and ln.e in (1, 2, 10, 11, 12):
+                return media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES_WATER
+            elif ln.d == 2 and ln.e in (0, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
+            elif ln.d in (5, 7) and ln.e == 1:
+                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
+            elif ln.d == 8 and ln.e in (1, 6):
+                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
+            elif ln.d == 9 and ln.e in (1, 2, 3):
+                return media_id.GENERAL_PURPOSE_OBJECTS_WATER
+        elif ln.c == 1 and ln.e in range(0, 13):
+            if ln.d in (0, 1, 2, 3, 6) and ln.f == 255:
+                return media_id.MEASURED_VALUES_WATER_CONSUMPTION
+            elif ln.d in range(1, 6) and ln.f in itertools.chain(range(100), range(101, 126)):
+                return media_id.MEASURED_VALUES_WATER_CONSUMPTION
+        elif ln.c in (2, 3) and ln.e in range(0, 13):
+            if ln.d in (0, 1, 2, 3, 6) and ln.f == 255:
+                return media_id.MEASURED_VALUES_WATER_MONITORING_VALUES
+            elif ln.d in range(1, 6) and ln.f in itertools.chain(range(100), range(101, 126)):
+                return media_id.MEASURED_VALUES_WATER_MONITORING_VALUES
+        elif ln.c == 97 and ln.d == 97:
+            return media_id.ERROR_REGISTER_OBJECTS_WATER
+        elif ln.c == 98:
+            return media_id.LIST_OBJECTS_WATER
+        elif ln.c == 99 and ln.d == 1:
+            return media_id.DATA_PROFILE_OBJECTS_WATER
+        else:
+            return media_id.WATER
+    return media_id.OTHER_MEDIA
+
+
 class TestType(unittest.TestCase):
 
     def test_dummy_class(self):
@@ -215,6 +641,42 @@ class TestType(unittest.TestCase):
                     col = collection.Collection.from_xml(k)
                     print(col)
 
+    def test_library_index(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as path:
+            lib_path = os.path.join(path, "Types")
+            t_path = os.path.join(lib_path, "KPZ", "09054d324d5f33")
+            os.makedirs(t_path)
+            os.makedirs(os.path.join(lib_path, "KPZ", "09054d324d5f34"))
+            for ver in ("1.4.2", "1.4.10", "1.5.0", "1.5.0b", "1.5.0a"):
+                open(os.path.join(t_path, F"{ver}.typ"), "w").close()
+            index_path = os.path.join(path, "index.json")
+            lib = collection.LibraryIndex(os.path.join(lib_path, ""), index_path)
+            self.assertTrue(os.path.isfile(index_path), "persist")
+            server_type = cdt.OctetString("4d324d5f33")
+            self.assertEqual(lib.get_entry(b"KPZ", server_type, AppVersion(1, 4, 9)).name, "1.4.2.typ", "nearest left")
+            self.assertEqual(lib.get_entry(b"KPZ", server_type, AppVersion(1, 4, 10)).name, "1.4.10.typ")
+            self.assertEqual(lib.get_entry(b"KPZ", server_type, AppVersion(1, 5, 0, "a")).name, "1.5.0a.typ", "with additional")
+            self.assertEqual(lib.get_entry(b"KPZ", server_type, AppVersion(1, 5, 1)).name, "1.5.0b.typ", "additional in order")
+            self.assertRaises(collection.exc.NoConfig, lib.get_entry, b"KPZ", server_type, AppVersion(1, 3, 9))
+            self.assertRaisesRegex(collection.exc.NoConfig, "version", lib.get_entry, b"KPZ", cdt.OctetString("4d324d5f34"), AppVersion(1, 4, 9))
+            lib2 = collection.LibraryIndex(lib_path, index_path)
+            self.assertTrue(lib2.load(), "valid persisted index")
+            self.assertEqual(lib2.get_entry(b"KPZ", server_type, AppVersion(1, 5, 0, "a")).name, "1.5.0a.typ")
+            with open(os.path.join(t_path, "1.4.2.typ"), "w") as f:
+                f.write("changed")
+            self.assertFalse(lib.is_valid(), "changed template")
+            self.assertTrue(lib.refresh())
+            open(os.path.join(t_path, "1.4.7.typ"), "w").close()
+            self.assertFalse(lib.is_valid(), "new template")
+            self.assertTrue(lib.refresh())
+            self.assertFalse(lib.refresh())
+            self.assertEqual(lib.get_entry(b"KPZ", server_type, AppVersion(1, 4, 9)).name, "1.4.7.typ")
+            with open(index_path, "w") as f:
+                f.write("{broken")
+            self.assertEqual(collection.LibraryIndex(lib_path, index_path).get_entry(b"KPZ", server_type, AppVersion(1, 4, 9)).name, "1.4.7.typ", "by scan")
+            self.assertTrue(lib2.load(), "broken index rewritten")
+
     def test_copy_benchmark(self):
         """best:
         0.50.2: 0.1568sec
@@ -246,6 +708,162 @@ class TestType(unittest.TestCase):
         print(id(col1.getAssociationBySAP(collection.enums.ClientSAP(0x30))), id(col1.get_object("0.0.40.0.3.255")))
         # print(col1.getAssociationBySAP.cache_info())
 
+    def test_copy_on_write_memory(self):
+        """static attributes linked with template, copy by first access"""
+        import gc
+        import tracemalloc
+        server_type = cdt.OctetString("4d324d5f33")
+        server_ver = AppVersion.from_str("1.4.13")
+        template = collection.get(b"KPZ", server_type, server_ver)
+        collection.get_collection(b"KPZ", server_type, server_ver)  # warm caches
+        n = 20
+
+        def get_size(unshare: bool) -> int:
+            gc.collect()
+            tracemalloc.start()
+            s = tracemalloc.take_snapshot()
+            cols = [collection.get_collection(b"KPZ", server_type, server_ver) for _ in range(n)]
+            if unshare:
+                for c in cols:
+                    for obj in c:
+                        for i in range(2, obj.get_attr_length() + 1):
+                            obj.get_attr(i)
+            gc.collect()
+            size = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(s, "filename"))
+            tracemalloc.stop()
+            return size
+
+        shared_size = get_size(False)
+        own_size = get_size(True)
+        print(F"per collection: linked {shared_size / n:.0f}, own {own_size / n:.0f} bytes")
+        self.assertLess(shared_size * 2, own_size, "linked values reduce memory of collections")
+        col, col2 = collection.get_collection(b"KPZ", server_type, server_ver), collection.get_collection(b"KPZ", server_type, server_ver)
+        clock, clock2, t_clock = (c.get_object("0.0.1.0.0.255") for c in (col, col2, template))
+        shared = [i for i in range(2, clock.get_attr_length() + 1) if clock.is_shared(i)]
+        self.assertTrue(len(shared) > 0, "clock has linked static attributes")
+        list(clock.get_index_with_attributes())
+        list(clock)
+        self.assertEqual([i for i in range(2, clock.get_attr_length() + 1) if clock.is_shared(i)], shared, "read only iteration keep links")
+        i = shared[0]
+        self.assertIs(clock.get_attr_link(i), t_clock.get_attr_link(i))
+        old = clock.get_attr_link(i).encoding
+        clock.get_attr(i).set(clock.get_attr(i).get_copy(old))
+        self.assertFalse(clock.is_shared(i), "copy on access")
+        self.assertIsNot(clock.get_attr(i), t_clock.get_attr_link(i))
+        self.assertEqual(clock.get_attr(i).encoding, old)
+        ass, ass2, t_ass = (c.getASSOCIATION(3) for c in (col, col2, template))
+        self.assertIs(ass.get_attr_link(2), t_ass.get_attr_link(2))
+        length = len(t_ass.get_attr_link(2))
+        ass.object_list.pop(-1)
+        ass2.object_list[0].version.set(7)
+        self.assertEqual(len(ass.object_list), length - 1)
+        self.assertEqual(len(t_ass.object_list), length, "in place change not write through template")
+        self.assertEqual(len(ass2.object_list), length, "and siblings")
+        self.assertNotEqual(int(t_ass.object_list[0].version), 7)
+        self.assertEqual(int(ass2.object_list[0].version), 7)
+
+    def test_snapshot(self):
+        server_type = cdt.OctetString("4d324d5f33")
+        template = collection.get(b"KPZ", server_type, AppVersion.from_str("1.4.13"))
+        col = collection.get_collection(b"KPZ", server_type, AppVersion.from_str("1.4.13"))
+        shared = get_shared_amount(col)
+        self.assertGreater(shared, 0)
+        col.to_snapshot()
+        self.assertEqual(get_shared_amount(col), shared, "snapshot keep links with template")
+        data = template.to_snapshot()
+        start = time.perf_counter()
+        col = collection.Collection.from_snapshot(data)
+        print(F"snapshot: {len(data)} bytes, restore: {time.perf_counter() - start} sec")
+        self.assertEqual(col, template)
+        self.assertEqual(len(list(col)), len(list(template)))
+        for obj in template:
+            new_obj = col.get_object(obj.logical_name)
+            self.assertIs(new_obj.__class__, obj.__class__)
+            for i in range(2, obj.get_attr_length() + 1):
+                if (value := obj.get_attr(i)) is not None:
+                    self.assertEqual(new_obj.get_attr(i).encoding, value.encoding, F"{obj} attr: {i}")
+
+    def test_pickle(self):
+        """collection and buffer with runtime Entry type through process pool"""
+        import pickle
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        template = collection.get(b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13"))
+        display = template.get_object("0.0.21.0.1.255")
+        display.set_attr(2, b"\x01\x00")
+        entry = display.buffer.TYPE
+        display.buffer.append(entry())
+        display.buffer.append(entry())
+        data = pickle.dumps(display.buffer)
+        buffer = pickle.loads(data)
+        self.assertIs(buffer.TYPE, entry, "same type by factory arguments")
+        self.assertIs(type(buffer[0]), entry)
+        self.assertEqual(buffer.encoding, display.buffer.encoding)
+        factory = cdt.dynamic_type(lambda n: type(F"Type{n}", (), dict()))
+        first = factory(0)
+        for n in range(1, 1100):
+            factory(n)
+        self.assertIs(factory(0), first, "one type by arguments without eviction")
+        col = collection.get_collection(b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13"))
+        shared = get_shared_amount(col)
+        pickle.dumps(col)
+        self.assertEqual(get_shared_amount(col), shared, "pickle keep links with template")
+        start = time.perf_counter()
+        data = pickle.dumps(template, pickle.HIGHEST_PROTOCOL)
+        print(F"pickle: {len(data)} bytes by {time.perf_counter() - start:.3f} sec")
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as executor:
+            res = list(executor.map(get_buffer, (template, template), ("0.0.21.0.1.255", "0.0.21.0.2.255")))
+        self.assertEqual(res[0][0], len(list(template)))
+        self.assertIs(res[0][1].TYPE, entry, "type restored in worker and returned")
+        self.assertEqual(res[0][1].encoding, display.buffer.encoding)
+        self.assertEqual(res[1][1].encoding, template.get_object("0.0.21.0.2.255").buffer.encoding)
+
+    def test_buffer_type_cache(self):
+        """same capture objects in other collections use cached names and Entry type"""
+        m, t, ver = b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13")
+        types = list()
+        names = list()
+        for n in range(20):
+            col = collection.get(m, t, ver)
+            if n == 1:
+                cache_size = len(collection._names_and_types)
+                start = time.perf_counter()
+            display = col.get_object("0.0.21.0.1.255")
+            display.set_attr(2, b"\x01\x00")
+            types.append(display.buffer.TYPE)
+            names.append([col.get_name_and_type(el)[0] for el in display.capture_objects])
+        print(F"buffer type by {(time.perf_counter() - start) / 19:.4f} sec")
+        self.assertIsNot(types[0], None)
+        self.assertTrue(all(t_ is types[0] for t_ in types), "one Entry type for all")
+        self.assertTrue(all(n == names[0] for n in names))
+        self.assertEqual(len(collection._names_and_types), cache_size, "cache not grow with collections")
+
+    def test_shared_templates(self):
+        """workers of process pool build collections from shared memory without XML, equal to collections from library"""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        m, t, ver = b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13")
+        with collection.SharedTemplates.create([(m, t, ver)]) as pool:
+            print(F"shared memory: {pool.name}")
+            digest = get_digest(collection.get_collection(m, t, ver))
+            self.assertEqual(get_digest(pool.get_collection(m, t, ver)), digest)
+            col = pool.get_collection(m, t, ver)
+            template = pool.get_template(m, t, ver)
+            self.assertTrue(any(col.get_object(obj.logical_name).get_attr_link(i) is obj.get_attr_link(i)
+                                for obj in template for i in range(2, obj.get_attr_length() + 1) if obj.is_shared(i)), "static values linked with worker template")
+            self.assertRaises(collection.exc.NoConfig, pool.get_collection, m, cdt.OctetString("4d324d5f31"), ver)
+            ctx = multiprocessing.get_context("spawn")
+            for name, func, args in (
+                    ("xml", build_from_xml, (m, t.encoding, str(ver))),
+                    ("shared", build_from_shared, (pool.name, m, t.encoding, str(ver)))):
+                with ProcessPoolExecutor(2, mp_context=ctx) as executor:
+                    start = time.perf_counter()
+                    res = list(executor.map(func, *zip(*(args,)*2)))
+                    print(F"{name}: total {time.perf_counter() - start:.3f} sec, workers(first collection sec, maxrss KB, objects): {res}")
+                    for r in res:
+                        self.assertEqual(r[2], len(list(collection.get(m, t, ver))))
+                        self.assertEqual(r[3], digest, "worker collection equal to template")
+
     def test_set_date_for_calibrator(self):
         import datetime
 
@@ -479,6 +1097,132 @@ class TestType(unittest.TestCase):
         )
         print(res)
 
+    def test_get_attr_tree_cache(self):
+        col = collection.get(
+            m=b"KPZ",
+            t=cdt.OctetString("4d324d5f31"),
+            ver=AppVersion.from_str("1.5.7"))
+        kwargs = dict(ass_id=3, obj_mode="mc", obj_filter=(classID.REGISTER, media_id.ABSTRACT), sort_mode="l", af_mode="lrw")
+        trees = getattr(col, "_Collection__attr_trees")
+
+        def cached(**kw):
+            return trees[(kw["ass_id"], kw["obj_mode"], kw["obj_filter"], kw["sort_mode"], kw["af_mode"], settings.get_current_language())][3]
+
+        t0 = time.perf_counter()
+        res = col.get_attr_tree(**kwargs)
+        tree = cached(**kwargs)
+        t1 = time.perf_counter()
+        self.assertEqual(col.get_attr_tree(**kwargs), res, "from cache")
+        self.assertIs(cached(**kwargs), tree, "from cache")
+        t2 = time.perf_counter()
+        print(F"build: {t1 - t0:.4f} s, cached: {t2 - t1:.6f} s")
+        # result is copy
+        media, by_class = next(iter(res.items()))
+        class_id, objects = next(iter(by_class.items()))
+        obj, indexes = next(iter(objects.items()))
+        indexes.clear()
+        objects.clear()
+        res.clear()
+        res2 = col.get_attr_tree(**kwargs)
+        self.assertIn(obj, res2[media][class_id])
+        self.assertNotEqual(len(res2[media][class_id][obj]), 0)
+        self.assertIs(cached(**kwargs), tree, "not changed by result")
+        col.get_attr_tree(**(kwargs | {"af_mode": "l"}))
+        self.assertIsNot(cached(**(kwargs | {"af_mode": "l"})), tree, "other key")
+        col.get_attr_tree(**(kwargs | {"obj_filter": (classID.REGISTER, media_id.ABSTRACT)}))
+        self.assertIs(cached(**(kwargs | {"obj_filter": (classID.REGISTER, media_id.ABSTRACT)})), tree, "equal filter")
+        pattern = (collection.LNPattern("0.b.96.d.e.255"),)
+        col.get_attr_tree(**(kwargs | {"obj_filter": pattern}))
+        tree2 = cached(**(kwargs | {"obj_filter": pattern}))
+        col.get_attr_tree(**(kwargs | {"obj_filter": (collection.LNPattern("0.b.96.d.e.255"),)}))
+        self.assertIs(cached(**(kwargs | {"obj_filter": (collection.LNPattern("0.b.96.d.e.255"),)})), tree2, "equal pattern")
+        # invalidate by object_list change
+        object_list = col.getASSOCIATION(3).object_list
+        element = object_list.pop(0)
+        col.get_attr_tree(**kwargs)
+        tree2 = cached(**kwargs)
+        self.assertIsNot(tree2, tree, "object_list changed")
+        object_list.append(element)
+        col.get_attr_tree(**kwargs)
+        self.assertIsNot(cached(**kwargs), tree2, "object_list changed")
+        # invalidate by collection change
+        tree = cached(**kwargs)
+        ln = cst.LogicalName("0.0.96.1.128.255")
+        col.add(classID.DATA, cdt.Unsigned(0), ln)
+        col.get_attr_tree(**kwargs)
+        tree2 = cached(**kwargs)
+        self.assertIsNot(tree2, tree, "object added")
+        self.assertTrue(col.try_remove(ln))
+        col.get_attr_tree(**kwargs)
+        self.assertIsNot(cached(**kwargs), tree2, "object removed")
+
+    def test_transaction(self):
+        col = collection.Collection()
+        obj = col.add(classID.DATA, cdt.Unsigned(0), cst.LogicalName("0.0.96.1.0.255"))
+        obj2 = col.add(classID.DATA, cdt.Unsigned(0), cst.LogicalName("0.0.96.1.1.255"))
+        calls = list()
+        obj._add_cbs_attr_post_init({2: lambda: calls.append(obj)})
+        with col.begin() as tr:
+            obj.set_attr(2, cdt.Unsigned(5).encoding)
+            obj.set_attr(2, cdt.Unsigned(6).encoding)
+            self.assertEqual(calls, [], "post init deferred to commit")
+            self.assertEqual(len(tr), 1)
+        self.assertEqual(calls, [obj], "post init once")
+        self.assertEqual(obj.get_attr(2), cdt.Unsigned(6))
+        # rollback with added objects
+        obj2._add_cbs_attr_post_init({2: lambda: calls.append(obj2)})
+        with self.assertRaises(ValueError):
+            with col.begin():
+                obj.set_attr(2, cdt.Unsigned(7).encoding)
+                obj2.set_attr(2, cdt.Unsigned(1).encoding)
+                col.add(classID.DATA, cdt.Unsigned(0), cst.LogicalName("0.0.96.1.2.255"))
+                raise ValueError("test")
+        self.assertEqual(obj.get_attr(2), cdt.Unsigned(6), "return origin value")
+        self.assertIsNone(obj2.get_attr(2), "return not initiated")
+        self.assertIn(2, obj2._cbs_attr_post_init, "callback kept for next initiation")
+        self.assertEqual(len(col), 3)
+        # rollback by failed callback
+        def failed():
+            raise NoObject("test")
+
+        obj2._add_cbs_attr_post_init({2: failed})
+        with self.assertRaises(cosem_interface_classes.cosem_interface_class.ObjectValidationError):
+            with col.begin():
+                obj2.set_attr(2, cdt.Unsigned(1).encoding)
+        self.assertIsNone(obj2.get_attr(2))
+        # copy registers by transaction
+        template = collection.get(
+            m=b"KPZ",
+            t=cdt.OctetString("4d324d5f31"),
+            ver=AppVersion.from_str("1.5.7"))
+        new = template.copy()
+        for obj in template.get_objects_by_class_id(int(classID.REGISTER)):
+            self.assertTrue(new.copy_obj_attr_values_from(obj))
+            for i, value in obj.get_index_with_attributes():
+                self.assertEqual(new.get_object(obj.logical_name).get_attr(i), value)
+
+    def test_load_transaction(self):
+        """post init callbacks of xml load run once by attribute, in transaction of object"""
+        calls = list()
+        origin = collection.Register._Register__set_value_data_type
+
+        def counted(obj: collection.Register):
+            calls.append((obj.logical_name, obj.collection.transaction is not None))
+            origin(obj)
+
+        collection.Register._Register__set_value_data_type = counted
+        try:
+            start = time.perf_counter()
+            col = collection.Collection.from_xml(collection.get_dir_entry(b"KPZ", cdt.OctetString("4d324d5f31"), AppVersion.from_str("1.5.7")))
+            print(F"load: {time.perf_counter() - start:.3f} s, callbacks: {len(calls)}")
+        finally:
+            collection.Register._Register__set_value_data_type = origin
+        self.assertIsNone(col.transaction)
+        registers = [obj.logical_name for obj in col if isinstance(obj, collection.Register) and obj.get_attr_link(2) is not None]
+        self.assertGreater(len(registers), 0)
+        self.assertEqual(sorted(ln for ln, _ in calls), sorted(registers), "once by object")
+        self.assertTrue(all(in_transaction for _, in_transaction in calls))
+
     def test_LNPattern(self):
         pattern = collection.LNPattern("a.2.(1, 200, 43, 51, 3-8).4.5.9")
         pattern2 = collection.LNPattern("a.2.31.4.5.9")
@@ -496,3 +1240,176 @@ class TestType(unittest.TestCase):
             keys=(collection.LNPattern("a.b.(14-20).d.e.f"),)
         )
         print(res)
+
+    def test_LNPattern_property(self):
+        """compiled masks against per group matching"""
+        import random
+        rnd = random.Random(1)
+
+        def get_group(i: int) -> tuple[str, set[int] | None]:
+            match rnd.randrange(4):
+                case 0:
+                    return "abcdef"[i], None
+                case 1:
+                    return str(v := rnd.choice((0, 1, 255, rnd.randrange(256)))), {v}
+                case _:
+                    el, values = list(), set()
+                    for _ in range(rnd.randrange(1, 4)):
+                        if rnd.randrange(2):
+                            el.append(str(v := rnd.randrange(256)))
+                            values.add(v)
+                        else:
+                            start = rnd.randrange(256)
+                            end = min(255, start + rnd.randrange(40))
+                            el.append(F"{start}-{end}")
+                            values.update(range(start, end + 1))
+                    return F"({', '.join(el)})", values
+
+        def near(groups: list[set[int] | None]) -> bytes:
+            return bytes(rnd.choice(tuple(g)) if g and rnd.randrange(4) else rnd.randrange(256) for g in groups)
+
+        for _ in range(300):
+            pats, refs = list(), list()
+            for _ in range(rnd.randrange(1, 4)):
+                groups = [get_group(i) for i in range(6)]
+                pats.append(collection.LNPattern(".".join(g[0] for g in groups)))
+                refs.append([g[1] for g in groups])
+            compiled = collection.LNPatterns(pats)
+            for _ in range(50):
+                ln = cst.LogicalName(bytearray(near(rnd.choice(refs))))
+                expected = [all(g is None or v in g for g, v in zip(ref, ln.contents)) for ref in refs]
+                self.assertEqual([p == ln for p in pats], expected, F"{ln}")
+                self.assertEqual(ln in compiled, any(expected))
+                self.assertEqual(ln in pats, any(expected))
+        self.assertRaises(ValueError, collection.LNPattern, "a.256.c.d.e.f")
+        self.assertRaises(ValueError, collection.LNPattern, "a.(1-2-3).c.d.e.f")
+        self.assertRaises(ValueError, collection.LNPattern, "x.b.c.d.e.f")
+
+    def test_get_filtered_benchmark(self):
+        """10k objects by class_id, media, relation group and patterns"""
+        import random
+        rnd = random.Random(2)
+        lns = {bytes((rnd.choice((0, 1, 1, 7)), 0, rnd.randrange(1, 100), rnd.randrange(10), rnd.randrange(100), 255)) for _ in range(12000)}
+        objects = [(collection.Data if ln[2] % 2 else collection.Register)(cst.LogicalName(bytearray(ln))) for ln in sorted(lns)[:10000]]
+        keys = (
+            classID.REGISTER,
+            media_id.ELECTRICITY,
+            media_id.GAS,
+            collection.LNPattern("a.b.(1-20, 31, 33).d.e.f"),
+            collection.LNPattern("a.b.(40-60).(1-3).e.f"))
+
+        def reference(objs):
+            medias = (0, 1, 7)
+            return [obj for obj in objs
+                    if obj.CLASS_ID == classID.REGISTER
+                    and obj.logical_name.a in medias
+                    and ((1 <= obj.logical_name.c <= 20 or obj.logical_name.c in (31, 33)) or (40 <= obj.logical_name.c <= 60 and 1 <= obj.logical_name.d <= 3))]
+
+        expected = reference(objects)
+        start = time.perf_counter()
+        res = collection.get_filtered(objects, keys)
+        print(F"get_filtered {len(objects)} objects: {time.perf_counter() - start:.4f} sec, found {len(res)}")
+        start = time.perf_counter()
+        reference(objects)
+        print(F"reference: {time.perf_counter() - start:.4f} sec")
+        start = time.perf_counter()
+        [obj for obj in objects if obj.logical_name in keys[3:]]
+        print(F"patterns one by one: {time.perf_counter() - start:.4f} sec")
+        start = time.perf_counter()
+        collection.get_filtered(objects, keys[3:])
+        print(F"compiled patterns: {time.perf_counter() - start:.4f} sec")
+        self.assertEqual(res, [obj for obj in expected if obj.logical_name.a in (1, 7)])
+        objects = [collection.Data(cst.LogicalName(ln)) for ln in ("0.0.1.0.0.255", "0.0.1.1.0.255", "0.0.2.0.0.255", "1.0.1.0.0.255")]
+        self.assertEqual(collection.get_filtered(objects, (media_id.CLOCK_OBJECTS,)), objects[:2])
+
+    def test_relation_group_table(self):
+        """equivalence with former if-chain by all combinations of values bounds used in rules, and explicit groups. Not matched nested rules return media now"""
+        from collections import namedtuple
+        LN = namedtuple("LN", "a b c d e f")
+        fields = dict(b=1, c=2, d=3, e=4, f=5)
+
+        def collect(rules, bounds):
+            for condition, result in rules:
+                for field, value in condition.items():
+                    mask = collection.get_mask(value)
+                    bounds[fields[field]].update(v for i in range(1, 256) if ((mask >> i) ^ (mask >> (i - 1))) & 1 for v in (i - 1, i))
+                if isinstance(result, tuple):
+                    collect(result, bounds)
+            return bounds
+
+        media_bounds = {a: collect(rules, [{0, 255} for _ in range(6)]) for a_values, (_, rules) in collection.RELATION_RULES.items() for a in a_values}
+        medias = {0: media_id.ABSTRACT, 1: media_id.ELECTRICITY, 4: media_id.HCA, 5: media_id.THERMAL, 6: media_id.THERMAL, 7: media_id.GAS, 8: media_id.WATER, 9: media_id.WATER}
+        checked, raised = 0, 0
+        start = time.perf_counter()
+        for a in (0, 1, 2, 4, 5, 6, 7, 8, 9, 15, 255):
+            default = medias.get(a, media_id.OTHER_MEDIA)
+            bounds = media_bounds.get(a, [{0, 255} for _ in range(6)])
+            values = itertools.chain(
+                itertools.product((a,), *map(sorted, bounds[1:])),
+                itertools.product((a,), (0,), range(256), range(256), (0, 255), (255,)))
+            for value in values:
+                try:
+                    expected = get_relation_group_reference(LN(*value))
+                except TypeError:
+                    raised += 1  # former rules with typo, checked below
+                    continue
+                checked += 1
+                self.assertIs(collection.relation_groups.get(bytes(value)), default if expected is media_id.OTHER_MEDIA else expected, F"{value}")  # nested rules fall-through was OTHER_MEDIA
+        print(F"checked {checked}, raised {raised}: {time.perf_counter() - start:.1f} sec")
+        for ln, group in (
+                ("0.0.1.0.0.255", media_id.CLOCK_OBJECTS),
+                ("0.0.1.7.0.255", media_id.ABSTRACT),  # not matched nested rules
+                ("0.0.0.1.0.255", media_id.BILLING_PERIOD_VALUES_RESET_COUNTER_ENTRIES),
+                ("0.0.0.3.0.255", media_id.ABSTRACT),  # not matched nested rules
+                ("0.0.10.0.125.255", media_id.SCRIPT_TABLE_OBJECTS),
+                ("0.0.10.0.112.255", media_id.ABSTRACT),
+                ("0.0.16.1.9.255", media_id.REGISTER_OBJECTS_MONITOR),
+                ("0.0.16.1.10.255", media_id.ABSTRACT),  # not matched nested rules
+                ("0.0.19.9.0.255", media_id.PAYMENT_METERING_RELATED_OBJECTS),
+                ("0.0.19.49.3.255", media_id.PAYMENT_METERING_RELATED_OBJECTS),
+                ("0.0.42.13.0.255", media_id.ABSTRACT),
+                ("0.0.40.0.0.255", media_id.ASSOCIATION_OBJECTS),
+                ("0.1.40.0.0.255", media_id.ABSTRACT),
+                ("0.0.44.1.0.255", media_id.FUNCTION_CONTROL_OBJECTS),
+                ("0.1.44.1.0.255", media_id.ABSTRACT),  # not matched nested rules
+                ("0.0.96.1.255.255", media_id.DEVICE_ID_OBJECTS),
+                ("0.0.96.1.10.255", media_id.METERING_POINT_ID_OBJECTS),
+                ("0.0.96.1.11.255", media_id.ABSTRACT),  # not matched nested rules
+                ("0.0.200.0.0.255", media_id.ABSTRACT),
+                ("1.0.0.5.0.255", media_id.ELECTRICITY),  # not matched nested rules
+                ("1.0.1.8.0.255", media_id.ACTIVE_POWER_PLUS),
+                ("1.0.80.8.0.255", media_id.ACTIVE_POWER_QIV),
+                ("1.0.12.46.0.100", media_id.VOLTAGE),
+                ("1.0.100.4.0.255", media_id.REGISTER_MONITOR_OBJECTS),
+                ("4.0.1.0.0.255", media_id.MEASURED_VALUES_HCA_CONSUMPTION),
+                ("4.0.1.0.1.255", media_id.HCA),
+                ("5.0.1.6.255.255", media_id.MEASURED_VALUES_THERMAL_CONSUMPTION),
+                ("6.0.1.6.254.255", media_id.THERMAL),  # not matched nested rules
+                ("6.0.13.20.0.255", media_id.THERMAL),  # not matched nested rules
+                ("7.0.42.13.1.255", media_id.GAS),
+                ("7.0.41.13.0.255", media_id.MEASURED_VALUES_GAS_PROCESS_VALUES),
+                ("7.0.41.15.0.255", media_id.GAS),
+                ("7.0.1.26.63.126", media_id.MEASURED_VALUES_GAS_INDEXES_AND_INDEX_DIFFERENCES),
+                ("7.0.1.26.64.126", media_id.GAS),
+                ("7.0.70.8.0.255", media_id.NATURAL_GAS_ANALYSIS),
+                ("8.0.1.6.12.255", media_id.MEASURED_VALUES_WATER_CONSUMPTION),
+                ("9.0.3.5.12.125", media_id.MEASURED_VALUES_WATER_MONITORING_VALUES),
+                ("9.0.3.5.13.125", media_id.WATER),
+                ("2.0.1.0.0.255", media_id.OTHER_MEDIA)):
+            self.assertIs(collection.get_relation_group(cst.LogicalName(ln)), group, ln)
+        for ln, group in (
+                ("0.0.19.9.1.255", media_id.ABSTRACT),
+                ("0.0.19.50.1.255", media_id.PAYMENT_METERING_RELATED_OBJECTS),
+                ("0.0.19.50.3.255", media_id.ABSTRACT),
+                ("0.0.23.2.0.255", media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS),
+                ("0.0.23.3.5.255", media_id.IEC_TWISTED_PAIR_1_SETUP_OBJECTS),
+                ("0.0.23.4.0.255", media_id.ABSTRACT),
+                ("7.0.42.13.0.255", media_id.MEASURED_VALUES_GAS_FLOW_RATE),
+                ("7.0.42.31.0.126", media_id.MEASURED_VALUES_GAS_FLOW_RATE),
+                ("7.0.42.14.0.255", media_id.GAS)):
+            self.assertIs(collection.get_relation_group(cst.LogicalName(ln)), group, F"{ln}: former rule with typo")
+        ln = cst.LogicalName("1.0.32.7.0.255")
+        start = time.perf_counter()
+        for _ in range(100000):
+            collection.get_relation_group(ln)
+        print(F"get_relation_group: {(time.perf_counter() - start) * 10} us")
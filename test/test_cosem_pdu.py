@@ -1,6 +1,8 @@
 import sys
+import time
 import unittest
 from src.DLMS_SPODES.types import cosem_pdu as pdu
+from src.DLMS_SPODES import cosem_pdu as apdu
 from src.DLMS_SPODES.types.byte_buffer import ByteBuffer
 from sys import getsizeof
 
@@ -93,3 +95,110 @@ class TestType(unittest.TestCase):
         print(getsizeof(buf))
         print(getsizeof(value))
         print(getsizeof(value2))
+
+    def test_length(self):
+        for length in (0, 0x7f, 0x80, 0xff, 0x100, 0xffff, 0x10000):
+            buf = pdu.Buffer.allocate(10)
+            buf.put_int(0xaa)
+            self.assertEqual(buf.put_len(length), pdu.decide_len(length))
+            self.assertEqual(bytes(buf.buf[1:buf.get_pos()]), pdu.encode_length(length), "put to position")
+            buf.set_pos(1)
+            self.assertEqual(buf.get_length(), length)
+
+    def test_choice_tag(self):
+        value = pdu.Data.get(pdu.Buffer(memoryview(b'\x16\x05')))
+        self.assertEqual(bytes(value), b'\x16\x05', "enum keep tag of common with unsigned type")
+        self.assertEqual(bytes(pdu.Data(pdu.Unsigned8.from_int(5))), b'\x11\x05', "tag by type")
+
+    def test_EncodedData(self):
+        for value in ("00", "01 03 02 02 11 01 12 00 02 09 03 01 02 03 0a 00", "04 0a ff c0", "13 02 02 11 12 05 01 00 02 00 03", "13 01 00 02 02 02 11 0f 04 01 02 03 04", "ff"):
+            data = bytes.fromhex(value) + b'\xee'
+            buf = pdu.Buffer(memoryview(data))
+            self.assertEqual(bytes(pdu.EncodedData.get(buf)), data[:-1])
+            self.assertEqual(buf.get_pos(), len(data) - 1)
+        self.assertRaises(BufferError, pdu.EncodedData.get, pdu.Buffer(memoryview(b'\x01\x02\x11\x00')))
+        self.assertRaises(ValueError, pdu.EncodedData.get, pdu.Buffer(memoryview(b'\x07')))
+
+    def test_APDU(self):
+        """ round trip of all services """
+        samples = [
+        "c0 01 c1 00 08 00 00 01 00 00 ff 02 00",
+        "c0 01 c1 00 07 01 00 63 01 00 ff 02 01 01 02 04 02 04 12 00 08 09 06 00 00 01 00 00 ff 0f 02 12 00 00 09 0c 07 e8 01 01 ff 00 00 00 00 80 00 00 09 0c 07 e8 01 02 ff 00 00 00 00 80 00 00 01 00",
+        "c0 02 c1 00 00 00 05",
+        "c0 03 c1 02 00 08 00 00 01 00 00 ff 02 00 00 03 01 00 01 08 00 ff 02 00",
+        "c4 01 c1 00 09 06 00 00 01 00 00 ff",
+        "c4 01 c1 01 03",
+        "c4 02 c1 00 00 00 00 01 00 82 01 00" + " 00"*256,
+        "c4 02 c1 01 00 00 00 02 01 0e",
+        "c4 03 c1 02 00 02 02 0f fe 16 1e 01 04",
+        "c1 01 c1 00 08 00 00 01 00 00 ff 02 00 09 0c 07 e8 01 01 ff 00 00 00 00 80 00 00",
+        "c1 02 c1 00 01 00 00 60 01 00 ff 02 00 00 00 00 00 01 03 01 02 03",
+        "c1 03 c1 01 00 00 00 02 02 04 05",
+        "c1 04 c1 01 00 01 00 00 01 00 00 ff 02 00 01 11 05",
+        "c1 05 c1 01 00 01 00 00 01 00 00 ff 02 00 00 00 00 00 01 01 05",
+        "c5 01 c1 00", "c5 02 c1 00 00 00 01", "c5 03 c1 00 00 00 00 02", "c5 04 c1 02 00 03 00 00 00 02", "c5 05 c1 01 00",
+        "c3 01 c1 00 0f 00 00 28 00 00 ff 01 00", "c3 01 c1 00 46 00 00 60 03 0a ff 01 01 16 00",
+        "c3 02 c1 00 00 00 01", "c3 03 c1 02 00 46 00 00 60 03 0a ff 01 00 46 00 00 60 03 0a ff 02 02 0f 00 0f 00",
+        "c3 04 c1 00 0f 00 00 28 00 00 ff 01 01 00 00 00 01 02 01 02", "c3 05 c1 01 00 0f 00 00 28 00 00 ff 01 00 00 00 00 01 00", "c3 06 c1 00 00 00 00 02 00",
+        "c7 01 c1 00 00", "c7 01 c1 00 01 00 09 02 aa bb", "c7 02 c1 01 00 00 00 01 01 05", "c7 03 c1 02 00 00 03 01 01 03", "c7 04 c1 00 00 00 02",
+        "c2 00 00 01 00 00 60 0b 00 ff 02 12 00 05", "c2 01 0c 07 e8 01 01 ff 00 00 00 00 80 00 00 00 01 00 00 60 0b 00 ff 02 12 00 05",
+        "0f 00 00 00 01 00 02 02 11 01 09 02 ab cd", "0f 00 00 00 01 0c 07 e8 01 01 ff 00 00 00 00 80 00 00 13 01 00 03 11 03 01 02 03",
+        "d8 01 02", "d8 02 06 00 00 00 05",
+        "01 00 00 00 06 5f 1f 04 00 00 7e 1f ff ff", "08 00 06 5f 1f 04 00 00 50 1f 04 00 00 07", "0e 01 06 01",
+        "62 00", "63 03 80 01 00",
+        ]
+        for value in samples:
+            data = bytes.fromhex(value)
+            new = apdu.decode(data)
+            self.assertEqual(bytes(new), data, F"round trip {new.value}")
+            self.assertEqual(len(new), len(data))
+        self.assertRaises(ValueError, apdu.decode, b'\xc4\x01\xc1\x00\x11\x01\x00')
+
+    def test_build(self):
+        request = apdu.APDU(apdu.GetRequest(apdu.GetRequestNormal((
+            apdu.InvokeIdAndPriority.from_int(0xc1),
+            apdu.CosemAttributeDescriptor((pdu.Unsigned16.from_int(8), pdu.OctetString6(memoryview(bytes((0, 0, 1, 0, 0, 255)))), pdu.Integer8.from_int(2))),
+            apdu.GetRequestNormal.__annotations__["access_selection"].default()))))
+        self.assertEqual(bytes(request), bytes.fromhex("c0 01 c1 00 08 00 00 01 00 00 ff 02 00"))
+        self.assertEqual(apdu.decode(bytes(request)), request)
+        initiate = apdu.decode(bytes.fromhex("01 00 00 00 06 5f 1f 04 00 00 7e 1f ff ff"))
+        self.assertEqual(int(initiate.value.proposed_conformance), 0x7e1f)
+        aarq = apdu.APDU(apdu.AARQ.new(initiate.value, mechanism_name=b'\x60\x85\x74\x05\x08\x02\x01', authentication_value=b'12345678'))
+        data = bytes(aarq)
+        self.assertEqual(data[:2], b'\x60\x36')
+        aarq = apdu.decode(data)
+        self.assertEqual(bytes(aarq.value.authentication_value), b'12345678')
+        self.assertEqual(aarq.value.user_information, initiate)
+        aare = apdu.decode(bytes.fromhex("61 17 a1 09 06 07 60 85 74 05 08 01 01 a2 03 02 01 01 a3 05 a1 03 02 01 0d"))
+        self.assertEqual((aare.value.result, aare.value.diagnostic, aare.value.user_information), (1, (1, 13), None), "rejected by authentication failure")
+        aare = apdu.APDU(apdu.AARE.new(apdu.decode(bytes.fromhex("08 00 06 5f 1f 04 00 00 50 1f 04 00 00 07")).value))
+        self.assertEqual(apdu.decode(bytes(aare)), aare)
+
+    def test_zero_copy(self):
+        data = bytes.fromhex("c4 02 c1 00 00 00 00 01 00 82 01 00") + bytes(range(256))
+        block = apdu.decode(data).value.value.result
+        self.assertEqual(int(block.block_number), 1)
+        self.assertIs(block.result.value.contents.obj, data, "raw-data is view of source")
+        data = bytes.fromhex("61 29 a1 09 06 07 60 85 74 05 08 01 01 a2 03 02 01 00 a3 05 a1 03 02 01 00 be 10 04 0e 08 00 06 5f 1f 04 00 00 50 1f 04 00 00 07")
+        self.assertIs(apdu.decode(data).value.user_information.value.negotiated_conformance.contents.obj, data, "user-information is view of source")
+
+    def test_benchmark(self):
+        amount = 10000
+        blocks = [bytes.fromhex("c4 02 c1 00") + i.to_bytes(4, "big") + b'\x00\x82\x04\x00' + bytes(1024) for i in range(amount)]
+        start = time.perf_counter()
+        for data in blocks:
+            apdu.decode(data)
+        duration = time.perf_counter() - start
+        print(F"parse {amount} blocks of 1 KB: {duration:.3f} s, {amount * len(blocks[0]) / duration / 1e6:.1f} MB/s")
+        data = b'\xc4\x01\xc1\x00\x01\x81\xc8' + b'\x02\x02\x09\x0c' + bytes(12) + b'\x06\x00\x00\x00\x01'
+        data = data[:7] + data[7:] * 200
+        start = time.perf_counter()
+        for _ in range(1000):
+            apdu.decode(data)
+        duration = time.perf_counter() - start
+        print(F"parse 1000 profiles of 200 entries: {duration:.3f} s, {1000 * len(data) / duration / 1e6:.1f} MB/s")
+        values = [apdu.decode(data) for data in blocks[:1000]]
+        start = time.perf_counter()
+        for value in values:
+            bytes(value)
+        print(F"encode 1000 blocks of 1 KB: {time.perf_counter() - start:.3f} s")
@@ -1,7 +1,10 @@
+import time
 import unittest
+from itertools import product
+from src.DLMS_SPODES import settings
 from src.DLMS_SPODES.types import cdt, cst, ut
 from src.DLMS_SPODES.cosem_interface_classes import collection
-from src.DLMS_SPODES.relation_to_OBIS import get_name
+from src.DLMS_SPODES.relation_to_OBIS import get_name, get_names, name_tables
 
 
 class TestType(unittest.TestCase):
@@ -19,4 +22,23 @@ class TestType(unittest.TestCase):
         obj = col.get_object("0.0.96.11.4.255")
         obj.set_attr(2, 2)
         print(obj.value, obj.value.report)
-        self.assertEqual(obj.value.report, "Магнитное поле - окончание(2)", "report match")
\ No newline at end of file
+        self.assertEqual(obj.value.report, "Магнитное поле - окончание(2)", "report match")
+
+    def test_get_names(self):
+        ln = cst.LogicalName("1.0.81.7.4.255")
+        self.assertEqual(get_name(ln, settings.Language.RUSSIAN), "угол между Ia и Ua")
+        self.assertEqual(get_name(ln, settings.Language.ENGLISH), "Angle from I(L1) to U(L1)")
+        language = settings.get_current_language()
+        try:
+            settings.set_current_language(settings.Language.ENGLISH.value)
+            self.assertEqual(get_name(ln), "Angle from I(L1) to U(L1)", "switch language in runtime")
+        finally:
+            settings.set_current_language(language.value)
+        self.assertEqual(get_name(ln), get_name(ln, language))
+        lns = [cst.LogicalName(bytearray((a, b, c, d, 0, 255))) for a, b, c, d in product((0, 1), range(3), range(1, 100), (0, 1, 2, 7, 8))]
+        for language in settings.Language:
+            t0 = time.perf_counter()
+            names = get_names(lns, language)
+            t1 = time.perf_counter()
+            self.assertEqual(names, [get_name(ln, language) for ln in lns])
+            print(F"{language.name} {len(lns)} names: {t1 - t0:.3f} s, table size: {len(name_tables[language])}")
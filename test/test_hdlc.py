@@ -1,5 +1,9 @@
+import asyncio
+import socket
+import time
 import unittest
-from src.DLMS_SPODES.hdlc import frame
+from collections import deque
+from src.DLMS_SPODES.hdlc import frame, negotiation, link, sub_layer
 
 
 class TestType(unittest.TestCase):
@@ -29,3 +33,215 @@ class TestType(unittest.TestCase):
             length=4
         )
         self.assertEqual(ad5.content, b'\x04\x00\x00\x21', "4 length address")
+
+    def test_interned(self):
+        for i in range(256):
+            c = frame.Control(i)
+            self.assertIs(frame.Control.from_frame(bytearray((i,))), frame.get_control(i))
+            self.assertEqual(frame.Control.next_send_sequence(c), frame.Control((c & 0xF0 | (c + 0x2) & 0xE) & 0xFF))
+            self.assertEqual(frame.Control.next_receiver_sequence(c), frame.Control(((c & 0xFF) + 0x20 | 0x10 | c & 0xE) & 0xFF))
+        self.assertIs(frame.Address.get(0x10, 0x11, 2), frame.Address.get(0x10, 0x11, 2))
+        self.assertIs(frame.Address.from_view(b'\x20\x23', 0)[0], frame.Address.get(0x10, 0x11))
+        for length in (0, 0x7ff):
+            for is_segmentation in (False, True):
+                f = frame.Format(is_segmentation=is_segmentation, length=length)
+                f2 = frame.Format.from_view(b'\x7e' + f.content)
+                self.assertEqual((f2.content, f2.length, f2.is_segmentation, f2.type), (f.content, length, is_segmentation, 0xA))
+        self.assertRaises(frame.FormatDataError, frame.Format.from_view, b'\x7e\xb0\x00')
+        DA = frame.Address(upper_address=0x10, lower_address=0x11, length=2)
+        SA = frame.Address(upper_address=0x30)
+        frames = [frame.Frame(DA=DA, SA=SA, control=frame.Control(i << 1 & 0xFE), info=b'\x01', is_segmentation=False).content for i in range(20000)]
+        t = time.perf_counter()
+        for content in frames:
+            f = frame.Frame.from_view(content)
+            frame.Control.next_receiver_sequence(frame.Control.next_send_sequence(f.control))
+        print(F"parse {len(frames)} frames: {time.perf_counter() - t:.3f} s")
+
+    def test_Scanner(self):
+        DA = frame.Address(upper_address=0x10, lower_address=0x11, length=2)
+        SA = frame.Address(upper_address=0x30)
+        frames = [frame.Frame(DA=DA, SA=SA, control=frame.Control.S0_R0, info=bytes(range(i % 200)), is_segmentation=False) for i in range(5000)]
+        frames[3] = frame.Frame(DA=DA, SA=SA, control=frame.Control.RR_R1_PF, info=bytes(), is_segmentation=False)
+        stream = bytearray(b'\x01\x7e\x02')
+        for i, f in enumerate(frames):
+            stream.extend(f.content)
+            if i == 10:
+                broken = bytearray(f.content)
+                broken[-4] ^= 0xff
+                stream.extend(broken)  # wrong FCS
+            elif i == 20:
+                stream.extend(b'\x7e\xa0\x7e\x33')  # wrong length
+        scanner = frame.Scanner()
+        received = list()
+        start = time.perf_counter()
+        for i in range(0, len(stream), 1000):
+            scanner.feed(stream[i:i + 1000])
+            received.extend(scanner)
+        print(F"scanner: {len(received)} frames by {time.perf_counter() - start:.3f} s")
+        self.assertEqual([f.content for f in received], [f.content for f in frames])
+        self.assertEqual(len(scanner), 1, "only end flag left")
+        data = bytearray(b''.join(f.content for f in frames[:2000]))
+        start = time.perf_counter()
+        amount = 0
+        while len(data) >= frame.Scanner.MIN_FRAME_LENGTH:
+            if frame.Frame.try_from(data) is not None:
+                amount += 1
+        print(F"try_from: {amount} frames by {time.perf_counter() - start:.3f} s")
+        shared_flags = frames[0].content + frames[1].content[1:]
+        scanner.feed(shared_flags)
+        self.assertEqual([f.content for f in scanner], [frames[0].content, frames[1].content], "end flag is start flag of next frame")
+
+    def test_CRC(self):
+        def reference(message: bytes) -> bytes:
+            value = 0xFFFF
+            for i in message:
+                value = ((value >> 8) ^ frame._CCITT[(value ^ i) & 0xFF]) & 0xFFFF
+            return (~value & 0xFFFF).to_bytes(2, "little")
+
+        messages = [bytes(), b'\x00', b'\xff', bytes(range(256)), bytes((i * 7) % 256 for i in range(2000))]
+        for m in messages:
+            self.assertEqual(frame.CRC(message=m).content, reference(m), F"{m[:10]}")
+            state = frame.CRC.update(frame.CRC.INIT, m[:len(m) // 3])
+            state = frame.CRC.update(state, memoryview(m)[len(m) // 3:])
+            self.assertEqual(frame.CRC.from_state(state).content, reference(m), "incremental")
+        DA = frame.Address(upper_address=0x10, lower_address=0x11, length=2)
+        SA = frame.Address(upper_address=0x30)
+        frames = [frame.Frame(DA=DA, SA=SA, control=frame.Control.S0_R0, info=bytes((i + j) % 256 for j in range(2000)), is_segmentation=False) for i in range(200)]
+        start = time.perf_counter()
+        for f in frames:
+            reference(f.content[1:8])
+            reference(f.content[1:-3])
+        print(F"loop: {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        for f in frames:
+            frame.Frame.try_from(bytearray(f.content))
+        print(F"parse with new CRC: {time.perf_counter() - start:.3f} s")
+        self.assertGreater(frame.get_header_state.cache_info().hits, 0, "header CRC memoised")
+
+    def test_Segmenter(self):
+        DA = frame.Address(upper_address=0x01, lower_address=0x11, length=2)
+        SA = frame.Address(upper_address=0x30)
+        apdu = bytes(i % 256 for i in range(10_000))
+        nego = negotiation.Negotiation(max_info_transmit=128, window_transmit=3)
+        segmenter = frame.Segmenter.from_negotiation(DA, SA, nego)
+        windows, control = segmenter.build(apdu, frame.Control.S0_R0)
+        frames = list()
+        for w in windows:
+            scanner = frame.Scanner()
+            scanner.feed(w)
+            frames.extend(scanner)
+            self.assertTrue(frames[-1].control.is_poll, "poll bit in end of window")
+        self.assertEqual(len(windows), 27)
+        self.assertEqual(len(frames), 79)
+        self.assertEqual(b''.join(f.info for f in frames), apdu)
+        self.assertEqual([f.is_segmentation for f in frames], [True] * 78 + [False])
+        self.assertTrue(all(f2.control & 0xEF == frame.Control.next_send_sequence(f1.control) & 0xEF for f1, f2 in zip(frames, frames[1:])), "send sequence without poll bit")
+        self.assertEqual(control, frames[-1].control)
+        for value in (bytearray(apdu), memoryview(apdu)):
+            self.assertEqual([bytes(w) for w in segmenter.build(value, frame.Control.S0_R0)[0]], [bytes(w) for w in windows], F"from {value.__class__.__name__}")
+        for f in frames[:3]:
+            self.assertEqual(f.content, frame.Frame(DA=DA, SA=SA, control=f.control, info=f.info, is_segmentation=f.is_segmentation).content)
+        start = time.perf_counter()
+        for _ in range(100):
+            segmenter.build(apdu, frame.Control.S0_R0)
+        print(F"segmenter: {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        for _ in range(100):
+            c = frame.Control.S0_R0
+            b''.join(frame.Frame(DA=DA, SA=SA, control=(c := frame.Control.next_send_sequence(c)), info=apdu[i:i + 128], is_segmentation=True).content for i in range(0, len(apdu), 128))
+        print(F"frames: {time.perf_counter() - start:.3f} s")
+
+    def test_Reassembler(self):
+        DA = frame.Address(upper_address=0x30)
+        SA = frame.Address(upper_address=0x01, lower_address=0x11, length=2)
+        apdu = bytes(i % 251 for i in range(100_000))
+        windows, _ = frame.Segmenter(DA, SA, max_info=2000, window=3).build(apdu, frame.Control.S0_R0)
+        scanner = frame.Scanner()
+        for w in windows:
+            scanner.feed(w)
+        frames = list(scanner)
+        received = frames[:5] + [frames[6], frames[5], frames[5], frames[4]] + frames[7:]  # out of sequence and duplicates
+        segments = list()
+        reassembler = frame.Reassembler(segments.append, window=3)
+        start = time.perf_counter()
+        for f in received:
+            if reassembler.feed(f):
+                break
+        print(F"reassembler: {time.perf_counter() - start:.4f} s")
+        self.assertTrue(reassembler.is_complete)
+        self.assertEqual(b''.join(segments), apdu)
+        self.assertEqual(len(segments), len(frames), "every segment handed once")
+        reassembler = frame.Reassembler()
+        for f in frames[:3]:
+            self.assertFalse(reassembler.feed(f))
+        self.assertEqual(reassembler.expected, 3)
+        self.assertEqual(bytes(reassembler.info), apdu[:6000])
+        windows, _ = frame.Segmenter(DA, SA, max_info=2000).build(apdu, frame.Control.S0_R0)
+        frames = list()
+        for w in windows:
+            scanner.feed(w)
+            frames.extend(scanner)
+        start = time.perf_counter()
+        frame.Frame.join_info(deque(frames))
+        print(F"join_info: {time.perf_counter() - start:.4f} s")
+
+    def test_LLC(self):
+        content = bytearray((0xe6, 0xe7, 0, 1, 2, 3))
+        self.assertEqual(sub_layer.LLC(content=content).info, b'\x01\x02\x03')
+        self.assertEqual(content, b'\x01\x02\x03', "header of bytearray consumed")
+        content = bytes((0xe6, 0xe7, 0, 1, 2, 3))
+        self.assertEqual(sub_layer.LLC(content=memoryview(content)).info, b'\x01\x02\x03')
+        self.assertRaises(ValueError, sub_layer.LLC, content=b'\xe6\xe7\x01')
+
+    def test_link(self):
+        class DelayedServer(link.Server):
+            """ high latency of link """
+            def _write(self, data):
+                asyncio.get_running_loop().call_later(0.005, self._transport.write, bytes(data))
+
+        async def exchange(window: int) -> float:
+            loop = asyncio.get_running_loop()
+            client_sock, server_sock = socket.socketpair()
+            DA = frame.Address(upper_address=0x01, lower_address=0x11, length=2)
+            SA = frame.Address(upper_address=0x30)
+            client = link.Client(DA, SA, negotiation.Negotiation(max_info_transmit=256, max_info_receive=256, window_transmit=window, window_receive=window))
+            server = DelayedServer(DA, lambda apdu: apdu * 10, negotiation.Negotiation(max_info_transmit=512, max_info_receive=512, window_transmit=7, window_receive=7))
+            await loop.create_connection(lambda: server, sock=server_sock)
+            transport, _ = await loop.create_connection(lambda: client, sock=client_sock)
+            await client.connect()
+            self.assertEqual((client.negotiation.max_info_transmit, client.negotiation.window_receive), (256, window))
+            start = time.perf_counter()
+            for i in range(3):
+                apdu = bytes(range(i, 256)) * 8
+                self.assertEqual(await client.request(apdu), apdu * 10)
+            duration = time.perf_counter() - start
+            await client.disconnect()
+            transport.close()
+            return duration
+
+        async def handler_error():
+            loop = asyncio.get_running_loop()
+            client_sock, server_sock = socket.socketpair()
+            DA = frame.Address(upper_address=0x01, lower_address=0x11, length=2)
+            SA = frame.Address(upper_address=0x30)
+
+            def handler(apdu: bytes) -> bytes:
+                raise ValueError("wrong APDU")
+
+            client = link.Client(DA, SA)
+            client.timeout, client.retries = 0.2, 1
+            server = link.Server(DA, handler)
+            server_transport, _ = await loop.create_connection(lambda: server, sock=server_sock)
+            transport, _ = await loop.create_connection(lambda: client, sock=client_sock)
+            await client.connect()
+            with self.assertLogs(link.logger, "ERROR") as logs:
+                with self.assertRaises((ConnectionError, TimeoutError)):
+                    await client.request(b'\x01')
+            self.assertIn("wrong APDU", logs.output[0])
+            self.assertTrue(server_transport.is_closing(), "connection closed")
+            transport.close()
+
+        asyncio.run(handler_error())
+        durations = [asyncio.run(exchange(w)) for w in (1, 3, 7)]
+        print(F"window 1, 3, 7: {', '.join(F'{d:.3f}' for d in durations)} s")
+        self.assertLess(durations[2], durations[0])
@@ -0,0 +1,276 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from random import Random
+from struct import pack
+from src.DLMS_SPODES.types import cdt, cst
+from src.DLMS_SPODES.cosem_interface_classes import collection
+from src.DLMS_SPODES.version import AppVersion
+from src.DLMS_SPODES.hdlc import frame, negotiation, link, tuning
+from src.DLMS_SPODES import simulator
+
+
+LLC_REQUEST = b'\xe6\xe6\x00'
+PROFILE = bytes((1, 0, 99, 1, 0, 255))
+CLOCK = bytes((0, 0, 1, 0, 0, 255))
+REGISTER = bytes((1, 0, 1, 8, 0, 255))
+CURRENT_ASSOCIATION = bytes((0, 0, 40, 0, 0, 255))
+
+
+def get_AARQ(secret: bytes = None, conformance: bytes = b'\xff\xff\xff', max_pdu: int = 0xffff) -> bytes:
+    content = b'\xa1\x09\x06\x07\x60\x85\x74\x05\x08\x01\x01'
+    if secret is not None:
+        content += b'\x8a\x02\x07\x80\x8b\x07\x60\x85\x74\x05\x08\x02\x01' + pack("BBBB", 0xac, len(secret) + 2, 0x80, len(secret)) + secret
+    content += b'\xbe\x10\x04\x0e\x01\x00\x00\x00\x06\x5f\x1f\x04\x00' + conformance + pack(">H", max_pdu)
+    return pack("BB", 0x60, len(content)) + content
+
+
+def get_capture_object(class_id: int, ln: bytes, index: int) -> bytes:
+    return pack(">BBBH", 2, 4, 0x12, class_id) + b'\x09\x06' + ln + pack(">BbBH", 0x0f, index, 0x12, 0)
+
+
+def get(class_id: int, ln: bytes, index: int, selection: bytes = b'\x00') -> bytes:
+    return pack(">BBBH", 0xc0, 1, 0xc1, class_id) + ln + pack("b", index) + selection
+
+
+def get_collection() -> collection.Collection:
+    return collection.get(b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13"))
+
+
+class DelayedTransport(simulator.PipeTransport):
+    """ pipe with latency, loss and corruption of written data """
+    latency: float = 0.002
+    loss: float = 0.0
+    corruption: float = 0.0
+    random = Random(1)
+
+    def write(self, data: bytes | bytearray | memoryview):
+        if self.random.random() >= self.loss:
+            data = bytearray(data)
+            if self.random.random() < self.corruption:
+                data[len(data) // 2] ^= 0x01
+            asyncio.get_running_loop().call_later(self.latency, super().write, bytes(data))
+
+
+class LossyTransport(DelayedTransport):
+    latency = 0.001
+    loss = 0.03
+    corruption = 0.03
+
+
+class TestType(unittest.TestCase):
+    def setUp(self):
+        self.col = get_collection()
+        self.col.getASSOCIATION(2).set_attr(7, b'\x09\x0812345678')
+        profile = self.col.get_object(PROFILE)
+        profile.set_attr_force(3, cdt.Array(b'\x01\x02' + get_capture_object(8, CLOCK, 2) + get_capture_object(3, REGISTER, 2)))
+        profile.set_attr_force(2, cdt.Array(b'\x01\x0a' + b''.join(
+            b'\x02\x02\x09\x0c' + bytes((7, 0xe8, 1, i + 1, 0xff, 0, 0, 0, 0, 0x80, 0, 0)) + b'\x15' + (i * 10).to_bytes(8, "big") for i in range(10))))
+
+    def associate(self, **kwargs) -> simulator.Session:
+        session = simulator.Session(self.col, 0x20)
+        aare = session.handle(get_AARQ(b'12345678', **kwargs))
+        self.assertEqual(aare[:2], b'\x61\x29', "accepted AARE")
+        return session
+
+    def test_AARQ(self):
+        session = simulator.Session(self.col, 0x20)
+        aare = session.handle(get_AARQ(b'wrong'))
+        self.assertEqual(aare[13:21], b'\xa2\x03\x02\x01\x01\xa3\x05\xa1', "rejected")
+        self.assertEqual(aare[24], 13, "authentication failure")
+        self.assertEqual(session.handle(get(8, CLOCK, 1)), b'\xd8\x01\x01', "without association")
+        aare = session.handle(get_AARQ())
+        self.assertEqual(aare[24], 12, "authentication mechanism required")
+        aare = session.handle(get_AARQ(b'12345678'))
+        self.assertEqual(aare[17], 0, "accepted")
+        self.assertEqual(aare[-7:], b'\x00\x10\x15\x04\x00\x00\x07', "association conformance and max receive pdu size")
+        aare = session.handle(get_AARQ(b'12345678', conformance=b'\x00\x00\x08'))
+        self.assertEqual(aare[-4:], b'\x0e\x01\x06\x02', "incompatible conformance")
+        self.assertFalse(session.is_associated)
+        self.assertEqual(simulator.Session(self.col, 0x10).handle(get_AARQ())[17], 0, "public association")
+        self.assertEqual(session.handle(b'\x62\x00'), b'\x63\x03\x80\x01\x00', "release")
+
+    def test_GET(self):
+        session = self.associate()
+        self.assertEqual(session.handle(get(8, CLOCK, 1)), b'\xc4\x01\xc1\x00\x09\x06' + CLOCK, "logical name")
+        self.assertEqual(session.handle(get(7, bytes((0, 0, 21, 0, 1, 255)), 2)), b'\xc4\x01\xc1\x01\x03', "read denied")
+        self.assertEqual(session.handle(get(1, bytes((0, 0, 99, 99, 0, 255)), 2)), b'\xc4\x01\xc1\x01\x04', "undefined")
+        self.assertEqual(session.handle(get(3, CLOCK, 2)), b'\xc4\x01\xc1\x01\x09', "class inconsistent")
+        self.assertEqual(session.handle(get(3, REGISTER, 2)), b'\xc4\x01\xc1\x00\x15' + bytes(8), "value")
+        self.assertEqual(session.handle(b'\xc0\x03\xc1\x01' + get(3, REGISTER, 2)[3:]), b'\xd8\x01\x02', "with-list not in conformance")
+        self.assertEqual(session.handle(b'\xc2\x00'), b'\xd8\x02\x02', "unknown service")
+
+    def test_block_transfer(self):
+        session = self.associate(max_pdu=200)
+        expected = self.col.getASSOCIATION(2).object_list.encoding
+        response = session.handle(get(15, CURRENT_ASSOCIATION, 2))
+        raw_data = bytearray()
+        blocks = 0
+        start = time.perf_counter()
+        while True:
+            self.assertEqual(response[:3], b'\xc4\x02\xc1')
+            self.assertLessEqual(len(response), 200, "max pdu")
+            last, number = response[3], int.from_bytes(response[4:8], "big")
+            length, pdu_ = cdt.get_length_and_pdu(response[9:])
+            raw_data += pdu_
+            blocks += 1
+            self.assertEqual(number, blocks)
+            if last:
+                break
+            response = session.handle(b'\xc0\x02\xc1' + pack(">L", number))
+        print(F"object list {len(expected)} bytes by {blocks} blocks: {time.perf_counter() - start:.3f} s")
+        self.assertEqual(bytes(raw_data), expected)
+        self.assertEqual(session.handle(b'\xc0\x02\xc1' + pack(">L", number))[-2:], b'\x01\x10', "no long get in progress")
+        session.handle(get(15, CURRENT_ASSOCIATION, 2))
+        self.assertEqual(session.handle(b'\xc0\x02\xc1\x00\x00\x00\x05')[-2:], b'\x01\x13', "block number invalid")
+
+    def test_selective_access(self):
+        session = self.associate()
+        profile = self.col.get_object(PROFILE)
+        row = profile.buffer[4].encoding
+        response = session.handle(get(7, PROFILE, 2))
+        self.assertEqual(response[:6], b'\xc4\x01\xc1\x00\x01\x0a', "all buffer")
+        date_time = b'\x09\x0c' + bytes((7, 0xe8, 1, 4, 0xff, 0, 0, 0, 0, 0x80, 0, 0))
+        date_time2 = b'\x09\x0c' + bytes((7, 0xe8, 1, 6, 0xff, 0, 0, 0, 0, 0x80, 0, 0))
+        range_descriptor = b'\x01\x01\x02\x04' + get_capture_object(8, CLOCK, 2) + date_time + date_time2 + b'\x01\x00'
+        response = session.handle(get(7, PROFILE, 2, range_descriptor))
+        self.assertEqual(response[4:6], b'\x01\x03', "3 days")
+        self.assertEqual(response[6 + len(row):6 + 2 * len(row)], row, "5 Jan")
+        range_descriptor = b'\x01\x01\x02\x04' + get_capture_object(3, REGISTER, 2) + b'\x15' + (25).to_bytes(8, "big") + b'\x15' + (45).to_bytes(8, "big") + b'\x01\x01' + get_capture_object(3, REGISTER, 2)
+        response = session.handle(get(7, PROFILE, 2, range_descriptor))
+        self.assertEqual(response[4:], b'\x01\x02' + b'\x02\x01\x15' + (30).to_bytes(8, "big") + b'\x02\x01\x15' + (40).to_bytes(8, "big"), "by register with selected values")
+        entry_descriptor = b'\x02\x02\x02\x04\x06\x00\x00\x00\x09\x06\x00\x00\x00\x00\x12\x00\x02\x12\x00\x00'
+        response = session.handle(get(7, PROFILE, 2, entry_descriptor))
+        self.assertEqual(response[4:7], b'\x01\x02\x02', "last 2 entries")
+        self.assertEqual(response[7:9], b'\x01\x15', "only second column")
+        self.assertEqual(session.handle(get(8, CLOCK, 2, entry_descriptor))[-2:], b'\x01\x0d', "scope of access violated")
+
+    def test_SET_and_ACTION(self):
+        self.col.getASSOCIATION(2).xDLMS_context_info.conformance.set("000000000001111000011101")
+        session = self.associate(max_pdu=100)
+        set_register = b'\xc1\x01\xc1\x00\x03' + REGISTER + b'\x02\x00\x15' + (123).to_bytes(8, "big")
+        self.assertEqual(session.handle(set_register), b'\xc5\x01\xc1\x03', "read only")
+        object_list = self.col.getASSOCIATION(2).object_list
+        element = object_list.get_element(cst.LogicalName(bytearray(REGISTER)))
+        object_list.remove(element)
+        for item in element.access_rights.attribute_access:
+            if int(item.attribute_id) == 2:
+                item.access_mode.set(3)
+        object_list.append(element)
+        self.assertEqual(session.handle(set_register), b'\xc5\x01\xc1\x00', "success")
+        self.assertEqual(self.col.get_object(REGISTER).value.contents, (123).to_bytes(8, "big"))
+        self.assertEqual(session.handle(set_register[:-9] + b'\x09\x01\x00'), b'\xc5\x01\xc1\x0c', "type unmatched")
+        value = b'\x15' + (456).to_bytes(8, "big")
+        first = b'\xc1\x02\xc1\x00\x03' + REGISTER + b'\x02\x00' + b'\x00\x00\x00\x00\x01\x05' + value[:5]
+        self.assertEqual(session.handle(first), b'\xc5\x02\xc1\x00\x00\x00\x01', "block acknowledge")
+        self.assertEqual(session.handle(b'\xc1\x03\xc1\x01\x00\x00\x00\x02\x04' + value[5:]), b'\xc5\x03\xc1\x00\x00\x00\x00\x02', "last block")
+        self.assertEqual(self.col.get_object(REGISTER).value.contents, (456).to_bytes(8, "big"))
+        get_with_list = b'\xc0\x03\xc1\x02' + get(3, REGISTER, 2)[3:] + get(8, CLOCK, 1)[3:]
+        self.assertEqual(session.handle(get_with_list), b'\xc4\x03\xc1\x02\x00' + value + b'\x00\x09\x06' + CLOCK, "with list")
+        shift_time = b'\xc3\x01\xc1\x00\x08' + CLOCK + b'\x06\x01\x10\x00\x0a'
+        self.assertEqual(session.handle(shift_time), b'\xc7\x01\xc1\x00\x00', "shift time")
+        self.assertIsNotNone(self.col.get_object(CLOCK).time, "time set by shift")
+        events = b'\xc3\x01\xc1\x00\x07' + bytes((0, 0, 99, 13, 0, 255))
+        self.assertEqual(session.handle(events + b'\x01\x01\x0f\x00'), b'\xc7\x01\xc1\x00\x00', "reset")
+        self.assertEqual(session.handle(events + b'\x02\x01\x0f\x00'), b'\xc7\x01\xc1\x0b\x00', "capture not supported")
+        self.assertEqual(session.handle(shift_time[:-3] + b'\x09\x00'), b'\xc7\x01\xc1\x0c\x00', "type unmatched")
+        self.assertEqual(session.handle(b'\xc3\x01\xc1\x00\x07' + PROFILE + b'\x01\x01\x0f\x00'), b'\xc7\x01\xc1\x03\x00', "reset denied")
+
+    def test_HDLC(self):
+        async def main():
+            meters = simulator.Simulator(get_collection(), frame.Address(upper_address=1, lower_address=0x10, length=2))
+            client = link.Client(meters.SA, frame.Address(upper_address=0x10), negotiation.Negotiation(max_info_transmit=128, max_info_receive=128))
+            meter = meters.connect_pipe(client)
+            await client.connect()
+            aare = await client.request(LLC_REQUEST + get_AARQ())
+            self.assertEqual(aare[:5], b'\xe6\xe7\x00\x61\x29')
+            self.assertEqual(meter.session.association_id, 1)
+            response = await client.request(LLC_REQUEST + get(15, CURRENT_ASSOCIATION, 2))
+            self.assertEqual(response[3:6], b'\xc4\x02\xc1', "object list by blocks")
+            await client.disconnect()
+            await client.connect()
+            self.assertIsNone(meter.session, "released with HDLC connection")
+            await client.disconnect()
+
+        asyncio.run(main())
+
+    def test_tuning(self):
+        candidates = ((128, 1), (128, 7), (1024, 1), (1024, 7))
+
+        async def read_object_list(meters: simulator.Simulator, tuner: tuning.Tuner, key: str, factory: type[simulator.PipeTransport]) -> link.Client:
+            client = link.Client(meters.SA, frame.Address(upper_address=0x20))
+            meter = meters()
+            client.timeout = meter.timeout = 0.03
+            client.retries = meter.retries = 10
+            simulator.connect_pipe(client, meter, factory)
+            await tuner.connect(key, client)
+            await client.request(LLC_REQUEST + get_AARQ(b'12345678'))
+            response = await client.request(LLC_REQUEST + get(15, CURRENT_ASSOCIATION, 2))
+            while response[6] == 0:
+                response = await client.request(LLC_REQUEST + b'\xc0\x02\xc1' + response[7:11])
+            await client.disconnect()
+            return client
+
+        async def main():
+            meters = simulator.Simulator(self.col, capability=negotiation.Negotiation(1024, 1024, 7, 7))
+            tuner = tuning.Tuner(candidates)
+            start = time.perf_counter()
+            for key, factory in (("delayed", DelayedTransport), ("lossy", LossyTransport)):
+                for candidate in candidates:
+                    self.assertEqual(tuner.get_choice(key), candidate, "explore not measured")
+                    client = await read_object_list(meters, tuner, key, factory)
+                    self.assertEqual((client.negotiation.max_info_transmit, client.negotiation.window_transmit), candidate)
+                choice = tuner.get_choice(key)
+                self.assertEqual(choice, max(candidates, key=lambda it: tuner.get_statistic(key, *it).goodput))
+                await read_object_list(meters, tuner, key, factory)
+            print(F"tuning by {2 * len(candidates) + 2} sessions: {time.perf_counter() - start:.3f} s\n{tuner}")
+            self.assertEqual(tuner.get_choice("delayed"), (1024, 7), "less round trips with latency")
+            self.assertGreater(sum(tuner.get_statistic("lossy", *it).retransmissions for it in candidates), 0)
+            self.assertGreater(sum(tuner.get_statistic("lossy", *it).error_rate for it in candidates), 0)
+            with tempfile.TemporaryDirectory() as directory:
+                tuner.save(path := os.path.join(directory, "tuning.json"))
+                restored = tuning.Tuner.load(path, candidates=candidates)
+            for key in ("delayed", "lossy"):
+                self.assertEqual(restored.get_choice(key), tuner.get_choice(key), "persist choice")
+                self.assertEqual(restored.get_statistic(key, 1024, 7), tuner.get_statistic(key, 1024, 7))
+
+        asyncio.run(main())
+
+    def test_many_meters(self):
+        amount = 1000
+
+        async def read_clock_ln(meters: simulator.Simulator, client: link.Client):
+            meters.connect_pipe(client)
+            await client.connect()
+            await client.request(LLC_REQUEST + get_AARQ())
+            response = await client.request(LLC_REQUEST + get(8, CLOCK, 1))
+            await client.disconnect()
+            return response[3:]
+
+        async def main():
+            meters = simulator.Simulator(get_collection())
+            start = time.perf_counter()
+            responses = await asyncio.gather(*(read_clock_ln(meters, link.Client(meters.SA, frame.Address(upper_address=0x10))) for _ in range(amount)))
+            print(F"{amount} meters by in-memory pipes: {time.perf_counter() - start:.3f} s")
+            self.assertEqual(set(responses), {b'\xc4\x01\xc1\x00\x09\x06' + CLOCK})
+
+        asyncio.run(main())
+
+    def test_TCP(self):
+        async def main():
+            meters = simulator.Simulator(get_collection())
+            server = await meters.serve_tcp()
+            host, port = server.sockets[0].getsockname()[:2]
+            client = link.Client(meters.SA, frame.Address(upper_address=0x10))
+            transport, _ = await asyncio.get_running_loop().create_connection(lambda: client, host, port)
+            await client.connect()
+            self.assertEqual((await client.request(LLC_REQUEST + get_AARQ()))[3:5], b'\x61\x29')
+            self.assertEqual(await client.request(LLC_REQUEST + get(8, CLOCK, 1)), b'\xe6\xe7\x00\xc4\x01\xc1\x00\x09\x06' + CLOCK)
+            await client.disconnect()
+            transport.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
@@ -0,0 +1,151 @@
+import asyncio
+import time
+import unittest
+from src.DLMS_SPODES.types import cdt
+from src.DLMS_SPODES.cosem_interface_classes import collection
+from src.DLMS_SPODES.version import AppVersion
+from src.DLMS_SPODES.wrapper import codec, transport
+from src.DLMS_SPODES import simulator
+
+
+def echo(header: codec.Header, apdu: memoryview) -> bytes:
+    return bytes(apdu)
+
+
+class TestType(unittest.TestCase):
+    def test_Buffer(self):
+        apdus = [bytes(range(i % 256)) * (i % 5) for i in range(1000)]
+        buf = codec.Buffer.allocate(sum(len(apdu) + codec.HEADER.size for apdu in apdus))
+        start = time.perf_counter()
+        for apdu in apdus:
+            buf.put_apdu(0x10, 1, apdu)
+        print(F"put {len(apdus)} APDU: {time.perf_counter() - start:.4f} s")
+        self.assertEqual(bytes(buf.buf[:12]), b'\x00\x01\x00\x10\x00\x01\x00\x00\x00\x01\x00\x10', "header")
+        buf = codec.Buffer(buf.buf)
+        start = time.perf_counter()
+        for apdu in apdus:
+            header, view = buf.get_apdu()
+            self.assertEqual((header.source, header.destination, view), (0x10, 1, apdu))
+        print(F"get {len(apdus)} APDU: {time.perf_counter() - start:.4f} s")
+        self.assertRaises(ValueError, codec.Buffer.wrap(b'\x00\x02\x00\x10\x00\x01\x00\x00').get_apdu)
+        self.assertRaises(BufferError, codec.Buffer.wrap(b'\x00\x01\x00\x10\x00\x01\x00\x05\x01').get_apdu)
+
+    def test_Decoder(self):
+        apdus = [bytes((i % 256,)) * (i * 37 % 9000) for i in range(300)]
+        stream = b''.join(bytes(codec.get_pdu(1, 0x10, apdu)) for apdu in apdus)
+        for chunk in (1, 7, 1500, len(stream)):
+            decoder = codec.Decoder(0x100)
+            got = list()
+            for pos in range(0, len(stream), chunk):
+                data = stream[pos: pos + chunk]
+                while data:
+                    free = decoder.get_buffer(len(data))
+                    length = min(len(free), len(data))
+                    free[:length] = data[:length]
+                    decoder.buffer_updated(length)
+                    data = data[length:]
+                    got.extend(bytes(view) for _, view in decoder)
+            self.assertEqual(got, apdus, F"by {chunk} bytes")
+            self.assertEqual(len(decoder), 0)
+
+    def test_echo(self):
+        amount = 200
+
+        async def exchange(port: int, n: int) -> bool:
+            client = transport.Client()
+            connection, _ = await asyncio.get_running_loop().create_connection(lambda: client, "127.0.0.1", port)
+            apdus = [bytes((n % 256,)) * (n * 13 + i * 1000) for i in range(5)]
+            ok = all([await client.request(apdu) == apdu for apdu in apdus])
+            connection.close()
+            return ok
+
+        async def main():
+            server = await asyncio.get_running_loop().create_server(lambda: transport.Server(echo), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            start = time.perf_counter()
+            results = await asyncio.gather(*(exchange(port, n) for n in range(amount)))
+            print(F"{amount} connections echo: {time.perf_counter() - start:.3f} s")
+            self.assertTrue(all(results))
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
+
+    def test_Listener(self):
+        async def main():
+            listener = transport.Listener(max_connections=1, inactivity_timeout=0.1)
+            server = await asyncio.get_running_loop().create_server(lambda: transport.Server(echo, listener), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client1, client2 = transport.Client(timeout=0.5), transport.Client(timeout=0.5)
+            await asyncio.get_running_loop().create_connection(lambda: client1, "127.0.0.1", port)
+            await asyncio.get_running_loop().create_connection(lambda: client2, "127.0.0.1", port)
+            self.assertEqual(await client1.request(b'\x01'), b'\x01')
+            with self.assertRaises((ConnectionError, TimeoutError)):
+                await client2.request(b'\x01')
+            await asyncio.sleep(0.3)
+            self.assertEqual(len(listener.connections), 0, "closed by inactivity")
+            with self.assertRaises(ConnectionError):
+                await client1.request(b'\x01')
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
+
+    def test_async_handler(self):
+        got = list()
+
+        async def handler(header: codec.Header, apdu: bytes) -> bytes:
+            await asyncio.sleep(0.01)
+            got.append(type(apdu))
+            if apdu == b'\xff':
+                raise ValueError("wrong APDU")
+            return apdu
+
+        async def main():
+            server = await asyncio.get_running_loop().create_server(lambda: transport.Server(handler), "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = transport.Client(timeout=0.3)
+            connection, _ = await asyncio.get_running_loop().create_connection(lambda: client, "127.0.0.1", port)
+            with self.assertLogs(transport.logger, "ERROR") as logs:
+                with self.assertRaises(TimeoutError):
+                    await client.request(b'\xff')
+            self.assertIn("wrong APDU", logs.output[0])
+            self.assertEqual(await client.request(b'\x01\x02'), b'\x01\x02', "after handler error")
+            self.assertEqual(got, [bytes, bytes], "copy of APDU")
+            connection.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
+
+    def test_simulator(self):
+        col = collection.get(b"KPZ", cdt.OctetString("4d324d5f33"), AppVersion.from_str("1.4.13"))
+        AARQ = bytes.fromhex("601da109060760857405080101be10040e01000000065f1f0400ffffffffff")
+        get_ln = bytes.fromhex("c001c100080000010000ff0100")
+
+        async def main():
+            server = await simulator.Simulator(col).serve_wrapper()
+            port = server.sockets[0].getsockname()[1]
+            client = transport.Client(source=0x10, destination=1)
+            connection, _ = await asyncio.get_running_loop().create_connection(lambda: client, "127.0.0.1", port)
+            self.assertEqual((await client.request(AARQ))[:2], b'\x61\x29')
+            self.assertEqual(await client.request(get_ln), bytes.fromhex("c401c10009060000010000ff"))
+            connection.close()
+            udp, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: transport.Datagram(simulator.WrapperMeter(col).handler), local_addr=("127.0.0.1", 0))
+            received = asyncio.get_running_loop().create_future()
+
+            class UDPClient(asyncio.DatagramProtocol):
+                def datagram_received(self, data, addr):
+                    received.set_result(data)
+
+            client_udp, _ = await asyncio.get_running_loop().create_datagram_endpoint(UDPClient, remote_addr=udp.get_extra_info("sockname"))
+            client_udp.sendto(codec.get_pdu(0x10, 1, AARQ))
+            header, apdu = codec.Buffer.wrap(await asyncio.wait_for(received, 1)).get_apdu()
+            self.assertEqual((header.source, header.destination, bytes(apdu[:2])), (1, 0x10, b'\x61\x29'))
+            client_udp.close()
+            udp.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())